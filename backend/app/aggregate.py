@@ -0,0 +1,138 @@
+"""
+UAE Batch Aggregation
+File-level totals folded from rule evaluations, without building a
+UAEValidationResponse per transaction.
+
+Memory is constant in the number of transactions: counters, a fixed-bucket
+STP score histogram, one counter per rule code (a closed set) and, when
+requested, a taxonomy report (one slot per purpose code).
+"""
+
+import time
+from typing import Dict, List, Optional
+
+from app.reference import ReferenceData, get_reference_data
+from app.schemas import UAEBatchSummaryResponse, UAESTPBucket, UAEValidationRequest
+from app.taxonomy import TaxonomyReport
+from app.tenants import tenant_profiles
+from app.validators import RuleEvaluation, UAEValidationEngine
+
+STP_HISTOGRAM_BUCKET_WIDTH = 10
+STP_HISTOGRAM_BUCKETS = 10  # 0-9, 10-19, ..., 90-100
+
+
+class BatchAggregate:
+    """
+    Constant-memory accumulators for one batch or file.
+
+    With a tenant (the batch's tenant profile) the summary reports the
+    version of the tenant's plan, which its decisions carry, rather than
+    the base reference data version.
+    """
+
+    def __init__(
+        self,
+        ref: Optional[ReferenceData] = None,
+        taxonomy: Optional[TaxonomyReport] = None,
+        tenant: Optional[str] = None,
+    ):
+        self.ref = ref or get_reference_data()
+        self.taxonomy = taxonomy
+        self.tenant = tenant
+        self.data_version = tenant_profiles.plan(tenant, self.ref).ref.version if tenant else self.ref.version
+        self.started = time.perf_counter()
+        self.validated = 0
+        self.unparseable = 0
+        self.compliant = 0
+        self.stp_score_total = 0.0
+        self.stp_score_min: Optional[float] = None
+        self.stp_score_max: Optional[float] = None
+        self.stp_ratings: Dict[str, int] = {"high": 0, "medium": 0, "low": 0}
+        self.stp_histogram: List[int] = [0] * STP_HISTOGRAM_BUCKETS
+        self.total_amount_aed = 0.0
+        self.total_penalty_risk_aed = 0.0
+        self.failures_by_rule: Dict[str, int] = {}
+        self.high_value_count = 0
+        self.lei_missing_count = 0
+
+    def add(self, evaluation: RuleEvaluation, request: UAEValidationRequest) -> None:
+        """Fold one evaluated transaction into the totals."""
+        score = evaluation.stp_score
+        self.validated += 1
+        if evaluation.violation_count == 0:
+            self.compliant += 1
+
+        self.stp_score_total += score
+        if self.stp_score_min is None or score < self.stp_score_min:
+            self.stp_score_min = score
+        if self.stp_score_max is None or score > self.stp_score_max:
+            self.stp_score_max = score
+        self.stp_ratings[evaluation.stp_rating] += 1
+        self.stp_histogram[min(int(score) // STP_HISTOGRAM_BUCKET_WIDTH, STP_HISTOGRAM_BUCKETS - 1)] += 1
+
+        self.total_amount_aed += evaluation.amount_aed
+        self.total_penalty_risk_aed += evaluation.penalty_risk
+
+        failures = self.failures_by_rule
+        for result in evaluation.results:
+            if not result.is_valid:
+                failures[result.rule_code] = failures.get(result.rule_code, 0) + 1
+
+        if evaluation.is_high_value:
+            self.high_value_count += 1
+        if evaluation.lei_required and not (request.debtor_lei or request.creditor_lei):
+            self.lei_missing_count += 1
+        if self.taxonomy is not None:
+            self.taxonomy.add(request.purpose_code, evaluation.amount_aed)
+
+    def add_unparseable(self) -> None:
+        """Count a file record that could not be mapped to a request."""
+        self.unparseable += 1
+
+    def to_response(self) -> UAEBatchSummaryResponse:
+        histogram = [
+            UAESTPBucket(
+                min_score=i * STP_HISTOGRAM_BUCKET_WIDTH,
+                max_score=100 if i == STP_HISTOGRAM_BUCKETS - 1 else (i + 1) * STP_HISTOGRAM_BUCKET_WIDTH - 1,
+                count=count,
+            )
+            for i, count in enumerate(self.stp_histogram)
+        ]
+        return UAEBatchSummaryResponse(
+            data_version=self.data_version,
+            total_transactions=self.validated + self.unparseable,
+            validated=self.validated,
+            unparseable=self.unparseable,
+            compliant=self.compliant,
+            non_compliant=self.validated - self.compliant,
+            stp_score_mean=round(self.stp_score_total / self.validated, 2) if self.validated else None,
+            stp_score_min=self.stp_score_min,
+            stp_score_max=self.stp_score_max,
+            stp_ratings=dict(self.stp_ratings),
+            stp_histogram=histogram,
+            total_amount_aed=round(self.total_amount_aed, 2),
+            total_penalty_risk_aed=self.total_penalty_risk_aed,
+            failures_by_rule=dict(sorted(self.failures_by_rule.items())),
+            high_value_count=self.high_value_count,
+            lei_missing_count=self.lei_missing_count,
+            taxonomy_report=self.taxonomy.to_response() if self.taxonomy is not None else None,
+            processing_time_ms=int((time.perf_counter() - self.started) * 1000),
+        )
+
+
+def aggregate_batch(
+    engine: UAEValidationEngine,
+    requests: List[UAEValidationRequest],
+    aggregate: Optional[BatchAggregate] = None,
+    tenant: Optional[str] = None,
+) -> BatchAggregate:
+    """
+    Evaluate a batch and fold it into aggregate (a new one by default).
+
+    tenant defaults to the aggregate's tenant.
+    """
+    aggregate = aggregate or BatchAggregate(tenant=tenant)
+    tenant = tenant or aggregate.tenant
+    for request, evaluation in zip(requests, engine.evaluate_batch(requests, aggregate.ref, tenant, failures_only=True)):
+        aggregate.add(evaluation, request)
+    return aggregate
@@ -0,0 +1,49 @@
+"""
+UAE Validation API - admission control
+Shed or admit requests by priority class before any engine work (see
+app.scheduler), and run bulk work chunk by chunk on scheduler slots.
+"""
+
+import os
+from typing import Any, Callable
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+
+from app.constants import UAE_SCHEDULER_CLIENT_HEADER, UAE_SCHEDULER_TRUST_CLIENT_HEADER
+from app.scheduler import Overloaded, scheduler
+
+TRUST_CLIENT_HEADER_ENV = "UAE_TRUST_CLIENT_HEADER"
+
+
+def client_id(http_request: Request) -> str:
+    """
+    Token bucket and idempotency key scope: the peer address.
+
+    The client header is anyone's to set, so it is honoured only when
+    UAE_TRUST_CLIENT_HEADER=1 (or UAE_SCHEDULER_TRUST_CLIENT_HEADER) says a
+    trusted proxy in front of the API sets it and strips it from callers.
+    """
+    if UAE_SCHEDULER_TRUST_CLIENT_HEADER or os.environ.get(TRUST_CLIENT_HEADER_ENV, "") not in ("", "0"):
+        client = http_request.headers.get(UAE_SCHEDULER_CLIENT_HEADER)
+        if client:
+            return client
+    return http_request.client.host if http_request.client else "unknown"
+
+
+def admit(http_request: Request, priority: str) -> None:
+    """Admit a request, or raise 429 with Retry-After."""
+    try:
+        scheduler.admit(priority, client_id(http_request))
+    except Overloaded as exc:
+        raise HTTPException(
+            status_code=429,
+            detail=str(exc),
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+
+async def run_held(priority: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Run func(*args) in the threadpool while holding a scheduler slot."""
+    async with scheduler.hold(priority):
+        return await run_in_threadpool(func, *args)
@@ -0,0 +1,92 @@
+"""
+UAE Bank Lookup API Endpoints
+"""
+
+from fastapi import APIRouter, HTTPException
+from typing import List, Dict
+
+from app.schemas import (
+    UAEBankLookupRequest,
+    UAEBankLookupResponse,
+    UAEBankLookupResult,
+)
+from app.reference import get_reference_data
+from app.validators import UAEBankDirectory
+
+router = APIRouter()
+
+bank_directory = UAEBankDirectory()
+
+
+@router.get("/", response_model=List[Dict[str, str]])
+async def list_banks():
+    """List all UAE banks in the directory, ordered by bank code."""
+    return [entry for entry in get_reference_data().bank_code_table if entry]
+
+
+@router.post("/lookup", response_model=UAEBankLookupResponse)
+async def bulk_bank_lookup(request: UAEBankLookupRequest):
+    """
+    Resolve banks for a batch of IBAN/BIC pairs (screening files).
+
+    Each item may carry an IBAN, a BIC or both. When both are present the
+    BIC's bank is cross-checked against the IBAN bank code.
+    """
+    ref = get_reference_data()
+    results = []
+    matched = mismatched = unresolved = 0
+
+    for item in request.items:
+        iban_bank_code = bank_directory.bank_code_from_iban(item.iban)
+        iban_bank = bank_directory.by_code(iban_bank_code, ref)
+        bic_bank = bank_directory.by_bic(item.bic, ref)
+
+        error_message = None
+        if item.iban and not iban_bank_code:
+            error_message = "UAE IBAN must be AE followed by 21 digits"
+        elif item.bic and not bank_directory.normalize_bic(item.bic):
+            error_message = "BIC must be 8 or 11 characters"
+        elif item.bic and not bic_bank:
+            error_message = "BIC not found in UAE bank directory"
+        elif iban_bank_code and not iban_bank:
+            error_message = f"Unknown bank code '{iban_bank_code}'"
+
+        bic_matches_iban = None
+        if iban_bank_code and bic_bank:
+            bic_matches_iban = bic_bank["code"] == iban_bank_code
+            if bic_matches_iban:
+                matched += 1
+            else:
+                mismatched += 1
+        if error_message:
+            unresolved += 1
+
+        results.append(UAEBankLookupResult(
+            iban=item.iban,
+            bic=item.bic,
+            iban_bank_code=iban_bank_code,
+            iban_bank_name=iban_bank["name"] if iban_bank else None,
+            bic_bank_code=bic_bank["code"] if bic_bank else None,
+            bic_bank_name=bic_bank["name"] if bic_bank else None,
+            bic_matches_iban=bic_matches_iban,
+            error_message=error_message,
+        ))
+
+    return UAEBankLookupResponse(
+        total=len(results),
+        matched=matched,
+        mismatched=mismatched,
+        unresolved=unresolved,
+        results=results,
+    )
+
+
+@router.get("/{bank_code}", response_model=Dict[str, str])
+async def get_bank(bank_code: str):
+    """Get a bank by its 3-digit CBUAE bank code."""
+    bank = bank_directory.by_code(bank_code)
+
+    if not bank:
+        raise HTTPException(status_code=404, detail=f"Bank code '{bank_code}' not found")
+
+    return bank
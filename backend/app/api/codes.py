@@ -3,25 +3,25 @@ UAE Code Lookup API Endpoints
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
+from typing import Optional, Dict, List, Mapping, Tuple
 
 from app.schemas import (
     UAEPurposeCodeResponse,
     UAEPurposeCodeListResponse,
     UAEPurposeCodeCategoryResponse,
     UAEPurposeCodeBulkResponse,
+    UAETaxonomyMapping,
 )
-from app.constants import (
-    UAE_PURPOSE_CODES,
-    UAE_PPC_CATEGORIES,
-    PURPOSE_CODE_LOOKUP,
-    CODES_BY_CATEGORY,
-)
+from app.reference import ReferenceData, VersionedCache, get_reference_data
+from app.taxonomy import taxonomy_index
 
 router = APIRouter()
 
+# Serialised responses and search index, rebuilt when reference data changes
+_response_cache = VersionedCache()
+
 
-def _code_to_response(code_data: dict) -> UAEPurposeCodeResponse:
+def _code_to_response(code_data: Mapping, ref: ReferenceData) -> UAEPurposeCodeResponse:
     """Convert raw code dict to response schema."""
     category_code = code_data.get("category", "OTH")
     return UAEPurposeCodeResponse(
@@ -29,14 +29,45 @@ def _code_to_response(code_data: dict) -> UAEPurposeCodeResponse:
         name=code_data["name"],
         description=code_data.get("description"),
         category_code=category_code,
-        category_name=UAE_PPC_CATEGORIES.get(category_code, "Other"),
+        category_name=ref.categories.get(category_code, "Other"),
         applies_to_domestic=code_data.get("domestic", False),
         applies_to_offshore=code_data.get("offshore", True),
         requires_lei=code_data.get("requires_lei", False),
-        lei_threshold_aed=1_000_000 if code_data.get("requires_lei") else None,
+        lei_threshold_aed=int(ref.lei_threshold_aed) if code_data.get("requires_lei") else None,
+    )
+
+
+def _cached_code_response(code_data: Mapping, ref: ReferenceData) -> UAEPurposeCodeResponse:
+    return _response_cache.get(
+        ref, ("code", code_data["code"]), lambda: _code_to_response(code_data, ref)
     )
 
 
+def _search_index(ref: ReferenceData) -> Dict[str, Tuple[str, str]]:
+    """Lower-cased (code, name) per purpose code for substring search."""
+    return _response_cache.get(
+        ref,
+        "search_index",
+        lambda: {c["code"]: (c["code"].lower(), c["name"].lower()) for c in ref.purpose_codes},
+    )
+
+
+def _category_responses(ref: ReferenceData, with_description: bool = False) -> List[UAEPurposeCodeCategoryResponse]:
+    def build():
+        return [
+            UAEPurposeCodeCategoryResponse(
+                category_code=cat_code,
+                category_name=cat_name,
+                description=f"UAE Payment Purpose Codes - {cat_name}" if with_description else None,
+                is_cross_border_only=cat_code in ["FAM", "TRV", "EDU", "MED", "CHR"],
+                code_count=len(ref.codes_by_category.get(cat_code, ())),
+            )
+            for cat_code, cat_name in ref.categories.items()
+        ]
+
+    return _response_cache.get(ref, ("categories", with_description), build)
+
+
 @router.get("/", response_model=UAEPurposeCodeListResponse)
 async def list_purpose_codes(
     category: Optional[str] = Query(None, description="Filter by category code"),
@@ -47,7 +78,8 @@ async def list_purpose_codes(
     offset: int = Query(0, ge=0),
 ):
     """List UAE purpose codes with filters."""
-    filtered_codes = UAE_PURPOSE_CODES.copy()
+    ref = get_reference_data()
+    filtered_codes = list(ref.purpose_codes)
 
     if category:
         category_upper = category.upper()
@@ -60,9 +92,10 @@ async def list_purpose_codes(
 
     if search:
         search_lower = search.lower()
+        index = _search_index(ref)
         filtered_codes = [
             c for c in filtered_codes
-            if search_lower in c["code"].lower() or search_lower in c["name"].lower()
+            if search_lower in index[c["code"]][0] or search_lower in index[c["code"]][1]
         ]
 
     if requires_lei is not None:
@@ -71,48 +104,33 @@ async def list_purpose_codes(
     total = len(filtered_codes)
     filtered_codes = filtered_codes[offset:offset + limit]
 
-    categories = [
-        UAEPurposeCodeCategoryResponse(
-            category_code=cat_code,
-            category_name=cat_name,
-            is_cross_border_only=cat_code in ["FAM", "TRV", "EDU", "MED", "CHR"],
-            code_count=len(CODES_BY_CATEGORY.get(cat_code, [])),
-        )
-        for cat_code, cat_name in UAE_PPC_CATEGORIES.items()
-    ]
-
     return UAEPurposeCodeListResponse(
         total=total,
         offset=offset,
         limit=limit,
-        codes=[_code_to_response(c) for c in filtered_codes],
-        categories=categories,
+        codes=[_cached_code_response(c, ref) for c in filtered_codes],
+        categories=_category_responses(ref),
     )
 
 
 @router.get("/static", response_model=UAEPurposeCodeBulkResponse)
 async def get_static_codes():
     """Get all 117 UAE purpose codes grouped by category."""
-    categories = [
-        UAEPurposeCodeCategoryResponse(
-            category_code=code,
-            category_name=name,
-            is_cross_border_only=code in ["FAM", "TRV", "EDU", "MED", "CHR"],
-            code_count=len(CODES_BY_CATEGORY.get(code, [])),
-        )
-        for code, name in UAE_PPC_CATEGORIES.items()
-    ]
+    ref = get_reference_data()
+    return _response_cache.get(ref, "static", lambda: _build_static_response(ref))
 
+
+def _build_static_response(ref: ReferenceData) -> UAEPurposeCodeBulkResponse:
     codes_by_category = {}
-    for cat_code in UAE_PPC_CATEGORIES.keys():
-        cat_codes = CODES_BY_CATEGORY.get(cat_code, [])
+    for cat_code in ref.categories.keys():
+        cat_codes = ref.codes_by_category.get(cat_code, ())
         if cat_codes:
             codes_by_category[cat_code] = [
                 {
                     "code": c["code"],
                     "name": c["name"],
                     "category_code": c.get("category", "OTH"),
-                    "category_name": UAE_PPC_CATEGORIES.get(c.get("category", "OTH"), "Other"),
+                    "category_name": ref.categories.get(c.get("category", "OTH"), "Other"),
                     "applies_to_domestic": c.get("domestic", False),
                     "applies_to_offshore": c.get("offshore", True),
                     "requires_lei": c.get("requires_lei", False),
@@ -122,9 +140,9 @@ async def get_static_codes():
             ]
 
     return UAEPurposeCodeBulkResponse(
-        total_codes=len(UAE_PURPOSE_CODES),
-        total_categories=len(UAE_PPC_CATEGORIES),
-        categories=categories,
+        total_codes=len(ref.purpose_codes),
+        total_categories=len(ref.categories),
+        categories=_category_responses(ref),
         codes_by_category=codes_by_category,
     )
 
@@ -132,24 +150,37 @@ async def get_static_codes():
 @router.get("/categories", response_model=List[UAEPurposeCodeCategoryResponse])
 async def list_categories():
     """List all UAE purpose code categories."""
-    return [
-        UAEPurposeCodeCategoryResponse(
-            category_code=cat_code,
-            category_name=cat_name,
-            description=f"UAE Payment Purpose Codes - {cat_name}",
-            is_cross_border_only=cat_code in ["FAM", "TRV", "EDU", "MED", "CHR"],
-            code_count=len(CODES_BY_CATEGORY.get(cat_code, [])),
-        )
-        for cat_code, cat_name in UAE_PPC_CATEGORIES.items()
-    ]
+    return _category_responses(get_reference_data(), with_description=True)
+
+
+@router.get("/bop/{bop_code}", response_model=List[UAETaxonomyMapping])
+async def get_codes_by_bop(bop_code: str):
+    """UAE purpose codes mapped to an IMF BOP code (e.g. 310)."""
+    return taxonomy_index.codes_by_bop(bop_code)
+
+
+@router.get("/iso/{iso_code}", response_model=List[UAETaxonomyMapping])
+async def get_codes_by_iso(iso_code: str):
+    """UAE purpose codes mapped to an ISO 20022 purpose code (e.g. SALA)."""
+    return taxonomy_index.codes_by_iso(iso_code)
+
+
+@router.get("/{code}/taxonomy", response_model=UAETaxonomyMapping)
+async def get_code_taxonomy(code: str):
+    """ISO 20022, IMF BOP and purpose taxonomy mapping of a purpose code."""
+    mapping = taxonomy_index.get(code)
+    if mapping is None:
+        raise HTTPException(status_code=404, detail=f"No taxonomy mapping for purpose code '{code}'")
+    return mapping
 
 
 @router.get("/{code}", response_model=UAEPurposeCodeResponse)
 async def get_purpose_code(code: str):
     """Get details for a specific purpose code."""
-    code_data = PURPOSE_CODE_LOOKUP.get(code.upper())
+    ref = get_reference_data()
+    code_data = ref.purpose_code_lookup.get(code.upper())
 
     if not code_data:
         raise HTTPException(status_code=404, detail=f"Purpose code '{code}' not found")
 
-    return _code_to_response(code_data)
+    return _cached_code_response(code_data, ref)
@@ -5,8 +5,12 @@ UAE Health Check API Endpoints
 from fastapi import APIRouter
 from datetime import datetime
 
-from app.schemas import HealthResponse
-from app.constants import UAE_PURPOSE_CODES, UAE_PPC_CATEGORIES
+from app.audit import get_audit_sink
+from app.schemas import HealthResponse, UAEAuditStatus, UAESchedulerStatus
+from app.lei import lei_registry
+from app.reference import get_reference_data
+from app.fx import get_fx_rates
+from app.scheduler import scheduler
 
 router = APIRouter()
 
@@ -14,22 +18,60 @@ router = APIRouter()
 @router.get("/", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
+    ref = get_reference_data()
     return HealthResponse(
         status="healthy",
         module="uae",
         version="1.0.0",
+        data_version=ref.version,
         timestamp=datetime.utcnow(),
         config={
-            "total_purpose_codes": len(UAE_PURPOSE_CODES),
-            "total_categories": len(UAE_PPC_CATEGORIES),
+            "total_purpose_codes": len(ref.purpose_codes),
+            "total_categories": len(ref.categories),
+            "total_banks": len(ref.bank_codes),
+            "reference_data_source": ref.source,
+            "reference_data_label": ref.label,
             "uaefts_version": "AUX700 V2018-001-01",
             "regulatory_body": "Central Bank of UAE",
+            "gleif_index_records": lei_registry.record_count,
+            "fx_rate_date": get_fx_rates().latest.rate_date,
         },
         features=[
             "purpose_code_validation",
             "iban_validation",
             "lei_validation",
+            "lei_checksum_validation",
+            "bic_iban_cross_check",
+            "hot_reload_reference_data",
+            "currency_aware_thresholds",
+            "tenant_profiles",
+            "duplicate_detection",
+            "structuring_detection",
+            "prescreen_mode",
+            "idempotency_keys",
+            "background_jobs",
+            "admission_control",
+            "audit_log",
+            "purpose_code_translation",
+            "corridor_profiles",
+            "bop_reporting",
+            "return_diagnosis",
             "stp_scoring",
             "penalty_assessment",
         ],
     )
+
+
+@router.get("/scheduler", response_model=UAESchedulerStatus)
+async def scheduler_status():
+    """Admission control: slots, queue depth and shed requests per priority class."""
+    return UAESchedulerStatus(**scheduler.snapshot())
+
+
+@router.get("/audit", response_model=UAEAuditStatus)
+async def audit_status():
+    """Audit log: queued, written and fsynced decisions, current segment."""
+    sink = get_audit_sink()
+    if sink is None:
+        return UAEAuditStatus(enabled=False)
+    return UAEAuditStatus(enabled=True, **sink.stats())
@@ -0,0 +1,90 @@
+"""
+UAE Validation API - fast request ingress
+Decode JSON bodies straight into request models in one pydantic-core pass.
+
+FastAPI's default body handling parses JSON with the json module, then
+validates the resulting dicts field by field. Here the raw body goes to a
+TypeAdapter compiled once at import (validate_json), so parsing and
+validation happen together. Invalid bodies are re-decoded the classic way
+so the 422 response is exactly what FastAPI would have produced.
+
+Responses can likewise be serialised by a precompiled adapter straight to
+bytes, skipping jsonable_encoder and response_model re-validation.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Type, Union
+
+from fastapi import Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas import UAEValidationMinimalResponse, UAEValidationRequest, UAEValidationResponse
+
+VALIDATION_REQUEST = TypeAdapter(UAEValidationRequest)
+VALIDATION_REQUEST_LIST = TypeAdapter(List[UAEValidationRequest])
+VALIDATION_RESPONSE_LIST = TypeAdapter(List[Union[UAEValidationResponse, UAEValidationMinimalResponse]])
+
+
+def _classic_decode(adapter: TypeAdapter, body: bytes) -> Any:
+    """
+    Decode the way FastAPI does (json module, then Python-mode validation).
+
+    Only used once the fast path has failed, so error messages and types
+    match FastAPI's exactly (JSON-mode validation words some errors differently).
+    """
+    try:
+        data = json.loads(body)
+    except json.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [{
+                "type": "json_invalid",
+                "loc": ("body", exc.pos),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": exc.msg},
+            }],
+            body=exc.doc,
+        ) from None
+    try:
+        return adapter.validate_python(data, from_attributes=True)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)],
+            body=data,
+        ) from None
+
+
+def decode(adapter: TypeAdapter, body: bytes) -> Any:
+    """Decode and validate a raw JSON body, raising FastAPI's 422 error."""
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    try:
+        return adapter.validate_json(body)
+    except ValidationError:
+        return _classic_decode(adapter, body)
+
+
+def encode(value: Any, adapter: Optional[TypeAdapter] = None) -> bytes:
+    """Serialise a model (or a value via adapter) to JSON bytes."""
+    return adapter.dump_json(value) if adapter is not None else value.model_dump_json().encode()
+
+
+def json_response(content: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Response for already-serialised JSON bytes."""
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def request_body_schema(model: Type[UAEValidationRequest], many: bool = False) -> Dict[str, Any]:
+    """openapi_extra documenting a body decoded by these dependencies."""
+    schema: Dict[str, Any] = model.model_json_schema()
+    if many:
+        schema = {"type": "array", "items": schema}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
@@ -0,0 +1,167 @@
+"""
+UAE Batch Job API Endpoints
+Submit large payment files for background validation, poll progress and
+page through the results.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+
+from app.api.admission import admit
+from app.constants import UAE_JOB_MAX_PAGE_SIZE, UAE_JOB_PAGE_SIZE, UAE_JOB_RETRY_AFTER_SECONDS, UAE_TENANT_HEADER
+from app.jobs import Job, JobLimitExceeded, JobNotFinished, job_manager
+from app.results import CSV_COLUMNS, ResultReader
+from app.scheduler import scheduler
+from app.schemas import DetailLevel, UAEJobListResponse, UAEJobResponse
+from app.tenants import UnknownTenantProfile
+
+router = APIRouter()
+
+CSV_HEADER = (",".join(CSV_COLUMNS) + "\n").encode()
+
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+
+
+def _job_response(job: Job) -> UAEJobResponse:
+    snapshot = job.snapshot()
+    for field in ("created_at", "started_at", "finished_at"):
+        snapshot[field] = _timestamp(snapshot[field])
+    return UAEJobResponse(**snapshot)
+
+
+def _get_job(job_id: str) -> Job:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@router.post("/", response_model=UAEJobResponse, status_code=202)
+def submit_job(
+    http_request: Request,
+    file: UploadFile = File(..., description="pacs.008 XML or concatenated MT103 file"),
+    file_format: str = Query("pacs008", alias="format", pattern="^(pacs008|mt103)$"),
+    transaction_direction: str = Query("outbound", pattern="^(inbound|outbound)$"),
+    detail: DetailLevel = Query("full", description="Response detail level stored per transaction"),
+):
+    """
+    Queue a payment file for background validation.
+
+    Returns 202 with the job ID straight away; poll GET /{job_id} for
+    progress. Returns 429 when too many jobs are already queued or running,
+    or when the client exceeds its rate limit for the jobs priority class.
+    X-Tenant-Profile applies as for /validate-batch (400 if not configured).
+    """
+    admit(http_request, "jobs")
+    tenant = http_request.headers.get(UAE_TENANT_HEADER) or None
+    try:
+        # Copying the upload and counting its rows takes a jobs class slot
+        with scheduler.hold_sync("jobs"):
+            job = job_manager.submit(file.file, file_format, transaction_direction, detail, tenant)
+    except UnknownTenantProfile as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except JobLimitExceeded as exc:
+        raise HTTPException(
+            status_code=429,
+            detail=str(exc),
+            headers={"Retry-After": str(UAE_JOB_RETRY_AFTER_SECONDS)},
+        )
+    return _job_response(job)
+
+
+@router.get("/", response_model=UAEJobListResponse)
+async def list_jobs():
+    """Queued, running and retained finished jobs, newest first."""
+    return UAEJobListResponse(jobs=[_job_response(job) for job in job_manager.jobs()])
+
+
+@router.get("/{job_id}", response_model=UAEJobResponse)
+async def get_job(job_id: str):
+    """Job status with rows done, rows/sec and an ETA while running."""
+    return _job_response(_get_job(job_id))
+
+
+@router.post("/{job_id}/cancel", response_model=UAEJobResponse)
+async def cancel_job(job_id: str):
+    """
+    Cancel a job.
+
+    A queued job never starts; a running job stops within a few hundred
+    rows and keeps the results written so far.
+    """
+    job = _get_job(job_id)
+    job_manager.cancel(job)
+    return _job_response(job)
+
+
+def _results(job_id: str) -> Optional[ResultReader]:
+    try:
+        return _get_job(job_id).results()
+    except JobNotFinished as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+
+@router.get("/{job_id}/results", response_model=None)
+def get_job_results(
+    job_id: str,
+    offset: int = Query(0, ge=0, description="Row to start from (next_offset of the previous page)"),
+    limit: int = Query(UAE_JOB_PAGE_SIZE, ge=1, le=UAE_JOB_MAX_PAGE_SIZE),
+    stp_rating: Optional[str] = Query(None, pattern="^(high|medium|low)$"),
+    rule_code: Optional[str] = Query(None, description="Only rows on which this rule failed"),
+    uaefts_compliant: Optional[bool] = Query(None),
+):
+    """
+    One page of per-transaction results of a finished job.
+
+    Each result is the NDJSON line the bulk CLI writes (index, reference and
+    response or error). Filters are answered from the store's columns;
+    next_offset is null on the last page.
+    """
+    results = _results(job_id)
+    total, lines, next_offset = 0, [], None
+    if results is not None:
+        total = results.rows
+        lines, next_offset = results.page(
+            offset, limit, stp_rating=stp_rating, rule_code=rule_code, uaefts_compliant=uaefts_compliant,
+        )
+
+    # Stored lines are already JSON; splice them in without re-parsing
+    content = b"".join((
+        f'{{"job_id": "{job_id}", "total": {total}, "offset": {offset}, '
+        f'"next_offset": {"null" if next_offset is None else next_offset}, "results": ['.encode(),
+        b", ".join(lines),
+        b"]}",
+    ))
+    return Response(content=content, media_type="application/json")
+
+
+@router.get("/{job_id}/export", response_model=None)
+def export_job_results(
+    job_id: str,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    stp_rating: Optional[str] = Query(None, pattern="^(high|medium|low)$"),
+    rule_code: Optional[str] = Query(None),
+    uaefts_compliant: Optional[bool] = Query(None),
+):
+    """
+    Stream a finished job's results as NDJSON (stored lines) or CSV (one
+    row per transaction: score, rating, compliance, failing rules).
+    """
+    results = _results(job_id)
+    filters = {"stp_rating": stp_rating, "rule_code": rule_code, "uaefts_compliant": uaefts_compliant}
+    if export_format == "csv":
+        body = results.export_csv(**filters) if results is not None else iter([CSV_HEADER])
+        media_type = "text/csv"
+    else:
+        body = results.export_ndjson(**filters) if results is not None else iter([])
+        media_type = "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{job_id}.{export_format}"'},
+    )
@@ -0,0 +1,68 @@
+"""
+UAE LEI Lookup API Endpoints
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from app.schemas import UAELEILookupResponse, UAELEIIndexResponse
+from app.lei import lei_checksum_valid, lei_registry
+
+router = APIRouter()
+
+
+def _index_status() -> UAELEIIndexResponse:
+    return UAELEIIndexResponse(
+        available=lei_registry.available,
+        index_path=lei_registry.index_path,
+        record_count=lei_registry.record_count,
+    )
+
+
+@router.get("/index", response_model=UAELEIIndexResponse)
+async def get_index_status():
+    """Status of the local GLEIF golden-copy index."""
+    return _index_status()
+
+
+@router.post("/index/rebuild", response_model=UAELEIIndexResponse)
+def rebuild_index():
+    """
+    Rebuild the GLEIF index from the configured source file.
+
+    The new index is swapped in atomically; in-flight validations finish
+    against the previous index. Other workers pick it up via /index/reload.
+    """
+    try:
+        lei_registry.rebuild()
+    except (ValueError, OSError) as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return _index_status()
+
+
+@router.post("/index/reload", response_model=UAELEIIndexResponse)
+def reload_index():
+    """Re-open the GLEIF index file after it was rebuilt by another worker."""
+    try:
+        lei_registry.reload()
+    except (ValueError, OSError) as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return _index_status()
+
+
+@router.get("/{lei}", response_model=UAELEILookupResponse)
+async def lookup_lei(lei: str):
+    """Check LEI check digits and, if an index is loaded, its GLEIF status."""
+    lei = lei.upper()
+    checksum_valid = lei_checksum_valid(lei)
+
+    if not checksum_valid or not lei_registry.available:
+        return UAELEILookupResponse(lei=lei, checksum_valid=checksum_valid)
+
+    record = lei_registry.lookup(lei)
+    return UAELEILookupResponse(
+        lei=lei,
+        checksum_valid=checksum_valid,
+        found=record is not None,
+        entity_status=record["entity_status"] if record else None,
+        registration_status=record["registration_status"] if record else None,
+    )
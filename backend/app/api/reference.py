@@ -0,0 +1,149 @@
+"""
+UAE Reference Data API Endpoints
+"""
+
+import json
+
+from fastapi import APIRouter, HTTPException
+
+from app.schemas import (
+    UAEReferenceDataResponse,
+    UAEFXRatesResponse,
+    UAETenantProfileRequest,
+    UAETenantProfileResponse,
+    UAETenantProfilesResponse,
+)
+from app.reference import ReferenceData, get_reference_data, reload_reference_data
+from app.fx import FXRateTable, get_fx_rates, reload_fx_rates
+from app.tenants import TenantProfile, reload_tenant_profiles, tenant_profiles
+
+router = APIRouter()
+
+
+def _to_response(ref: ReferenceData) -> UAEReferenceDataResponse:
+    return UAEReferenceDataResponse(
+        version=ref.version,
+        label=ref.label,
+        source=ref.source,
+        total_purpose_codes=len(ref.purpose_codes),
+        total_categories=len(ref.categories),
+        total_banks=len(ref.bank_codes),
+        lei_threshold_aed=ref.lei_threshold_aed,
+        high_value_threshold_aed=ref.high_value_threshold_aed,
+        penalty_per_violation_aed=ref.penalty_per_violation_aed,
+    )
+
+
+def _fx_to_response(table: FXRateTable) -> UAEFXRatesResponse:
+    return UAEFXRatesResponse(
+        source=table.source,
+        rate_date=table.latest.rate_date,
+        rate_dates=sorted(table.snapshots),
+        rates=dict(table.latest.rates),
+    )
+
+
+def _tenant_to_response(profile: TenantProfile) -> UAETenantProfileResponse:
+    plan = tenant_profiles.plan(profile.name, get_reference_data())
+    return UAETenantProfileResponse(
+        name=profile.name,
+        version=profile.version,
+        label=profile.label,
+        data_version=plan.ref.version,
+        lei_threshold_aed=plan.ref.lei_threshold_aed,
+        high_value_threshold_aed=plan.ref.high_value_threshold_aed,
+        penalty_per_violation_aed=plan.ref.penalty_per_violation_aed,
+        disabled_rules=sorted(plan.disabled),
+    )
+
+
+def _tenants_to_response() -> UAETenantProfilesResponse:
+    return UAETenantProfilesResponse(
+        source=tenant_profiles.source,
+        profiles=[_tenant_to_response(p) for _, p in sorted(tenant_profiles.profiles().items())],
+    )
+
+
+@router.get("/", response_model=UAEReferenceDataResponse)
+async def get_reference():
+    """Current reference data version and thresholds."""
+    return _to_response(get_reference_data())
+
+
+@router.post("/reload", response_model=UAEReferenceDataResponse)
+def reload_reference():
+    """
+    Reload reference data from UAE_REFERENCE_DATA_PATH and swap it in.
+
+    In-flight validations finish on the previous version. An invalid file
+    leaves the current data in place.
+    """
+    try:
+        ref = reload_reference_data()
+    except (OSError, ValueError, KeyError, TypeError, json.JSONDecodeError) as exc:
+        raise HTTPException(status_code=409, detail=f"Reference data not reloaded: {exc}")
+    return _to_response(ref)
+
+
+@router.get("/fx", response_model=UAEFXRatesResponse)
+async def get_fx():
+    """Current FX rates used for AED threshold equivalents."""
+    return _fx_to_response(get_fx_rates())
+
+
+@router.post("/fx/reload", response_model=UAEFXRatesResponse)
+def reload_fx():
+    """Reload FX rates from UAE_FX_RATES_PATH and swap them in."""
+    try:
+        table = reload_fx_rates()
+    except (OSError, ValueError, KeyError, TypeError, json.JSONDecodeError) as exc:
+        raise HTTPException(status_code=409, detail=f"FX rates not reloaded: {exc}")
+    return _fx_to_response(table)
+
+
+@router.get("/tenants", response_model=UAETenantProfilesResponse)
+async def get_tenants():
+    """Tenant profiles with their effective thresholds and disabled rules."""
+    return _tenants_to_response()
+
+
+@router.get("/tenants/{name}", response_model=UAETenantProfileResponse)
+async def get_tenant(name: str):
+    """One tenant profile."""
+    profile = tenant_profiles.profiles().get(name)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Tenant profile not found: {name}")
+    return _tenant_to_response(profile)
+
+
+@router.put("/tenants/{name}", response_model=UAETenantProfileResponse)
+def put_tenant(name: str, request: UAETenantProfileRequest):
+    """
+    Add or replace a tenant profile in this process.
+
+    The profile's compiled plan is dropped; the next request for the tenant
+    compiles the new one. Not written back to UAE_TENANT_PROFILES_PATH.
+    """
+    raw = request.model_dump(exclude_none=True)
+    raw["thresholds"] = request.thresholds.model_dump(exclude_none=True)
+    try:
+        profile = TenantProfile.from_dict(name, raw)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    tenant_profiles.set_profile(profile)
+    return _tenant_to_response(profile)
+
+
+@router.post("/tenants/reload", response_model=UAETenantProfilesResponse)
+def reload_tenants():
+    """
+    Reload tenant profiles from UAE_TENANT_PROFILES_PATH.
+
+    Plans of changed or removed profiles are dropped. An invalid file
+    leaves the current profiles in place.
+    """
+    try:
+        reload_tenant_profiles()
+    except (OSError, ValueError, KeyError, TypeError, json.JSONDecodeError) as exc:
+        raise HTTPException(status_code=409, detail=f"Tenant profiles not reloaded: {exc}")
+    return _tenants_to_response()
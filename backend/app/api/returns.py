@@ -0,0 +1,81 @@
+"""
+UAE Returned-Payment API Endpoints
+Diagnose returned payments (AC01, NARR, LEIR, ...) against the validation
+rules: likely root cause and a corrected field set per payment.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, File, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from app.api.admission import admit, run_held
+from app.api.ingress import decode, encode, json_response, request_body_schema
+from app.constants import UAE_RETURN_REASONS, UAE_SCHEDULER_CHUNK_SIZE
+from app.reference import ReferenceData, get_reference_data
+from app.returns import ReturnDiagnosisEngine
+from app.scheduler import scheduler
+from app.schemas import UAEReturnDiagnosis, UAEReturnedPayment
+
+router = APIRouter()
+
+diagnosis_engine = ReturnDiagnosisEngine()
+
+RETURNED_PAYMENT_LIST = TypeAdapter(List[UAEReturnedPayment])
+RETURN_DIAGNOSIS_LIST = TypeAdapter(List[UAEReturnDiagnosis])
+
+
+@router.get("/reasons")
+async def list_return_reasons():
+    """Supported return reason codes with the rules and fields each one points at."""
+    return UAE_RETURN_REASONS
+
+
+@router.post(
+    "/diagnose",
+    response_model=List[UAEReturnDiagnosis],
+    openapi_extra=request_body_schema(UAEReturnedPayment, many=True),
+)
+async def diagnose_returns(http_request: Request):
+    """
+    Diagnose a list of returned payments.
+
+    Each original transaction is re-validated and its failing rules are
+    matched against the return code: the best match is the root cause,
+    corrected_fields holds values to resend with (re-validated into
+    corrected_stp_score), review_fields what needs a manual check.
+
+    Runs in the batch priority class, one scheduler slot per chunk.
+    """
+    admit(http_request, "batch")
+    body = await http_request.body()
+    returns = await run_held("batch", decode, RETURNED_PAYMENT_LIST, body)
+    ref = get_reference_data()
+    parts = [
+        await run_held("batch", _diagnose_chunk, returns[i:i + UAE_SCHEDULER_CHUNK_SIZE], ref)
+        for i in range(0, len(returns), UAE_SCHEDULER_CHUNK_SIZE)
+    ]
+    return json_response(b"[" + b",".join(parts) + b"]")
+
+
+def _diagnose_chunk(returns: List[UAEReturnedPayment], ref: ReferenceData) -> bytes:
+    """Diagnose a chunk and encode it as JSON array items (no brackets)."""
+    return encode(diagnosis_engine.diagnose_batch(returns, ref), RETURN_DIAGNOSIS_LIST)[1:-1]
+
+
+@router.post("/diagnose-file", response_model=None)
+def diagnose_returns_file(
+    http_request: Request,
+    file: UploadFile = File(..., description="NDJSON file, one UAEReturnedPayment per line"),
+):
+    """
+    Diagnose a bulk file of returned payments.
+
+    Results are streamed back as NDJSON in input order, one line per
+    payment; lines that cannot be read give {"line": n, "error": ...}.
+    Runs in the batch priority class, one scheduler slot per chunk.
+    """
+    admit(http_request, "batch")
+    lines = diagnosis_engine.diagnose_ndjson(file.file, batch_size=UAE_SCHEDULER_CHUNK_SIZE)
+    return StreamingResponse(scheduler.paced(lines, "batch"), media_type="application/x-ndjson")
@@ -0,0 +1,108 @@
+"""
+UAE Purpose Code Translation API Endpoints
+Re-code purpose codes between UAE and India, Pakistan, Philippines,
+Bangladesh and Egypt via ISO 20022.
+"""
+
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
+
+from app.api.ingress import decode, request_body_schema
+from app.corridors import CORRIDOR_PROFILES, CODE_BITS, CorridorProfile
+from app.schemas import (
+    Market,
+    UAECorridorCode,
+    UAECorridorProfileResponse,
+    UAETranslateBatchRequest,
+    UAETranslationResponse,
+)
+from app.translation import translation_index
+
+router = APIRouter()
+
+TRANSLATE_BATCH_REQUEST = TypeAdapter(UAETranslateBatchRequest)
+
+
+@router.get("/translate", response_model=UAETranslationResponse)
+async def translate_code(
+    code: str = Query(..., description="Purpose code in the source market"),
+    source_market: Market = Query("AE"),
+    target_market: Market = Query(...),
+):
+    """
+    Translate one purpose code, e.g. UAE FAM -> Pakistan 9302/9304/9702.
+
+    Target codes are ranked by the confidence of their own ISO mapping.
+    """
+    if source_market == target_market:
+        raise HTTPException(status_code=400, detail="source_market and target_market must differ")
+    translation = translation_index.translate(code, source_market, target_market)
+    if translation is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No {target_market} translation for {source_market} purpose code '{code}'",
+        )
+    return translation
+
+
+@router.post(
+    "/translate-batch",
+    response_model=None,
+    openapi_extra=request_body_schema(UAETranslateBatchRequest),
+)
+async def translate_batch(http_request: Request):
+    """
+    Re-code a list of purpose codes from one market into another.
+
+    Each result is a compact UAETranslationBatchItem (found, iso_code,
+    confidence, ranked target codes), in request order. Every translation
+    is a single precomputed lookup, so batches of millions of codes are
+    bound by request decoding and response size. Group corridor payments
+    by market pair, one request per pair.
+    """
+    request = decode(TRANSLATE_BATCH_REQUEST, await http_request.body())
+    if request.source_market == request.target_market:
+        raise HTTPException(status_code=400, detail="source_market and target_market must differ")
+
+    items = translation_index.translate_batch_json(request.codes, request.source_market, request.target_market)
+    content = b"".join((
+        f'{{"source_market": "{request.source_market}", "target_market": "{request.target_market}", '
+        f'"total": {len(items)}, "results": ['.encode(),
+        b", ".join(items),
+        b"]}",
+    ))
+    return Response(content=content, media_type="application/json")
+
+
+def _corridor_response(profile: CorridorProfile) -> UAECorridorProfileResponse:
+    return UAECorridorProfileResponse(
+        market=profile.market,
+        name=profile.name,
+        currency=profile.currency,
+        complexity=profile.complexity,
+        allowed_codes=[
+            UAECorridorCode(
+                code=code,
+                confidence=profile.confidence[CODE_BITS[code]],
+                target_codes=list(profile.targets[CODE_BITS[code]]),
+            )
+            for code in profile.allowed_codes
+        ],
+    )
+
+
+@router.get("/corridors", response_model=List[UAECorridorProfileResponse])
+async def list_corridors():
+    """Corridor profiles used by the destination_market validation check."""
+    return [_corridor_response(profile) for profile in CORRIDOR_PROFILES.values()]
+
+
+@router.get("/corridors/{market}", response_model=UAECorridorProfileResponse)
+async def get_corridor(market: str):
+    """UAE purpose codes expected on payments to one destination market."""
+    profile = CORRIDOR_PROFILES.get(market.upper())
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Corridor not found: {market}")
+    return _corridor_response(profile)
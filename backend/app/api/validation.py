@@ -2,25 +2,135 @@
 UAE Validation API Endpoints
 """
 
-from fastapi import APIRouter
+import hashlib
+import json
+import xml.etree.ElementTree as ET
+from typing import Awaitable, Callable, List, Optional, Union
+
+from fastapi import APIRouter, File, HTTPException, Query, Request, UploadFile
+from fastapi.responses import StreamingResponse
 
 from app.schemas import (
     UAEValidationRequest,
     UAEValidationResponse,
     UAEIBANValidationRequest,
     UAEIBANValidationResponse,
+    UAEValidationMinimalResponse,
+    UAEPrescreenResponse,
+    UAEBatchSummaryResponse,
+    DetailLevel,
+    ValidationMode,
 )
+from app.aggregate import BatchAggregate, aggregate_batch
+from app.audit import get_audit_sink
+from app.constants import UAE_IDEMPOTENCY_KEY_MAX_LENGTH, UAE_SCHEDULER_CHUNK_SIZE, UAE_TENANT_HEADER
+from app.idempotency import IdempotencyCache, IdempotencyConflict, default_store
+from app.reference import ReferenceData, get_reference_data
+from app.scheduler import scheduler
+from app.taxonomy import TaxonomyReport
+from app.tenants import UnknownTenantProfile, tenant_profiles
 from app.validators import UAEValidationEngine, UAEIBANValidator
+from app.duplicates import DuplicateDetectionStage
+from app.velocity import VelocityStage
+from app.api.admission import admit, client_id, run_held
+from app.api.ingress import (
+    VALIDATION_REQUEST,
+    VALIDATION_REQUEST_LIST,
+    VALIDATION_RESPONSE_LIST,
+    decode,
+    encode,
+    json_response,
+    request_body_schema,
+)
+from app.ingest.base import aggregate_transactions, to_ndjson_line, validate_transactions
+from app.ingest.pacs008 import iter_pacs008
 
 router = APIRouter()
 
-# Singleton instances (stateless, safe to reuse)
-validator = UAEValidationEngine()
+# Singleton instances, safe to reuse. The duplicate and velocity stages keep
+# fixed-size state shared by /validate calls and uploaded files; decisions
+# go to the audit log when UAE_AUDIT_DIR is set.
+validator = UAEValidationEngine(stages=[DuplicateDetectionStage(), VelocityStage()], audit=get_audit_sink())
 iban_validator = UAEIBANValidator()
+idempotency = IdempotencyCache(default_store())
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+ValidationResponse = Union[UAEValidationResponse, UAEValidationMinimalResponse, UAEPrescreenResponse]
+
+TAXONOMY_QUERY = Query(False, description="Also total counts and AED amounts per IMF BOP and ISO 20022 code")
+
+DETAIL_QUERY = Query(
+    "full",
+    description="minimal: score and failing rule codes; errors_only: failing results only; full: everything",
+)
+
+MODE_QUERY = Query(
+    "full",
+    description="prescreen: stop at the first error and return only the verdict (no STP score, detail ignored)",
+)
+
+
+def _tenant(http_request: Request) -> Optional[str]:
+    """Tenant profile named by the header (400 if it is not configured)."""
+    tenant = http_request.headers.get(UAE_TENANT_HEADER)
+    if tenant and tenant not in tenant_profiles:
+        raise HTTPException(status_code=400, detail=f"Unknown tenant profile '{tenant}'")
+    return tenant or None
 
 
-@router.post("/validate", response_model=UAEValidationResponse)
-async def validate_uae_transaction(request: UAEValidationRequest):
+async def _respond(http_request: Request, body: bytes, compute: Callable[[], Awaitable[bytes]]):
+    """
+    Run compute() and return its JSON bytes.
+
+    With an Idempotency-Key header the response is stored and replayed for
+    retries of the same request (marked Idempotent-Replayed: true). Keys are
+    scoped by client (client_id: the address, or a trusted client header), so
+    clients never share stored responses.
+    """
+    async def checked() -> bytes:
+        try:
+            return await compute()
+        except UnknownTenantProfile as exc:
+            # Named in a transaction's tenant_profile field
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    key = http_request.headers.get(IDEMPOTENCY_KEY_HEADER)
+    if key is None:
+        return json_response(await checked())
+    if not key or len(key) > UAE_IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{IDEMPOTENCY_KEY_HEADER} must be 1-{UAE_IDEMPOTENCY_KEY_MAX_LENGTH} characters",
+        )
+
+    url = http_request.url
+    scope = f"{url.path}?{url.query}\n"
+    tenant = http_request.headers.get(UAE_TENANT_HEADER)
+    if tenant:
+        # The tenant header changes the outcome as much as the query does
+        scope += f"{UAE_TENANT_HEADER}: {tenant}\n"
+    request_hash = hashlib.sha256(scope.encode() + body).hexdigest()
+    # Header values cannot contain newlines, so the parts cannot run together
+    scoped_key = f"{client_id(http_request)}\n{url.path}\n{key}"
+    try:
+        content, replayed = await idempotency.run(scoped_key, request_hash, checked)
+    except IdempotencyConflict as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return json_response(content, {"Idempotent-Replayed": "true"} if replayed else None)
+
+
+@router.post(
+    "/validate",
+    response_model=ValidationResponse,
+    openapi_extra=request_body_schema(UAEValidationRequest),
+)
+async def validate_uae_transaction(
+    http_request: Request,
+    detail: DetailLevel = DETAIL_QUERY,
+    mode: ValidationMode = MODE_QUERY,
+):
     """
     Validate a UAE payment transaction against UAEFTS AUX700 rules.
 
@@ -30,8 +140,31 @@ async def validate_uae_transaction(request: UAEValidationRequest):
     - LEI requirements for high-value transactions (>= AED 1,000,000)
     - STP score calculation
     - Penalty risk assessment
+
+    The UAEValidationRequest body is decoded, and the response encoded, in
+    single compiled passes (see app.api.ingress). Send an Idempotency-Key
+    header to have retries replay the original response.
+
+    With mode=prescreen the rules run cheapest first and stop at the first
+    error; the response is only the verdict and the failing rule, for
+    upstream gating.
+
+    The X-Tenant-Profile header (or the tenant_profile field) selects the
+    tenant's thresholds, penalty and enabled rules (see app.tenants).
+
+    Runs in the interactive priority class: returns 429 with Retry-After
+    when the client's rate limit or the queue depth is exceeded.
     """
-    return validator.validate(request)
+    admit(http_request, "interactive")
+    tenant = _tenant(http_request)
+    body = await http_request.body()
+
+    async def compute() -> bytes:
+        async with scheduler.hold("interactive"):
+            request = decode(VALIDATION_REQUEST, body)
+            return encode(validator.validate(request, detail=detail, mode=mode, tenant=tenant))
+
+    return await _respond(http_request, body, compute)
 
 
 @router.post("/validate-iban", response_model=UAEIBANValidationResponse)
@@ -54,3 +187,113 @@ async def validate_iban(request: UAEIBANValidationRequest):
         check_digits=result.get("check_digits"),
         error_message=result.get("error_message"),
     )
+
+
+@router.post(
+    "/validate-batch",
+    response_model=Union[List[ValidationResponse], UAEBatchSummaryResponse],
+    openapi_extra=request_body_schema(UAEValidationRequest, many=True),
+)
+async def validate_batch(
+    http_request: Request,
+    aggregate: bool = Query(False, description="Return only batch totals"),
+    taxonomy: bool = TAXONOMY_QUERY,
+    detail: DetailLevel = DETAIL_QUERY,
+):
+    """
+    Validate a list of transactions against one reference data snapshot.
+
+    With aggregate=true no per-transaction response is built; only the
+    batch summary (STP histogram, penalty total, failures per rule) is
+    returned, plus the BOP/ISO taxonomy report with taxonomy=true.
+    Idempotency-Key and X-Tenant-Profile are supported as for /validate;
+    a transaction's tenant_profile field overrides the header.
+
+    Runs in the batch priority class, one scheduler slot per chunk of
+    transactions, so concurrent /validate calls are served between chunks.
+    """
+    if taxonomy and not aggregate:
+        raise HTTPException(status_code=400, detail="taxonomy=true requires aggregate=true")
+    admit(http_request, "batch")
+    tenant = _tenant(http_request)
+    body = await http_request.body()
+
+    async def compute() -> bytes:
+        requests = await run_held("batch", decode, VALIDATION_REQUEST_LIST, body)
+        chunks = [requests[i:i + UAE_SCHEDULER_CHUNK_SIZE] for i in range(0, len(requests), UAE_SCHEDULER_CHUNK_SIZE)]
+        if aggregate:
+            totals = BatchAggregate(taxonomy=TaxonomyReport() if taxonomy else None, tenant=tenant)
+            for chunk in chunks:
+                await run_held("batch", aggregate_batch, validator, chunk, totals, tenant)
+            return encode(totals.to_response())
+        ref = get_reference_data()
+        parts = [await run_held("batch", _validate_chunk, chunk, ref, detail, tenant) for chunk in chunks]
+        return b"[" + b",".join(parts) + b"]"
+
+    return await _respond(http_request, body, compute)
+
+
+def _validate_chunk(
+    requests: List[UAEValidationRequest], ref: ReferenceData, detail: DetailLevel, tenant: Optional[str]
+) -> bytes:
+    """Validate a chunk and encode its responses as JSON array items (no brackets)."""
+    return encode(validator.validate_batch(requests, ref, detail, tenant), VALIDATION_RESPONSE_LIST)[1:-1]
+
+
+@router.post("/validate-pacs008", response_model=None)
+def validate_pacs008_file(
+    http_request: Request,
+    file: UploadFile = File(..., description="ISO 20022 pacs.008 XML file"),
+    transaction_direction: str = Query("outbound", pattern="^(inbound|outbound)$"),
+    aggregate: bool = Query(False, description="Return only file totals instead of NDJSON"),
+    taxonomy: bool = TAXONOMY_QUERY,
+    detail: DetailLevel = DETAIL_QUERY,
+):
+    """
+    Validate every CdtTrfTxInf of an uploaded pacs.008 file.
+
+    The file is parsed incrementally and results are streamed back as
+    NDJSON, one line per transaction, so memory stays flat for large files.
+    With aggregate=true a single UAEBatchSummaryResponse is returned instead.
+
+    With taxonomy=true the same pass also totals the file per IMF BOP and
+    ISO 20022 code: the report is the summary's taxonomy_report, or a final
+    {"taxonomy_report": ...} NDJSON line after the results.
+
+    X-Tenant-Profile applies as for /validate-batch.
+
+    Runs in the batch priority class: the file is parsed and validated one
+    chunk per scheduler slot.
+    """
+    admit(http_request, "batch")
+    tenant = _tenant(http_request)
+    report = TaxonomyReport() if taxonomy else None
+    if aggregate:
+        try:
+            transactions = iter_pacs008(file.file, transaction_direction)
+            return aggregate_transactions(
+                validator,
+                transactions,
+                batch_size=UAE_SCHEDULER_CHUNK_SIZE,
+                taxonomy=report,
+                hold=lambda: scheduler.hold_sync("batch"),
+                tenant=tenant,
+            ).to_response()
+        except ET.ParseError as exc:
+            raise HTTPException(status_code=400, detail=f"Malformed pacs.008 XML: {exc}")
+
+    def lines():
+        transactions = iter_pacs008(file.file, transaction_direction)
+        try:
+            for tx, response in validate_transactions(
+                validator, transactions, batch_size=UAE_SCHEDULER_CHUNK_SIZE, detail=detail, taxonomy=report,
+                tenant=tenant,
+            ):
+                yield to_ndjson_line(tx, response)
+        except ET.ParseError as exc:
+            yield json.dumps({"error": f"Malformed pacs.008 XML: {exc}"}) + "\n"
+            return
+        if report is not None:
+            yield f'{{"taxonomy_report": {report.to_response().model_dump_json()}}}\n'
+
+    return StreamingResponse(scheduler.paced(lines(), "batch"), media_type="application/x-ndjson")
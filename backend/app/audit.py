@@ -0,0 +1,464 @@
+"""
+UAE Audit Log
+Durable, append-only record of every validation decision.
+
+UAEValidationEngine.evaluate hands each decision to the AuditSink (when
+one is configured), which encodes it into a line (a few microseconds,
+mostly cached fragments) and appends it to a bounded queue; nothing is
+written on the request path. A background writer group commits: it wakes
+once per UAE_AUDIT_COMMIT_INTERVAL_MS window (sooner when
+UAE_AUDIT_COMMIT_RECORDS are queued) and writes the whole window in one
+write() and, depending on the durability setting, one fsync:
+
+    commit    fsync after every group commit (default): a decision is on
+              disk within one window plus one fsync of being made
+    interval  fsync at most every UAE_AUDIT_FSYNC_INTERVAL_MS
+    none      leave flushing to the OS; segments are still fsynced when
+              they are closed
+
+flush() waits until everything recorded so far is written and fsynced,
+whatever the setting. When the queue is full, record() blocks until the
+writer catches up (UAE_AUDIT_ON_FULL = "block", nothing is lost) or
+counts and discards the record ("drop"). Callers on an asyncio event loop
+never block: stalling the loop would stall every request, so their
+records are dropped and counted under either setting.
+
+A batch whose write fails stays queued and is retried every
+UAE_AUDIT_RETRY_INTERVAL_MS (the error shows in stats() meanwhile); only
+a failure while closing discards it, counted as dropped.
+
+Records are compact NDJSON, one decision per line:
+
+    {"ts":1718000000.123,"session_uuid":"...","data_version":"...",
+     "stp_score":85.0,"stp_rating":"high","uaefts_compliant":true,
+     "violation_count":0,"penalty_risk_aed":0.0,"failed_rules":["..."]}
+
+With UAE_AUDIT_REQUESTS=1 each line also carries the validated request
+("request": {...}, None fields omitted), which makes the log replayable
+traffic for app.replay. Off by default: requests hold IBANs and LEIs.
+
+Segments are written as audit-<start ms>-<pid>-<seq>.ndjson.open and
+renamed to .ndjson once rotated (UAE_AUDIT_SEGMENT_BYTES or
+UAE_AUDIT_SEGMENT_SECONDS) or closed, so a segment without .open is
+complete. Every process (API, job workers) writes its own segments.
+
+Set UAE_AUDIT_DIR to enable; UAE_AUDIT_DURABILITY overrides the default.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from app.constants import (
+    UAE_AUDIT_COMMIT_INTERVAL_MS,
+    UAE_AUDIT_COMMIT_RECORDS,
+    UAE_AUDIT_DURABILITY,
+    UAE_AUDIT_FSYNC_INTERVAL_MS,
+    UAE_AUDIT_MAX_QUEUE,
+    UAE_AUDIT_ON_FULL,
+    UAE_AUDIT_RETRY_INTERVAL_MS,
+    UAE_AUDIT_SEGMENT_BYTES,
+    UAE_AUDIT_SEGMENT_SECONDS,
+)
+
+AUDIT_DIR_ENV = "UAE_AUDIT_DIR"
+AUDIT_DURABILITY_ENV = "UAE_AUDIT_DURABILITY"
+AUDIT_REQUESTS_ENV = "UAE_AUDIT_REQUESTS"
+
+DURABILITY_LEVELS = ("commit", "interval", "none")
+
+SEGMENT_SUFFIX = ".ndjson"
+OPEN_SUFFIX = ".open"
+
+# (ts, session_uuid, data_version, stp_score, stp_rating, violation_count,
+#  penalty_risk_aed, failed rule codes)
+AuditItem = Tuple[float, str, Optional[str], float, str, int, float, Tuple[str, ...]]
+
+_RECORD = (
+    '{"ts":%.3f,"session_uuid":"%s","data_version":%s,"stp_score":%r,"stp_rating":"%s",'
+    '"uaefts_compliant":%s,"violation_count":%d,"penalty_risk_aed":%r,"failed_rules":%s}\n'
+)
+
+
+def _on_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _fsync_directory(directory: str) -> None:
+    """Make renames in a directory durable (no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class AuditSink:
+    """Bounded queue of decisions plus the writer thread that commits them."""
+
+    def __init__(
+        self,
+        directory: str,
+        durability: str = UAE_AUDIT_DURABILITY,
+        max_queue: int = UAE_AUDIT_MAX_QUEUE,
+        on_full: str = UAE_AUDIT_ON_FULL,
+        segment_bytes: int = UAE_AUDIT_SEGMENT_BYTES,
+        segment_seconds: float = UAE_AUDIT_SEGMENT_SECONDS,
+        fsync_interval_ms: float = UAE_AUDIT_FSYNC_INTERVAL_MS,
+        commit_interval_ms: float = UAE_AUDIT_COMMIT_INTERVAL_MS,
+        commit_records: int = UAE_AUDIT_COMMIT_RECORDS,
+        retry_interval_ms: float = UAE_AUDIT_RETRY_INTERVAL_MS,
+        include_requests: bool = False,
+    ):
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"durability must be one of {', '.join(DURABILITY_LEVELS)}")
+        if on_full not in ("block", "drop"):
+            raise ValueError("on_full must be block or drop")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.durability = durability
+        self.max_queue = max_queue
+        self.on_full = on_full
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.fsync_interval = fsync_interval_ms / 1000
+        self.commit_interval = commit_interval_ms / 1000
+        self.commit_records = min(commit_records, max_queue)
+        self.retry_interval = retry_interval_ms / 1000
+        self.include_requests = include_requests
+
+        self._lock = threading.Lock()
+        self._has_work = threading.Condition(self._lock)  # writer waits for records
+        self._has_space = threading.Condition(self._lock)  # blocked record() calls
+        self._committed = threading.Condition(self._lock)  # flush() callers
+        self._queue: Deque[str] = deque()
+        self._closing = False
+        self._flush_requested = False
+
+        # Sequence numbers: records queued / written / written and fsynced
+        self.enqueued = 0
+        self.written = 0
+        self.synced = 0
+        self.dropped = 0
+        self.commits = 0
+        self.fsyncs = 0
+        self.segments = 0
+        self.error: Optional[str] = None
+
+        # Encoding caches (shared by request threads; plain dict/attribute
+        # updates, so a race only costs a repeated json.dumps)
+        self._rules_json: Dict[Tuple[str, ...], str] = {}
+        self._version_json: Tuple[Optional[str], str] = (None, "null")
+
+        # Writer thread state
+        self._file = None
+        self._path: Optional[str] = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._last_fsync = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    # -------------------------------------------------------------------------
+    # Request side
+    # -------------------------------------------------------------------------
+
+    def record(self, evaluation, request=None) -> None:
+        """
+        Queue one RuleEvaluation's decision and its request: a
+        UAEValidationRequest, or the PaymentFields tuple of app.engine.
+        """
+        request_json = None
+        if self.include_requests and request is not None:
+            if hasattr(request, "model_dump_json"):
+                request_json = request.model_dump_json(exclude_none=True)
+            else:
+                fields = {k: v for k, v in request._asdict().items() if v is not None}
+                request_json = json.dumps(fields, separators=(",", ":"))
+        self.submit((
+            evaluation.start_time,
+            evaluation.session_uuid,
+            evaluation.ref.version,
+            evaluation.stp_score,
+            evaluation.stp_rating,
+            evaluation.violation_count,
+            evaluation.penalty_risk,
+            tuple(r.rule_code for r in evaluation.results if not r.is_valid),
+        ), request_json)
+
+    def submit(self, item: AuditItem, request_json: Optional[str] = None) -> None:
+        """Queue one encoded decision; request_json is appended as "request"."""
+        line = self._encode(item)
+        if request_json is not None:
+            line = f'{line[:-2]},"request":{request_json}}}\n'
+        with self._lock:
+            if self._closing:
+                raise RuntimeError("audit sink is closed")
+            while len(self._queue) >= self.max_queue:
+                # Waiting on the event loop would stall every request it serves
+                if self.on_full == "drop" or _on_event_loop():
+                    self.dropped += 1
+                    return
+                self._has_work.notify()
+                self._has_space.wait()
+            self._queue.append(line)
+            self.enqueued += 1
+            # Wake the writer to open a commit window, or to close it early
+            if len(self._queue) == 1 or len(self._queue) == self.commit_records:
+                self._has_work.notify()
+
+    def _encode(self, item: AuditItem) -> str:
+        ts, session_uuid, version, score, rating, violations, penalty, rules = item
+        rules_json = self._rules_json.get(rules)
+        if rules_json is None:
+            rules_json = json.dumps(list(rules), separators=(",", ":"))
+            if len(self._rules_json) < 65_536:
+                self._rules_json[rules] = rules_json
+        version_json = self._version_json
+        if version_json[0] != version:
+            version_json = self._version_json = (version, json.dumps(version))
+        return _RECORD % (
+            ts, session_uuid, version_json[1], score, rating,
+            "true" if violations == 0 else "false", violations, penalty, rules_json,
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record queued so far is written and fsynced."""
+        with self._lock:
+            target = self.enqueued
+            if self.synced >= target:
+                return True
+            self._flush_requested = True
+            self._has_work.notify()
+            self._committed.wait_for(lambda: self.synced >= target or self.error is not None, timeout)
+            return self.synced >= target
+
+    def close(self) -> None:
+        """Commit what is queued, fsync and close the open segment."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            self._has_work.notify()
+        self._thread.join()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "durability": self.durability,
+                "queued": len(self._queue),
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "synced": self.synced,
+                "dropped": self.dropped,
+                "commits": self.commits,
+                "fsyncs": self.fsyncs,
+                "segments": self.segments,
+                "current_segment": os.path.basename(self._path) if self._path else None,
+                "error": self.error,
+            }
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _timeout(self) -> Optional[float]:
+        """How long the idle writer may sleep before an fsync or rotation is due."""
+        if self._file is None:
+            return None
+        deadline = self._opened_at + self.segment_seconds
+        if self.durability == "interval" and self.synced < self.written:
+            deadline = min(deadline, self._last_fsync + self.fsync_interval)
+        return max(0.0, deadline - time.time())
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue and not self._closing and not self._flush_requested:
+                    timeout = self._timeout()
+                    if not self._has_work.wait(timeout) and timeout is not None:
+                        break
+                # Group commit window: let more records arrive
+                if self._queue:
+                    deadline = time.monotonic() + self.commit_interval
+                    while len(self._queue) < self.commit_records and not self._closing and not self._flush_requested:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._has_work.wait(remaining)
+                batch, self._queue = self._queue, deque()
+                self._has_space.notify_all()
+                force = self._closing or self._flush_requested
+                self._flush_requested = False
+                closing = self._closing
+
+            try:
+                if batch:
+                    self._write(batch)
+                    batch = None
+                if self._file is not None:
+                    self._sync(force)
+                    if closing or self._size >= self.segment_bytes or time.time() - self._opened_at >= self.segment_seconds:
+                        self._close_segment()
+            except OSError as exc:
+                # Keep the writer alive; the failure shows in stats() / health
+                with self._lock:
+                    self.error = f"{type(exc).__name__}: {exc}"
+                    self._committed.notify_all()
+                    if batch and closing:
+                        self.dropped += len(batch)
+                    elif batch:
+                        # Requeue ahead of newer records and retry after a pause
+                        self._queue.extendleft(reversed(batch))
+                        self._has_work.wait(self.retry_interval)
+                        continue
+
+            if closing:
+                with self._lock:
+                    if not self._queue:
+                        return
+
+    def _write(self, batch: Deque[str]) -> None:
+        if self._file is None:
+            self._open_segment()
+        data = "".join(batch).encode()
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[self._file.write(view):]
+        except OSError:
+            # Cut the partial batch off so the retry does not duplicate records
+            try:
+                os.ftruncate(self._file.fileno(), self._size)
+            except OSError:
+                self._abandon_segment()
+            raise
+        self._size += len(data)
+        with self._lock:
+            self.written += len(batch)
+            self.commits += 1
+
+    def _sync(self, force: bool) -> None:
+        with self._lock:
+            pending = self.written > self.synced
+            written = self.written
+        if not pending:
+            return
+        now = time.time()
+        if (
+            force
+            or self.durability == "commit"
+            or (self.durability == "interval" and now - self._last_fsync >= self.fsync_interval)
+        ):
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+            with self._lock:
+                self.synced = written
+                self.fsyncs += 1
+                self._committed.notify_all()
+
+    def _open_segment(self) -> None:
+        self._opened_at = time.time()
+        name = f"audit-{int(self._opened_at * 1000):013d}-{os.getpid()}-{self.segments:04d}{SEGMENT_SUFFIX}"
+        self._path = os.path.join(self.directory, name + OPEN_SUFFIX)
+        self._file = open(self._path, "ab", buffering=0)  # one write() per commit
+        self._size = 0
+        self._last_fsync = self._opened_at
+        with self._lock:
+            self.segments += 1
+
+    def _abandon_segment(self) -> None:
+        """Stop appending to a segment whose tail cannot be repaired; it stays .open."""
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        with self._lock:
+            self._file = None
+            self._path = None
+
+    def _close_segment(self) -> None:
+        """fsync, close and publish the open segment."""
+        self._sync(force=True)
+        self._file.close()
+        os.replace(self._path, self._path[: -len(OPEN_SUFFIX)])
+        _fsync_directory(self.directory)
+        with self._lock:
+            self._file = None
+            self._path = None
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+def segment_paths(directory: str, include_open: bool = True) -> List[str]:
+    """Segments in write order (per process), oldest first."""
+    names = [
+        name for name in os.listdir(directory)
+        if name.startswith("audit-") and (
+            name.endswith(SEGMENT_SUFFIX) or (include_open and name.endswith(SEGMENT_SUFFIX + OPEN_SUFFIX))
+        )
+    ]
+    return [os.path.join(directory, name) for name in sorted(names)]
+
+
+def iter_records(directory: str, include_open: bool = True) -> Iterator[Dict]:
+    """
+    Every decision in an audit directory. A last line cut short by a crash
+    (no newline) is skipped.
+    """
+    for path in segment_paths(directory, include_open):
+        with open(path, "rb") as f:
+            for line in f:
+                if line.endswith(b"\n"):
+                    yield json.loads(line)
+
+
+# =============================================================================
+# PROCESS SINK
+# =============================================================================
+
+_sink: Optional[AuditSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_audit_sink() -> Optional[AuditSink]:
+    """This process's sink when UAE_AUDIT_DIR is set, otherwise None."""
+    global _sink
+    directory = os.environ.get(AUDIT_DIR_ENV)
+    if not directory:
+        return None
+    with _sink_lock:
+        if _sink is None:
+            _sink = AuditSink(
+                directory,
+                durability=os.environ.get(AUDIT_DURABILITY_ENV) or UAE_AUDIT_DURABILITY,
+                include_requests=os.environ.get(AUDIT_REQUESTS_ENV, "") not in ("", "0"),
+            )
+        return _sink
+
+
+def close_audit_sink() -> None:
+    """Commit and close this process's sink, if one was started."""
+    global _sink
+    with _sink_lock:
+        sink, _sink = _sink, None
+    if sink is not None:
+        sink.close()
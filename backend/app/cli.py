@@ -0,0 +1,216 @@
+"""
+UAE Payment Validator - Bulk CLI
+
+Validate payment files offline and write one NDJSON line per transaction:
+
+    python -m app.cli pacs008 batch.xml --output results.ndjson
+    python -m app.cli mt103 legacy.fin --output results.ndjson
+
+With --aggregate only the file-level summary is written, as one JSON object.
+With --taxonomy-report PATH the same pass also writes counts and AED amounts
+per IMF BOP and ISO 20022 code to PATH.
+
+Returned payments (NDJSON, one UAEReturnedPayment per line) are diagnosed
+with:
+
+    python -m app.cli returns returned.ndjson --output diagnosis.ndjson
+
+Recorded traffic (audit log directories or NDJSON, see app.replay) is
+replayed through the engine, with decision differences reported, with:
+
+    python -m app.cli replay /var/log/uae-audit --processes 4 --report replay.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Iterable, Optional, TextIO
+
+from app.ingest.base import (
+    IngestedTransaction,
+    aggregate_transactions,
+    to_ndjson_line,
+    validate_transactions,
+)
+from app.ingest.mt103 import iter_mt103
+from app.ingest.pacs008 import iter_pacs008
+from app.duplicates import DuplicateDetectionStage
+from app.replay import print_report, replay
+from app.returns import ReturnDiagnosisEngine
+from app.taxonomy import TaxonomyReport
+from app.validators import UAEValidationEngine
+from app.velocity import VelocityStage
+
+
+def _engine() -> UAEValidationEngine:
+    return UAEValidationEngine(stages=[DuplicateDetectionStage(), VelocityStage()])
+
+
+def _run(
+    transactions: Iterable[IngestedTransaction],
+    out: TextIO,
+    detail: str = "full",
+    taxonomy: Optional[TaxonomyReport] = None,
+) -> int:
+    """Validate transactions, stream results to out and report totals on stderr."""
+    engine = _engine()
+    start = time.perf_counter()
+    total = rejected = compliant = 0
+
+    for tx, response in validate_transactions(engine, transactions, detail=detail, taxonomy=taxonomy):
+        out.write(to_ndjson_line(tx, response))
+        total += 1
+        if response is None:
+            rejected += 1
+        elif response.violation_count == 0:
+            compliant += 1
+
+    elapsed = time.perf_counter() - start
+    _report(total, compliant, rejected, elapsed)
+    return 0
+
+
+def _run_aggregate(
+    transactions: Iterable[IngestedTransaction],
+    out: TextIO,
+    detail: str = "full",
+    taxonomy: Optional[TaxonomyReport] = None,
+) -> int:
+    """Validate transactions and write only the file summary to out."""
+    start = time.perf_counter()
+    summary = aggregate_transactions(_engine(), transactions, taxonomy=taxonomy).to_response()
+    out.write(summary.model_dump_json(indent=2) + "\n")
+    _report(summary.total_transactions, summary.compliant, summary.unparseable, time.perf_counter() - start)
+    return 0
+
+
+def _run_returns(path: str, out: TextIO) -> int:
+    """Diagnose a returned-payment file and report totals on stderr."""
+    start = time.perf_counter()
+    total = 0
+    with open(path, "rb") as f:
+        for line in ReturnDiagnosisEngine().diagnose_ndjson(f):
+            out.write(line)
+            total += 1
+    elapsed = time.perf_counter() - start
+    print(
+        f"{total:,} returned payments diagnosed ({elapsed:.2f}s, {total / elapsed if elapsed else 0.0:,.0f}/s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _run_replay(args: argparse.Namespace) -> int:
+    """
+    Replay recorded traffic; exit status 1 when any decision differs, else 2
+    when requests were skipped for a tenant profile that is not configured.
+    """
+    report = replay(
+        args.paths,
+        processes=args.processes,
+        rate=args.rate,
+        speed=args.speed,
+        stateless=args.stateless,
+        max_diffs=args.max_diffs,
+        reference_data_path=args.reference_data,
+        fx_rates_path=args.fx_rates,
+        tenant_profiles_path=args.tenant_profiles,
+    )
+    print_report(report)
+    if args.diffs:
+        with open(args.diffs, "w", encoding="utf-8") as f:
+            for example in report["examples"]:
+                f.write(json.dumps(example) + "\n")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump({k: v for k, v in report.items() if k != "examples"}, f, indent=2)
+            f.write("\n")
+    if report["diffs"]:
+        return 1
+    return 2 if report["unknown_tenant"] else 0
+
+
+def _report(total: int, compliant: int, rejected: int, elapsed: float) -> None:
+    rate = total / elapsed if elapsed else 0.0
+    print(
+        f"{total:,} transactions: {compliant:,} compliant, "
+        f"{total - compliant - rejected:,} non-compliant, {rejected:,} unparseable "
+        f"({elapsed:.2f}s, {rate:,.0f} tx/s)",
+        file=sys.stderr,
+    )
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Bulk UAE payment validation")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    pacs008 = subparsers.add_parser("pacs008", help="Validate an ISO 20022 pacs.008 XML file")
+    pacs008.add_argument("file", help="pacs.008 XML file")
+    pacs008.add_argument("--direction", choices=["inbound", "outbound"], default="outbound")
+    pacs008.add_argument("--output", "-o", help="NDJSON output file (default: stdout)")
+    pacs008.add_argument("--aggregate", action="store_true", help="Write only the file summary")
+    pacs008.add_argument("--detail", choices=["minimal", "errors_only", "full"], default="full")
+    pacs008.add_argument("--taxonomy-report", help="Also write BOP/ISO totals (JSON) to this file")
+
+    mt103 = subparsers.add_parser("mt103", help="Validate a file of concatenated SWIFT MT103 messages")
+    mt103.add_argument("file", help="MT103 file")
+    mt103.add_argument("--direction", choices=["inbound", "outbound"], default="outbound")
+    mt103.add_argument("--output", "-o", help="NDJSON output file (default: stdout)")
+    mt103.add_argument("--aggregate", action="store_true", help="Write only the file summary")
+    mt103.add_argument("--detail", choices=["minimal", "errors_only", "full"], default="full")
+    mt103.add_argument("--taxonomy-report", help="Also write BOP/ISO totals (JSON) to this file")
+
+    returns = subparsers.add_parser("returns", help="Diagnose an NDJSON file of returned payments")
+    returns.add_argument("file", help="NDJSON file, one returned payment per line")
+    returns.add_argument("--output", "-o", help="NDJSON output file (default: stdout)")
+
+    replayer = subparsers.add_parser("replay", help="Replay recorded traffic and diff the decisions")
+    replayer.add_argument("paths", nargs="+", help="Audit log directories or NDJSON files")
+    replayer.add_argument("--processes", "-p", type=int, default=1, help="Worker processes (default: 1)")
+    pacing = replayer.add_mutually_exclusive_group()
+    pacing.add_argument("--rate", type=float, help="Total requests per second (default: maximum speed)")
+    pacing.add_argument("--speed", type=float, help="Multiple of the recorded pace, e.g. 2 for twice as fast")
+    replayer.add_argument("--stateless", action="store_true", help="Skip the duplicate and velocity stages")
+    replayer.add_argument("--reference-data", help="Reference data file to replay against")
+    replayer.add_argument("--fx-rates", help="FX rates file to replay against")
+    replayer.add_argument("--tenant-profiles", help="Tenant profiles file to replay against")
+    replayer.add_argument("--diffs", help="Write differing decisions (NDJSON) to this file")
+    replayer.add_argument("--max-diffs", type=int, default=100, help="Examples kept per process (default: 100)")
+    replayer.add_argument("--report", help="Also write the report (JSON) to this file")
+
+    args = parser.parse_args(argv)
+    if args.command == "replay":
+        if args.processes < 1:
+            parser.error("--processes must be at least 1")
+        return _run_replay(args)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    if args.command == "returns":
+        try:
+            return _run_returns(args.file, out)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    run = _run_aggregate if args.aggregate else _run
+    taxonomy = TaxonomyReport() if args.taxonomy_report else None
+
+    try:
+        if args.command == "pacs008":
+            status = run(iter_pacs008(args.file, args.direction), out, args.detail, taxonomy)
+        elif args.command == "mt103":
+            status = run(iter_mt103(args.file, args.direction), out, args.detail, taxonomy)
+        else:
+            return 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if taxonomy is not None:
+        with open(args.taxonomy_report, "w", encoding="utf-8") as f:
+            f.write(taxonomy.to_response().model_dump_json(indent=2) + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,116 @@ UAE_LEI_THRESHOLD_AED: int = 1_000_000
 UAE_HIGH_VALUE_THRESHOLD_AED: int = 500_000
 UAE_PENALTY_PER_VIOLATION_AED: float = 1_000.0
 
+# =============================================================================
+# DUPLICATE DETECTION
+# =============================================================================
+
+UAE_DUPLICATE_WINDOW_SECONDS: int = 900
+UAE_DUPLICATE_BUCKETS: int = 6
+UAE_DUPLICATE_BUCKET_CAPACITY: int = 250_000
+UAE_DUPLICATE_FALSE_POSITIVE_RATE: float = 0.001
+UAE_DUPLICATE_LRU_SIZE: int = 50_000
+
+# =============================================================================
+# VELOCITY / STRUCTURING
+# =============================================================================
+
+UAE_VELOCITY_WINDOW_SECONDS: int = 86_400
+UAE_VELOCITY_MAX_DEBTORS: int = 200_000
+UAE_VELOCITY_RING_SIZE: int = 8
+
+# =============================================================================
+# IDEMPOTENCY (Idempotency-Key response replay)
+# =============================================================================
+
+UAE_IDEMPOTENCY_TTL_SECONDS: int = 86_400
+UAE_IDEMPOTENCY_MAX_ENTRIES: int = 100_000
+UAE_IDEMPOTENCY_KEY_MAX_LENGTH: int = 255
+
+# =============================================================================
+# BATCH JOBS (background file validation)
+# =============================================================================
+
+UAE_JOB_MAX_ACTIVE: int = 8  # queued + running; more submissions get 429
+UAE_JOB_MAX_RETAINED: int = 100  # finished jobs kept for polling / paging
+UAE_JOB_WORKER_NICE: int = 10  # keep worker processes behind interactive requests
+UAE_JOB_PROGRESS_EVERY: int = 500  # rows between progress updates / cancel checks
+UAE_JOB_PAGE_SIZE: int = 1_000
+UAE_JOB_MAX_PAGE_SIZE: int = 10_000
+UAE_JOB_RETRY_AFTER_SECONDS: int = 30
+
+# =============================================================================
+# AUDIT LOG (append-only record of validation decisions, see app.audit)
+# =============================================================================
+
+UAE_AUDIT_DURABILITY: str = "commit"  # commit: fsync per group commit | interval | none
+UAE_AUDIT_COMMIT_INTERVAL_MS: int = 5  # group commit window: the writer wakes once per window
+UAE_AUDIT_COMMIT_RECORDS: int = 4_096  # ... or as soon as this many records are queued
+UAE_AUDIT_FSYNC_INTERVAL_MS: int = 100  # "interval": longest a written record waits for fsync
+UAE_AUDIT_MAX_QUEUE: int = 100_000  # decisions waiting for the writer
+UAE_AUDIT_ON_FULL: str = "block"  # block: wait for the writer | drop: count and discard
+UAE_AUDIT_RETRY_INTERVAL_MS: int = 1_000  # pause before rewriting a batch whose write failed
+UAE_AUDIT_SEGMENT_BYTES: int = 64 * 1024 * 1024
+UAE_AUDIT_SEGMENT_SECONDS: int = 3_600
+
+# =============================================================================
+# ADMISSION CONTROL (priority scheduling of engine work, see app.scheduler)
+# =============================================================================
+
+UAE_SCHEDULER_ENABLED: bool = True
+UAE_SCHEDULER_SLOTS: int = 1  # engine work running at once per process (pure Python: one GIL)
+UAE_SCHEDULER_CHUNK_SIZE: int = 50  # transactions of bulk work per slot hold
+UAE_SCHEDULER_MAX_CLIENTS: int = 10_000  # token buckets kept per priority class (LRU)
+UAE_SCHEDULER_CLIENT_HEADER: str = "X-Client-Id"  # honoured only when trusted (below)
+UAE_SCHEDULER_TRUST_CLIENT_HEADER: bool = False  # True only behind a proxy that sets the header
+
+# weight: share of slots under contention; max_queue: waiting requests before
+# shedding; rate/burst: per-client token bucket (requests/second, bucket size)
+UAE_SCHEDULER_CLASSES: Dict[str, Dict] = {
+    "interactive": {"weight": 16, "max_queue": 512, "rate": 2_000.0, "burst": 10_000},
+    "batch": {"weight": 4, "max_queue": 32, "rate": 20.0, "burst": 40},
+    "jobs": {"weight": 1, "max_queue": 8, "rate": 1.0, "burst": 10},
+}
+
+# =============================================================================
+# TENANT PROFILES (per-business-line thresholds and rules, see app.tenants)
+# =============================================================================
+
+UAE_TENANT_HEADER: str = "X-Tenant-Profile"  # the request's tenant_profile field wins
+
+# Every rule code the engine can report; tenant profiles enable / disable these
+UAE_RULE_CODES: List[str] = [
+    "UAE_PPC_MANDATORY", "UAE_PPC_VALID", "UAE_PPC_APPLICABILITY", "UAE_CORRIDOR_PPC",
+    "UAE_IBAN_DEBTOR", "UAE_IBAN_CREDITOR", "UAE_BIC_DEBTOR", "UAE_BIC_CREDITOR",
+    "UAE_LEI_DEBTOR", "UAE_LEI_DEBTOR_FORMAT", "UAE_LEI_DEBTOR_STATUS",
+    "UAE_FX_RATE", "UAE_HIGH_VALUE", "UAE_DUPLICATE_PAYMENT", "UAE_VELOCITY_DEBTOR",
+]
+
+# =============================================================================
+# FX (AED per unit; fixed pegs used when no rate file is configured)
+# =============================================================================
+
+UAE_FX_PEGGED_RATES: Dict[str, float] = {
+    "AED": 1.0,
+    "USD": 3.6725,
+    "SAR": 0.97933,  # SAR 3.75 / USD
+    "QAR": 1.00893,  # QAR 3.64 / USD
+    "BHD": 9.76729,  # BHD 0.376 / USD
+    "OMR": 9.55137,  # OMR 0.3845 / USD
+}
+
+# Indicative AED rates of common corridor currencies (not pegged). Replace
+# them with daily rates through UAE_FX_RATES_PATH
+UAE_FX_REFERENCE_RATES: Dict[str, float] = {
+    "EUR": 4.28,
+    "GBP": 4.90,
+    "INR": 0.0418,
+    "PKR": 0.0131,
+    "PHP": 0.0634,
+    "BDT": 0.0301,
+    "EGP": 0.0756,
+}
+
 # =============================================================================
 # IBAN VALIDATION
 # =============================================================================
@@ -24,6 +134,24 @@ UAE_IBAN_LENGTH: int = 23
 UAE_IBAN_COUNTRY_CODE: str = "AE"
 UAE_IBAN_PATTERN: str = r"^AE\d{21}$"
 
+# =============================================================================
+# LEI VALIDATION (ISO 17442)
+# =============================================================================
+
+# GLEIF registration statuses under which an LEI may be used on a payment
+LEI_ACTIVE_REGISTRATION_STATUSES = frozenset({
+    "ISSUED",
+    "PENDING_TRANSFER",
+    "PENDING_ARCHIVAL",
+})
+
+# =============================================================================
+# SWIFT/BIC VALIDATION
+# =============================================================================
+
+UAE_BIC_PATTERN: str = r"^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$"
+UAE_BANK_CODE_SLOTS: int = 1000
+
 # =============================================================================
 # UAE BANK CODES (Central Bank of UAE assignments)
 # =============================================================================
@@ -240,6 +368,56 @@ UAE_PURPOSE_CODES: List[Dict] = [
     {"code": "OTH", "name": "Other Payments", "category": "OTH", "domestic": True, "offshore": True},
 ]
 
+# =============================================================================
+# RETURN REASON CODES (returned-payment diagnosis)
+# ISO 20022 return reasons seen on UAEFTS returns, with the engine rules that
+# can explain each one and the fields to check. rules=None: any failing rule
+# explains the return; no rules: the cause is outside the payment message
+# (closed account, funds, mandate).
+# =============================================================================
+
+_IBAN_RULES = ["UAE_IBAN_DEBTOR", "UAE_IBAN_CREDITOR"]
+_PURPOSE_RULES = ["UAE_PPC_MANDATORY", "UAE_PPC_VALID", "UAE_PPC_APPLICABILITY"]
+_LEI_RULES = ["UAE_LEI_DEBTOR", "UAE_LEI_DEBTOR_FORMAT", "UAE_LEI_DEBTOR_STATUS"]
+
+UAE_RETURN_REASONS: List[Dict] = [
+    {"code": "AC01", "name": "Incorrect Account Number", "category": "account",
+     "rules": _IBAN_RULES, "fields": ["creditor_iban", "debtor_iban"]},
+    {"code": "AC04", "name": "Closed Account", "category": "account",
+     "rules": [], "fields": ["creditor_iban"]},
+    {"code": "AC06", "name": "Blocked Account", "category": "account",
+     "rules": [], "fields": ["creditor_iban"]},
+    {"code": "AM04", "name": "Insufficient Funds", "category": "amount",
+     "rules": [], "fields": ["amount"]},
+    {"code": "BE01", "name": "Inconsistent with End Customer", "category": "beneficiary",
+     "rules": ["UAE_IBAN_CREDITOR", "UAE_BIC_CREDITOR"], "fields": ["creditor_iban", "creditor_bic"]},
+    {"code": "FF01", "name": "Invalid File Format", "category": "format",
+     "rules": None, "fields": []},
+    {"code": "MD01", "name": "No Mandate", "category": "mandate",
+     "rules": [], "fields": []},
+    {"code": "MS03", "name": "Reason Not Specified", "category": "other",
+     "rules": None, "fields": []},
+    {"code": "RC01", "name": "Bank Identifier Incorrect", "category": "routing",
+     "rules": ["UAE_BIC_CREDITOR", "UAE_BIC_DEBTOR"], "fields": ["creditor_bic", "debtor_bic"]},
+    {"code": "RR01", "name": "Missing Debtor Account/ID", "category": "regulatory",
+     "rules": ["UAE_IBAN_DEBTOR"] + _LEI_RULES,
+     "fields": ["debtor_iban", "debtor_lei"]},
+    {"code": "RR02", "name": "Missing Debtor Name/Address", "category": "regulatory",
+     "rules": [], "fields": []},
+    {"code": "RR03", "name": "Missing Creditor Name/Address", "category": "regulatory",
+     "rules": [], "fields": []},
+    {"code": "RR04", "name": "Regulatory Reason", "category": "regulatory",
+     "rules": None, "fields": []},
+    {"code": "NARR", "name": "Narrative/Purpose Code Issue", "category": "purpose",
+     "rules": _PURPOSE_RULES, "fields": ["purpose_code", "remittance_info"]},
+    {"code": "LEIR", "name": "LEI Required", "category": "lei",
+     "rules": _LEI_RULES, "fields": ["debtor_lei", "creditor_lei"]},
+    {"code": "PURC", "name": "Invalid Purpose Code", "category": "purpose",
+     "rules": _PURPOSE_RULES, "fields": ["purpose_code"]},
+    {"code": "IBAV", "name": "Invalid IBAN", "category": "account",
+     "rules": _IBAN_RULES, "fields": ["debtor_iban", "creditor_iban"]},
+]
+
 # =============================================================================
 # LOOKUP STRUCTURES (built at import time for O(1) access)
 # =============================================================================
@@ -0,0 +1,106 @@
+"""
+UAE Corridor Profiles
+Purpose code expectations for offshore payments per destination market.
+
+The receiving bank in India, Pakistan, the Philippines, Bangladesh or
+Egypt has to re-code the UAE purpose code into its own code set (see
+src/data/corridorData.ts). Each corridor is compiled once into a profile,
+from the corridor mappings in corridorData.ts (high confidence) and the
+ISO 20022 middle layer of the translation index:
+
+    allowed     bitset over UAE purpose codes (bit = CODE_BITS[code]) of the
+                codes with a known mapping into the destination market
+    confidence  per bit, the mapping confidence (high / medium / low)
+    targets     per bit, the destination codes it maps to
+
+so the corridor check for a payment is a dict lookup and a bit test. Both
+sources cover a fraction of each market's code set, so a code without a
+known mapping is unknown, not wrong.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from app.market_codes import UAE_TO_ISO
+from app.translation import translation_index
+
+# UAE purpose codes known to the ISO 20022 middle layer, one bit each
+CODE_BITS: Dict[str, int] = {code: bit for bit, code in enumerate(UAE_TO_ISO)}
+
+# Destination markets (corridorData.ts CORRIDOR_MARKETS / UAE_CORRIDORS)
+CORRIDOR_MARKETS: Dict[str, Dict] = {
+    "IN": {"name": "India", "currency": "INR", "regulator": "Reserve Bank of India (RBI)",
+           "total_codes": 303, "complexity": "very_high"},
+    "PK": {"name": "Pakistan", "currency": "PKR", "regulator": "State Bank of Pakistan (SBP)",
+           "total_codes": 272, "complexity": "high"},
+    "PH": {"name": "Philippines", "currency": "PHP", "regulator": "Bangko Sentral ng Pilipinas (BSP)",
+           "total_codes": 199, "complexity": "high"},
+    "BD": {"name": "Bangladesh", "currency": "BDT", "regulator": "Bangladesh Bank",
+           "total_codes": 666, "complexity": "very_high"},
+    "EG": {"name": "Egypt", "currency": "EGP", "regulator": "Central Bank of Egypt (CBE)",
+           "total_codes": 14, "complexity": "low"},
+}
+
+# Corridor mappings (corridorData.ts UAE_CORRIDORS commonUseCases)
+CORRIDOR_MAPPINGS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "IN": {"FAM": ("S0301", "S0302"), "SAL": ("P0001",), "EDU": ("S0305",), "MED": ("S0306",),
+           "CIN": ("S0003",)},
+    "PK": {"FAM": ("9301",), "SAL": ("9301",), "EDU": ("9071",), "CHC": ("9083",), "MED": ("9061",)},
+    "PH": {"FAM": ("5201",), "SAL": ("5202",), "CHC": ("5310", "5311"), "EDU": ("5132",),
+           "CIN": ("5301",)},
+    "BD": {"FAM": ("1801", "1802"), "SAL": ("1801",), "GDI": ("2101",), "EDU": ("5101",)},
+    "EG": {"SAL": ("SALA",), "EOS": ("PENS",), "GRI": ("GOVT",), "GDE": ("SUPP",), "GDI": ("SUPP",)},
+}
+
+
+class CorridorProfile(NamedTuple):
+    """Compiled purpose code expectations of one UAE -> market corridor."""
+
+    market: str
+    name: str
+    currency: str
+    complexity: str
+    allowed: int
+    confidence: Tuple[Optional[str], ...]
+    targets: Tuple[Tuple[str, ...], ...]
+
+    def lookup(self, purpose_code: str) -> Tuple[bool, Optional[str], Tuple[str, ...]]:
+        """(mapped, confidence, destination codes) of a UAE purpose code."""
+        bit = CODE_BITS.get(purpose_code)
+        if bit is None or not (self.allowed >> bit) & 1:
+            return False, None, ()
+        return True, self.confidence[bit], self.targets[bit]
+
+    @property
+    def allowed_codes(self) -> Tuple[str, ...]:
+        return tuple(code for code, bit in CODE_BITS.items() if (self.allowed >> bit) & 1)
+
+
+def _compile(market: str, info: Dict) -> CorridorProfile:
+    allowed = 0
+    confidence = [None] * len(CODE_BITS)
+    targets = [()] * len(CODE_BITS)
+    mappings = CORRIDOR_MAPPINGS.get(market, {})
+    for code, bit in CODE_BITS.items():
+        translation = translation_index.translate(code, "AE", market)
+        translated = tuple(target.code for target in translation.target_codes) if translation else ()
+        documented = mappings.get(code, ())
+        if not documented and not translated:
+            continue
+        allowed |= 1 << bit
+        confidence[bit] = "high" if documented else translation.confidence
+        targets[bit] = documented + tuple(t for t in translated if t not in documented)
+    return CorridorProfile(
+        market=market,
+        name=info["name"],
+        currency=info["currency"],
+        complexity=info["complexity"],
+        allowed=allowed,
+        confidence=tuple(confidence),
+        targets=tuple(targets),
+    )
+
+
+CORRIDOR_PROFILES: Dict[str, CorridorProfile] = {
+    market: _compile(market, info) for market, info in CORRIDOR_MARKETS.items()
+}
+
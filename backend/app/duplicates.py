@@ -0,0 +1,201 @@
+"""
+UAE Duplicate Payment Detection
+Bounded-memory detection of repeated submissions within a time window.
+
+A payment's fingerprint is its debtor IBAN, creditor IBAN, currency, amount
+and purpose code. Fingerprints go into a rotating Bloom filter: the window
+is split into time buckets, each a fixed-size Bloom filter, and the oldest
+bucket is cleared and reused as time moves on. A Bloom hit is confirmed
+against a small exact LRU that remembers the earlier session_uuid.
+
+Memory is fixed by configuration (buckets x filter size + LRU entries),
+whatever the traffic volume.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+from app.constants import (
+    UAE_DUPLICATE_WINDOW_SECONDS,
+    UAE_DUPLICATE_BUCKETS,
+    UAE_DUPLICATE_BUCKET_CAPACITY,
+    UAE_DUPLICATE_FALSE_POSITIVE_RATE,
+    UAE_DUPLICATE_LRU_SIZE,
+)
+from app.schemas import UAEValidationRequest
+from app.validators import StageContext, ValidationResult, ValidationStage
+
+
+def payment_fingerprint(request: UAEValidationRequest) -> Optional[bytes]:
+    """16-byte fingerprint of the fields that identify a resubmission."""
+    if not request.debtor_iban and not request.creditor_iban:
+        return None
+    key = "|".join((
+        (request.debtor_iban or "").upper().replace(" ", ""),
+        (request.creditor_iban or "").upper().replace(" ", ""),
+        request.currency.upper(),
+        f"{request.amount:.2f}",
+        request.purpose_code or "",
+    ))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+class RotatingBloomFilter:
+    """Time-bucketed Bloom filter covering a sliding window."""
+
+    def __init__(
+        self,
+        window_seconds: float,
+        buckets: int,
+        capacity_per_bucket: int,
+        false_positive_rate: float,
+    ):
+        # Standard sizing: m = -n ln p / (ln 2)^2, k = m/n ln 2
+        bits = int(-capacity_per_bucket * math.log(false_positive_rate) / (math.log(2) ** 2))
+        self.bits = max(64, bits)
+        self.hashes = max(1, round(self.bits / capacity_per_bucket * math.log(2)))
+        self.bucket_seconds = window_seconds / buckets
+        self._filters = [bytearray((self.bits + 7) // 8) for _ in range(buckets)]
+        self._epochs = [-1] * buckets
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(len(f) for f in self._filters)
+
+    def _positions(self, fingerprint: bytes) -> List[int]:
+        # Kirsch-Mitzenmacher double hashing from the two 64-bit halves
+        h1 = int.from_bytes(fingerprint[:8], "little")
+        h2 = int.from_bytes(fingerprint[8:], "little") | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def _contains(self, positions: List[int], epoch: int) -> bool:
+        slots = len(self._filters)
+        for slot in range(slots):
+            if epoch - self._epochs[slot] >= slots:
+                continue  # bucket has aged out of the window
+            bloom = self._filters[slot]
+            if all(bloom[p >> 3] & (1 << (p & 7)) for p in positions):
+                return True
+        return False
+
+    def might_contain(self, fingerprint: bytes, now: float) -> bool:
+        """Return True if the fingerprint may be in the window."""
+        return self._contains(self._positions(fingerprint), int(now // self.bucket_seconds))
+
+    def check_and_add(self, fingerprint: bytes, now: float) -> bool:
+        """Return True if the fingerprint may be in the window, then add it."""
+        epoch = int(now // self.bucket_seconds)
+        slots = len(self._filters)
+        positions = self._positions(fingerprint)
+        seen = self._contains(positions, epoch)
+
+        slot = epoch % slots
+        if epoch > self._epochs[slot]:
+            # Reuse the oldest bucket for the current time slice
+            self._filters[slot] = bytearray(len(self._filters[slot]))
+            self._epochs[slot] = epoch
+        elif epoch < self._epochs[slot]:
+            # Late timestamp: its bucket already holds a time slice at least
+            # one window newer, so the payment has aged out; leave it intact
+            return seen
+        bloom = self._filters[slot]
+        for p in positions:
+            bloom[p >> 3] |= 1 << (p & 7)
+
+        return seen
+
+
+class DuplicateMatch(NamedTuple):
+    """An earlier submission with the same fingerprint."""
+
+    session_uuid: Optional[str]
+    seconds_ago: Optional[float]
+
+
+class DuplicateDetector:
+    """Bloom pre-filter plus exact LRU confirmation. Thread-safe."""
+
+    def __init__(
+        self,
+        window_seconds: float = UAE_DUPLICATE_WINDOW_SECONDS,
+        buckets: int = UAE_DUPLICATE_BUCKETS,
+        capacity_per_bucket: int = UAE_DUPLICATE_BUCKET_CAPACITY,
+        false_positive_rate: float = UAE_DUPLICATE_FALSE_POSITIVE_RATE,
+        lru_size: int = UAE_DUPLICATE_LRU_SIZE,
+    ):
+        self.window_seconds = window_seconds
+        self.bloom = RotatingBloomFilter(window_seconds, buckets, capacity_per_bucket, false_positive_rate)
+        self.lru_size = lru_size
+        self._recent: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._last_eviction = float("-inf")
+        self._lock = threading.Lock()
+
+    def check(self, fingerprint: bytes, session_uuid: str, now: Optional[float] = None) -> Optional[DuplicateMatch]:
+        """
+        Record a submission and return the earlier match, if any.
+
+        A Bloom hit confirmed by the LRU returns the earlier session_uuid.
+        A Bloom hit the LRU cannot confirm is only reported when the LRU has
+        evicted entries within the window (it may have forgotten the match);
+        otherwise it is a Bloom false positive and is ignored.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            maybe_seen = self.bloom.check_and_add(fingerprint, now)
+            earlier = self._recent.pop(fingerprint, None)
+
+            self._recent[fingerprint] = (session_uuid, now)
+            if len(self._recent) > self.lru_size:
+                _, (_, evicted_at) = self._recent.popitem(last=False)
+                self._last_eviction = max(self._last_eviction, evicted_at)
+
+            if not maybe_seen:
+                return None
+            if earlier and now - earlier[1] <= self.window_seconds:
+                return DuplicateMatch(earlier[0], now - earlier[1])
+            if self._last_eviction >= now - self.window_seconds:
+                return DuplicateMatch(None, None)
+            return None
+
+
+class DuplicateDetectionStage(ValidationStage):
+    """Engine stage that flags repeated submissions with a warning."""
+
+    def __init__(self, detector: Optional[DuplicateDetector] = None):
+        self.detector = detector or DuplicateDetector()
+
+    def check(self, request: UAEValidationRequest, context: StageContext) -> List[ValidationResult]:
+        fingerprint = payment_fingerprint(request)
+        if fingerprint is None:
+            return []
+
+        match = self.detector.check(fingerprint, context.session_uuid, context.timestamp)
+        if match is None:
+            return []
+
+        if match.session_uuid:
+            message = (
+                f"Same debtor, creditor, amount and purpose as session {match.session_uuid} "
+                f"{match.seconds_ago:.0f}s ago"
+            )
+        else:
+            message = "Same debtor, creditor, amount and purpose as a recent submission"
+
+        return [ValidationResult(
+            rule_code="UAE_DUPLICATE_PAYMENT",
+            rule_name="Duplicate Submission Check",
+            rule_category="duplicate",
+            field_code="session_uuid",
+            field_value=match.session_uuid,
+            validation_status="warning",
+            is_valid=False,
+            error_code="DUPLICATE_SUSPECTED" if match.session_uuid else "DUPLICATE_POSSIBLE",
+            error_message=message,
+            severity="warning",
+            stp_impact=-10,
+        )]
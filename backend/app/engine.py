@@ -0,0 +1,173 @@
+"""
+UAE Validation Engine - in-process library API
+Validate payments from Python without HTTP, UAEValidationRequest parsing or
+UAEValidationResponse construction.
+
+    from app.engine import validate_fields
+
+    result = validate_fields("offshore", "outbound", 25_000, purpose_code="SAL",
+                             debtor_iban="AE070331234567890123456")
+    result.stp_score, result.uaefts_compliant, result.failed_rules
+
+Rules are evaluated by UAEValidationEngine.evaluate, the same code path as
+/validate, on a lightweight PaymentFields tuple carrying the request fields.
+"""
+
+from typing import Iterable, List, NamedTuple, Optional, Tuple, get_args
+
+from app.reference import ReferenceData, get_reference_data
+from app.schemas import PURPOSE_CODE_FORMAT, Market
+from app.validators import RuleEvaluation, UAEValidationEngine
+
+_TRANSACTION_TYPES = frozenset({"domestic", "offshore"})
+_TRANSACTION_DIRECTIONS = frozenset({"inbound", "outbound"})
+_MARKETS = frozenset(get_args(Market))
+
+# Stateless default engine (no duplicate/velocity stages)
+_default_engine = UAEValidationEngine()
+
+
+class PaymentFields(NamedTuple):
+    """Transaction fields, in UAEValidationRequest order."""
+
+    transaction_type: str
+    transaction_direction: str
+    amount: float
+    currency: str = "AED"
+    purpose_code: Optional[str] = None
+    debtor_iban: Optional[str] = None
+    creditor_iban: Optional[str] = None
+    debtor_lei: Optional[str] = None
+    creditor_lei: Optional[str] = None
+    debtor_bic: Optional[str] = None
+    creditor_bic: Optional[str] = None
+    remittance_info: Optional[str] = None
+    destination_market: Optional[str] = None
+    tenant_profile: Optional[str] = None
+
+
+class RuleFailure(NamedTuple):
+    """One failing rule."""
+
+    rule_code: str
+    error_code: Optional[str]
+    severity: str
+    stp_impact: float
+    penalty_aed: float
+
+
+class FieldsResult(NamedTuple):
+    """Compact, immutable validation verdict."""
+
+    stp_score: float
+    stp_rating: str
+    uaefts_compliant: bool
+    violation_count: int
+    penalty_risk_aed: float
+    amount_aed: float
+    failures: Tuple[RuleFailure, ...]
+
+    @property
+    def failed_rules(self) -> Tuple[str, ...]:
+        return tuple(f.rule_code for f in self.failures)
+
+
+def _checked(fields: PaymentFields) -> PaymentFields:
+    """Apply the UAEValidationRequest field constraints; raises ValueError."""
+    if fields.transaction_type not in _TRANSACTION_TYPES:
+        raise ValueError("transaction_type must be 'domestic' or 'offshore'")
+    if fields.transaction_direction not in _TRANSACTION_DIRECTIONS:
+        raise ValueError("transaction_direction must be 'inbound' or 'outbound'")
+    if not fields.amount > 0:
+        raise ValueError("amount must be greater than 0")
+    if len(fields.currency) > 3:
+        raise ValueError("currency must be at most 3 characters")
+    if fields.remittance_info is not None and len(fields.remittance_info) > 140:
+        raise ValueError("remittance_info must be at most 140 characters")
+    if fields.destination_market is not None and fields.destination_market not in _MARKETS:
+        raise ValueError(f"destination_market must be one of {', '.join(sorted(_MARKETS))}")
+
+    purpose_code = fields.purpose_code
+    if purpose_code is not None:
+        upper = purpose_code.upper()
+        if not PURPOSE_CODE_FORMAT.match(upper):
+            raise ValueError("purpose_code must be 2-5 alphanumeric characters")
+        if upper != purpose_code:
+            fields = fields._replace(purpose_code=upper)
+    return fields
+
+
+def _to_result(evaluation: RuleEvaluation) -> FieldsResult:
+    return FieldsResult(
+        stp_score=float(evaluation.stp_score),
+        stp_rating=evaluation.stp_rating,
+        uaefts_compliant=evaluation.violation_count == 0,
+        violation_count=evaluation.violation_count,
+        penalty_risk_aed=evaluation.penalty_risk,
+        amount_aed=evaluation.amount_aed,
+        failures=tuple(
+            RuleFailure(r.rule_code, r.error_code, r.severity, r.stp_impact, r.penalty_amount_aed)
+            for r in evaluation.results
+            if not r.is_valid
+        ),
+    )
+
+
+def validate_fields(
+    transaction_type: str,
+    transaction_direction: str,
+    amount: float,
+    currency: str = "AED",
+    purpose_code: Optional[str] = None,
+    debtor_iban: Optional[str] = None,
+    creditor_iban: Optional[str] = None,
+    debtor_lei: Optional[str] = None,
+    creditor_lei: Optional[str] = None,
+    debtor_bic: Optional[str] = None,
+    creditor_bic: Optional[str] = None,
+    remittance_info: Optional[str] = None,
+    destination_market: Optional[str] = None,
+    tenant_profile: Optional[str] = None,
+    *,
+    ref: Optional[ReferenceData] = None,
+    engine: Optional[UAEValidationEngine] = None,
+) -> FieldsResult:
+    """
+    Validate one payment given as plain arguments.
+
+    Args:
+        ref: Reference data snapshot (default: current)
+        engine: Engine to use, e.g. one with stateful stages (default: stateless)
+
+    Raises:
+        ValueError: if a field violates the request schema constraints
+        UnknownTenantProfile: if tenant_profile is not configured (app.tenants)
+    """
+    fields = _checked(PaymentFields(
+        transaction_type, transaction_direction, amount, currency, purpose_code,
+        debtor_iban, creditor_iban, debtor_lei, creditor_lei, debtor_bic, creditor_bic,
+        remittance_info, destination_market, tenant_profile,
+    ))
+    return _to_result((engine or _default_engine).evaluate(fields, ref, failures_only=True))
+
+
+def validate_tuples(
+    rows: Iterable[tuple],
+    *,
+    ref: Optional[ReferenceData] = None,
+    engine: Optional[UAEValidationEngine] = None,
+) -> List[FieldsResult]:
+    """
+    Validate a batch of payments given as tuples in PaymentFields order.
+
+    The batch shares one reference data snapshot and converts amounts to AED
+    column-wise, like UAEValidationEngine.validate_batch.
+
+    Raises:
+        ValueError: if any row violates the request schema constraints
+    """
+    batch = [_checked(PaymentFields(*row)) for row in rows]
+    evaluations = (engine or _default_engine).evaluate_batch(
+        batch, ref or get_reference_data(), failures_only=True
+    )
+    return [_to_result(evaluation) for evaluation in evaluations]
@@ -0,0 +1,187 @@
+"""
+UAE FX Rates
+Currency-aware AED thresholds from a local rate table.
+
+Rates are AED per unit of currency. The table holds one immutable snapshot
+per rate date; each snapshot precomputes, per currency, the LEI and
+high-value thresholds expressed in that currency. A threshold check is then
+a single comparison of the raw amount, with no per-request conversion.
+
+Set UAE_FX_RATES_PATH to a JSON or CSV file:
+
+    {"rates": {"2026-10-19": {"USD": 3.6725, "EUR": 4.27}}}
+
+    rate_date,currency,aed_per_unit
+    2026-10-19,USD,3.6725
+
+Without a file the built-in pegged (GCC/USD) rates and indicative rates of
+common corridor currencies (EUR, GBP, INR, PKR, PHP, BDT, EGP) are used.
+
+A currency with no rate cannot be compared with the AED thresholds, so it
+is treated conservatively: both thresholds are zero, i.e. an LEI is
+required and the payment is flagged high-value whatever the amount.
+"""
+
+import csv
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from app.constants import UAE_FX_PEGGED_RATES, UAE_FX_REFERENCE_RATES
+from app.reference import ReferenceData
+
+FX_RATES_PATH_ENV = "UAE_FX_RATES_PATH"
+
+# Reference data versions whose per-currency limits a snapshot keeps
+_MAX_LIMIT_VERSIONS = 64
+
+
+class CurrencyLimits(NamedTuple):
+    """AED thresholds expressed in one transaction currency."""
+
+    currency: str
+    aed_rate: Optional[float]
+    lei_threshold: float
+    high_value_threshold: float
+
+    def to_aed(self, amount: float) -> float:
+        return amount * self.aed_rate if self.aed_rate else amount
+
+
+@dataclass(frozen=True)
+class FXSnapshot:
+    """Immutable AED rates for one rate date."""
+
+    rate_date: str
+    rates: Mapping[str, float]
+    _limits: Dict[str, Mapping[str, CurrencyLimits]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    def limits(self, ref: ReferenceData) -> Mapping[str, CurrencyLimits]:
+        """Per-currency thresholds for the given reference data version."""
+        limits = self._limits.get(ref.version)
+        if limits is None:
+            limits = MappingProxyType({
+                currency: CurrencyLimits(
+                    currency=currency,
+                    aed_rate=rate,
+                    lei_threshold=ref.lei_threshold_aed / rate,
+                    high_value_threshold=ref.high_value_threshold_aed / rate,
+                )
+                for currency, rate in self.rates.items()
+            })
+            # One entry per reference data version in use: the current one plus
+            # one per tenant profile (see app.tenants). Past the bound the
+            # versions are stale ones from reloads; start over
+            if len(self._limits) >= _MAX_LIMIT_VERSIONS:
+                self._limits.clear()
+            self._limits[ref.version] = limits
+        return limits
+
+    def limits_for(self, currency: str, ref: ReferenceData) -> CurrencyLimits:
+        """
+        Thresholds for one currency.
+
+        Currencies without a rate get no rate and zero thresholds (LEI
+        required, high value); the engine also reports the missing rate.
+        """
+        limits = self.limits(ref).get(currency.upper())
+        if limits is None:
+            return CurrencyLimits(currency.upper(), None, 0.0, 0.0)
+        return limits
+
+    def to_aed_column(self, amounts: Sequence[float], currencies: Sequence[str]) -> List[float]:
+        """
+        Convert a column of amounts to AED.
+
+        Rows are grouped by currency so each rate is looked up once per
+        batch; amounts in unknown currencies are returned unchanged.
+        """
+        rows_by_currency: Dict[str, List[int]] = {}
+        for row, currency in enumerate(currencies):
+            rows_by_currency.setdefault(currency.upper(), []).append(row)
+
+        converted = list(amounts)
+        for currency, rows in rows_by_currency.items():
+            rate = self.rates.get(currency)
+            if rate is None or rate == 1.0:
+                continue
+            for row in rows:
+                converted[row] = amounts[row] * rate
+        return converted
+
+
+class FXRateTable:
+    """Rate snapshots by date; the latest date is current."""
+
+    def __init__(self, snapshots: Dict[str, FXSnapshot], source: str = "builtin"):
+        if not snapshots:
+            raise ValueError("FX rate table has no rates")
+        self.source = source
+        self.snapshots: Mapping[str, FXSnapshot] = MappingProxyType(dict(snapshots))
+        self.latest = self.snapshots[max(self.snapshots)]
+
+    def snapshot(self, rate_date: Optional[str] = None) -> FXSnapshot:
+        """Snapshot for a rate date (default: latest)."""
+        if rate_date is None:
+            return self.latest
+        return self.snapshots[rate_date]
+
+    @classmethod
+    def from_rates(cls, rates_by_date: Mapping[str, Mapping[str, float]], source: str) -> "FXRateTable":
+        snapshots = {}
+        for rate_date, rates in rates_by_date.items():
+            normalized = {currency.upper(): float(rate) for currency, rate in rates.items()}
+            if any(rate <= 0 for rate in normalized.values()):
+                raise ValueError(f"FX rates for {rate_date} must be positive")
+            normalized["AED"] = 1.0
+            snapshots[rate_date] = FXSnapshot(rate_date, MappingProxyType(normalized))
+        return cls(snapshots, source)
+
+    @classmethod
+    def from_file(cls, path: str) -> "FXRateTable":
+        """Load rates from a JSON or CSV file."""
+        rates_by_date: Dict[str, Dict[str, float]] = {}
+        if path.lower().endswith(".csv"):
+            with open(path, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    rates_by_date.setdefault(row["rate_date"], {})[row["currency"]] = float(row["aed_per_unit"])
+        else:
+            with open(path, encoding="utf-8") as f:
+                rates_by_date = json.load(f)["rates"]
+        return cls.from_rates(rates_by_date, source=path)
+
+    @classmethod
+    def builtin(cls) -> "FXRateTable":
+        return cls.from_rates({"builtin": {**UAE_FX_REFERENCE_RATES, **UAE_FX_PEGGED_RATES}}, source="builtin")
+
+
+# =============================================================================
+# CURRENT TABLE (atomic swap)
+# =============================================================================
+
+_reload_lock = threading.Lock()
+_current: FXRateTable = (
+    FXRateTable.from_file(os.environ[FX_RATES_PATH_ENV])
+    if os.environ.get(FX_RATES_PATH_ENV)
+    else FXRateTable.builtin()
+)
+
+
+def get_fx_rates() -> FXRateTable:
+    """Return the current FX rate table."""
+    return _current
+
+
+def reload_fx_rates(path: Optional[str] = None) -> FXRateTable:
+    """Load FX rates from a file (or the built-in rates) and swap them in."""
+    global _current
+    path = path or os.environ.get(FX_RATES_PATH_ENV)
+    with _reload_lock:
+        table = FXRateTable.from_file(path) if path else FXRateTable.builtin()
+        _current = table
+    return table
@@ -0,0 +1,256 @@
+"""
+UAE Idempotency Store
+Replay stored responses for retried requests that carry an Idempotency-Key.
+
+The first request with a key computes its response; the serialised bytes
+are stored together with a hash of the request. A retry with the same key
+gets the stored bytes back (same session_uuid, no re-validation). A key
+reused for a different request is rejected. Concurrent requests with the
+same key in one process share a single in-flight computation.
+
+Stores are pluggable:
+    MemoryIdempotencyStore - bounded TTL/LRU dict (default, per process)
+    SQLiteIdempotencyStore - local SQLite file shared by all workers
+
+Set UAE_IDEMPOTENCY_DB to a file path to use SQLite. SQLite calls can wait
+up to the busy timeout on another worker's write lock, so the cache runs
+them in the thread pool rather than on the event loop.
+
+Keys are scoped by the caller (see app.api.validation), so two clients
+using the same key never see each other's responses.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.constants import UAE_IDEMPOTENCY_MAX_ENTRIES, UAE_IDEMPOTENCY_TTL_SECONDS
+
+IDEMPOTENCY_DB_ENV = "UAE_IDEMPOTENCY_DB"
+
+
+class StoredResponse(NamedTuple):
+    """Serialised response for one idempotency key."""
+
+    request_hash: str
+    body: bytes
+
+
+class IdempotencyConflict(Exception):
+    """The key was already used for a different request."""
+
+
+class IdempotencyStore(ABC):
+    """Base class: bounded key -> StoredResponse storage with expiry."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[StoredResponse]:
+        ...
+
+    @abstractmethod
+    def put(self, key: str, entry: StoredResponse) -> StoredResponse:
+        """Store entry unless the key exists; return the entry now stored."""
+
+    async def get_async(self, key: str) -> Optional[StoredResponse]:
+        """get() from the event loop; stores that may block override this."""
+        return self.get(key)
+
+    async def put_async(self, key: str, entry: StoredResponse) -> StoredResponse:
+        """put() from the event loop; stores that may block override this."""
+        return self.put(key, entry)
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """In-process TTL/LRU store. Thread-safe."""
+
+    def __init__(
+        self,
+        max_entries: int = UAE_IDEMPOTENCY_MAX_ENTRIES,
+        ttl_seconds: float = UAE_IDEMPOTENCY_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, StoredResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires, entry = item
+            if expires < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: StoredResponse) -> StoredResponse:
+        now = time.time()
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and existing[0] >= now:
+                return existing[1]
+            self._entries[key] = (now + self.ttl_seconds, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+
+class SQLiteIdempotencyStore(IdempotencyStore):
+    """
+    SQLite-backed store shared by every worker on the host.
+
+    The first writer of a key wins (INSERT OR IGNORE); others read its
+    response back. Expired and excess rows are pruned every prune_every
+    writes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = UAE_IDEMPOTENCY_MAX_ENTRIES,
+        ttl_seconds: float = UAE_IDEMPOTENCY_TTL_SECONDS,
+        prune_every: int = 1000,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.prune_every = prune_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS idempotency ("
+            " key TEXT PRIMARY KEY,"
+            " created REAL NOT NULL,"
+            " request_hash TEXT NOT NULL,"
+            " body BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idempotency_created ON idempotency (created)")
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT request_hash, body FROM idempotency WHERE key = ? AND created >= ?",
+                (key, time.time() - self.ttl_seconds),
+            ).fetchone()
+        return StoredResponse(row[0], bytes(row[1])) if row else None
+
+    def put(self, key: str, entry: StoredResponse) -> StoredResponse:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Replace an expired row, keep a live one
+                self._conn.execute(
+                    "DELETE FROM idempotency WHERE key = ? AND created < ?",
+                    (key, now - self.ttl_seconds),
+                )
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO idempotency (key, created, request_hash, body) VALUES (?, ?, ?, ?)",
+                    (key, now, entry.request_hash, entry.body),
+                )
+                row = self._conn.execute(
+                    "SELECT request_hash, body FROM idempotency WHERE key = ?", (key,)
+                ).fetchone()
+                self._writes += 1
+                if self._writes % self.prune_every == 0:
+                    self._prune(now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return StoredResponse(row[0], bytes(row[1]))
+
+    async def get_async(self, key: str) -> Optional[StoredResponse]:
+        return await run_in_threadpool(self.get, key)
+
+    async def put_async(self, key: str, entry: StoredResponse) -> StoredResponse:
+        return await run_in_threadpool(self.put, key, entry)
+
+    def _prune(self, now: float) -> None:
+        self._conn.execute("DELETE FROM idempotency WHERE created < ?", (now - self.ttl_seconds,))
+        self._conn.execute(
+            "DELETE FROM idempotency WHERE key IN ("
+            " SELECT key FROM idempotency ORDER BY created DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+
+class IdempotencyCache:
+    """Idempotent execution over a store, collapsing concurrent duplicates."""
+
+    def __init__(self, store: IdempotencyStore):
+        self.store = store
+        # None: the computing request was cancelled and a waiter takes over
+        self._inflight: Dict[str, "asyncio.Future[Optional[StoredResponse]]"] = {}
+
+    @staticmethod
+    def _checked(entry: StoredResponse, request_hash: str) -> bytes:
+        if entry.request_hash != request_hash:
+            raise IdempotencyConflict("Idempotency-Key was already used for a different request")
+        return entry.body
+
+    async def run(
+        self,
+        key: str,
+        request_hash: str,
+        compute: Callable[[], Awaitable[bytes]],
+    ) -> Tuple[bytes, bool]:
+        """
+        Return (response bytes, replayed) for key.
+
+        compute() runs at most once per key and process while the entry is
+        live; failures are not stored, so a retry computes again. If the
+        request computing it is cancelled (client gone), one of the waiting
+        duplicates computes it instead of all of them failing.
+        """
+        while True:
+            pending = self._inflight.get(key)
+            if pending is None:
+                entry = await self.store.get_async(key)
+                if entry is not None:
+                    return self._checked(entry, request_hash), True
+                # Another request may have started computing while the store was read
+                pending = self._inflight.get(key)
+            if pending is None:
+                break
+            entry = await asyncio.shield(pending)
+            if entry is not None:
+                return self._checked(entry, request_hash), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await compute()
+            entry = await self.store.put_async(key, StoredResponse(request_hash, body))
+            future.set_result(entry)
+        except asyncio.CancelledError:
+            future.set_result(None)
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved: waiters (if any) re-raise it
+            raise
+        finally:
+            del self._inflight[key]
+
+        # Another worker may have stored its response first
+        return self._checked(entry, request_hash), entry.body != body
+
+
+def default_store() -> IdempotencyStore:
+    """SQLite when UAE_IDEMPOTENCY_DB is set, otherwise in-memory."""
+    path = os.environ.get(IDEMPOTENCY_DB_ENV)
+    return SQLiteIdempotencyStore(path) if path else MemoryIdempotencyStore()
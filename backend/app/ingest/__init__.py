@@ -0,0 +1 @@
+# UAE Payment File Ingestion
@@ -0,0 +1,131 @@
+"""
+UAE Payment Ingestion - shared helpers
+Mapping parsed file records onto UAEValidationRequest and running them
+through the validation engine.
+"""
+
+import json
+from contextlib import nullcontext
+from itertools import islice
+from typing import Callable, ContextManager, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from app.aggregate import BatchAggregate, aggregate_batch
+from app.reference import get_reference_data
+from app.schemas import DetailLevel, UAEValidationMinimalResponse, UAEValidationRequest, UAEValidationResponse
+from app.taxonomy import TaxonomyReport
+from app.validators import UAEValidationEngine
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class IngestedTransaction(NamedTuple):
+    """One transaction read from a payment file."""
+
+    index: int
+    reference: Optional[str]
+    request: Optional[UAEValidationRequest]
+    error: Optional[str] = None
+
+
+def classify_transaction_type(debtor_iban: Optional[str], creditor_iban: Optional[str]) -> str:
+    """Domestic when both accounts are UAE IBANs, otherwise offshore."""
+    if debtor_iban and creditor_iban and debtor_iban[:2].upper() == "AE" and creditor_iban[:2].upper() == "AE":
+        return "domestic"
+    return "offshore"
+
+
+def build_transaction(index: int, reference: Optional[str], **fields) -> IngestedTransaction:
+    """Build a validation request, capturing schema errors per transaction."""
+    remittance_info = fields.get("remittance_info")
+    if remittance_info and len(remittance_info) > 140:
+        fields["remittance_info"] = remittance_info[:140]
+    try:
+        return IngestedTransaction(index, reference, UAEValidationRequest(**fields))
+    except ValidationError as exc:
+        message = "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in exc.errors()
+        )
+        return IngestedTransaction(index, reference, None, message)
+
+
+def iter_batches(transactions: Iterable[IngestedTransaction], batch_size: int) -> Iterator[List[IngestedTransaction]]:
+    """Group a transaction stream into lists of at most batch_size."""
+    iterator = iter(transactions)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def validate_transactions(
+    engine: UAEValidationEngine,
+    transactions: Iterable[IngestedTransaction],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    detail: DetailLevel = "full",
+    taxonomy: Optional[TaxonomyReport] = None,
+    tenant: Optional[str] = None,
+) -> Iterator[Tuple[IngestedTransaction, Optional[Union[UAEValidationResponse, UAEValidationMinimalResponse]]]]:
+    """
+    Validate ingested transactions in batches, lazily.
+
+    The whole stream uses one reference data snapshot. Memory is bounded by
+    batch_size, not by the size of the file. Each batch is also folded into
+    taxonomy if given, so one pass yields the results and the BOP report.
+    tenant applies to transactions that name no tenant profile.
+    """
+    ref = get_reference_data()
+    for batch in iter_batches(transactions, batch_size):
+        requests = [tx.request for tx in batch if tx.request]
+        if taxonomy is not None:
+            taxonomy.add_batch(requests)
+        responses = iter(engine.validate_batch(requests, ref, detail, tenant))
+        for tx in batch:
+            yield tx, next(responses) if tx.request else None
+
+
+def aggregate_transactions(
+    engine: UAEValidationEngine,
+    transactions: Iterable[IngestedTransaction],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    taxonomy: Optional[TaxonomyReport] = None,
+    hold: Callable[[], ContextManager] = nullcontext,
+    tenant: Optional[str] = None,
+) -> BatchAggregate:
+    """
+    Validate ingested transactions and return only file-level totals.
+
+    No per-transaction response is built; memory is bounded by batch_size.
+    Each batch is read and validated inside hold() (e.g. a scheduler slot).
+    tenant applies to transactions that name no tenant profile.
+    """
+    aggregate = BatchAggregate(taxonomy=taxonomy, tenant=tenant)
+    batches = iter_batches(transactions, batch_size)
+    while True:
+        with hold():
+            batch = next(batches, None)
+            if batch is None:
+                break
+            requests = []
+            for tx in batch:
+                if tx.request:
+                    requests.append(tx.request)
+                else:
+                    aggregate.add_unparseable()
+            aggregate_batch(engine, requests, aggregate)
+    return aggregate
+
+
+def to_ndjson_line(
+    tx: IngestedTransaction,
+    response: Optional[Union[UAEValidationResponse, UAEValidationMinimalResponse]],
+) -> str:
+    """Serialise one validated transaction as an NDJSON line."""
+    if response is None:
+        return json.dumps({"index": tx.index, "reference": tx.reference, "error": tx.error}) + "\n"
+    return (
+        f'{{"index": {tx.index}, "reference": {json.dumps(tx.reference)}, '
+        f'"response": {response.model_dump_json()}}}\n'
+    )
@@ -0,0 +1,148 @@
+"""
+UAE Payment Ingestion - SWIFT MT103
+Bulk parser for concatenated MT103 messages.
+
+Messages are scanned in place: the file is memory-mapped (or a bytes buffer
+is wrapped in a memoryview) and only the offsets of block 4 fields are
+recorded while scanning. Just the values of the fields we map are copied
+out and decoded:
+
+    :20:        transaction reference
+    :26T:       transaction type code (purpose)
+    :32A:       value date, currency and amount
+    :50K:/:50F: ordering customer (account line -> debtor IBAN)
+    :59:/:59A:/:59F: beneficiary (account line -> creditor IBAN)
+    :70:        remittance information -> remittance_info
+    :77B:       regulatory reporting (purpose fallback)
+"""
+
+import mmap
+import re
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from app.ingest.base import IngestedTransaction, build_transaction, classify_transaction_type
+
+BLOCK4_START = b"{4:"
+BLOCK4_END = b"\n-}"
+FIELD_START = b"\n:"
+
+WANTED_TAGS = frozenset({
+    b"20", b"26T", b"32A", b"50K", b"50F", b"59", b"59A", b"59F", b"70", b"77B",
+})
+
+# 77B narrative, e.g. "/ORDERRES/AE//SAL" or "/PURP/SAL"
+_REGULATORY_PURPOSE = re.compile(r"(?://|/PURP/)([A-Z0-9]{2,5})\s*$")
+
+Buffer = Union[bytes, bytearray, mmap.mmap]
+
+
+def _scan_fields(buf: Buffer, start: int, end: int) -> Dict[bytes, Tuple[int, int]]:
+    """Record (value_start, value_end) offsets of wanted block 4 fields."""
+    fields: Dict[bytes, Tuple[int, int]] = {}
+    pos = buf.find(FIELD_START, start, end)
+    while pos != -1:
+        tag_start = pos + 2
+        tag_end = buf.find(b":", tag_start, end)
+        if tag_end == -1:
+            break
+        next_pos = buf.find(FIELD_START, tag_end, end)
+        tag = bytes(buf[tag_start:tag_end])
+        if tag in WANTED_TAGS:
+            fields[tag] = (tag_end + 1, next_pos if next_pos != -1 else end)
+        pos = next_pos
+    return fields
+
+
+def _value(view: memoryview, fields: Dict[bytes, Tuple[int, int]], *tags: bytes) -> Optional[str]:
+    for tag in tags:
+        span = fields.get(tag)
+        if span:
+            return bytes(view[span[0]:span[1]]).decode("ascii", "replace").strip()
+    return None
+
+
+def _account(party: Optional[str]) -> Optional[str]:
+    """Account from the first line of a party field (':50K:/AE07...')."""
+    if not party or not party.startswith("/"):
+        return None
+    return party[1:].split("\n", 1)[0].strip().replace(" ", "") or None
+
+
+def _amount(field_32a: Optional[str]) -> Tuple[Optional[float], str]:
+    """Currency and amount from 32A ('YYMMDDCCCAMOUNT', comma decimal)."""
+    if not field_32a or len(field_32a) < 10:
+        return None, "AED"
+    try:
+        return float(field_32a[9:].replace(",", ".")), field_32a[6:9]
+    except ValueError:
+        return None, field_32a[6:9]
+
+
+def _purpose(field_26t: Optional[str], field_77b: Optional[str]) -> Optional[str]:
+    if field_26t:
+        return field_26t
+    if field_77b:
+        match = _REGULATORY_PURPOSE.search(field_77b.replace("\r", "").replace("\n", ""))
+        if match:
+            return match.group(1)
+    return None
+
+
+def _map_message(
+    index: int,
+    view: memoryview,
+    fields: Dict[bytes, Tuple[int, int]],
+    transaction_direction: str,
+) -> IngestedTransaction:
+    amount, currency = _amount(_value(view, fields, b"32A"))
+    debtor_iban = _account(_value(view, fields, b"50K", b"50F"))
+    creditor_iban = _account(_value(view, fields, b"59", b"59A", b"59F"))
+    remittance_info = _value(view, fields, b"70")
+    if remittance_info:
+        remittance_info = " ".join(line.strip() for line in remittance_info.splitlines())
+
+    return build_transaction(
+        index,
+        _value(view, fields, b"20"),
+        transaction_type=classify_transaction_type(debtor_iban, creditor_iban),
+        transaction_direction=transaction_direction,
+        amount=amount,
+        currency=currency,
+        purpose_code=_purpose(_value(view, fields, b"26T"), _value(view, fields, b"77B")),
+        debtor_iban=debtor_iban,
+        creditor_iban=creditor_iban,
+        remittance_info=remittance_info,
+    )
+
+
+def iter_mt103_buffer(buf: Buffer, transaction_direction: str = "outbound") -> Iterator[IngestedTransaction]:
+    """Stream transactions from a buffer holding concatenated MT103 messages."""
+    view = memoryview(buf)
+    try:
+        index = 0
+        pos = buf.find(BLOCK4_START)
+        while pos != -1:
+            end = buf.find(BLOCK4_END, pos)
+            if end == -1:
+                yield IngestedTransaction(index, None, None, "Truncated MT103 message: block 4 not terminated")
+                return
+            fields = _scan_fields(buf, pos, end)
+            yield _map_message(index, view, fields, transaction_direction)
+            index += 1
+            pos = buf.find(BLOCK4_START, end)
+    finally:
+        view.release()
+
+
+def iter_mt103(path: str, transaction_direction: str = "outbound") -> Iterator[IngestedTransaction]:
+    """Stream transactions from a file of concatenated MT103 messages."""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return
+        try:
+            yield from iter_mt103_buffer(mm, transaction_direction)
+        finally:
+            mm.close()
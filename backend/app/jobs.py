@@ -0,0 +1,412 @@
+"""
+UAE Batch Jobs
+Validate large payment files in background worker processes.
+
+A submitted file is copied into its own job directory and validated by a
+process pool (UAE_JOB_WORKERS processes, default one per core but one, run
+at a lower CPU priority) so interactive /validate requests keep the API
+process's event loop and CPU. Each job directory holds:
+
+    input          the uploaded file
+    results/       per-transaction results (app.results store: NDJSON
+                   records plus offset index and filter columns)
+    progress       "rows_done rows_total started_at", rewritten atomically
+    cancel         created to ask the worker to stop
+
+Workers and the API process share nothing but these files, so status polls
+never wait on a worker.
+"""
+
+import atexit
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.audit import close_audit_sink, get_audit_sink
+from app.constants import (
+    UAE_JOB_MAX_ACTIVE,
+    UAE_JOB_MAX_RETAINED,
+    UAE_JOB_PROGRESS_EVERY,
+    UAE_JOB_WORKER_NICE,
+)
+from app.duplicates import DuplicateDetectionStage
+from app.fx import reload_fx_rates
+from app.ingest.base import to_ndjson_line, validate_transactions
+from app.ingest.mt103 import BLOCK4_START, iter_mt103
+from app.ingest.pacs008 import iter_pacs008
+from app.reference import reload_reference_data
+from app.results import ResultReader, ResultWriter
+from app.tenants import TenantProfile, UnknownTenantProfile, reload_tenant_profiles, tenant_profiles
+from app.validators import UAEValidationEngine
+from app.velocity import VelocityStage
+
+JOBS_DIR_ENV = "UAE_JOBS_DIR"
+JOB_WORKERS_ENV = "UAE_JOB_WORKERS"
+
+JOB_FORMATS = ("pacs008", "mt103")
+
+
+class JobLimitExceeded(Exception):
+    """Too many queued or running jobs."""
+
+
+class JobNotFinished(Exception):
+    """Results were requested before the job finished."""
+
+
+class JobOutcome(NamedTuple):
+    """Returned by the worker when a job stops."""
+
+    status: str  # completed | cancelled | failed
+    rows_done: int
+    compliant: int
+    unparseable: int
+    error: Optional[str] = None
+
+
+# =============================================================================
+# JOB FILES
+# =============================================================================
+
+def _input_path(directory: str) -> str:
+    return os.path.join(directory, "input")
+
+
+def _results_path(directory: str) -> str:
+    return os.path.join(directory, "results")
+
+
+def _progress_path(directory: str) -> str:
+    return os.path.join(directory, "progress")
+
+
+def _cancel_path(directory: str) -> str:
+    return os.path.join(directory, "cancel")
+
+
+def _write_progress(directory: str, rows_done: int, rows_total: int, started_at: float) -> None:
+    path = _progress_path(directory)
+    with open(path + ".tmp", "w") as f:
+        f.write(f"{rows_done} {rows_total} {started_at}")
+    os.replace(path + ".tmp", path)
+
+
+def read_progress(directory: str) -> Optional[Tuple[int, int, float]]:
+    """(rows_done, rows_total, started_at), or None before the worker starts."""
+    try:
+        with open(_progress_path(directory)) as f:
+            rows_done, rows_total, started_at = f.read().split()
+    except (FileNotFoundError, ValueError):
+        return None
+    return int(rows_done), int(rows_total), float(started_at)
+
+
+def estimate_rows(path: str, file_format: str) -> int:
+    """
+    Count transactions by scanning for their markers, without parsing.
+
+    Exact for MT103 (one block 4 per message); for pacs.008 each
+    CdtTrfTxInf has an opening and a closing tag.
+    """
+    marker, per_row = (BLOCK4_START, 1) if file_format == "mt103" else (b"CdtTrfTxInf>", 2)
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return 0
+        with mm:
+            count = 0
+            pos = mm.find(marker)
+            while pos != -1:
+                count += 1
+                pos = mm.find(marker, pos + len(marker))
+    return count // per_row
+
+
+# =============================================================================
+# WORKER PROCESS
+# =============================================================================
+
+def _init_worker() -> None:
+    if UAE_JOB_WORKER_NICE and hasattr(os, "nice"):
+        os.nice(UAE_JOB_WORKER_NICE)
+    # Publish the worker's last audit segment (drop .open) when it exits
+    atexit.register(close_audit_sink)
+
+
+def run_job(
+    directory: str,
+    file_format: str,
+    direction: str,
+    detail: str,
+    tenant: Optional[str] = None,
+    tenant_profile: Optional[Dict] = None,
+) -> JobOutcome:
+    """
+    Validate a job's input file into its results files (worker side).
+
+    Reference data, FX rates and tenant profiles are re-read from the
+    configured files first, so a job sees any reload made in the API process
+    before it started. The job's tenant comes with its profile as the API
+    process had it at submission (tenant_profile, in the file format), since
+    it may have been set there without being written to the file.
+    """
+    reload_reference_data()
+    reload_fx_rates()
+    reload_tenant_profiles()
+    if tenant_profile is not None:
+        tenant_profiles.set_profile(TenantProfile.from_dict(tenant, tenant_profile))
+
+    source = _input_path(directory)
+    rows_total = estimate_rows(source, file_format)
+    started_at = time.time()
+    _write_progress(directory, 0, rows_total, started_at)
+
+    engine = UAEValidationEngine(stages=[DuplicateDetectionStage(), VelocityStage()], audit=get_audit_sink())
+    transactions = iter_mt103(source, direction) if file_format == "mt103" else iter_pacs008(source, direction)
+    cancel = _cancel_path(directory)
+
+    try:
+        with ResultWriter(_results_path(directory)) as results:
+            def flush() -> None:
+                results.flush()
+                _write_progress(directory, results.rows, max(rows_total, results.rows), started_at)
+
+            try:
+                for tx, response in validate_transactions(engine, transactions, detail=detail, tenant=tenant):
+                    results.add(to_ndjson_line(tx, response).encode("utf-8"), tx.reference, response)
+                    if results.rows % UAE_JOB_PROGRESS_EVERY == 0:
+                        flush()
+                        if os.path.exists(cancel):
+                            return JobOutcome("cancelled", results.rows, results.compliant, results.unparseable)
+            except ET.ParseError as exc:
+                flush()
+                return JobOutcome(
+                    "failed", results.rows, results.compliant, results.unparseable, f"Malformed pacs.008 XML: {exc}"
+                )
+            flush()
+        return JobOutcome("completed", results.rows, results.compliant, results.unparseable)
+    finally:
+        # A job's decisions are on disk before its outcome is reported, however it ended
+        if engine.audit is not None:
+            engine.audit.flush()
+
+
+# =============================================================================
+# JOB MANAGER (API process)
+# =============================================================================
+
+class Job:
+    """One submitted file and what is known about its progress."""
+
+    def __init__(self, job_id: str, directory: str, file_format: str, detail: str):
+        self.job_id = job_id
+        self.directory = directory
+        self.file_format = file_format
+        self.detail = detail
+        self.status = "queued"
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.outcome: Optional[JobOutcome] = None
+        self.future: Optional[Future] = None
+        self._results: Optional[ResultReader] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "cancelled", "failed")
+
+    def snapshot(self) -> Dict:
+        """Status, progress and throughput as plain values."""
+        progress = read_progress(self.directory)
+        status = self.status
+        if status == "queued" and progress is not None:
+            status = "running"
+
+        rows_done, rows_total, started_at = progress or (0, 0, None)
+        if self.outcome is not None:
+            rows_done = self.outcome.rows_done
+            rows_total = max(rows_total, rows_done)
+
+        rows_per_second = eta_seconds = None
+        if started_at is not None:
+            elapsed = (self.finished_at or time.time()) - started_at
+            if elapsed > 0 and rows_done:
+                rows_per_second = rows_done / elapsed
+                if status == "running":
+                    eta_seconds = max(rows_total - rows_done, 0) / rows_per_second
+
+        outcome = self.outcome
+        return {
+            "job_id": self.job_id,
+            "status": status,
+            "format": self.file_format,
+            "detail": self.detail,
+            "created_at": self.created_at,
+            "started_at": started_at,
+            "finished_at": self.finished_at,
+            "rows_done": rows_done,
+            "rows_total": rows_total,
+            "rows_per_second": rows_per_second,
+            "eta_seconds": eta_seconds,
+            "compliant": outcome.compliant if outcome else None,
+            "unparseable": outcome.unparseable if outcome else None,
+            "error": outcome.error if outcome else None,
+        }
+
+    def results(self) -> Optional[ResultReader]:
+        """
+        Reader over the job's results, or None if nothing was written.
+
+        Raises:
+            JobNotFinished: while the job is queued or running
+        """
+        if not self.finished:
+            raise JobNotFinished(f"Job {self.job_id} is {self.status}")
+        if self._results is None:
+            try:
+                self._results = ResultReader(_results_path(self.directory))
+            except FileNotFoundError:
+                # Failed or cancelled before the worker started writing
+                return None
+        return self._results
+
+
+class JobManager:
+    """
+    Submits jobs to the worker pool and tracks them.
+
+    At most max_active jobs may be queued or running; max_retained finished
+    jobs are kept (oldest first out, files deleted).
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        workers: Optional[int] = None,
+        max_active: int = UAE_JOB_MAX_ACTIVE,
+        max_retained: int = UAE_JOB_MAX_RETAINED,
+    ):
+        self._directory = directory or os.environ.get(JOBS_DIR_ENV)
+        self.workers = workers or int(os.environ.get(JOB_WORKERS_ENV) or max(1, (os.cpu_count() or 2) - 1))
+        self.max_active = max_active
+        self.max_retained = max_retained
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def directory(self) -> str:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="uae-jobs-")
+        os.makedirs(self._directory, exist_ok=True)
+        return self._directory
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: never fork the API process with its threads and sockets
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._pool
+
+    def submit(
+        self,
+        source,
+        file_format: str,
+        direction: str = "outbound",
+        detail: str = "full",
+        tenant: Optional[str] = None,
+    ) -> Job:
+        """
+        Copy a binary file object into a new job and queue it.
+
+        tenant applies to transactions that name no tenant profile.
+
+        Raises:
+            JobLimitExceeded: if max_active jobs are already queued or running
+            UnknownTenantProfile: if the tenant profile is not configured
+        """
+        tenant_profile = None
+        if tenant:
+            profile = tenant_profiles.profiles().get(tenant)
+            if profile is None:
+                raise UnknownTenantProfile(f"Unknown tenant profile '{tenant}'")
+            tenant_profile = profile.to_dict()
+
+        with self._lock:
+            if sum(1 for job in self._jobs.values() if not job.finished) >= self.max_active:
+                raise JobLimitExceeded(f"{self.max_active} jobs already queued or running")
+            job_id = uuid.uuid4().hex
+            job = Job(job_id, os.path.join(self.directory, job_id), file_format, detail)
+            self._jobs[job_id] = job
+
+        try:
+            os.makedirs(job.directory)
+            with open(_input_path(job.directory), "wb") as f:
+                shutil.copyfileobj(source, f, 1 << 20)
+            job.future = self._executor().submit(
+                run_job, job.directory, file_format, direction, detail, tenant, tenant_profile
+            )
+        except BaseException:
+            with self._lock:
+                del self._jobs[job_id]
+            shutil.rmtree(job.directory, ignore_errors=True)
+            raise
+        job.future.add_done_callback(lambda future: self._finish(job, future))
+        return job
+
+    def _finish(self, job: Job, future: Future) -> None:
+        if future.cancelled():
+            outcome = JobOutcome("cancelled", 0, 0, 0)
+        elif future.exception() is not None:
+            outcome = JobOutcome("failed", 0, 0, 0, f"{type(future.exception()).__name__}: {future.exception()}")
+        else:
+            outcome = future.result()
+        with self._lock:
+            job.outcome = outcome
+            job.finished_at = time.time()
+            job.status = outcome.status
+            self._evict()
+
+    def _evict(self) -> None:
+        finished = [job for job in self._jobs.values() if job.finished]
+        for job in sorted(finished, key=lambda j: j.finished_at)[:max(0, len(finished) - self.max_retained)]:
+            # Readers still serving a request keep their mappings until released
+            del self._jobs[job.job_id]
+            shutil.rmtree(job.directory, ignore_errors=True)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> List[Job]:
+        return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def cancel(self, job: Job) -> None:
+        """Drop a queued job; ask a running one to stop at its next progress update."""
+        if job.finished:
+            return
+        if job.future is not None and job.future.cancel():
+            return
+        open(_cancel_path(job.directory), "w").close()
+
+    def shutdown(self) -> None:
+        """Cancel every unfinished job and stop the workers without waiting."""
+        for job in list(self._jobs.values()):
+            self.cancel(job)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+job_manager = JobManager()
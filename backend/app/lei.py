@@ -0,0 +1,307 @@
+"""
+UAE LEI Validation
+ISO 17442 check digits and local GLEIF golden-copy lookup.
+
+The GLEIF concatenated file (LEI-CDF XML or golden-copy CSV) is converted once
+into a sorted, fixed-width index that is memory-mapped and binary-searched, so
+millions of LEI records cost only page cache and each lookup is O(log n). The
+build is an external sort: sorted runs of SORT_CHUNK_RECORDS records are
+spilled next to the index and merged, so it needs bounded memory too.
+
+A record without a registration status, or with one this module does not
+know, is stored as UNKNOWN rather than assumed ISSUED.
+
+Index layout:
+    header  = MAGIC (8 bytes) + record count (8 bytes, little-endian)
+    record  = LEI (20 bytes) + entity status (1) + registration status (1)
+
+Build an index from the command line:
+    python -m app.lei build <gleif-file> <index-file>
+"""
+
+import csv
+import heapq
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Optional, Tuple
+
+GLEIF_INDEX_PATH_ENV = "UAE_GLEIF_INDEX_PATH"
+GLEIF_SOURCE_PATH_ENV = "UAE_GLEIF_SOURCE_PATH"
+
+LEI_PATTERN = re.compile(r"^[A-Z0-9]{18}[0-9]{2}$")
+
+INDEX_MAGIC = b"UAELEI01"
+HEADER_SIZE = 16
+LEI_SIZE = 20
+RECORD_SIZE = 22
+
+# Records sorted in memory per run while building an index (22 MB)
+SORT_CHUNK_RECORDS = 1_000_000
+
+ENTITY_STATUS_CODES: Dict[str, bytes] = {
+    "ACTIVE": b"A",
+    "INACTIVE": b"I",
+    "NULL": b"N",
+}
+
+REGISTRATION_STATUS_CODES: Dict[str, bytes] = {
+    "ISSUED": b"I",
+    "LAPSED": b"L",
+    "MERGED": b"M",
+    "RETIRED": b"R",
+    "ANNULLED": b"A",
+    "DUPLICATE": b"D",
+    "TRANSFERRED": b"T",
+    "PENDING_TRANSFER": b"P",
+    "PENDING_ARCHIVAL": b"H",
+    "PENDING_VALIDATION": b"V",
+    "CANCELLED": b"C",
+    "UNKNOWN": b"U",
+}
+
+_ENTITY_STATUS_NAMES = {v: k for k, v in ENTITY_STATUS_CODES.items()}
+_REGISTRATION_STATUS_NAMES = {v: k for k, v in REGISTRATION_STATUS_CODES.items()}
+
+
+# =============================================================================
+# CHECK DIGITS
+# =============================================================================
+
+def lei_checksum_valid(lei: Optional[str]) -> bool:
+    """Validate LEI check digits (ISO 17442, ISO 7064 MOD 97-10)."""
+    if not lei:
+        return False
+    lei = lei.upper()
+    if not LEI_PATTERN.match(lei):
+        return False
+    # int(c, 36) maps 0-9 to themselves and A-Z to 10-35
+    numeric = "".join(str(int(char, 36)) for char in lei)
+    return int(numeric) % 97 == 1
+
+
+# =============================================================================
+# GLEIF SOURCE READERS
+# =============================================================================
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _iter_gleif_xml(path: str) -> Iterator[Tuple[str, str, str]]:
+    """Stream (lei, entity_status, registration_status) from LEI-CDF XML."""
+    lei = entity_status = registration_status = None
+    open_elements = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            open_elements.append(elem)
+            continue
+
+        open_elements.pop()
+        name = _local_name(elem.tag)
+        if name == "LEI":
+            lei = (elem.text or "").strip()
+        elif name == "EntityStatus":
+            entity_status = (elem.text or "").strip()
+        elif name == "RegistrationStatus":
+            registration_status = (elem.text or "").strip()
+        elif name == "LEIRecord":
+            if lei:
+                yield lei, entity_status or "NULL", registration_status or "UNKNOWN"
+            lei = entity_status = registration_status = None
+            # Drop the finished record and every earlier sibling
+            elem.clear()
+            if open_elements:
+                del open_elements[-1][:]
+
+
+def _iter_gleif_csv(path: str) -> Iterator[Tuple[str, str, str]]:
+    """Stream (lei, entity_status, registration_status) from golden-copy CSV."""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            lei = row.get("LEI")
+            if lei:
+                yield (
+                    lei.strip(),
+                    row.get("Entity.EntityStatus") or "NULL",
+                    row.get("Registration.RegistrationStatus") or "UNKNOWN",
+                )
+
+
+def iter_gleif_records(path: str) -> Iterator[Tuple[str, str, str]]:
+    """Stream LEI records from a GLEIF concatenated file (.xml or .csv)."""
+    if path.lower().endswith(".csv"):
+        return _iter_gleif_csv(path)
+    return _iter_gleif_xml(path)
+
+
+# =============================================================================
+# MEMORY-MAPPED INDEX
+# =============================================================================
+
+def _write_run(records: List[bytes], directory: str) -> str:
+    """Sort records and spill them to a temporary run file."""
+    records.sort()
+    fd, path = tempfile.mkstemp(dir=directory, prefix=".lei-run-")
+    with os.fdopen(fd, "wb") as f:
+        f.writelines(records)
+    return path
+
+
+def _iter_run(path: str, block_records: int = 4096) -> Iterator[bytes]:
+    """Stream the fixed-width records of a run file."""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(RECORD_SIZE * block_records)
+            if not block:
+                return
+            for offset in range(0, len(block), RECORD_SIZE):
+                yield block[offset:offset + RECORD_SIZE]
+
+
+def build_index(source_path: str, index_path: str, chunk_records: int = SORT_CHUNK_RECORDS) -> int:
+    """
+    Convert a GLEIF file into a sorted fixed-width index.
+
+    Records are sorted in runs of chunk_records and the runs merged, so
+    memory stays bounded whatever the size of the golden copy. The index is
+    written to a temporary file and renamed into place, so readers holding
+    the previous index are never affected.
+
+    Returns:
+        Number of records written
+    """
+    directory = os.path.dirname(os.path.abspath(index_path))
+    runs: List[str] = []
+    chunk: List[bytes] = []
+    count = 0
+    tmp_path = None
+    try:
+        for lei, entity_status, registration_status in iter_gleif_records(source_path):
+            lei = lei.upper()
+            if len(lei) != LEI_SIZE:
+                continue
+            chunk.append(
+                lei.encode("ascii")
+                + ENTITY_STATUS_CODES.get(entity_status.upper(), b"N")
+                + REGISTRATION_STATUS_CODES.get(registration_status.upper(), b"U")
+            )
+            count += 1
+            if len(chunk) >= chunk_records:
+                runs.append(_write_run(chunk, directory))
+                chunk = []
+        chunk.sort()
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".lei-index-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(INDEX_MAGIC + struct.pack("<Q", count))
+            f.writelines(heapq.merge(chunk, *(_iter_run(run) for run in runs)) if runs else chunk)
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    finally:
+        for run in runs:
+            os.unlink(run)
+
+    return count
+
+
+class GLEIFIndex:
+    """Read-only view of a memory-mapped LEI index."""
+
+    def __init__(self, index_path: str):
+        self.path = index_path
+        with open(index_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mm[:8] != INDEX_MAGIC:
+            raise ValueError(f"'{index_path}' is not a LEI index")
+        (self.record_count,) = struct.unpack("<Q", self._mm[8:HEADER_SIZE])
+
+    def lookup(self, lei: str) -> Optional[Dict[str, str]]:
+        """Binary-search the index for an LEI."""
+        key = lei.upper().encode("ascii", "replace")
+        mm = self._mm
+        lo, hi = 0, self.record_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER_SIZE + mid * RECORD_SIZE
+            current = mm[offset:offset + LEI_SIZE]
+            if current < key:
+                lo = mid + 1
+            elif current > key:
+                hi = mid
+            else:
+                status = mm[offset + LEI_SIZE:offset + RECORD_SIZE]
+                return {
+                    "lei": current.decode("ascii"),
+                    "entity_status": _ENTITY_STATUS_NAMES.get(status[:1], "NULL"),
+                    "registration_status": _REGISTRATION_STATUS_NAMES.get(status[1:], "UNKNOWN"),
+                }
+        return None
+
+
+class LEIRegistry:
+    """
+    Process-wide holder for the current GLEIF index.
+
+    Rebuilds swap the index in a single attribute assignment; lookups already
+    running keep using the previous mapping until they finish.
+    """
+
+    def __init__(self, index_path: Optional[str] = None, source_path: Optional[str] = None):
+        self.index_path = index_path
+        self.source_path = source_path
+        self._index: Optional[GLEIFIndex] = None
+        self._rebuild_lock = threading.Lock()
+        if index_path and os.path.exists(index_path):
+            self._index = GLEIFIndex(index_path)
+
+    @property
+    def available(self) -> bool:
+        return self._index is not None
+
+    @property
+    def record_count(self) -> int:
+        index = self._index
+        return index.record_count if index else 0
+
+    def lookup(self, lei: str) -> Optional[Dict[str, str]]:
+        """Look up an LEI; returns None if not found or no index is loaded."""
+        index = self._index
+        return index.lookup(lei) if index else None
+
+    def reload(self) -> int:
+        """Re-open the index file (e.g. after another worker rebuilt it)."""
+        if not self.index_path or not os.path.exists(self.index_path):
+            raise ValueError("GLEIF index path is not configured or missing")
+        self._index = GLEIFIndex(self.index_path)
+        return self._index.record_count
+
+    def rebuild(self, source_path: Optional[str] = None) -> int:
+        """Rebuild the index from a fresh GLEIF file and swap it in."""
+        source_path = source_path or self.source_path
+        if not source_path or not self.index_path:
+            raise ValueError("GLEIF source and index paths must be configured")
+        with self._rebuild_lock:
+            count = build_index(source_path, self.index_path)
+            self._index = GLEIFIndex(self.index_path)
+        return count
+
+
+lei_registry = LEIRegistry(
+    index_path=os.environ.get(GLEIF_INDEX_PATH_ENV),
+    source_path=os.environ.get(GLEIF_SOURCE_PATH_ENV),
+)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "build":
+        sys.exit("usage: python -m app.lei build <gleif-file> <index-file>")
+    print(f"Indexed {build_index(sys.argv[2], sys.argv[3]):,} LEI records")
@@ -2,16 +2,31 @@
 UAE Payment Validator - Backend API
 
 A self-contained, stateless FastAPI backend for UAE payment validation.
-No database required - all data served from in-memory constants.
+No database required - all data served from in-memory reference data.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import codes, validation, health
+from app.api import codes, validation, health, banks, lei, reference, jobs, translation, returns
+from app.audit import close_audit_sink
+from app.jobs import job_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop background job workers with the API process
+    job_manager.shutdown()
+    # Commit queued audit records and close the open segment
+    close_audit_sink()
+
 
 # Create FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="UAE Payment Validator API",
     description="""
 ## UAE Payment Validation API
@@ -65,6 +80,42 @@ app.include_router(
     tags=["Validation"],
 )
 
+app.include_router(
+    translation.router,
+    prefix="/api/v1/uae/translation",
+    tags=["Translation"],
+)
+
+app.include_router(
+    returns.router,
+    prefix="/api/v1/uae/returns",
+    tags=["Returns"],
+)
+
+app.include_router(
+    jobs.router,
+    prefix="/api/v1/uae/jobs",
+    tags=["Batch Jobs"],
+)
+
+app.include_router(
+    banks.router,
+    prefix="/api/v1/uae/banks",
+    tags=["Banks"],
+)
+
+app.include_router(
+    lei.router,
+    prefix="/api/v1/uae/lei",
+    tags=["LEI"],
+)
+
+app.include_router(
+    reference.router,
+    prefix="/api/v1/uae/reference",
+    tags=["Reference Data"],
+)
+
 app.include_router(
     health.router,
     prefix="/api/v1/uae/health",
@@ -84,6 +135,10 @@ async def root():
             "codes": "/api/v1/uae/codes/",
             "validation": "/api/v1/uae/validation/validate",
             "iban": "/api/v1/uae/validation/validate-iban",
+            "jobs": "/api/v1/uae/jobs/",
+            "returns": "/api/v1/uae/returns/diagnose",
+            "banks": "/api/v1/uae/banks/lookup",
+            "lei": "/api/v1/uae/lei/{lei}",
         },
     }
 
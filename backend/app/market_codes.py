@@ -0,0 +1,682 @@
+"""
+Cross-Market Purpose Code Mappings (ISO 20022 middle layer)
+Port of the frontend tables in src/data/isoMiddleLayer.ts.
+
+UAE, India, Pakistan, Philippines, Bangladesh and Egypt purpose codes are
+mapped onto ISO 20022 external purpose codes; MULTI_MARKET_MAPPINGS lists,
+per ISO code, the codes each market uses for it. Translation indexes are
+compiled from these tables in app.translation.
+
+Market tables map code -> (iso_code, confidence) or
+(iso_code, confidence, direction).
+"""
+
+from typing import Dict, List, Tuple
+
+MARKETS: Tuple[str, ...] = ("AE", "IN", "PK", "PH", "BD", "EG")
+CONFIDENCE_LEVELS: Tuple[str, ...] = ("high", "medium", "low")
+
+# =============================================================================
+# ISO 20022 PURPOSE CODES
+# =============================================================================
+
+ISO_PURPOSE_CODES: Dict[str, Dict[str, str]] = {
+    "FAMI": {"name": "FamilySupport", "definition": "Transaction is related to a payment to a family member.", "category": "Personal Transfers"},
+    "DEPD": {"name": "DependentSupportPayment", "definition": "Payment made to support a dependent (child support, alimony, etc.).", "category": "Personal Transfers"},
+    "SALA": {"name": "SalaryPayment", "definition": "Transaction is the payment of salaries.", "category": "Salary & Employment"},
+    "BONU": {"name": "BonusPayment", "definition": "Transaction is related to payment of a bonus.", "category": "Salary & Employment"},
+    "ALLW": {"name": "Allowance", "definition": "Transaction is related to the payment of allowances.", "category": "Salary & Employment"},
+    "PAYR": {"name": "Payroll", "definition": "Transaction is related to payroll.", "category": "Salary & Employment"},
+    "COMM": {"name": "Commission", "definition": "Transaction is payment of commission.", "category": "Salary & Employment"},
+    "PENS": {"name": "PensionPayment", "definition": "Transaction is the payment of pension.", "category": "Pension & Benefits"},
+    "SSBE": {"name": "SocialSecurityBenefit", "definition": "Transaction is a social security benefit payment.", "category": "Pension & Benefits"},
+    "BENE": {"name": "UnemploymentDisabilityBenefit", "definition": "Transaction is related to unemployment or disability benefit.", "category": "Pension & Benefits"},
+    "EDUC": {"name": "Education", "definition": "Transaction is related to a payment of education costs.", "category": "Education"},
+    "STDY": {"name": "Study", "definition": "Transaction is related to a payment for study costs.", "category": "Education"},
+    "MDCS": {"name": "MedicalServices", "definition": "Transaction is related to a payment of medical services.", "category": "Medical"},
+    "HLTI": {"name": "HealthInsurance", "definition": "Transaction is related to a payment of health insurance.", "category": "Medical"},
+    "HLTC": {"name": "HomeHealthCare", "definition": "Transaction is related to a payment of home health care.", "category": "Medical"},
+    "INSU": {"name": "InsurancePremium", "definition": "Transaction is payment of an insurance premium.", "category": "Insurance"},
+    "LIFI": {"name": "LifeInsurance", "definition": "Transaction is related to a payment of life insurance.", "category": "Insurance"},
+    "INSC": {"name": "PaymentOfInsuranceClaim", "definition": "Transaction is related to payment of an insurance claim.", "category": "Insurance"},
+    "GDDS": {"name": "PurchaseSaleOfGoods", "definition": "Transaction is related to purchase and sale of goods.", "category": "Trade"},
+    "SUPP": {"name": "SupplierPayment", "definition": "Transaction is related to a payment to a supplier.", "category": "Trade"},
+    "COMT": {"name": "ConsumerThirdPartyConsolidatedPayment", "definition": "A2A Software as a Service (SaaS) payment consolidating transactions.", "category": "Trade"},
+    "CORT": {"name": "TradeSettlementPayment", "definition": "Transaction is related to settlement of a trade.", "category": "Services"},
+    "IVPT": {"name": "InvoicePayment", "definition": "Transaction is the payment of an invoice.", "category": "Services"},
+    "FEES": {"name": "PaymentOfFees", "definition": "Transaction is the payment of fees.", "category": "Services"},
+    "LOAN": {"name": "Loan", "definition": "Transaction is related to the transfer of a loan to a borrower.", "category": "Loans"},
+    "LOAR": {"name": "LoanRepayment", "definition": "Transaction is related to the repayment of a loan to a lender.", "category": "Loans"},
+    "INTE": {"name": "Interest", "definition": "Transaction is the payment of interest.", "category": "Loans"},
+    "DIVD": {"name": "Dividend", "definition": "Transaction is the payment of dividends.", "category": "Investment"},
+    "INVS": {"name": "InvestmentAndSecurities", "definition": "Transaction is related to investment and securities.", "category": "Investment"},
+    "SAVG": {"name": "Savings", "definition": "Transaction is a savings payment.", "category": "Investment"},
+    "TAXS": {"name": "TaxPayment", "definition": "Transaction is the payment of taxes.", "category": "Tax & Government"},
+    "GOVT": {"name": "GovernmentPayment", "definition": "Transaction is a payment to or from a government department.", "category": "Tax & Government"},
+    "TAXR": {"name": "TaxRefund", "definition": "Transaction is the refund of taxes.", "category": "Tax & Government"},
+    "CHAR": {"name": "CharityPayment", "definition": "Transaction is a payment for charity reasons.", "category": "Charity"},
+    "GIFT": {"name": "Gift", "definition": "Transaction is the payment of a gift.", "category": "Charity"},
+    "RENT": {"name": "Rent", "definition": "Transaction is the payment of rent.", "category": "Property"},
+    "BLDM": {"name": "BuildingMaintenance", "definition": "Transaction is related to building maintenance.", "category": "Property"},
+    "TRPT": {"name": "RoadPricing", "definition": "Transaction is for road pricing.", "category": "Transport"},
+    "AIRB": {"name": "Air", "definition": "Transaction is for air transport.", "category": "Transport"},
+    "RLWY": {"name": "Railway", "definition": "Transaction is for rail transport.", "category": "Transport"},
+    "OTHR": {"name": "Other", "definition": "Other payment purpose.", "category": "Other"},
+}
+
+# =============================================================================
+# UAE -> ISO
+# =============================================================================
+
+UAE_TO_ISO: Dict[str, Tuple[str, ...]] = {
+    "FAM": ("FAMI", "high"),
+    "SAL": ("SALA", "high"),
+    "BON": ("BONU", "high"),
+    "ALW": ("ALLW", "high"),
+    "COM": ("COMM", "high"),
+    "ACM": ("COMM", "medium"),
+    "COP": ("SALA", "medium"),
+    "LAS": ("SALA", "medium"),
+    "EOS": ("PENS", "medium"),
+    "SAA": ("SALA", "high"),
+    "EDU": ("EDUC", "high"),
+    "MED": ("MDCS", "high"),
+    "INS": ("INSU", "high"),
+    "GDE": ("GDDS", "high"),
+    "GDI": ("GDDS", "high"),
+    "GMS": ("GDDS", "medium"),
+    "FIS": ("CORT", "medium"),
+    "IFS": ("CORT", "medium"),
+    "TCS": ("CORT", "medium"),
+    "ITS": ("CORT", "medium"),
+    "PMS": ("CORT", "medium"),
+    "RDS": ("CORT", "medium"),
+    "TTS": ("CORT", "medium"),
+    "LIP": ("INTE", "high"),
+    "LNC": ("FEES", "medium"),
+    "LND": ("LOAN", "high"),
+    "IID": ("INTE", "high"),
+    "IOL": ("INTE", "high"),
+    "DIV": ("DIVD", "high"),
+    "DOE": ("DIVD", "high"),
+    "IGD": ("DIVD", "high"),
+    "CIN": ("INVS", "medium"),
+    "TAX": ("TAXS", "high"),
+    "XAT": ("TAXR", "high"),
+    "GRI": ("GOVT", "medium"),
+    "GOS": ("GOVT", "medium"),
+    "CHC": ("CHAR", "high"),
+    "REN": ("RENT", "high"),
+    "ATS": ("AIRB", "high"),
+    "OTS": ("TRPT", "medium"),
+    "STS": ("TRPT", "medium"),
+}
+
+# =============================================================================
+# INDIA (inward - P codes) -> ISO
+# =============================================================================
+
+INDIA_INWARD_TO_ISO: Dict[str, Tuple[str, ...]] = {
+    "P1301": ("FAMI", "high"),
+    "P1307": ("FAMI", "medium"),
+    "P0305": ("EDUC", "high"),
+    "P1107": ("EDUC", "high"),
+    "P0304": ("MDCS", "high"),
+    "P1108": ("MDCS", "high"),
+    "P0601": ("LIFI", "high"),
+    "P0607": ("INSC", "high"),
+    "P0611": ("PENS", "high"),
+    "P1408": ("DIVD", "high"),
+    "P1409": ("DIVD", "high"),
+    "P1411": ("INTE", "high"),
+    "P1412": ("DIVD", "high"),
+    "P1403": ("INTE", "high"),
+    "P1405": ("INTE", "high"),
+    "P1201": ("GOVT", "high"),
+    "P1203": ("GOVT", "high"),
+}
+
+# =============================================================================
+# INDIA (outward - S codes) -> ISO
+# =============================================================================
+
+INDIA_OUTWARD_TO_ISO: Dict[str, Tuple[str, ...]] = {
+    "S1301": ("FAMI", "high"),
+    "S0023": ("FAMI", "medium"),
+    "S1307": ("FAMI", "medium"),
+    "S0305": ("EDUC", "high"),
+    "S1107": ("EDUC", "high"),
+    "S0304": ("MDCS", "high"),
+    "S1108": ("MDCS", "high"),
+    "S0601": ("LIFI", "high"),
+    "S0603": ("INSU", "high"),
+    "S0607": ("INSC", "high"),
+    "S0611": ("PENS", "high"),
+    "S1302": ("GIFT", "high"),
+    "S1303": ("CHAR", "high"),
+    "S1304": ("CHAR", "high"),
+    "S1306": ("TAXS", "high"),
+    "S0101": ("GDDS", "high"),
+    "S0102": ("GDDS", "high"),
+    "S0104": ("GDDS", "medium"),
+    "S0108": ("GDDS", "medium"),
+    "S0201": ("TRPT", "medium"),
+    "S0207": ("AIRB", "high"),
+    "S0203": ("TRPT", "high"),
+    "S0209": ("AIRB", "high"),
+    "S0003": ("INVS", "high"),
+    "S0001": ("INVS", "high"),
+    "S0011": ("LOAN", "high"),
+    "S0012": ("LOAR", "high"),
+    "S1402": ("INTE", "high"),
+    "S1403": ("INTE", "high"),
+    "S1408": ("DIVD", "high"),
+    "S1409": ("DIVD", "high"),
+    "S1201": ("GOVT", "high"),
+    "S1202": ("GOVT", "high"),
+}
+
+# =============================================================================
+# PAKISTAN (SBP) -> ISO
+# =============================================================================
+
+PAKISTAN_TO_ISO: Dict[str, Tuple[str, ...]] = {
+    "9010": ("SEAB", "high"),
+    "9011": ("SEAB", "high"),
+    "9012": ("SEAB", "medium"),
+    "9013": ("SEAB", "medium"),
+    "9016": ("AIRB", "high"),
+    "9017": ("AIRB", "high"),
+    "9018": ("AIRB", "medium"),
+    "9061": ("MDCS", "high"),
+    "9071": ("EDUC", "high"),
+    "9072": ("EDUC", "high"),
+    "9081": ("TRVL", "high"),
+    "9082": ("TRVL", "high"),
+    "9083": ("CHAR", "medium"),
+    "9091": ("SCVE", "medium"),
+    "9092": ("SCVE", "high"),
+    "9121": ("SCVE", "high"),
+    "9122": ("SCVE", "high"),
+    "9123": ("FEES", "high"),
+    "9124": ("SCVE", "high"),
+    "9125": ("LICF", "high"),
+    "9126": ("SCVE", "high"),
+    "9201": ("GDDS", "high"),
+    "9202": ("GDDS", "high"),
+    "9211": ("GDDS", "high"),
+    "9212": ("GDDS", "high"),
+    "9301": ("SALA", "high", "inward"),
+    "9302": ("FAMI", "high", "inward"),
+    "9303": ("PENS", "high", "inward"),
+    "9304": ("FAMI", "high", "inward"),
+    "9401": ("INVS", "high"),
+    "9402": ("INVS", "high"),
+    "9403": ("LOAN", "high"),
+    "9411": ("SECU", "high"),
+    "9412": ("SECU", "high"),
+    "9501": ("DIVI", "high"),
+    "9502": ("INTE", "high"),
+    "9503": ("INTE", "high"),
+    "9504": ("DIVI", "high"),
+    "9601": ("GOVT", "high"),
+    "9602": ("GOVT", "high"),
+    "9603": ("TAXS", "high"),
+    "9701": ("CHAR", "high"),
+    "9702": ("FAMI", "high"),
+    "9703": ("PENS", "high"),
+}
+
+# =============================================================================
+# PHILIPPINES (BSP) -> ISO
+# =============================================================================
+
+PHILIPPINES_TO_ISO: Dict[str, Tuple[str, ...]] = {
+    "5132": ("EDUC", "high"),
+    "5133": ("EDUC", "high"),
+    "5134": ("CCRD", "high"),
+    "5135": ("DCRD", "high"),
+    "5136": ("OTHR", "medium"),
+    "5137": ("EDUC", "high"),
+    "5138": ("EDUC", "high"),
+    "5140": ("GOVT", "high"),
+    "5141": ("TRVL", "high"),
+    "5142": ("TRVL", "high"),
+    "5143": ("TRVL", "high"),
+    "5144": ("GOVT", "high"),
+    "5145": ("TAXS", "high"),
+    "5175": ("SCVE", "medium"),
+    "5176": ("SCVE", "medium"),
+    "5177": ("SCVE", "high"),
+    "5201": ("FAMI", "high", "inward"),
+    "5202": ("FAMI", "high", "inward"),
+    "5203": ("SALA", "high", "inward"),
+    "5204": ("PENS", "high", "inward"),
+    "5301": ("INVS", "high"),
+    "5302": ("INVS", "high"),
+    "5310": ("FAMI", "high"),
+    "5311": ("CHAR", "high"),
+    "5312": ("CHAR", "high"),
+    "5313": ("CHAR", "medium"),
+    "5401": ("INVS", "high"),
+    "5402": ("SECU", "high"),
+    "5403": ("SECU", "high"),
+    "5501": ("LOAR", "high"),
+    "5502": ("LOAN", "high"),
+    "5503": ("INTE", "high"),
+    "5601": ("INSU", "high"),
+    "5602": ("ICCP", "high"),
+    "5701": ("MDCS", "high"),
+    "5702": ("MDCS", "high"),
+    "5703": ("HLTI", "high"),
+    "5801": ("FEES", "high"),
+    "5802": ("FEES", "high"),
+    "5803": ("COMM", "high"),
+    "5901": ("GDDS", "high"),
+    "5902": ("GDDS", "high"),
+}
+
+# =============================================================================
+# BANGLADESH (Bangladesh Bank) -> ISO
+# =============================================================================
+
+BANGLADESH_TO_ISO: Dict[str, Tuple[str, ...]] = {
+    "1001": ("SCVE", "high"),
+    "1002": ("SCVE", "high"),
+    "1003": ("SCVE", "high"),
+    "1004": ("SCVE", "high"),
+    "1005": ("SCVE", "high"),
+    "1006": ("SCVE", "high"),
+    "1007": ("SCVE", "high"),
+    "1008": ("COMM", "high"),
+    "1009": ("COMM", "high"),
+    "1801": ("SALA", "high", "inward"),
+    "1802": ("SALA", "high", "inward"),
+    "1803": ("FAMI", "high", "inward"),
+    "1804": ("FAMI", "high", "inward"),
+    "1805": ("FAMI", "medium", "inward"),
+    "2101": ("GDDS", "high"),
+    "2102": ("GDDS", "high"),
+    "2103": ("GDDS", "high"),
+    "2104": ("GDDS", "high"),
+    "2105": ("GDDS", "high"),
+    "2106": ("GDDS", "high"),
+    "2107": ("GDDS", "high"),
+    "2201": ("GDDS", "high"),
+    "2202": ("GDDS", "high"),
+    "2203": ("GDDS", "high"),
+    "2204": ("GDDS", "high"),
+    "2205": ("GDDS", "high"),
+    "2206": ("GDDS", "high"),
+    "3101": ("INVS", "high"),
+    "3102": ("INVS", "high"),
+    "3103": ("LOAN", "high"),
+    "3201": ("SECU", "high"),
+    "3202": ("SECU", "high"),
+    "4101": ("DIVI", "high"),
+    "4102": ("DIVI", "high"),
+    "4201": ("DIVI", "high"),
+    "4301": ("INTE", "high"),
+    "4302": ("INTE", "high"),
+    "4303": ("INTE", "high"),
+    "5001": ("GOVT", "high"),
+    "5002": ("GOVT", "high"),
+    "5003": ("TAXS", "high"),
+    "5101": ("EDUC", "high"),
+    "5102": ("EDUC", "high"),
+    "5103": ("EDUC", "high"),
+    "6001": ("FAMI", "high"),
+    "6002": ("CHAR", "high"),
+    "6003": ("CHAR", "high"),
+    "6004": ("PENS", "high"),
+    "0010": ("SEAB", "high"),
+    "0020": ("SEAB", "high"),
+    "0030": ("SEAB", "high"),
+    "0040": ("SEAB", "medium"),
+    "0050": ("SEAB", "medium"),
+    "0060": ("SEAB", "medium"),
+    "0110": ("AIRB", "high"),
+    "0120": ("AIRB", "high"),
+    "0130": ("AIRB", "high"),
+    "0140": ("AIRB", "medium"),
+    "0150": ("AIRB", "medium"),
+    "0210": ("TRPT", "high"),
+    "0220": ("TRPT", "high"),
+    "0230": ("TRPT", "medium"),
+    "0301": ("TRVL", "high"),
+    "0302": ("TRVL", "high"),
+    "0303": ("EDUC", "high"),
+    "0304": ("MDCS", "high"),
+    "0305": ("CHAR", "medium"),
+    "0401": ("SCVE", "high"),
+    "0402": ("SCVE", "high"),
+    "0403": ("SCVE", "high"),
+    "0501": ("SCVE", "high"),
+    "0502": ("SCVE", "high"),
+    "0601": ("INSU", "high"),
+    "0602": ("INSU", "high"),
+    "0603": ("ICCP", "high"),
+    "0604": ("INSU", "high"),
+    "0701": ("FEES", "high"),
+    "0702": ("FEES", "high"),
+    "0703": ("FEES", "high"),
+    "0801": ("SCVE", "high"),
+    "0802": ("SCVE", "high"),
+    "0803": ("SCVE", "high"),
+    "0804": ("SCVE", "high"),
+    "0901": ("LICF", "high"),
+    "0902": ("LICF", "high"),
+    "0903": ("LICF", "high"),
+    "0904": ("LICF", "high"),
+}
+
+# =============================================================================
+# EGYPT (CBE) -> ISO
+# =============================================================================
+
+EGYPT_TO_ISO: Dict[str, Tuple[str, ...]] = {
+    "SALA": ("SALA", "high"),
+    "PENS": ("PENS", "high"),
+    "SSBE": ("SSBE", "high"),
+    "PENG": ("PENS", "high"),
+    "GOVT": ("GOVT", "high"),
+    "LOAN": ("LOAN", "high"),
+    "SUPP": ("SUPP", "high"),
+    "CCRD": ("CCRD", "high"),
+    "CACC": ("ACCT", "high"),
+    "SCCD": ("GOVT", "medium"),
+    "DIVD": ("DIVI", "high"),
+    "INTR": ("INTE", "high"),
+    "COMM": ("COMM", "high"),
+    "OTHR": ("OTHR", "high"),
+}
+
+# =============================================================================
+# MULTI-MARKET CROSS MAPPINGS (per ISO code, the codes each market uses)
+# =============================================================================
+
+MULTI_MARKET_MAPPINGS: List[Dict] = [
+    {
+        "iso": "FAMI",
+        "confidence": "high",
+        "notes": "Primary remittance code across all markets",
+        "codes": {
+            "AE": [
+                {"code": "FAM", "purpose": "Family Support (Workers remittances)", "description": "Cross Border & Domestic", "direction": None},
+            ],
+            "IN": [
+                {"code": "P1301", "purpose": "Family Maintenance/Savings - Receipt", "description": "Inward from NRIs", "direction": "inward"},
+                {"code": "S1301", "purpose": "Family Maintenance/Savings - Payment", "description": "Outward", "direction": "outward"},
+            ],
+            "PK": [
+                {"code": "9302", "purpose": "Workers remittance - Savings", "description": "Inward remittances", "direction": "inward"},
+                {"code": "9304", "purpose": "Workers remittance - Other", "description": "Other remittances", "direction": "inward"},
+                {"code": "9702", "purpose": "Personal transfers", "description": "Personal transfers", "direction": None},
+            ],
+            "PH": [
+                {"code": "5201", "purpose": "OFW Remittance - Family support", "description": "Overseas Filipino Worker family support", "direction": "inward"},
+                {"code": "5202", "purpose": "OFW Remittance - Savings", "description": "Overseas Filipino Worker savings", "direction": "inward"},
+                {"code": "5310", "purpose": "Donations/Gifts - Individual", "description": "Personal gifts", "direction": None},
+            ],
+            "BD": [
+                {"code": "1803", "purpose": "Workers remittance - Other", "description": "Other worker remittances", "direction": "inward"},
+                {"code": "6001", "purpose": "Personal transfers - Family", "description": "Family transfers", "direction": None},
+            ],
+            "EG": [],
+        },
+    },
+    {
+        "iso": "SALA",
+        "confidence": "high",
+        "notes": "Salary payments - India uses P1301 for salary transfers",
+        "codes": {
+            "AE": [
+                {"code": "SAL", "purpose": "Salary Payment", "description": "Regular salary payments", "direction": None},
+                {"code": "SAA", "purpose": "Salary Advance", "description": "Advance against salary", "direction": None},
+            ],
+            "IN": [],
+            "PK": [
+                {"code": "9301", "purpose": "Workers remittance - Wages", "description": "Wage earner remittances", "direction": "inward"},
+            ],
+            "PH": [
+                {"code": "5203", "purpose": "OFW Remittance - Salary", "description": "OFW salary transfers", "direction": "inward"},
+            ],
+            "BD": [
+                {"code": "1801", "purpose": "Workers remittance - Wage earners", "description": "Wage earner remittances", "direction": "inward"},
+                {"code": "1802", "purpose": "Workers remittance - Professionals", "description": "Professional remittances", "direction": "inward"},
+            ],
+            "EG": [
+                {"code": "SALA", "purpose": "Salary Payment", "description": "Salary and wage payments", "direction": None},
+            ],
+        },
+    },
+    {
+        "iso": "EDUC",
+        "confidence": "high",
+        "notes": "Education-related transfers",
+        "codes": {
+            "AE": [
+                {"code": "EDU", "purpose": "Educational Support", "description": "Education fees and expenses", "direction": None},
+            ],
+            "IN": [
+                {"code": "S0305", "purpose": "Travel for Education - Payment", "description": "Education travel", "direction": "outward"},
+                {"code": "P0305", "purpose": "Travel for Education - Receipt", "description": "Education receipts", "direction": "inward"},
+                {"code": "S1107", "purpose": "Education Services - Payment", "description": "Education services", "direction": "outward"},
+            ],
+            "PK": [
+                {"code": "9071", "purpose": "Education - Students", "description": "Student education expenses", "direction": None},
+                {"code": "9072", "purpose": "Education - Other", "description": "Other education expenses", "direction": None},
+            ],
+            "PH": [
+                {"code": "5132", "purpose": "Education expenses - Philippines", "description": "Local education", "direction": None},
+                {"code": "5133", "purpose": "Education expenses - Abroad", "description": "Foreign education", "direction": None},
+                {"code": "5137", "purpose": "Training expenses - Philippines", "description": "Local training", "direction": None},
+            ],
+            "BD": [
+                {"code": "0303", "purpose": "Travel - Education", "description": "Education travel", "direction": None},
+                {"code": "5101", "purpose": "Education expenses abroad", "description": "Foreign education", "direction": None},
+                {"code": "5102", "purpose": "Education - tuition", "description": "Tuition fees", "direction": None},
+            ],
+            "EG": [],
+        },
+    },
+    {
+        "iso": "MDCS",
+        "confidence": "high",
+        "notes": "Medical and health-related transfers",
+        "codes": {
+            "AE": [
+                {"code": "MED", "purpose": "Medical Treatment", "description": "Medical expenses", "direction": None},
+            ],
+            "IN": [
+                {"code": "S0304", "purpose": "Medical Treatment - Payment", "description": "Medical travel", "direction": "outward"},
+                {"code": "P0304", "purpose": "Medical Treatment - Receipt", "description": "Medical receipts", "direction": "inward"},
+                {"code": "S1108", "purpose": "Health Service - Payment", "description": "Health services", "direction": "outward"},
+            ],
+            "PK": [
+                {"code": "9061", "purpose": "Health related travel", "description": "Medical treatment abroad", "direction": None},
+            ],
+            "PH": [
+                {"code": "5701", "purpose": "Medical expenses", "description": "Medical treatment", "direction": None},
+                {"code": "5702", "purpose": "Hospital expenses", "description": "Hospital bills", "direction": None},
+            ],
+            "BD": [
+                {"code": "0304", "purpose": "Travel - Medical", "description": "Medical travel", "direction": None},
+            ],
+            "EG": [],
+        },
+    },
+    {
+        "iso": "PENS",
+        "confidence": "high",
+        "notes": "Pension and end-of-service payments",
+        "codes": {
+            "AE": [
+                {"code": "PEN", "purpose": "Pension", "description": "Pension payments", "direction": None},
+                {"code": "EOS", "purpose": "End of Service", "description": "Gratuity payments", "direction": None},
+            ],
+            "IN": [
+                {"code": "S0611", "purpose": "Periodic Pension - Payment", "description": "Pension outward", "direction": "outward"},
+                {"code": "P0611", "purpose": "Periodic Pension - Receipt", "description": "Pension inward", "direction": "inward"},
+            ],
+            "PK": [
+                {"code": "9303", "purpose": "Workers remittance - Pensions", "description": "Pension remittances", "direction": "inward"},
+                {"code": "9703", "purpose": "Pensions", "description": "Pension transfers", "direction": None},
+            ],
+            "PH": [
+                {"code": "5204", "purpose": "OFW Remittance - Pension", "description": "OFW pension", "direction": "inward"},
+            ],
+            "BD": [
+                {"code": "6004", "purpose": "Pension payments", "description": "Pension transfers", "direction": None},
+            ],
+            "EG": [
+                {"code": "PENS", "purpose": "Pensions Payment", "description": "Pension disbursements", "direction": None},
+                {"code": "PENG", "purpose": "National Social Insurance", "description": "Social insurance", "direction": None},
+            ],
+        },
+    },
+    {
+        "iso": "DIVD",
+        "confidence": "high",
+        "notes": "Dividend payments across markets",
+        "codes": {
+            "AE": [
+                {"code": "DIV", "purpose": "Dividend Payouts", "description": "Dividend payments", "direction": None},
+                {"code": "DOE", "purpose": "Dividends on Equity", "description": "Equity dividends", "direction": None},
+                {"code": "IGD", "purpose": "Dividends Intragroup", "description": "Intragroup dividends", "direction": None},
+            ],
+            "IN": [
+                {"code": "S1409", "purpose": "FDI Dividends - Payment", "description": "FDI dividend outward", "direction": "outward"},
+                {"code": "P1409", "purpose": "FDI Dividends - Receipt", "description": "FDI dividend inward", "direction": "inward"},
+                {"code": "P1412", "purpose": "Portfolio Dividends - Receipt", "description": "Portfolio dividends", "direction": "inward"},
+            ],
+            "PK": [
+                {"code": "9501", "purpose": "Dividends", "description": "Dividend payments", "direction": None},
+                {"code": "9504", "purpose": "Profits", "description": "Profit repatriation", "direction": None},
+            ],
+            "PH": [],
+            "BD": [
+                {"code": "4101", "purpose": "Dividend repatriation", "description": "FDI dividends", "direction": None},
+                {"code": "4102", "purpose": "Dividend - Portfolio", "description": "Portfolio dividends", "direction": None},
+            ],
+            "EG": [
+                {"code": "DIVD", "purpose": "Dividends", "description": "Dividend payments", "direction": None},
+            ],
+        },
+    },
+    {
+        "iso": "GDDS",
+        "confidence": "high",
+        "notes": "Trade in goods - exports and imports",
+        "codes": {
+            "AE": [
+                {"code": "GDE", "purpose": "Goods Sold (Export)", "description": "Export proceeds", "direction": None},
+                {"code": "GDI", "purpose": "Goods Bought (Import)", "description": "Import payments", "direction": None},
+            ],
+            "IN": [
+                {"code": "S0101", "purpose": "Advance against Imports", "description": "Import advance", "direction": "outward"},
+                {"code": "S0102", "purpose": "Import Settlement", "description": "Import payment", "direction": "outward"},
+            ],
+            "PK": [
+                {"code": "9201", "purpose": "Merchandise - Exports", "description": "Export of goods", "direction": None},
+                {"code": "9211", "purpose": "Merchandise - Imports", "description": "Import of goods", "direction": None},
+            ],
+            "PH": [
+                {"code": "5901", "purpose": "Export proceeds", "description": "Export receipts", "direction": None},
+                {"code": "5902", "purpose": "Import payments", "description": "Import payments", "direction": None},
+            ],
+            "BD": [
+                {"code": "2101", "purpose": "Exports - RMG", "description": "Ready made garments", "direction": None},
+                {"code": "2102", "purpose": "Exports - Textiles", "description": "Textile exports", "direction": None},
+                {"code": "2201", "purpose": "Imports - Capital machinery", "description": "Machinery imports", "direction": None},
+                {"code": "2202", "purpose": "Imports - Raw materials", "description": "Raw material imports", "direction": None},
+            ],
+            "EG": [
+                {"code": "SUPP", "purpose": "Supplier Benefit", "description": "Supplier payments", "direction": None},
+            ],
+        },
+    },
+    {
+        "iso": "CHAR",
+        "confidence": "high",
+        "notes": "Charitable and religious donations",
+        "codes": {
+            "AE": [
+                {"code": "CHC", "purpose": "Charitable Contributions", "description": "Charity and aid", "direction": None},
+            ],
+            "IN": [
+                {"code": "S1303", "purpose": "Religious/Charitable Donations", "description": "Religious donations", "direction": "outward"},
+                {"code": "S1304", "purpose": "Government/Charitable", "description": "Charitable grants", "direction": "outward"},
+            ],
+            "PK": [
+                {"code": "9083", "purpose": "Religious travel", "description": "Hajj and religious", "direction": None},
+                {"code": "9701", "purpose": "Grants and donations", "description": "Charitable donations", "direction": None},
+            ],
+            "PH": [
+                {"code": "5311", "purpose": "Donations/Gifts - Institution", "description": "Institutional donations", "direction": None},
+                {"code": "5312", "purpose": "Donations/Gifts - Religious", "description": "Religious donations", "direction": None},
+            ],
+            "BD": [
+                {"code": "0305", "purpose": "Travel - Religious", "description": "Hajj/Umrah travel", "direction": None},
+                {"code": "6002", "purpose": "Donations - Charitable", "description": "Charitable donations", "direction": None},
+                {"code": "6003", "purpose": "Donations - Religious", "description": "Religious donations", "direction": None},
+            ],
+            "EG": [],
+        },
+    },
+    {
+        "iso": "INSU",
+        "confidence": "high",
+        "notes": "Insurance premium payments",
+        "codes": {
+            "AE": [
+                {"code": "INS", "purpose": "Insurance Services", "description": "Insurance premiums", "direction": None},
+            ],
+            "IN": [
+                {"code": "S0603", "purpose": "General Insurance - Payment", "description": "Insurance premium", "direction": "outward"},
+            ],
+            "PK": [
+                {"code": "9122", "purpose": "Insurance services", "description": "Insurance", "direction": None},
+            ],
+            "PH": [
+                {"code": "5601", "purpose": "Insurance premium", "description": "Insurance premium", "direction": None},
+            ],
+            "BD": [
+                {"code": "0601", "purpose": "Life insurance premium", "description": "Life insurance", "direction": None},
+                {"code": "0602", "purpose": "Non-life insurance premium", "description": "General insurance", "direction": None},
+            ],
+            "EG": [],
+        },
+    },
+    {
+        "iso": "GOVT",
+        "confidence": "high",
+        "notes": "Government-related payments",
+        "codes": {
+            "AE": [
+                {"code": "GRI", "purpose": "Government Related Income", "description": "Government fees", "direction": None},
+                {"code": "GOS", "purpose": "Government Goods & Services", "description": "Embassy expenses", "direction": None},
+            ],
+            "IN": [
+                {"code": "S1201", "purpose": "Indian Embassy Maintenance", "description": "Embassy maintenance", "direction": "outward"},
+                {"code": "P1201", "purpose": "Foreign Embassy Maintenance", "description": "Embassy receipts", "direction": "inward"},
+            ],
+            "PK": [
+                {"code": "9601", "purpose": "Government receipts", "description": "Government receipts", "direction": None},
+                {"code": "9602", "purpose": "Government payments", "description": "Government payments", "direction": None},
+            ],
+            "PH": [
+                {"code": "5140", "purpose": "Foreign Office maintenance", "description": "Embassy expenses", "direction": None},
+                {"code": "5144", "purpose": "Embassy expenses", "description": "Embassy costs", "direction": None},
+            ],
+            "BD": [
+                {"code": "5001", "purpose": "Government grants received", "description": "Government grants", "direction": None},
+                {"code": "5002", "purpose": "Government grants paid", "description": "Government payments", "direction": None},
+            ],
+            "EG": [
+                {"code": "GOVT", "purpose": "Government Payment", "description": "Government payments", "direction": None},
+                {"code": "SCCD", "purpose": "Suez Canal Certificate", "description": "Suez Canal related", "direction": None},
+            ],
+        },
+    },
+]
@@ -0,0 +1,277 @@
+"""
+UAE Reference Data
+Versioned, hot-reloadable purpose codes, bank codes and thresholds.
+
+The built-in data in app.constants is the default. Setting
+UAE_REFERENCE_DATA_PATH points the service at a JSON file instead:
+
+    {
+        "version": "2026-10-01",
+        "thresholds": {
+            "lei_threshold_aed": 1000000,
+            "high_value_threshold_aed": 500000,
+            "penalty_per_violation_aed": 1000.0
+        },
+        "categories": {"SAL": "Salary and Compensation", ...},
+        "purpose_codes": [{"code": "SAL", "name": "Salary Payment", ...}, ...],
+        "bank_codes": {"033": {"name": "Emirates NBD", "swift": "EBILAEAD"}, ...}
+    }
+
+Sections missing from the file fall back to the built-in data. The file's
+"version" is an operator label: the snapshot version is always derived
+from the content ("<label>+sha256:<hash>"), so changed data never reuses a
+version and every version-keyed cache follows it. Every
+ReferenceData object is immutable once built; reloading builds a new one
+with all indexes precomputed and swaps it in with a single assignment, so
+a request that took a snapshot keeps a consistent view until it finishes.
+
+Export the built-in data as a starting file:
+    python -m app.reference export reference_data.json
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Tuple
+
+from app.constants import (
+    UAE_PURPOSE_CODES,
+    UAE_PPC_CATEGORIES,
+    UAE_BANK_CODES,
+    UAE_BANK_CODE_SLOTS,
+    UAE_LEI_THRESHOLD_AED,
+    UAE_HIGH_VALUE_THRESHOLD_AED,
+    UAE_PENALTY_PER_VIOLATION_AED,
+)
+
+REFERENCE_DATA_PATH_ENV = "UAE_REFERENCE_DATA_PATH"
+
+
+# =============================================================================
+# REFERENCE DATA SNAPSHOT
+# =============================================================================
+
+@dataclass(frozen=True)
+class ReferenceData:
+    """Immutable snapshot of reference data with precomputed indexes."""
+
+    version: str
+    source: str
+    label: Optional[str]
+    purpose_codes: Tuple[Mapping[str, Any], ...]
+    categories: Mapping[str, str]
+    bank_codes: Mapping[str, Mapping[str, str]]
+    lei_threshold_aed: float
+    high_value_threshold_aed: float
+    penalty_per_violation_aed: float
+
+    # Precomputed indexes
+    purpose_code_lookup: Mapping[str, Mapping[str, Any]]
+    codes_by_category: Mapping[str, Tuple[Mapping[str, Any], ...]]
+    bank_code_table: Tuple[Optional[Mapping[str, str]], ...]
+    bic_lookup: Mapping[str, Mapping[str, str]]
+
+    @classmethod
+    def build(
+        cls,
+        purpose_codes: List[Dict],
+        categories: Dict[str, str],
+        bank_codes: Dict[str, Dict[str, str]],
+        lei_threshold_aed: float,
+        high_value_threshold_aed: float,
+        penalty_per_violation_aed: float,
+        label: Optional[str] = None,
+        source: str = "builtin",
+    ) -> "ReferenceData":
+        """Validate raw data and precompute every lookup index."""
+        codes = tuple(MappingProxyType(dict(c)) for c in purpose_codes)
+
+        lookup: Dict[str, Mapping[str, Any]] = {}
+        by_category: Dict[str, List[Mapping[str, Any]]] = {}
+        for code in codes:
+            lookup[code["code"].upper()] = code
+            by_category.setdefault(code.get("category", "OTH"), []).append(code)
+
+        # Direct-address bank table: slot N holds bank code "%03d" % N (or None).
+        # IBAN bank codes are 3 digits, so 1000 slots cover every possible code.
+        table: List[Optional[Mapping[str, str]]] = [None] * UAE_BANK_CODE_SLOTS
+        for bank_code, bank in bank_codes.items():
+            if len(bank_code) != 3 or not bank_code.isdigit():
+                raise ValueError(f"Bank code '{bank_code}' must be 3 digits")
+            table[int(bank_code)] = MappingProxyType({"code": bank_code, **bank})
+
+        # Reverse SWIFT/BIC index keyed by the 8-character institution BIC.
+        # 11-character BICs (with branch code) resolve through their first 8 chars.
+        bic_lookup = {
+            entry["swift"].upper()[:8]: entry
+            for entry in table if entry and entry.get("swift")
+        }
+
+        version = "sha256:" + _content_hash(
+            purpose_codes, categories, bank_codes,
+            lei_threshold_aed, high_value_threshold_aed, penalty_per_violation_aed,
+        )
+        if label:
+            version = f"{label}+{version}"
+
+        return cls(
+            version=version,
+            source=source,
+            label=label,
+            purpose_codes=codes,
+            categories=MappingProxyType(dict(categories)),
+            bank_codes=MappingProxyType({k: MappingProxyType(dict(v)) for k, v in bank_codes.items()}),
+            lei_threshold_aed=lei_threshold_aed,
+            high_value_threshold_aed=high_value_threshold_aed,
+            penalty_per_violation_aed=penalty_per_violation_aed,
+            purpose_code_lookup=MappingProxyType(lookup),
+            codes_by_category=MappingProxyType({k: tuple(v) for k, v in by_category.items()}),
+            bank_code_table=tuple(table),
+            bic_lookup=MappingProxyType(bic_lookup),
+        )
+
+    @classmethod
+    def from_constants(cls) -> "ReferenceData":
+        """Build reference data from the built-in constants."""
+        return cls.build(
+            purpose_codes=UAE_PURPOSE_CODES,
+            categories=UAE_PPC_CATEGORIES,
+            bank_codes=UAE_BANK_CODES,
+            lei_threshold_aed=UAE_LEI_THRESHOLD_AED,
+            high_value_threshold_aed=UAE_HIGH_VALUE_THRESHOLD_AED,
+            penalty_per_violation_aed=UAE_PENALTY_PER_VIOLATION_AED,
+        )
+
+    @classmethod
+    def from_file(cls, path: str) -> "ReferenceData":
+        """Build reference data from a JSON file, falling back to built-ins per section."""
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+
+        thresholds = raw.get("thresholds", {})
+        return cls.build(
+            purpose_codes=raw.get("purpose_codes", UAE_PURPOSE_CODES),
+            categories=raw.get("categories", UAE_PPC_CATEGORIES),
+            bank_codes=raw.get("bank_codes", UAE_BANK_CODES),
+            lei_threshold_aed=thresholds.get("lei_threshold_aed", UAE_LEI_THRESHOLD_AED),
+            high_value_threshold_aed=thresholds.get("high_value_threshold_aed", UAE_HIGH_VALUE_THRESHOLD_AED),
+            penalty_per_violation_aed=thresholds.get("penalty_per_violation_aed", UAE_PENALTY_PER_VIOLATION_AED),
+            label=str(raw["version"]) if raw.get("version") else None,
+            source=path,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to the JSON file format."""
+        return {
+            "version": self.label,
+            "thresholds": {
+                "lei_threshold_aed": self.lei_threshold_aed,
+                "high_value_threshold_aed": self.high_value_threshold_aed,
+                "penalty_per_violation_aed": self.penalty_per_violation_aed,
+            },
+            "categories": dict(self.categories),
+            "purpose_codes": [dict(c) for c in self.purpose_codes],
+            "bank_codes": {k: dict(v) for k, v in self.bank_codes.items()},
+        }
+
+
+def _content_hash(*parts: Any) -> str:
+    payload = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:12]
+
+
+# =============================================================================
+# CURRENT SNAPSHOT (atomic swap)
+# =============================================================================
+
+_reload_lock = threading.Lock()
+_current: ReferenceData = (
+    ReferenceData.from_file(os.environ[REFERENCE_DATA_PATH_ENV])
+    if os.environ.get(REFERENCE_DATA_PATH_ENV)
+    else ReferenceData.from_constants()
+)
+
+
+def get_reference_data() -> ReferenceData:
+    """
+    Return the current reference data snapshot.
+
+    Callers should take one snapshot per request and use it throughout,
+    rather than calling this repeatedly.
+    """
+    return _current
+
+
+def reload_reference_data(path: Optional[str] = None) -> ReferenceData:
+    """
+    Load reference data from a file (or the built-ins) and swap it in.
+
+    Args:
+        path: JSON file to load; defaults to UAE_REFERENCE_DATA_PATH, or the
+            built-in constants when that is unset
+
+    Returns:
+        The new snapshot
+    """
+    global _current
+    path = path or os.environ.get(REFERENCE_DATA_PATH_ENV)
+    with _reload_lock:
+        # Build fully before publishing; a bad file leaves the current data in place
+        data = ReferenceData.from_file(path) if path else ReferenceData.from_constants()
+        _current = data
+    return data
+
+
+# =============================================================================
+# VERSIONED CACHES
+# =============================================================================
+
+class VersionedCache:
+    """
+    Cache for values derived from reference data.
+
+    Entries are kept per reference data version, for the two versions used
+    most recently; a third version evicts the older of the two. Versions are
+    only compared for equality (they have no order), so requests still
+    holding the previous snapshot during a reload keep hitting its entries
+    instead of wiping the new version's, and the other way round.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        # (version, entries) for the most and the second most recently used version
+        self._state: Tuple[Tuple[Optional[str], Dict[Hashable, Any]], ...] = ((None, {}), (None, {}))
+
+    def _entries(self, version: str) -> Dict[Hashable, Any]:
+        current, previous = self._state
+        if current[0] == version:
+            return current[1]
+        if previous[0] == version:
+            self._state = (previous, current)
+            return previous[1]
+        entries: Dict[Hashable, Any] = {}
+        self._state = ((version, entries), current)
+        return entries
+
+    def get(self, ref: ReferenceData, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing it with factory on a miss."""
+        entries = self._entries(ref.version)
+        try:
+            return entries[key]
+        except KeyError:
+            value = factory()
+            if len(entries) < self.max_entries:
+                entries[key] = value
+            return value
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "export":
+        sys.exit("usage: python -m app.reference export <file.json>")
+    with open(sys.argv[2], "w", encoding="utf-8") as f:
+        json.dump(ReferenceData.from_constants().to_dict(), f, indent=2)
+    print(f"Exported reference data to {sys.argv[2]}")
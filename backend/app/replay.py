@@ -0,0 +1,488 @@
+"""
+UAE Traffic Replay
+Re-run recorded validation traffic through UAEValidationEngine, offline,
+and report throughput, latency percentiles and decision differences.
+
+Recorded traffic is read from local NDJSON files or audit log directories.
+Each line is one of:
+
+    audit record   written with UAE_AUDIT_REQUESTS=1: decision fields plus
+                   "request" (see app.audit)
+    recording      {"request": {...}, "response": {...}} with a minimal,
+                   errors_only or full response
+    request        a bare UAEValidationRequest (replayed, nothing to diff)
+
+Decisions compared: stp_score, failing rule codes and uaefts_compliant.
+
+Runs use the same duplicate and velocity stages as the API, fed with the
+recorded timestamps, so a replay of unchanged code reproduces the recorded
+decisions. An audit directory holds the segments of every process that
+wrote to it (API workers, job workers), overlapping in time: each
+process's segments are read in order and the processes are merged by
+"ts", and each source process replays on its own stage state, as it was
+recorded. Job workers start fresh stage state per job, so decisions of
+several jobs run by one worker can differ on the duplicate and velocity
+warnings; use --stateless to compare those exactly. Across N processes
+the traffic is partitioned by debtor IBAN: both stages are keyed by
+debtor, so every partition sees all of its debtors' payments in recorded
+order. --stateless drops the stages.
+
+Pacing: maximum speed (default), a fixed total --rate in requests/second,
+or --speed times the recorded pace. Reference data, FX rates and tenant
+profiles come from the configured files, or --reference-data / --fx-rates /
+--tenant-profiles, so a candidate file can be replayed against production
+decisions before it is rolled out. Audit records of requests that picked a
+tenant profile by header replay under that tenant (read from data_version);
+records of a tenant that is not configured are skipped and counted as
+unknown_tenant.
+"""
+
+import heapq
+import json
+import os
+import re
+import sys
+import time
+import zlib
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.audit import segment_paths
+from app.duplicates import DuplicateDetectionStage
+from app.fx import get_fx_rates, reload_fx_rates
+from app.ingest.base import iter_batches
+from app.reference import get_reference_data, reload_reference_data
+from app.schemas import UAEValidationRequest
+from app.tenants import UnknownTenantProfile, reload_tenant_profiles
+from app.validators import RuleEvaluation, UAEValidationEngine
+from app.velocity import VelocityStage
+
+_VALIDATION_REQUEST = UAEValidationRequest.model_validate
+_DEBTOR_IBAN = re.compile(rb'"debtor_iban"\s*:\s*"([^"]*)"')
+_TS = re.compile(rb'"ts"\s*:\s*([0-9.eE+-]+)')
+_SEGMENT_NAME = re.compile(r"audit-(\d+)-(\d+)-(\d+)\.")
+
+
+class Decision(NamedTuple):
+    """The compared part of a validation outcome (failed_rules sorted: order is not compared)."""
+
+    stp_score: float
+    failed_rules: Tuple[str, ...]
+    uaefts_compliant: bool
+
+
+class RecordedRequest(NamedTuple):
+    """One replayable line."""
+
+    reference: str  # session_uuid, else file:line
+    source: Optional[str]  # process that recorded it (audit directories)
+    request: UAEValidationRequest
+    timestamp: Optional[float]
+    tenant: Optional[str]
+    recorded: Optional[Decision]
+
+
+class ReplayTask(NamedTuple):
+    """What one worker process replays."""
+
+    paths: Tuple[str, ...]  # files and audit directories, as given
+    partition: int
+    partitions: int
+    stateless: bool
+    rate: Optional[float]  # per partition
+    speed: Optional[float]
+    max_diffs: int
+    reference_data_path: Optional[str]
+    fx_rates_path: Optional[str]
+    tenant_profiles_path: Optional[str]
+
+
+class PartitionResult(NamedTuple):
+    """What one worker process reports back."""
+
+    replayed: int
+    unreadable: int
+    unknown_tenants: Dict[str, int]
+    compared: int
+    diffs: int
+    score_diffs: int
+    compliance_diffs: int
+    rule_diffs: int
+    rules_added: Dict[str, int]
+    rules_removed: Dict[str, int]
+    examples: List[Dict]
+    latencies_us: array
+    elapsed: float
+
+
+# =============================================================================
+# READING RECORDED TRAFFIC
+# =============================================================================
+
+def input_files(paths: List[str]) -> List[str]:
+    """Files to replay: audit directories expand to their segments."""
+    files: List[str] = []
+    for path in paths:
+        files.extend(segment_paths(path) if os.path.isdir(path) else [path])
+    return files
+
+
+def partition_of(line: bytes, partitions: int) -> int:
+    """Partition by debtor IBAN, read from the raw line without parsing it."""
+    if partitions == 1:
+        return 0
+    match = _DEBTOR_IBAN.search(line)
+    return zlib.crc32(match.group(1) if match else b"") % partitions
+
+
+def _recorded_decision(data: Dict) -> Optional[Decision]:
+    """The decision recorded next to a request, if any."""
+    if "request" not in data:
+        return None
+    decision = data.get("response", data)
+    if "stp_score" not in decision:
+        return None
+    if "failed_rules" in decision:
+        failed = decision["failed_rules"]
+    else:
+        failed = [r["rule_code"] for r in decision.get("results", ()) if not r["is_valid"]]
+    compliant = decision.get("uaefts_compliant")
+    if compliant is None:
+        compliant = decision.get("violation_count", 0) == 0
+    return Decision(decision["stp_score"], tuple(sorted(failed)), compliant)
+
+
+def _tenant(data_version: Optional[str]) -> Optional[str]:
+    """Tenant of a tenant plan's data version ("<base>+<tenant>@<profile version>")."""
+    if not data_version:
+        return None
+    # The base version may itself contain "+" (a labelled "<label>+sha256:<hash>")
+    # and tenant names never do, so the tenant follows the last "+"
+    head, _, _ = data_version.rpartition("@")
+    if "+" not in head:
+        return None
+    return head.rpartition("+")[2] or None
+
+
+def parse_line(line: bytes, reference: str, source: Optional[str] = None) -> RecordedRequest:
+    """Parse one recorded line (raises ValueError / ValidationError)."""
+    data = json.loads(line)
+    if not isinstance(data, dict):
+        raise ValueError("not a JSON object")
+    request = _VALIDATION_REQUEST(data["request"] if "request" in data else data)
+    response = data.get("response") or {}
+    return RecordedRequest(
+        reference=data.get("session_uuid") or response.get("session_uuid") or reference,
+        source=source,
+        request=request,
+        timestamp=data.get("ts"),
+        tenant=_tenant(data.get("data_version") or response.get("data_version")),
+        recorded=_recorded_decision(data),
+    )
+
+
+def source_segments(directory: str) -> Dict[str, List[str]]:
+    """
+    An audit directory's segments per source process, in write order.
+
+    Segments are audit-<start ms>-<pid>-<seq>; seq restarts at 0 with each
+    process, so a restarted process with a reused pid is a new source.
+    """
+    sources: Dict[str, List[str]] = {}
+    current: Dict[str, str] = {}
+    named = []
+    for path in segment_paths(directory):
+        match = _SEGMENT_NAME.match(os.path.basename(path))
+        if match:
+            named.append((match.group(2), int(match.group(3)), match.group(1), path))
+    for pid, seq, started, path in sorted(named):
+        if seq == 0 or pid not in current:
+            current[pid] = f"{pid}@{started}"
+        sources.setdefault(current[pid], []).append(path)
+    return sources
+
+
+def _lines(path: str) -> Iterator[Tuple[str, bytes]]:
+    """(file:line, raw line) of a file's complete lines."""
+    name = os.path.basename(path)
+    with open(path, "rb") as f:
+        for number, line in enumerate(f, 1):
+            # Skip blank lines and a last line cut short by a crash
+            if line.strip() and line.endswith(b"\n"):
+                yield f"{name}:{number}", line
+
+
+def _timestamp(line: bytes) -> float:
+    match = _TS.search(line)
+    try:
+        return float(match.group(1)) if match else 0.0
+    except ValueError:
+        return 0.0
+
+
+def iter_partition(
+    paths: Tuple[str, ...], partition: int, partitions: int
+) -> Iterator[Tuple[str, bytes, Optional[str]]]:
+    """
+    (reference, raw line, source) of one partition's lines. Files are read
+    in order; an audit directory's source processes are merged by ts.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            for reference, line in _lines(path):
+                if partition_of(line, partitions) == partition:
+                    yield reference, line, None
+            continue
+
+        def stream(source: str, segments: List[str]) -> Iterator[Tuple[float, str, bytes, str]]:
+            for segment in segments:
+                for reference, line in _lines(segment):
+                    if partition_of(line, partitions) == partition:
+                        yield _timestamp(line), reference, line, source
+
+        streams = [stream(source, segments) for source, segments in source_segments(path).items()]
+        for _, reference, line, source in heapq.merge(*streams, key=lambda item: item[0]):
+            yield reference, line, source
+
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+def _decision(evaluation: RuleEvaluation) -> Decision:
+    return Decision(
+        evaluation.stp_score,
+        tuple(sorted(r.rule_code for r in evaluation.results if not r.is_valid)),
+        evaluation.violation_count == 0,
+    )
+
+
+def replay_partition(task: ReplayTask) -> PartitionResult:
+    """Replay one partition (runs in a worker process, or inline for one)."""
+    if task.reference_data_path:
+        reload_reference_data(task.reference_data_path)
+    if task.fx_rates_path:
+        reload_fx_rates(task.fx_rates_path)
+    if task.tenant_profiles_path:
+        reload_tenant_profiles(task.tenant_profiles_path)
+    ref = get_reference_data()
+    fx = get_fx_rates().latest
+    # One engine, and so one set of stage state, per recording process
+    engines: Dict[Optional[str], UAEValidationEngine] = {}
+
+    latencies = array("f")
+    examples: List[Dict] = []
+    rules_added: Counter = Counter()
+    rules_removed: Counter = Counter()
+    unknown_tenants: Counter = Counter()
+    unreadable = compared = diffs = score_diffs = compliance_diffs = rule_diffs = 0
+    first_recorded: Optional[float] = None
+
+    perf_counter = time.perf_counter
+    start = perf_counter()
+    for batch in iter_batches(iter_partition(task.paths, task.partition, task.partitions), 1_000):
+        for reference, line, source in batch:
+            try:
+                recorded = parse_line(line, reference, source)
+            except (ValueError, KeyError, TypeError, ValidationError):
+                unreadable += 1
+                continue
+
+            # Pacing: fixed rate, or the recorded pace scaled by speed
+            if task.rate:
+                due = start + len(latencies) / task.rate
+            elif task.speed and recorded.timestamp is not None:
+                if first_recorded is None:
+                    first_recorded = recorded.timestamp
+                due = start + (recorded.timestamp - first_recorded) / task.speed
+            else:
+                due = None
+            if due is not None:
+                delay = due - perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            engine = engines.get(None if task.stateless else source)
+            if engine is None:
+                engine = engines[None if task.stateless else source] = UAEValidationEngine(
+                    stages=[] if task.stateless else [DuplicateDetectionStage(), VelocityStage()]
+                )
+
+            began = perf_counter()
+            try:
+                evaluation = engine.evaluate(
+                    recorded.request, ref, fx,
+                    timestamp=None if task.stateless else recorded.timestamp,
+                    tenant=recorded.tenant,
+                    failures_only=True,
+                )
+            except UnknownTenantProfile:
+                unknown_tenants[recorded.tenant] += 1
+                continue
+            latencies.append((perf_counter() - began) * 1e6)
+
+            if recorded.recorded is None:
+                continue
+            compared += 1
+            replayed = _decision(evaluation)
+            if replayed == recorded.recorded:
+                continue
+            diffs += 1
+            before, after = recorded.recorded, replayed
+            if before.stp_score != after.stp_score:
+                score_diffs += 1
+            if before.uaefts_compliant != after.uaefts_compliant:
+                compliance_diffs += 1
+            if before.failed_rules != after.failed_rules:
+                rule_diffs += 1
+                rules_added.update(set(after.failed_rules) - set(before.failed_rules))
+                rules_removed.update(set(before.failed_rules) - set(after.failed_rules))
+            if len(examples) < task.max_diffs:
+                examples.append({
+                    "reference": recorded.reference,
+                    "recorded": before._asdict(),
+                    "replayed": after._asdict(),
+                })
+
+    return PartitionResult(
+        replayed=len(latencies),
+        unreadable=unreadable,
+        unknown_tenants=dict(unknown_tenants),
+        compared=compared,
+        diffs=diffs,
+        score_diffs=score_diffs,
+        compliance_diffs=compliance_diffs,
+        rule_diffs=rule_diffs,
+        rules_added=dict(rules_added),
+        rules_removed=dict(rules_removed),
+        examples=examples,
+        latencies_us=latencies,
+        elapsed=perf_counter() - start,
+    )
+
+
+# =============================================================================
+# DRIVER
+# =============================================================================
+
+def _percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(len(samples) * pct))]
+
+
+def replay(
+    paths: List[str],
+    processes: int = 1,
+    rate: Optional[float] = None,
+    speed: Optional[float] = None,
+    stateless: bool = False,
+    max_diffs: int = 100,
+    reference_data_path: Optional[str] = None,
+    fx_rates_path: Optional[str] = None,
+    tenant_profiles_path: Optional[str] = None,
+) -> Dict:
+    """
+    Replay recorded traffic and return the report: throughput, engine
+    latency percentiles, and decision differences with up to max_diffs
+    examples per process.
+    """
+    files = tuple(input_files(paths))
+    tasks = [
+        ReplayTask(
+            paths=tuple(paths),
+            partition=partition,
+            partitions=processes,
+            stateless=stateless,
+            rate=rate / processes if rate else None,
+            speed=speed,
+            max_diffs=max_diffs,
+            reference_data_path=reference_data_path,
+            fx_rates_path=fx_rates_path,
+            tenant_profiles_path=tenant_profiles_path,
+        )
+        for partition in range(processes)
+    ]
+
+    start = time.perf_counter()
+    if processes == 1:
+        results = [replay_partition(tasks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn")) as pool:
+            results = list(pool.map(replay_partition, tasks))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(value for result in results for value in result.latencies_us)
+    replayed = sum(r.replayed for r in results)
+    rules_added: Counter = Counter()
+    rules_removed: Counter = Counter()
+    unknown_tenants: Counter = Counter()
+    for result in results:
+        unknown_tenants.update(result.unknown_tenants)
+        rules_added.update(result.rules_added)
+        rules_removed.update(result.rules_removed)
+
+    return {
+        "files": len(files),
+        "processes": processes,
+        "stateless": stateless,
+        "replayed": replayed,
+        "unreadable": sum(r.unreadable for r in results),
+        "unknown_tenant": sum(unknown_tenants.values()),
+        "unknown_tenants": dict(unknown_tenants.most_common()),
+        "elapsed_seconds": round(elapsed, 3),
+        "requests_per_second": round(replayed / elapsed, 1) if elapsed else 0.0,
+        "latency_us": {
+            "mean": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            "p50": round(_percentile(latencies, 0.50), 1),
+            "p95": round(_percentile(latencies, 0.95), 1),
+            "p99": round(_percentile(latencies, 0.99), 1),
+            "p999": round(_percentile(latencies, 0.999), 1),
+            "max": round(latencies[-1], 1) if latencies else 0.0,
+        },
+        "compared": sum(r.compared for r in results),
+        "diffs": sum(r.diffs for r in results),
+        "stp_score_diffs": sum(r.score_diffs for r in results),
+        "compliance_diffs": sum(r.compliance_diffs for r in results),
+        "rule_code_diffs": sum(r.rule_diffs for r in results),
+        "rules_added": dict(rules_added.most_common()),
+        "rules_removed": dict(rules_removed.most_common()),
+        "examples": [example for result in results for example in result.examples],
+    }
+
+
+def print_report(report: Dict, out=sys.stderr) -> None:
+    """Human-readable summary of a replay report."""
+    latency = report["latency_us"]
+    print(
+        f"{report['replayed']:,} requests replayed from {report['files']} file(s) in "
+        f"{report['elapsed_seconds']:.2f}s across {report['processes']} process(es): "
+        f"{report['requests_per_second']:,.0f} req/s, {report['unreadable']:,} unreadable",
+        file=out,
+    )
+    print(
+        f"engine latency: mean {latency['mean']:,.1f} us  p50 {latency['p50']:,.1f} us  "
+        f"p95 {latency['p95']:,.1f} us  p99 {latency['p99']:,.1f} us  p999 {latency['p999']:,.1f} us",
+        file=out,
+    )
+    print(
+        f"decisions: {report['compared']:,} compared, {report['diffs']:,} differ "
+        f"(stp_score {report['stp_score_diffs']:,}, uaefts_compliant {report['compliance_diffs']:,}, "
+        f"rule codes {report['rule_code_diffs']:,})",
+        file=out,
+    )
+    if report["unknown_tenant"]:
+        print(
+            f"{report['unknown_tenant']:,} requests skipped, tenant profile not configured: "
+            + ", ".join(f"{tenant} x{count:,}" for tenant, count in report["unknown_tenants"].items())
+            + " (pass the recording's profiles with --tenant-profiles)",
+            file=out,
+        )
+    for label, key in (("rules now failing", "rules_added"), ("rules no longer failing", "rules_removed")):
+        if report[key]:
+            print(f"{label}: " + ", ".join(f"{code} x{count:,}" for code, count in report[key].items()), file=out)
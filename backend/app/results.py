@@ -0,0 +1,411 @@
+"""
+UAE Result Store
+Disk-spilled, columnar storage for per-transaction batch results.
+
+A store is a directory of append-only files written once by ResultWriter
+and read through mmap by ResultReader; nothing is ever loaded whole:
+
+    records.ndjson  one NDJSON line per transaction (index, reference, response)
+    offsets.u64     byte offset of every record (row -> record, O(1) paging)
+    rating.u8       stp_rating code per row (RATING_CODES, UNPARSEABLE)
+    compliant.u8    1 when violation_count == 0, 0 when not, UNPARSEABLE
+    score.f32       stp_score per row
+    rules.u64       bitmask of failing rule ids per row
+    reference.lp    uint16 length-prefixed transaction references
+    rule_<id>.u32   posting list: rows on which rule id failed
+    meta.json       rule id dictionary and counts
+
+Filters on stp_rating / uaefts_compliant scan a one-byte column with
+mmap.find; rule_code filters walk that rule's posting list, so a page
+costs the rows it touches, not the size of the store.
+"""
+
+import array
+import bisect
+import csv
+import io
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from app.schemas import UAEValidationMinimalResponse, UAEValidationResponse
+
+RATING_CODES: Dict[str, int] = {"high": 0, "medium": 1, "low": 2}
+RATINGS: Tuple[str, ...] = tuple(RATING_CODES)
+UNPARSEABLE = 255
+
+# Rules past this many distinct codes share the last bit
+MAX_RULE_BITS = 64
+
+CSV_COLUMNS = (
+    "index", "reference", "stp_score", "stp_rating", "uaefts_compliant", "failed_rules", "error",
+)
+
+_LENGTH = struct.Struct("<H")
+
+Response = Union[UAEValidationResponse, UAEValidationMinimalResponse]
+
+
+def failed_rules(response: Response) -> List[str]:
+    """Failing rule codes of either response shape."""
+    if isinstance(response, UAEValidationMinimalResponse):
+        return response.failed_rules
+    return [r.rule_code for r in response.results if not r.is_valid]
+
+
+# (file, array typecode), in ResultWriter buffer order
+COLUMNS = (
+    ("offsets.u64", "Q"),
+    ("rating.u8", "B"),
+    ("compliant.u8", "B"),
+    ("score.f32", "f"),
+    ("rules.u64", "Q"),
+)
+
+
+# =============================================================================
+# WRITER
+# =============================================================================
+
+class ResultWriter:
+    """
+    Append per-transaction results to a store directory.
+
+    Columns are buffered in arrays and written out on flush(), so memory is
+    bounded by the rows between flushes.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.rows = 0
+        self.rule_ids: Dict[str, int] = {}
+        self.rating_counts = [0] * len(RATINGS)
+        self.compliant = 0
+        self.unparseable = 0
+        self._position = 0
+
+        self._records = open(os.path.join(directory, "records.ndjson"), "wb")
+        self._references = open(os.path.join(directory, "reference.lp"), "wb")
+        self._column_files = [open(os.path.join(directory, name), "wb") for name, _ in COLUMNS]
+        self._buffers = [array.array(typecode) for _, typecode in COLUMNS]
+        self._postings: Dict[int, array.array] = {}
+        self._posting_files: Dict[int, object] = {}
+
+    def _rule_id(self, rule_code: str) -> int:
+        rule_id = self.rule_ids.get(rule_code)
+        if rule_id is None:
+            rule_id = self.rule_ids[rule_code] = len(self.rule_ids)
+        return min(rule_id, MAX_RULE_BITS - 1)
+
+    def add(self, line: bytes, reference: Optional[str], response: Optional[Response]) -> None:
+        """Append one row: its NDJSON line and the response it was built from."""
+        offsets, ratings, compliant, scores, masks = self._buffers
+        row = self.rows
+        offsets.append(self._position)
+        self._records.write(line)
+        self._position += len(line)
+
+        encoded = (reference or "").encode("utf-8")[:0xFFFF]
+        self._references.write(_LENGTH.pack(len(encoded)) + encoded)
+
+        if response is None:
+            ratings.append(UNPARSEABLE)
+            compliant.append(UNPARSEABLE)
+            scores.append(0.0)
+            masks.append(0)
+            self.unparseable += 1
+        else:
+            rating = RATING_CODES.get(response.stp_rating, RATING_CODES["low"])
+            ratings.append(rating)
+            self.rating_counts[rating] += 1
+            is_compliant = response.violation_count == 0
+            compliant.append(1 if is_compliant else 0)
+            self.compliant += is_compliant
+            scores.append(response.stp_score)
+            mask = 0
+            for rule_code in failed_rules(response):
+                rule_id = self._rule_id(rule_code)
+                if not mask >> rule_id & 1:
+                    mask |= 1 << rule_id
+                    posting = self._postings.get(rule_id)
+                    if posting is None:
+                        posting = self._postings[rule_id] = array.array("I")
+                    posting.append(row)
+            masks.append(mask)
+        self.rows += 1
+
+    def flush(self) -> None:
+        """Write buffered columns and postings, then the metadata."""
+        self._records.flush()
+        self._references.flush()
+        for f, buffer in zip(self._column_files, self._buffers):
+            buffer.tofile(f)
+            f.flush()
+            del buffer[:]
+        for rule_id, posting in self._postings.items():
+            f = self._posting_files.get(rule_id)
+            if f is None:
+                f = self._posting_files[rule_id] = open(os.path.join(self.directory, f"rule_{rule_id}.u32"), "wb")
+            posting.tofile(f)
+            f.flush()
+            del posting[:]
+        self._write_meta()
+
+    def _write_meta(self) -> None:
+        path = os.path.join(self.directory, "meta.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump({
+                "rows": self.rows,
+                "rule_ids": self.rule_ids,
+                "ratings": dict(zip(RATINGS, self.rating_counts)),
+                "compliant": self.compliant,
+                "unparseable": self.unparseable,
+            }, f)
+        os.replace(path + ".tmp", path)
+
+    def close(self) -> None:
+        self.flush()
+        for f in (self._records, self._references, *self._column_files, *self._posting_files.values()):
+            f.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# =============================================================================
+# READER
+# =============================================================================
+
+def _map(path: str) -> Optional[mmap.mmap]:
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file
+            return None
+
+
+class ResultReader:
+    """Memory-mapped, read-only view of a finished store."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+        self.rows: int = meta["rows"]
+        self.rule_ids: Dict[str, int] = meta["rule_ids"]
+        self.rule_codes = sorted(self.rule_ids, key=self.rule_ids.get)
+        self.rating_counts: Dict[str, int] = meta["ratings"]
+        self.compliant: int = meta["compliant"]
+        self.unparseable: int = meta["unparseable"]
+
+        self._maps: List[mmap.mmap] = []
+        self._views: List[memoryview] = []
+        self._postings: Dict[int, Optional[memoryview]] = {}
+        self._records = self._open("records.ndjson")
+        self._references = self._open("reference.lp")
+        self._offsets = self._view("offsets.u64", "Q")
+        self._ratings = self._open("rating.u8")
+        self._compliant = self._open("compliant.u8")
+        self._scores = self._view("score.f32", "f")
+        self._masks = self._view("rules.u64", "Q")
+
+    def _open(self, name: str) -> Union[mmap.mmap, bytes]:
+        mm = _map(os.path.join(self.directory, name))
+        if mm is None:
+            return b""
+        self._maps.append(mm)
+        return mm
+
+    def _view(self, name: str, typecode: str) -> memoryview:
+        view = memoryview(self._open(name)).cast(typecode)
+        self._views.append(view)
+        return view
+
+    def close(self) -> None:
+        for view in self._views:
+            view.release()
+        for mm in self._maps:
+            mm.close()
+        self._views = []
+        self._maps = []
+
+    def __enter__(self) -> "ResultReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- rows ---------------------------------------------------------------
+
+    def _record_span(self, row: int) -> Tuple[int, int]:
+        end = self._offsets[row + 1] if row + 1 < self.rows else len(self._records)
+        return self._offsets[row], end
+
+    def record(self, row: int) -> bytes:
+        """The stored NDJSON line of a row, without the newline."""
+        start, end = self._record_span(row)
+        return self._records[start:end].rstrip(b"\n")
+
+    def _rule_matches(self, row: int, rule_code: str) -> bool:
+        if self.rule_ids[rule_code] < MAX_RULE_BITS - 1:
+            return True
+        # Overflow rules share the last bit: confirm against the record
+        response = json.loads(self.record(row))["response"]
+        codes = response.get("failed_rules") or [r["rule_code"] for r in response["results"] if not r["is_valid"]]
+        return rule_code in codes
+
+    def select(
+        self,
+        start: int = 0,
+        limit: Optional[int] = None,
+        stp_rating: Optional[str] = None,
+        rule_code: Optional[str] = None,
+        uaefts_compliant: Optional[bool] = None,
+    ) -> Iterator[int]:
+        """
+        Yield matching row numbers from row start on, in order.
+
+        Unparseable rows never match a filter.
+        """
+        remaining = self.rows if limit is None else limit
+        if remaining <= 0 or start >= self.rows:
+            return
+        rating_byte = None if stp_rating is None else RATING_CODES.get(stp_rating, -1)
+        compliant_byte = None if uaefts_compliant is None else int(uaefts_compliant)
+        if rating_byte == -1:
+            return
+
+        def accept(row: int) -> bool:
+            if rating_byte is not None and self._ratings[row] != rating_byte:
+                return False
+            if compliant_byte is not None and self._compliant[row] != compliant_byte:
+                return False
+            return rule_code is None or self._rule_matches(row, rule_code)
+
+        if rule_code is not None:
+            rows = self._posting(rule_code)
+            if rows is None:
+                return
+            for i in range(bisect.bisect_left(rows, start), len(rows)):
+                row = rows[i]
+                if accept(row):
+                    yield row
+                    remaining -= 1
+                    if not remaining:
+                        return
+            return
+
+        if rating_byte is None and compliant_byte is None:
+            yield from range(start, min(start + remaining, self.rows))
+            return
+
+        # Scan the one-byte column with mmap.find (C speed), check the other
+        column, byte = (self._ratings, rating_byte) if rating_byte is not None else (self._compliant, compliant_byte)
+        needle = bytes((byte,))
+        row = column.find(needle, start)
+        while row != -1:
+            if accept(row):
+                yield row
+                remaining -= 1
+                if not remaining:
+                    return
+            row = column.find(needle, row + 1)
+
+    def _posting(self, rule_code: str) -> Optional[memoryview]:
+        """Rows on which rule_code (or its shared overflow bit) failed."""
+        rule_id = self.rule_ids.get(rule_code)
+        if rule_id is None:
+            return None
+        bit = min(rule_id, MAX_RULE_BITS - 1)
+        if bit not in self._postings:
+            name = f"rule_{bit}.u32"
+            exists = os.path.exists(os.path.join(self.directory, name))
+            self._postings[bit] = self._view(name, "I") if exists else None
+        return self._postings[bit]
+
+    def page(self, start: int, limit: int, **filters) -> Tuple[List[bytes], Optional[int]]:
+        """(records of up to limit matching rows from start, row to continue from)."""
+        rows = list(self.select(start, limit, **filters))
+        if not rows:
+            return [], None
+        next_row = rows[-1] + 1
+        if len(rows) < limit or next_row >= self.rows:
+            return [self.record(row) for row in rows], None
+        return [self.record(row) for row in rows], next_row
+
+    # -- exports ------------------------------------------------------------
+
+    def _filtered(self, filters: Dict) -> bool:
+        return any(value is not None for value in filters.values())
+
+    def export_ndjson(self, chunk_size: int = 1 << 20, **filters) -> Iterator[bytes]:
+        """Stream matching records as NDJSON; unfiltered exports copy the file in chunks."""
+        if not self._filtered(filters):
+            for pos in range(0, len(self._records), chunk_size):
+                yield self._records[pos:pos + chunk_size]
+            return
+        out = bytearray()
+        for row in self.select(**filters):
+            start, end = self._record_span(row)
+            out += self._records[start:end]
+            if len(out) >= chunk_size:
+                yield bytes(out)
+                out.clear()
+        if out:
+            yield bytes(out)
+
+    def _reference_offsets(self) -> Iterator[Tuple[int, int]]:
+        pos = 0
+        refs = self._references
+        for _ in range(self.rows):
+            (length,) = _LENGTH.unpack_from(refs, pos)
+            yield pos + _LENGTH.size, length
+            pos += _LENGTH.size + length
+
+    def export_csv(self, chunk_rows: int = 10_000, **filters) -> Iterator[bytes]:
+        """
+        Stream matching rows as CSV built from the columns.
+
+        Only unparseable rows read their record (for the error message).
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        selected = self.select(**filters)
+        wanted = next(selected, None)
+        pending = 0
+        for row, (ref_start, ref_length) in enumerate(self._reference_offsets()):
+            if wanted is None:
+                break
+            if row != wanted:
+                continue
+            wanted = next(selected, None)
+
+            reference = bytes(self._references[ref_start:ref_start + ref_length]).decode("utf-8") or None
+            if self._ratings[row] == UNPARSEABLE:
+                error = json.loads(self.record(row)).get("error")
+                writer.writerow((row, reference, "", "", "", "", error))
+            else:
+                mask = self._masks[row]
+                rules = ";".join(
+                    code for code in self.rule_codes
+                    if mask >> min(self.rule_ids[code], MAX_RULE_BITS - 1) & 1
+                )
+                writer.writerow((
+                    row, reference, f"{self._scores[row]:g}", RATINGS[self._ratings[row]],
+                    "true" if self._compliant[row] else "false", rules, "",
+                ))
+            pending += 1
+            if pending >= chunk_rows:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        yield buffer.getvalue().encode("utf-8")
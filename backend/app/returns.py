@@ -0,0 +1,278 @@
+"""
+UAE Returned-Payment Diagnosis
+Explain why a payment was returned and what to change before resending it.
+
+Each returned payment (original transaction plus ISO 20022 return reason)
+is re-evaluated by UAEValidationEngine and its failing rules are joined
+against a return code index compiled once from UAE_RETURN_REASONS: return
+code -> rank of each rule that can explain it. The best-ranked failing
+rule (errors before warnings) is the root cause.
+
+Corrections are derived per failing rule through a dispatch table: the
+BIC of the bank that holds the IBAN for BIC rules, a purpose code matched
+against the remittance information for purpose code rules. Everything
+else is listed for manual review. A corrected transaction is re-evaluated
+so the diagnosis shows whether the resend would pass.
+"""
+
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.constants import UAE_RETURN_REASONS
+from app.ingest.base import iter_batches
+from app.reference import ReferenceData, VersionedCache, get_reference_data
+from app.schemas import UAEReturnDiagnosis, UAEReturnedPayment, UAEReturnRootCause, UAEValidationRequest
+from app.validators import RuleEvaluation, UAEValidationEngine, ValidationResult
+
+RETURNED_PAYMENT = TypeAdapter(UAEReturnedPayment)
+
+DEFAULT_BATCH_SIZE = 500
+
+# Remittance words too common to say anything about the purpose
+_STOP_WORDS = frozenset({"and", "the", "for", "with", "from", "payment", "payments", "transfer", "other"})
+
+
+class ReturnReason(NamedTuple):
+    """One return code, compiled for lookup."""
+
+    code: str
+    name: str
+    category: str
+    ranks: Optional[Dict[str, int]]  # rule_code -> rank; None: any failing rule
+    fields: Tuple[str, ...]
+
+
+def _compile_reasons() -> Dict[str, ReturnReason]:
+    reasons = {}
+    for reason in UAE_RETURN_REASONS:
+        rules = reason["rules"]
+        reasons[reason["code"]] = ReturnReason(
+            code=reason["code"],
+            name=reason["name"],
+            category=reason["category"],
+            ranks=None if rules is None else {rule: rank for rank, rule in enumerate(rules)},
+            fields=tuple(reason["fields"]),
+        )
+    return reasons
+
+
+RETURN_REASONS: Dict[str, ReturnReason] = _compile_reasons()
+
+# Unknown return codes: any failing rule may explain them
+_UNKNOWN_REASON = ReturnReason("", "", "", None, ())
+
+
+# =============================================================================
+# PURPOSE CODE SUGGESTION
+# =============================================================================
+
+_suggestion_cache = VersionedCache(max_entries=65_536)
+
+
+def _code_texts(ref: ReferenceData, transaction_type: str) -> List[Tuple[str, str]]:
+    """(code, searchable text) of the codes applicable to a transaction type."""
+    def build():
+        flag = "domestic" if transaction_type == "domestic" else "offshore"
+        return [
+            (
+                c["code"],
+                f"{c['name']} {c.get('description') or ''} {ref.categories.get(c.get('category', 'OTH'), '')}".lower(),
+            )
+            for c in ref.purpose_codes
+            if c.get(flag, flag == "offshore")
+        ]
+
+    return _suggestion_cache.get(ref, ("texts", transaction_type), build)
+
+
+def _codes_matching(ref: ReferenceData, transaction_type: str, term: str) -> Tuple[str, ...]:
+    return _suggestion_cache.get(
+        ref,
+        (transaction_type, term),
+        lambda: tuple(code for code, text in _code_texts(ref, transaction_type) if term in text),
+    )
+
+
+def suggest_purpose_code(
+    remittance_info: Optional[str],
+    transaction_type: str,
+    ref: Optional[ReferenceData] = None,
+    exclude: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Purpose code whose name, description or category matches the most
+    remittance words (as the exception investigation screen suggests),
+    or None.
+    """
+    if not remittance_info:
+        return None
+    ref = ref or get_reference_data()
+    scores: Dict[str, int] = {}
+    for term in set(remittance_info.lower().split()):
+        if len(term) > 2 and term not in _STOP_WORDS:
+            for code in _codes_matching(ref, transaction_type, term):
+                scores[code] = scores.get(code, 0) + 1
+    scores.pop(exclude, None)
+    if not scores:
+        return None
+    # Highest score; ties go to the code listed first
+    order = {code: i for i, (code, _) in enumerate(_code_texts(ref, transaction_type))}
+    return min(scores, key=lambda code: (-scores[code], order[code]))
+
+
+# =============================================================================
+# CORRECTIONS (rule_code -> corrector)
+# =============================================================================
+
+Corrector = Callable[["ReturnDiagnosisEngine", UAEValidationRequest, ValidationResult, ReferenceData], Optional[str]]
+
+
+def _correct_purpose_code(
+    engine: "ReturnDiagnosisEngine", request: UAEValidationRequest, result: ValidationResult, ref: ReferenceData
+) -> Optional[str]:
+    return suggest_purpose_code(request.remittance_info, request.transaction_type, ref, exclude=request.purpose_code)
+
+
+def _correct_bic(
+    engine: "ReturnDiagnosisEngine", request: UAEValidationRequest, result: ValidationResult, ref: ReferenceData
+) -> Optional[str]:
+    iban = request.debtor_iban if result.field_code == "debtor_bic" else request.creditor_iban
+    bank = engine.engine.bank_directory.by_code(engine.engine.bank_directory.bank_code_from_iban(iban), ref)
+    return bank["swift"] if bank and bank.get("swift") else None
+
+
+CORRECTORS: Dict[str, Corrector] = {
+    "UAE_PPC_MANDATORY": _correct_purpose_code,
+    "UAE_PPC_VALID": _correct_purpose_code,
+    "UAE_PPC_APPLICABILITY": _correct_purpose_code,
+    "UAE_BIC_DEBTOR": _correct_bic,
+    "UAE_BIC_CREDITOR": _correct_bic,
+}
+
+
+# =============================================================================
+# DIAGNOSIS ENGINE
+# =============================================================================
+
+class ReturnDiagnosisEngine:
+    """
+    Diagnoses returned payments against the validation rules.
+
+    Uses an engine without stateful stages by default: a returned payment
+    is by nature a resubmission, so duplicate and velocity checks would
+    only add noise.
+    """
+
+    def __init__(self, engine: Optional[UAEValidationEngine] = None):
+        self.engine = engine or UAEValidationEngine()
+
+    def diagnose(self, returned: UAEReturnedPayment, ref: Optional[ReferenceData] = None) -> UAEReturnDiagnosis:
+        """Diagnose one returned payment."""
+        ref = ref or get_reference_data()
+        return self._diagnose(returned, self.engine.evaluate(returned.transaction, ref, failures_only=True), ref)
+
+    def diagnose_batch(
+        self, returns: List[UAEReturnedPayment], ref: Optional[ReferenceData] = None
+    ) -> List[UAEReturnDiagnosis]:
+        """Diagnose returned payments against one reference data snapshot."""
+        ref = ref or get_reference_data()
+        evaluations = self.engine.evaluate_batch([r.transaction for r in returns], ref, failures_only=True)
+        return [self._diagnose(returned, evaluation, ref) for returned, evaluation in zip(returns, evaluations)]
+
+    def _diagnose(
+        self, returned: UAEReturnedPayment, evaluation: RuleEvaluation, ref: ReferenceData
+    ) -> UAEReturnDiagnosis:
+        return_code = returned.return_code.strip().upper()
+        reason = RETURN_REASONS.get(return_code)
+        ranks = (reason or _UNKNOWN_REASON).ranks
+
+        failures = [r for r in evaluation.results if not r.is_valid]
+        candidates = failures if ranks is None else [r for r in failures if r.rule_code in ranks]
+        root = min(
+            candidates,
+            key=lambda r: (r.severity != "error", ranks.get(r.rule_code, 0) if ranks is not None else 0),
+            default=None,
+        )
+
+        if reason is None:
+            status = "unknown_code"
+        elif root is not None:
+            status = "explained"
+        elif ranks is not None and not ranks:
+            status = "external"
+        else:
+            status = "unexplained"
+
+        request = returned.transaction
+        corrected: Dict[str, str] = {}
+        review: Dict[str, None] = dict.fromkeys(reason.fields if reason else ())
+        for result in failures:
+            # Errors, and warnings the return code points at (e.g. unknown BIC for RC01)
+            if result.field_code in corrected or (result.severity != "error" and result not in candidates):
+                continue
+            corrector = CORRECTORS.get(result.rule_code)
+            value = corrector(self, request, result, ref) if corrector else None
+            if value is not None and value != getattr(request, result.field_code, None):
+                corrected[result.field_code] = value
+            else:
+                review[result.field_code] = None
+        for field in corrected:
+            review.pop(field, None)
+
+        corrected_score = corrected_compliant = None
+        if corrected:
+            resend = self.engine.evaluate(
+                request.model_copy(update=corrected), ref, amount_aed=evaluation.amount_aed, failures_only=True
+            )
+            corrected_score = resend.stp_score
+            corrected_compliant = resend.violation_count == 0
+
+        return UAEReturnDiagnosis(
+            reference=returned.reference,
+            return_code=return_code,
+            return_reason=reason.name if reason else None,
+            category=reason.category if reason else None,
+            status=status,
+            root_cause=UAEReturnRootCause(
+                rule_code=root.rule_code,
+                field_code=root.field_code,
+                error_code=root.error_code,
+                error_message=root.error_message,
+                remediation_suggestion=root.remediation_suggestion,
+            ) if root is not None else None,
+            other_failures=[r.rule_code for r in failures if r is not root],
+            corrected_fields=corrected,
+            review_fields=list(review),
+            stp_score=evaluation.stp_score,
+            corrected_stp_score=corrected_score,
+            corrected_compliant=corrected_compliant,
+        )
+
+    def diagnose_ndjson(
+        self, lines: Iterable[bytes], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[str]:
+        """
+        Diagnose an NDJSON stream of UAEReturnedPayment, one output line per
+        input line, lazily. Lines that do not parse produce an error line.
+        """
+        ref = get_reference_data()
+        numbered = ((number, line) for number, line in enumerate(lines, 1) if line.strip())
+        for batch in iter_batches(numbered, batch_size):
+            parsed: List[Tuple[int, Optional[UAEReturnedPayment], Optional[str]]] = []
+            for number, line in batch:
+                try:
+                    parsed.append((number, RETURNED_PAYMENT.validate_json(line), None))
+                except ValidationError as exc:
+                    message = "; ".join(
+                        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in exc.errors()
+                    )
+                    parsed.append((number, None, message))
+
+            diagnoses = iter(self.diagnose_batch([p for _, p, _ in parsed if p is not None], ref))
+            for number, returned, error in parsed:
+                if returned is None:
+                    yield json.dumps({"line": number, "error": error}) + "\n"
+                else:
+                    yield next(diagnoses).model_dump_json() + "\n"
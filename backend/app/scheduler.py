@@ -0,0 +1,308 @@
+"""
+UAE Admission Control
+Priority scheduling of engine work between interactive and bulk traffic.
+
+Every request that runs the validation engine goes through the process's
+Scheduler, in one of three priority classes: interactive (/validate),
+batch (/validate-batch, file uploads, return diagnosis) and jobs
+(background job submissions; the jobs themselves run in niced worker
+processes, see app.jobs).
+
+    admission   queue depth of the class, then the client's token bucket
+                for the class; either one failing raises Overloaded
+                (HTTP 429 with Retry-After)
+    slots       engine work only runs while holding one of
+                UAE_SCHEDULER_SLOTS slots. Bulk work takes a slot per chunk
+                of UAE_SCHEDULER_CHUNK_SIZE transactions, so an interactive
+                request never waits behind more than one chunk per slot
+    dequeue     a freed slot goes to the waiting class with the lowest pass
+                (stride scheduling): each grant advances the class by
+                1/weight, so under contention classes get slots in the ratio
+                of their weights and none starves
+
+Slots can be waited for from the event loop (hold) or from a worker thread
+(hold_sync, paced), so async endpoints and streaming generators share one
+set of queues.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from itertools import islice
+from typing import AsyncIterator, Callable, Deque, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from app.constants import (
+    UAE_SCHEDULER_CHUNK_SIZE,
+    UAE_SCHEDULER_CLASSES,
+    UAE_SCHEDULER_ENABLED,
+    UAE_SCHEDULER_MAX_CLIENTS,
+    UAE_SCHEDULER_SLOTS,
+)
+
+T = TypeVar("T")
+
+# Weight of the latest hold in the per-class service time average
+_SERVICE_EWMA = 0.1
+
+
+class Overloaded(Exception):
+    """Request shed by admission control."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Requests per second with bursts of up to `burst`."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Take one token: 0.0, or the seconds until one is available."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class _Waiter:
+    __slots__ = ("grant", "granted")
+
+    def __init__(self, grant: Callable[[], None]):
+        self.grant = grant
+        self.granted = False
+
+
+class _PriorityClass:
+    """Queue, client buckets and counters of one priority class."""
+
+    def __init__(self, name: str, weight: float, max_queue: int, rate: float, burst: float):
+        self.name = name
+        self.weight = weight
+        self.max_queue = max_queue
+        self.rate = rate
+        self.burst = burst
+        self.queue: Deque[_Waiter] = deque()
+        self.buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self.pass_ = 0.0
+        self.running = 0
+        self.admitted = 0
+        self.shed = 0
+        self.grants = 0
+        self.service_seconds = 0.0
+
+    def bucket(self, client: str, now: float, max_clients: int) -> TokenBucket:
+        bucket = self.buckets.get(client)
+        if bucket is None:
+            bucket = self.buckets[client] = TokenBucket(self.rate, self.burst, now)
+            if len(self.buckets) > max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(client)
+        return bucket
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class Scheduler:
+    """Admission, slots and weighted fair dequeue for one process."""
+
+    def __init__(
+        self,
+        slots: int = UAE_SCHEDULER_SLOTS,
+        classes: Dict[str, Dict] = UAE_SCHEDULER_CLASSES,
+        enabled: bool = UAE_SCHEDULER_ENABLED,
+        max_clients: int = UAE_SCHEDULER_MAX_CLIENTS,
+    ):
+        self.configure(slots, classes, enabled, max_clients)
+
+    def configure(
+        self,
+        slots: int = UAE_SCHEDULER_SLOTS,
+        classes: Dict[str, Dict] = UAE_SCHEDULER_CLASSES,
+        enabled: bool = UAE_SCHEDULER_ENABLED,
+        max_clients: int = UAE_SCHEDULER_MAX_CLIENTS,
+    ) -> None:
+        """Reset with new settings. Only call while no work is in flight."""
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        self.enabled = enabled
+        self.slots = slots
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        self._free = slots
+        self._vtime = 0.0
+        self._classes = {name: _PriorityClass(name, **config) for name, config in classes.items()}
+
+    # -------------------------------------------------------------------------
+    # Admission
+    # -------------------------------------------------------------------------
+
+    def admit(self, priority: str, client: str) -> None:
+        """Admit one request of a client, or raise Overloaded."""
+        if not self.enabled:
+            return
+        cls = self._classes[priority]
+        now = time.monotonic()
+        with self._lock:
+            if len(cls.queue) >= cls.max_queue:
+                cls.shed += 1
+                raise Overloaded(f"Too many queued {priority} requests", self._drain_seconds(cls))
+            wait = cls.bucket(client, now, self.max_clients).take(now)
+            if wait:
+                cls.shed += 1
+                raise Overloaded(f"Rate limit exceeded for {priority} requests", max(1, math.ceil(wait)))
+            cls.admitted += 1
+
+    def _drain_seconds(self, cls: _PriorityClass) -> int:
+        """Rough time for the class's queue to get a slot each (under the lock)."""
+        return max(1, math.ceil(len(cls.queue) * cls.service_seconds / self.slots))
+
+    # -------------------------------------------------------------------------
+    # Slots
+    # -------------------------------------------------------------------------
+
+    def _enqueue(self, cls: _PriorityClass, waiter: _Waiter) -> bool:
+        """Grant a free slot straight away, or queue the waiter (under the lock)."""
+        if not cls.queue:
+            # A class that was idle restarts at the current virtual time
+            # instead of spending credit banked while it had nothing to run
+            cls.pass_ = max(cls.pass_, self._vtime)
+        if self._free:
+            self._grant(cls)
+            waiter.granted = True
+            return True
+        cls.queue.append(waiter)
+        return False
+
+    def _grant(self, cls: _PriorityClass) -> None:
+        self._free -= 1
+        cls.running += 1
+        cls.grants += 1
+        self._vtime = cls.pass_
+        cls.pass_ += 1 / cls.weight
+
+    def _release(self, cls: _PriorityClass, elapsed: Optional[float]) -> None:
+        grants: List[Callable[[], None]] = []
+        with self._lock:
+            cls.running -= 1
+            self._free += 1
+            if elapsed is not None:
+                cls.service_seconds += _SERVICE_EWMA * (elapsed - cls.service_seconds)
+            while self._free:
+                waiting = [c for c in self._classes.values() if c.queue]
+                if not waiting:
+                    break
+                next_cls = min(waiting, key=lambda c: c.pass_)
+                waiter = next_cls.queue.popleft()
+                self._grant(next_cls)
+                waiter.granted = True
+                grants.append(waiter.grant)
+        for grant in grants:
+            grant()
+
+    @asynccontextmanager
+    async def hold(self, priority: str) -> AsyncIterator[None]:
+        """Hold a slot from the event loop."""
+        if not self.enabled:
+            yield
+            return
+        cls = self._classes[priority]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = _Waiter(lambda: loop.call_soon_threadsafe(_resolve, future))
+        with self._lock:
+            granted = self._enqueue(cls, waiter)
+        if not granted:
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    granted = waiter.granted
+                    if not granted:
+                        cls.queue.remove(waiter)
+                if granted:
+                    # Granted just before the cancellation: pass the slot on
+                    self._release(cls, None)
+                raise
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._release(cls, time.perf_counter() - start)
+
+    @contextmanager
+    def hold_sync(self, priority: str) -> Iterator[None]:
+        """Hold a slot from a worker thread (blocks the thread while queued)."""
+        if not self.enabled:
+            yield
+            return
+        cls = self._classes[priority]
+        event = threading.Event()
+        waiter = _Waiter(event.set)
+        with self._lock:
+            granted = self._enqueue(cls, waiter)
+        if not granted:
+            event.wait()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._release(cls, time.perf_counter() - start)
+
+    def paced(self, items: Iterable[T], priority: str, chunk_size: int = UAE_SCHEDULER_CHUNK_SIZE) -> Iterator[T]:
+        """
+        Re-yield a lazily produced stream, producing each chunk of chunk_size
+        items while holding a slot. The slot is not held while the consumer
+        handles the items (e.g. while they are written to the client).
+        """
+        iterator = iter(items)
+        while True:
+            with self.hold_sync(priority):
+                chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield from chunk
+
+    # -------------------------------------------------------------------------
+    # Status
+    # -------------------------------------------------------------------------
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "slots": self.slots,
+                "free_slots": self._free,
+                "classes": [
+                    {
+                        "priority": cls.name,
+                        "weight": cls.weight,
+                        "queued": len(cls.queue),
+                        "running": cls.running,
+                        "admitted": cls.admitted,
+                        "shed": cls.shed,
+                        "slot_grants": cls.grants,
+                        "avg_hold_ms": round(cls.service_seconds * 1000, 3),
+                    }
+                    for cls in self._classes.values()
+                ],
+            }
+
+
+scheduler = Scheduler()
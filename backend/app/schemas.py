@@ -4,11 +4,25 @@ Pydantic models for request/response validation.
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 import re
 
 
+PURPOSE_CODE_FORMAT = re.compile(r"^[A-Z0-9]{2,5}$")
+
+# Response verbosity for validation endpoints:
+#   minimal     - score, compliance and failing rule codes only
+#   errors_only - full response shape, failing results only, no IBAN details
+#   full        - every rule result, IBAN details and recommendations
+DetailLevel = Literal["minimal", "errors_only", "full"]
+# Validation mode for /validate:
+#   full      - every rule, STP score and recommendations (per DetailLevel)
+#   prescreen - fail-fast verdict: stop at the first error-severity failure
+ValidationMode = Literal["full", "prescreen"]
+Market = Literal["AE", "IN", "PK", "PH", "BD", "EG"]
+
+
 # =============================================================================
 # REQUEST SCHEMAS
 # =============================================================================
@@ -36,24 +50,82 @@ class UAEValidationRequest(BaseModel):
     creditor_iban: Optional[str] = Field(None, description="Creditor's UAE IBAN")
     debtor_lei: Optional[str] = Field(None, description="Debtor's LEI (20 chars)")
     creditor_lei: Optional[str] = Field(None, description="Creditor's LEI (20 chars)")
+    debtor_bic: Optional[str] = Field(None, description="Debtor agent SWIFT/BIC (8 or 11 chars)")
+    creditor_bic: Optional[str] = Field(None, description="Creditor agent SWIFT/BIC (8 or 11 chars)")
     remittance_info: Optional[str] = Field(None, max_length=140)
+    destination_market: Optional[Market] = Field(
+        None,
+        description="Destination market of an offshore payment (IN, PK, PH, BD, EG) for corridor purpose code checks",
+    )
+    tenant_profile: Optional[str] = Field(
+        None,
+        max_length=64,
+        description="Tenant profile (thresholds, penalty, enabled rules); overrides the X-Tenant-Profile header",
+    )
 
     @field_validator("purpose_code")
     @classmethod
     def validate_purpose_code_format(cls, v):
         if v is not None:
-            if not re.match(r"^[A-Z0-9]{2,5}$", v.upper()):
+            if not PURPOSE_CODE_FORMAT.match(v.upper()):
                 raise ValueError("purpose_code must be 2-5 alphanumeric characters")
             return v.upper()
         return v
 
 
+class UAETenantThresholds(BaseModel):
+    """Threshold overrides of a tenant profile (None: reference data value)."""
+
+    lei_threshold_aed: Optional[float] = Field(None, gt=0)
+    high_value_threshold_aed: Optional[float] = Field(None, gt=0)
+    penalty_per_violation_aed: Optional[float] = Field(None, gt=0)
+
+
+class UAETenantProfileRequest(BaseModel):
+    """A tenant profile, as in the UAE_TENANT_PROFILES_PATH file."""
+
+    version: Optional[str] = Field(None, description="Operator label; the profile version is a hash of its content")
+    thresholds: UAETenantThresholds = Field(default_factory=UAETenantThresholds)
+    enabled_rules: Optional[List[str]] = Field(None, description="Rules that count (default: all)")
+    disabled_rules: List[str] = Field(default_factory=list)
+
+
 class UAEIBANValidationRequest(BaseModel):
     """Request schema for standalone IBAN validation."""
 
     iban: str = Field(..., description="UAE IBAN to validate")
 
 
+class UAEBankLookupItem(BaseModel):
+    """Single entry of a bulk bank lookup."""
+
+    iban: Optional[str] = Field(None, description="UAE IBAN")
+    bic: Optional[str] = Field(None, description="SWIFT/BIC (8 or 11 chars)")
+
+
+class UAEBankLookupRequest(BaseModel):
+    """Request schema for bulk bank lookup (screening files)."""
+
+    items: List[UAEBankLookupItem] = Field(..., max_length=10_000)
+
+
+class UAETranslateBatchRequest(BaseModel):
+    """Purpose codes of one market to re-code into another."""
+
+    source_market: Market = Field("AE", description="Market the codes belong to")
+    target_market: Market = Field(..., description="Market to translate into")
+    codes: List[str] = Field(..., description="Purpose codes, in payment order")
+
+
+class UAEReturnedPayment(BaseModel):
+    """A returned payment: the original transaction and its return reason."""
+
+    reference: Optional[str] = None
+    return_code: str = Field(..., description="ISO 20022 return reason code (e.g. AC01, NARR, LEIR)")
+    return_info: Optional[str] = Field(None, description="Free-text return information from the returning bank")
+    transaction: UAEValidationRequest
+
+
 # =============================================================================
 # RESPONSE SCHEMAS
 # =============================================================================
@@ -143,6 +215,28 @@ class UAEValidationResponse(BaseModel):
     created_at: datetime
 
 
+class UAEValidationMinimalResponse(BaseModel):
+    """Compact validation verdict (detail=minimal)."""
+
+    session_uuid: str
+    stp_score: float
+    stp_rating: str
+    uaefts_compliant: bool
+    violation_count: int
+    total_penalty_risk_aed: float
+    failed_rules: List[str]
+
+
+class UAEPrescreenResponse(BaseModel):
+    """Fail-fast verdict (mode=prescreen): the first error-severity failure, if any."""
+
+    uaefts_compliant: bool
+    failed_rule: Optional[str] = None
+    error_code: Optional[str] = None
+    field_code: Optional[str] = None
+    error_message: Optional[str] = None
+
+
 class UAEIBANValidationResponse(BaseModel):
     """Response schema for standalone IBAN validation."""
 
@@ -156,10 +250,310 @@ class UAEIBANValidationResponse(BaseModel):
     error_message: Optional[str] = None
 
 
+class UAEBankLookupResult(BaseModel):
+    """Bank lookup result for a single IBAN/BIC pair."""
+
+    iban: Optional[str] = None
+    bic: Optional[str] = None
+    iban_bank_code: Optional[str] = None
+    iban_bank_name: Optional[str] = None
+    bic_bank_code: Optional[str] = None
+    bic_bank_name: Optional[str] = None
+    bic_matches_iban: Optional[bool] = None
+    error_message: Optional[str] = None
+
+
+class UAEBankLookupResponse(BaseModel):
+    """Response schema for bulk bank lookup."""
+
+    total: int
+    matched: int
+    mismatched: int
+    unresolved: int
+    results: List[UAEBankLookupResult]
+
+
+class UAELEILookupResponse(BaseModel):
+    """Response schema for LEI lookup."""
+
+    lei: str
+    checksum_valid: bool
+    found: Optional[bool] = None
+    entity_status: Optional[str] = None
+    registration_status: Optional[str] = None
+
+
+class UAELEIIndexResponse(BaseModel):
+    """Status of the local GLEIF index."""
+
+    available: bool
+    index_path: Optional[str] = None
+    record_count: int = 0
+
+
+class UAETenantProfileResponse(BaseModel):
+    """A tenant profile with its effective thresholds."""
+
+    name: str
+    version: str
+    label: Optional[str] = None
+    data_version: str = Field(..., description="Version reported on this tenant's decisions")
+    lei_threshold_aed: float
+    high_value_threshold_aed: float
+    penalty_per_violation_aed: float
+    disabled_rules: List[str]
+
+
+class UAETenantProfilesResponse(BaseModel):
+    """Configured tenant profiles."""
+
+    source: str
+    profiles: List[UAETenantProfileResponse]
+
+
+class UAEReferenceDataResponse(BaseModel):
+    """Current reference data version."""
+
+    version: str
+    label: Optional[str] = None
+    source: str
+    total_purpose_codes: int
+    total_categories: int
+    total_banks: int
+    lei_threshold_aed: float
+    high_value_threshold_aed: float
+    penalty_per_violation_aed: float
+
+
+class UAEFXRatesResponse(BaseModel):
+    """Current FX rate table (AED per unit)."""
+
+    source: str
+    rate_date: str
+    rate_dates: List[str]
+    rates: Dict[str, float]
+
+
+class UAESTPBucket(BaseModel):
+    """One bucket of the STP score histogram."""
+
+    min_score: int
+    max_score: int
+    count: int
+
+
+class UAETaxonomyBucket(BaseModel):
+    """Payments rolled up under one IMF BOP or ISO 20022 code."""
+
+    code: Optional[str] = Field(None, description="None for purpose codes without a mapping")
+    name: str
+    category: Optional[str] = None
+    count: int
+    amount_aed: float
+    purpose_codes: List[str]
+
+
+class UAETaxonomyReport(BaseModel):
+    """Counts and AED amounts per IMF BOP and ISO 20022 code."""
+
+    total_count: int
+    total_amount_aed: float
+    unmapped_count: int = Field(..., description="Payments whose purpose code has no BOP mapping")
+    by_bop: List[UAETaxonomyBucket]
+    by_iso: List[UAETaxonomyBucket]
+
+
+class UAEBatchSummaryResponse(BaseModel):
+    """File-level totals from aggregate-only batch validation."""
+
+    data_version: str
+    total_transactions: int
+    validated: int
+    unparseable: int
+    compliant: int
+    non_compliant: int
+    stp_score_mean: Optional[float] = None
+    stp_score_min: Optional[float] = None
+    stp_score_max: Optional[float] = None
+    stp_ratings: Dict[str, int]
+    stp_histogram: List[UAESTPBucket]
+    total_amount_aed: float
+    total_penalty_risk_aed: float
+    failures_by_rule: Dict[str, int]
+    high_value_count: int
+    lei_missing_count: int
+    taxonomy_report: Optional[UAETaxonomyReport] = None
+    processing_time_ms: int
+
+
+class UAEJobResponse(BaseModel):
+    """Status and progress of a background batch job."""
+
+    job_id: str
+    status: Literal["queued", "running", "completed", "cancelled", "failed"]
+    format: str
+    detail: DetailLevel
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    rows_done: int = 0
+    rows_total: int = Field(0, description="Transactions found by a pre-scan of the file")
+    rows_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    compliant: Optional[int] = None
+    unparseable: Optional[int] = None
+    error: Optional[str] = None
+
+
+class UAEJobListResponse(BaseModel):
+    """All retained jobs, newest first."""
+
+    jobs: List[UAEJobResponse]
+
+
+class UAESchedulerClassStatus(BaseModel):
+    """Queue and counters of one admission control priority class."""
+
+    priority: str
+    weight: float
+    queued: int
+    running: int
+    admitted: int
+    shed: int
+    slot_grants: int
+    avg_hold_ms: float
+
+
+class UAESchedulerStatus(BaseModel):
+    """Admission control state of the serving process."""
+
+    enabled: bool
+    slots: int
+    free_slots: int
+    classes: List[UAESchedulerClassStatus]
+
+
+class UAEAuditStatus(BaseModel):
+    """Audit log writer state of the serving process."""
+
+    enabled: bool
+    directory: Optional[str] = None
+    durability: Optional[str] = None
+    queued: int = 0
+    enqueued: int = 0
+    written: int = 0
+    synced: int = 0
+    dropped: int = 0
+    commits: int = 0
+    fsyncs: int = 0
+    segments: int = 0
+    current_segment: Optional[str] = None
+    error: Optional[str] = None
+
+
+class UAEMarketCode(BaseModel):
+    """A purpose code of one market."""
+
+    code: str
+    purpose: str
+    description: str = ""
+    direction: Optional[str] = None
+    confidence: Optional[str] = Field(None, description="Confidence of this code's own ISO mapping")
+
+
+class UAETranslationResponse(BaseModel):
+    """Translation of one purpose code via its ISO 20022 code."""
+
+    source_market: str
+    target_market: str
+    source_code: UAEMarketCode
+    iso_code: str
+    iso_name: str
+    confidence: str
+    target_codes: List[UAEMarketCode] = Field(..., description="Best match first")
+
+
+class UAECorridorCode(BaseModel):
+    """A UAE purpose code expected in a corridor."""
+
+    code: str
+    confidence: Optional[str] = None
+    target_codes: List[str]
+
+
+class UAECorridorProfileResponse(BaseModel):
+    """Purpose code expectations of one UAE -> destination market corridor."""
+
+    market: Market
+    name: str
+    currency: str
+    complexity: str
+    allowed_codes: List[UAECorridorCode]
+
+
+class UAETranslationBatchItem(BaseModel):
+    """Compact translation of one code in a batch."""
+
+    code: str
+    found: bool
+    iso_code: Optional[str] = None
+    confidence: Optional[str] = None
+    target_codes: List[str] = Field([], description="Best match first")
+
+
 # =============================================================================
 # CODE SCHEMAS
 # =============================================================================
 
+class UAETaxonomyMapping(BaseModel):
+    """ISO 20022 and IMF BOP mapping of one UAE purpose code."""
+
+    uae_code: str
+    uae_name: str
+    iso_code: Optional[str] = None
+    iso_name: Optional[str] = None
+    iso_confidence: str
+    bop_code: Optional[str] = None
+    bop_name: Optional[str] = None
+    bop_confidence: str
+    taxonomy_code: str
+    taxonomy_l0: str
+    notes: str
+
+
+class UAEReturnRootCause(BaseModel):
+    """The failing rule that most likely caused a return."""
+
+    rule_code: str
+    field_code: str
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    remediation_suggestion: Optional[str] = None
+
+
+class UAEReturnDiagnosis(BaseModel):
+    """Root cause and corrections for one returned payment."""
+
+    reference: Optional[str] = None
+    return_code: str
+    return_reason: Optional[str] = None
+    category: Optional[str] = None
+    status: Literal["explained", "unexplained", "external", "unknown_code"] = Field(
+        ...,
+        description=(
+            "explained: a failing rule matches the return reason; unexplained: no matching rule fails; "
+            "external: the reason is outside the payment message; unknown_code: return code not recognised"
+        ),
+    )
+    root_cause: Optional[UAEReturnRootCause] = None
+    other_failures: List[str] = Field(default_factory=list, description="Other failing rule codes")
+    corrected_fields: Dict[str, str] = Field(default_factory=dict, description="Field values to resend with")
+    review_fields: List[str] = Field(default_factory=list, description="Fields to check by hand")
+    stp_score: float
+    corrected_stp_score: Optional[float] = None
+    corrected_compliant: Optional[bool] = None
+
+
 class UAEPurposeCodeResponse(BaseModel):
     """Purpose code details."""
 
@@ -216,6 +610,7 @@ class HealthResponse(BaseModel):
     status: str
     module: str = "uae"
     version: str = "1.0.0"
+    data_version: Optional[str] = None
     timestamp: datetime
     config: Dict[str, Any]
     features: List[str]
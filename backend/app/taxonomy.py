@@ -0,0 +1,137 @@
+"""
+UAE Taxonomy Reporting
+Roll payment volumes up by IMF BOP and ISO 20022 code.
+
+The mapping tables (app.taxonomy_codes) are compiled once into a slot per
+mapped UAE purpose code plus one "unmapped" slot, with parallel arrays
+giving each slot's ISO and BOP code. A report accumulates a count and an
+AED amount per slot (one dict lookup and two list updates per payment),
+so memory is fixed by the code list, not by the number of payments; the
+per-BOP and per-ISO buckets are summed from the slots when the report is
+built.
+"""
+
+from typing import Dict, List, Optional
+
+from app.fx import get_fx_rates
+from app.schemas import UAETaxonomyBucket, UAETaxonomyMapping, UAETaxonomyReport, UAEValidationRequest
+from app.taxonomy_codes import IMF_BOP_CODES, ISO_20022_CODES, UAE_TAXONOMY_MAPPINGS
+
+UNMAPPED_NAME = "Unmapped"
+
+
+def _mapping(entry: Dict) -> UAETaxonomyMapping:
+    iso, bop = entry["iso_code"], entry["bop_code"]
+    return UAETaxonomyMapping(
+        **entry,
+        iso_name=ISO_20022_CODES[iso]["name"] if iso else None,
+        bop_name=IMF_BOP_CODES[bop]["name"] if bop else None,
+    )
+
+
+class TaxonomyIndex:
+    """UAE purpose code -> slot, and slot -> (ISO code, BOP code)."""
+
+    def __init__(self, mappings: List[Dict] = UAE_TAXONOMY_MAPPINGS):
+        self.mappings: Dict[str, UAETaxonomyMapping] = {m["uae_code"]: _mapping(m) for m in mappings}
+        self.codes: List[str] = list(self.mappings)
+        self.slots: Dict[str, int] = {code: slot for slot, code in enumerate(self.codes)}
+        self.unmapped = len(self.codes)
+        # Indexed by slot; the unmapped slot maps to nothing
+        self.iso_of: List[Optional[str]] = [self.mappings[c].iso_code for c in self.codes] + [None]
+        self.bop_of: List[Optional[str]] = [self.mappings[c].bop_code for c in self.codes] + [None]
+        self._by_iso: Dict[str, List[UAETaxonomyMapping]] = {}
+        self._by_bop: Dict[str, List[UAETaxonomyMapping]] = {}
+        for mapping in self.mappings.values():
+            if mapping.iso_code:
+                self._by_iso.setdefault(mapping.iso_code, []).append(mapping)
+            if mapping.bop_code:
+                self._by_bop.setdefault(mapping.bop_code, []).append(mapping)
+
+    @property
+    def slot_count(self) -> int:
+        return self.unmapped + 1
+
+    def slot(self, purpose_code: Optional[str]) -> int:
+        if not purpose_code:
+            return self.unmapped
+        slot = self.slots.get(purpose_code)
+        if slot is None:
+            slot = self.slots.get(purpose_code.strip().upper(), self.unmapped)
+        return slot
+
+    def get(self, uae_code: str) -> Optional[UAETaxonomyMapping]:
+        return self.mappings.get(uae_code.strip().upper())
+
+    def codes_by_iso(self, iso_code: str) -> List[UAETaxonomyMapping]:
+        """UAE codes mapped to an ISO 20022 code (getUAECodesByISO)."""
+        return self._by_iso.get(iso_code.strip().upper(), [])
+
+    def codes_by_bop(self, bop_code: str) -> List[UAETaxonomyMapping]:
+        """UAE codes mapped to an IMF BOP code (getUAECodesByBOP)."""
+        return self._by_bop.get(bop_code.strip(), [])
+
+
+taxonomy_index = TaxonomyIndex()
+
+
+class TaxonomyReport:
+    """Constant-memory counts and AED amounts per taxonomy slot."""
+
+    def __init__(self, index: Optional[TaxonomyIndex] = None):
+        self.index = index or taxonomy_index
+        self.counts: List[int] = [0] * self.index.slot_count
+        self.amounts: List[float] = [0.0] * self.index.slot_count
+
+    def add(self, purpose_code: Optional[str], amount_aed: float) -> None:
+        """Fold one payment into its slot."""
+        slot = self.index.slot(purpose_code)
+        self.counts[slot] += 1
+        self.amounts[slot] += amount_aed
+
+    def add_batch(self, requests: List[UAEValidationRequest]) -> None:
+        """Fold a batch, converting amounts to AED column-wise."""
+        amounts_aed = get_fx_rates().latest.to_aed_column(
+            [request.amount for request in requests],
+            [request.currency for request in requests],
+        )
+        slot_of, counts, amounts = self.index.slot, self.counts, self.amounts
+        for request, amount_aed in zip(requests, amounts_aed):
+            slot = slot_of(request.purpose_code)
+            counts[slot] += 1
+            amounts[slot] += amount_aed
+
+    def _buckets(self, code_of: List[Optional[str]], names: Dict[str, Dict], category: bool) -> List[UAETaxonomyBucket]:
+        totals: Dict[Optional[str], List] = {}
+        codes = self.index.codes
+        for slot, count in enumerate(self.counts):
+            if not count:
+                continue
+            bucket = totals.setdefault(code_of[slot], [0, 0.0, []])
+            bucket[0] += count
+            bucket[1] += self.amounts[slot]
+            if slot != self.index.unmapped:
+                bucket[2].append(codes[slot])
+        return [
+            UAETaxonomyBucket(
+                code=code,
+                name=names[code]["name"] if code else UNMAPPED_NAME,
+                category=names[code]["category"] if code and category else None,
+                count=count,
+                amount_aed=round(amount, 2),
+                purpose_codes=sorted(purpose_codes),
+            )
+            # Mapped codes in code order, unmapped last
+            for code, (count, amount, purpose_codes) in sorted(totals.items(), key=lambda kv: (kv[0] is None, kv[0] or ""))
+        ]
+
+    def to_response(self) -> UAETaxonomyReport:
+        by_bop = self._buckets(self.index.bop_of, IMF_BOP_CODES, category=True)
+        return UAETaxonomyReport(
+            total_count=sum(self.counts),
+            total_amount_aed=round(sum(self.amounts), 2),
+            unmapped_count=sum(b.count for b in by_bop if b.code is None),
+            by_bop=by_bop,
+            by_iso=self._buckets(self.index.iso_of, ISO_20022_CODES, category=False),
+        )
+
@@ -0,0 +1,735 @@
+"""
+UAE Purpose Code Taxonomy Mappings (ISO 20022 / IMF BOP)
+Port of the frontend tables in src/data/taxonomyMapping.ts.
+
+Each UAE purpose code is mapped to an ISO 20022 external purpose code, an
+IMF BPM6 balance of payments code and an underlying purpose taxonomy node,
+with a confidence per mapping (exact, close, partial, none). Purpose codes
+without an entry have no mapping. Reporting indexes are compiled from these
+tables in app.taxonomy.
+"""
+
+from typing import Dict, List, Optional
+
+MAPPING_CONFIDENCE_LEVELS = ("exact", "close", "partial", "none")
+
+# =============================================================================
+# ISO 20022 PURPOSE CODES (ExternalPurpose1Code)
+# =============================================================================
+
+ISO_20022_CODES: Dict[str, Dict[str, str]] = {
+    "ACCT": {"name": "AccountManagement", "definition": "Transaction moves funds between 2 accounts of same account holder at the same bank."},
+    "CASH": {"name": "CashManagementTransfer", "definition": "Transaction is a general cash management instruction."},
+    "INTC": {"name": "IntraCompanyPayment", "definition": "Transaction is an intra-company payment between two companies belonging to the same group."},
+    "INTP": {"name": "IntraPartyPayment", "definition": "Transaction is a payment between two accounts belonging to the same party."},
+    "SALA": {"name": "SalaryPayment", "definition": "Transaction is the payment of salaries."},
+    "BONU": {"name": "BonusPayment", "definition": "Transaction is a bonus payment."},
+    "PENS": {"name": "PensionPayment", "definition": "Transaction is the payment of pension."},
+    "SSBE": {"name": "SocialSecurityBenefit", "definition": "Transaction is a social security benefit payment."},
+    "PAYR": {"name": "Payroll", "definition": "Transaction is related to the payment of payroll."},
+    "ALLW": {"name": "Allowance", "definition": "Transaction is the payment of allowances."},
+    "GDDS": {"name": "PurchaseSaleOfGoods", "definition": "Transaction is related to purchase and sale of goods."},
+    "GDSV": {"name": "PurchaseSaleOfGoodsAndServices", "definition": "Transaction is related to purchase and sale of goods and services."},
+    "TRAD": {"name": "TradeServices", "definition": "Transaction is related to trade services."},
+    "SCVE": {"name": "PurchaseSaleOfServices", "definition": "Transaction is related to purchase and sale of services."},
+    "COMC": {"name": "CommercialPayment", "definition": "Transaction is a payment for commercial purposes."},
+    "SUPP": {"name": "SupplierPayment", "definition": "Transaction is related to a payment to a supplier."},
+    "TRVL": {"name": "TravelPayment", "definition": "Transaction is the payment of travel related expenses."},
+    "AIRB": {"name": "AirTransport", "definition": "Transaction is related to air transport."},
+    "SEAB": {"name": "SeaTransport", "definition": "Transaction is related to sea transport."},
+    "TRPT": {"name": "TransportPayment", "definition": "Transaction is the payment of transport costs."},
+    "DIVI": {"name": "Dividend", "definition": "Transaction is the payment of dividends."},
+    "INTE": {"name": "Interest", "definition": "Transaction is the payment of interest."},
+    "LOAN": {"name": "LoanPayment", "definition": "Transaction is related to the payment of a loan."},
+    "LOAR": {"name": "LoanRepayment", "definition": "Transaction is related to the repayment of a loan."},
+    "SECU": {"name": "Securities", "definition": "Transaction is the payment of securities."},
+    "INVS": {"name": "InvestmentAndSecurities", "definition": "Transaction is related to investment and securities."},
+    "INSU": {"name": "InsurancePremium", "definition": "Transaction is a payment of an insurance premium."},
+    "ICCP": {"name": "InsuranceClaim", "definition": "Transaction is an insurance claim payment."},
+    "TAXS": {"name": "TaxPayment", "definition": "Transaction is the payment of taxes."},
+    "TAXR": {"name": "TaxRefund", "definition": "Transaction is a tax refund."},
+    "GOVT": {"name": "GovernmentPayment", "definition": "Transaction is a payment to or from a government department."},
+    "CUST": {"name": "CustomsPayment", "definition": "Transaction is payment of customs duties."},
+    "ELEC": {"name": "Electricity", "definition": "Transaction is for electricity bill payment."},
+    "WTER": {"name": "Water", "definition": "Transaction is for water bill payment."},
+    "GASB": {"name": "GasBill", "definition": "Transaction is for gas bill payment."},
+    "PHON": {"name": "TelephoneBill", "definition": "Transaction is for telephone bill payment."},
+    "UBIL": {"name": "UtilitiesBill", "definition": "Transaction is for utilities bill payment."},
+    "EDUC": {"name": "Education", "definition": "Transaction is for education-related payment."},
+    "STDY": {"name": "Study", "definition": "Transaction is related to a payment for study costs."},
+    "MDCS": {"name": "MedicalServices", "definition": "Transaction is related to the payment for medical services."},
+    "HLTI": {"name": "HealthInsurance", "definition": "Transaction is related to health insurance."},
+    "RENT": {"name": "RentPayment", "definition": "Transaction is the payment of rent."},
+    "LEAS": {"name": "LeasePayment", "definition": "Transaction is related to a payment of a lease."},
+    "RLWY": {"name": "RealtyPayment", "definition": "Transaction is related to a payment on a property."},
+    "LICF": {"name": "LicenseFee", "definition": "Transaction is the payment of a license fee."},
+    "ROYP": {"name": "RoyaltyPayment", "definition": "Transaction is the payment of royalties."},
+    "CHAR": {"name": "CharityPayment", "definition": "Transaction is a payment to a charity."},
+    "ALMY": {"name": "AlimonyPayment", "definition": "Transaction is the payment of alimony."},
+    "FAMI": {"name": "FamilyMaintenance", "definition": "Transaction is related to a payment for family maintenance."},
+    "COMM": {"name": "Commission", "definition": "Transaction is the payment of commission."},
+    "FEES": {"name": "Fees", "definition": "Transaction is the payment of fees."},
+    "BKFE": {"name": "BankingFees", "definition": "Transaction is related to payment of bank loan fees."},
+    "CCRD": {"name": "CreditCardPayment", "definition": "Transaction is a payment of credit card bill."},
+    "DCRD": {"name": "DebitCardPayment", "definition": "Transaction is a payment via debit card."},
+    "OTHR": {"name": "Other", "definition": "Other payment purpose."},
+    "REFU": {"name": "Refund", "definition": "Transaction is the payment of a refund."},
+    "ADVA": {"name": "AdvancePayment", "definition": "Transaction is the payment of an advance."},
+    "RCPT": {"name": "ReceiptPayment", "definition": "Transaction is related to a receipt."},
+}
+
+# =============================================================================
+# IMF BALANCE OF PAYMENTS CODES (BPM6)
+# =============================================================================
+
+IMF_BOP_CODES: Dict[str, Dict[str, Optional[str]]] = {
+    "100": {"name": "Goods", "category": "Current Account", "level": "category", "parent": "993"},
+    "110": {"name": "General merchandise", "category": "Goods", "level": "subcategory", "parent": "100"},
+    "150": {"name": "Goods for processing", "category": "Goods", "level": "subcategory", "parent": "100"},
+    "160": {"name": "Repairs on goods", "category": "Goods", "level": "subcategory", "parent": "100"},
+    "170": {"name": "Goods procured in ports", "category": "Goods", "level": "subcategory", "parent": "100"},
+    "200": {"name": "Services", "category": "Current Account", "level": "category", "parent": "993"},
+    "205": {"name": "Transportation services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "206": {"name": "Sea transport", "category": "Services", "level": "detail", "parent": "205"},
+    "210": {"name": "Air transport", "category": "Services", "level": "detail", "parent": "205"},
+    "236": {"name": "Travel services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "245": {"name": "Communications services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "249": {"name": "Construction services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "253": {"name": "Insurance services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "260": {"name": "Financial services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "262": {"name": "Computer and information services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "266": {"name": "Royalties and license fees", "category": "Services", "level": "subcategory", "parent": "200"},
+    "268": {"name": "Other business services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "287": {"name": "Personal cultural recreational", "category": "Services", "level": "subcategory", "parent": "200"},
+    "291": {"name": "Government services", "category": "Services", "level": "subcategory", "parent": "200"},
+    "300": {"name": "Primary Income", "category": "Current Account", "level": "category", "parent": "993"},
+    "310": {"name": "Compensation of employees", "category": "Income", "level": "subcategory", "parent": "300"},
+    "320": {"name": "Investment income", "category": "Income", "level": "subcategory", "parent": "300"},
+    "321": {"name": "Direct investment income", "category": "Income", "level": "detail", "parent": "320"},
+    "331": {"name": "Portfolio investment income", "category": "Income", "level": "detail", "parent": "320"},
+    "339": {"name": "Other investment income", "category": "Income", "level": "detail", "parent": "320"},
+    "379": {"name": "Secondary Income", "category": "Current Account", "level": "category", "parent": "993"},
+    "380": {"name": "General government transfers", "category": "Transfers", "level": "subcategory", "parent": "379"},
+    "390": {"name": "Other sectors transfers", "category": "Transfers", "level": "subcategory", "parent": "379"},
+    "391": {"name": "Personal transfers", "category": "Transfers", "level": "detail", "parent": "390"},
+    "392": {"name": "Other current transfers", "category": "Transfers", "level": "detail", "parent": "390"},
+    "400": {"name": "Capital Account", "category": "Capital", "level": "category", "parent": None},
+    "430": {"name": "Capital transfers", "category": "Capital", "level": "subcategory", "parent": "400"},
+    "500": {"name": "Financial Account", "category": "Financial", "level": "category", "parent": None},
+    "505": {"name": "Direct investment", "category": "Financial", "level": "subcategory", "parent": "500"},
+    "555": {"name": "Portfolio investment", "category": "Financial", "level": "subcategory", "parent": "500"},
+    "602": {"name": "Other investment", "category": "Financial", "level": "subcategory", "parent": "500"},
+}
+
+# =============================================================================
+# UNDERLYING PURPOSE TAXONOMY
+# =============================================================================
+
+UNDERLYING_PURPOSE_TAXONOMY: Dict[str, Dict[str, Optional[str]]] = {
+    "INCOME": {"name": "Income & Compensation", "level": "L0", "parent": None},
+    "TRADE": {"name": "Trade in Goods", "level": "L0", "parent": None},
+    "SERVICES": {"name": "Services", "level": "L0", "parent": None},
+    "INVESTMENT": {"name": "Investment & Capital", "level": "L0", "parent": None},
+    "TRANSFERS": {"name": "Transfers", "level": "L0", "parent": None},
+    "SAL_WAGE": {"name": "Salaries & Wages", "level": "L1", "parent": "INCOME"},
+    "BENEFITS": {"name": "Benefits & Allowances", "level": "L1", "parent": "INCOME"},
+    "GOODS_EXP": {"name": "Goods Export", "level": "L1", "parent": "TRADE"},
+    "GOODS_IMP": {"name": "Goods Import", "level": "L1", "parent": "TRADE"},
+    "PROF_SVC": {"name": "Professional Services", "level": "L1", "parent": "SERVICES"},
+    "FIN_SVC": {"name": "Financial Services", "level": "L1", "parent": "SERVICES"},
+    "TRANSPORT": {"name": "Transport Services", "level": "L1", "parent": "SERVICES"},
+    "TRAVEL": {"name": "Travel & Tourism", "level": "L1", "parent": "SERVICES"},
+    "EQUITY": {"name": "Equity Investment", "level": "L1", "parent": "INVESTMENT"},
+    "DEBT": {"name": "Debt & Loans", "level": "L1", "parent": "INVESTMENT"},
+    "PROPERTY": {"name": "Real Property", "level": "L1", "parent": "INVESTMENT"},
+    "FAMILY": {"name": "Family Remittances", "level": "L1", "parent": "TRANSFERS"},
+    "CHARITY": {"name": "Charity & Donations", "level": "L1", "parent": "TRANSFERS"},
+}
+
+# =============================================================================
+# UAE CODE -> ISO / BOP / TAXONOMY
+# =============================================================================
+
+UAE_TAXONOMY_MAPPINGS: List[Dict[str, Optional[str]]] = [
+    {
+        "uae_code": "SAL", "uae_name": "Salary Payment",
+        "iso_code": "SALA", "iso_confidence": "exact",
+        "bop_code": "310", "bop_confidence": "exact",
+        "taxonomy_code": "SAL_WAGE", "taxonomy_l0": "INCOME",
+        "notes": "Direct mapping to ISO SALA and BOP 310",
+    },
+    {
+        "uae_code": "SAA", "uae_name": "Salary Advance",
+        "iso_code": "ADVA", "iso_confidence": "close",
+        "bop_code": "310", "bop_confidence": "close",
+        "taxonomy_code": "SAL_WAGE", "taxonomy_l0": "INCOME",
+        "notes": "Advance payment against salary - maps to general advance in ISO",
+    },
+    {
+        "uae_code": "BON", "uae_name": "Bonus Payment",
+        "iso_code": "BONU", "iso_confidence": "exact",
+        "bop_code": "310", "bop_confidence": "exact",
+        "taxonomy_code": "BENEFITS", "taxonomy_l0": "INCOME",
+        "notes": "Direct mapping to ISO BONU and BOP 310",
+    },
+    {
+        "uae_code": "COP", "uae_name": "Compensation",
+        "iso_code": "SALA", "iso_confidence": "close",
+        "bop_code": "310", "bop_confidence": "exact",
+        "taxonomy_code": "BENEFITS", "taxonomy_l0": "INCOME",
+        "notes": "General compensation - maps to salary in ISO",
+    },
+    {
+        "uae_code": "LAS", "uae_name": "Leave Salary",
+        "iso_code": "SALA", "iso_confidence": "close",
+        "bop_code": "310", "bop_confidence": "exact",
+        "taxonomy_code": "BENEFITS", "taxonomy_l0": "INCOME",
+        "notes": "Leave salary is a form of wage payment",
+    },
+    {
+        "uae_code": "PEN", "uae_name": "Pension",
+        "iso_code": "PENS", "iso_confidence": "exact",
+        "bop_code": "392", "bop_confidence": "exact",
+        "taxonomy_code": "BENEFITS", "taxonomy_l0": "INCOME",
+        "notes": "Direct mapping to ISO PENS",
+    },
+    {
+        "uae_code": "OVT", "uae_name": "Overtime",
+        "iso_code": "SALA", "iso_confidence": "close",
+        "bop_code": "310", "bop_confidence": "exact",
+        "taxonomy_code": "SAL_WAGE", "taxonomy_l0": "INCOME",
+        "notes": "Overtime is part of wages - no specific ISO code",
+    },
+    {
+        "uae_code": "EOS", "uae_name": "End of Service",
+        "iso_code": "SSBE", "iso_confidence": "close",
+        "bop_code": "310", "bop_confidence": "close",
+        "taxonomy_code": "BENEFITS", "taxonomy_l0": "INCOME",
+        "notes": "End of service gratuity - UAE specific",
+    },
+    {
+        "uae_code": "AES", "uae_name": "Advance Against EOS",
+        "iso_code": "ADVA", "iso_confidence": "close",
+        "bop_code": "310", "bop_confidence": "partial",
+        "taxonomy_code": "BENEFITS", "taxonomy_l0": "INCOME",
+        "notes": "Advance against future gratuity",
+    },
+    {
+        "uae_code": "ALW", "uae_name": "Allowance",
+        "iso_code": "ALLW", "iso_confidence": "exact",
+        "bop_code": "310", "bop_confidence": "exact",
+        "taxonomy_code": "BENEFITS", "taxonomy_l0": "INCOME",
+        "notes": "Direct mapping to ISO ALLW",
+    },
+    {
+        "uae_code": "FAM", "uae_name": "Family Support (Workers Remittances)",
+        "iso_code": "FAMI", "iso_confidence": "exact",
+        "bop_code": "391", "bop_confidence": "exact",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Workers remittances - core BOP category 391",
+    },
+    {
+        "uae_code": "TOF", "uae_name": "Transfer of Funds Between Persons",
+        "iso_code": "FAMI", "iso_confidence": "close",
+        "bop_code": "391", "bop_confidence": "exact",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Person-to-person transfer",
+    },
+    {
+        "uae_code": "OAT", "uae_name": "Own Account Transfer",
+        "iso_code": "ACCT", "iso_confidence": "exact",
+        "bop_code": None, "bop_confidence": "none",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Own account transfer - not BOP relevant (same entity)",
+    },
+    {
+        "uae_code": "AE015", "uae_name": "Family Support",
+        "iso_code": "FAMI", "iso_confidence": "exact",
+        "bop_code": "391", "bop_confidence": "exact",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Alternative code for family support",
+    },
+    {
+        "uae_code": "GDE", "uae_name": "Goods Sold (Export)",
+        "iso_code": "GDDS", "iso_confidence": "exact",
+        "bop_code": "110", "bop_confidence": "exact",
+        "taxonomy_code": "GOODS_EXP", "taxonomy_l0": "TRADE",
+        "notes": "Export of merchandise goods - BOP 110",
+    },
+    {
+        "uae_code": "GDI", "uae_name": "Goods Bought (Import)",
+        "iso_code": "GDDS", "iso_confidence": "exact",
+        "bop_code": "110", "bop_confidence": "exact",
+        "taxonomy_code": "GOODS_IMP", "taxonomy_l0": "TRADE",
+        "notes": "Import of merchandise goods - BOP 110",
+    },
+    {
+        "uae_code": "GMS", "uae_name": "Processing Repair Maintenance on Goods",
+        "iso_code": "GDDS", "iso_confidence": "close",
+        "bop_code": "160", "bop_confidence": "exact",
+        "taxonomy_code": "GOODS_EXP", "taxonomy_l0": "TRADE",
+        "notes": "Repairs on goods - specific BOP 160",
+    },
+    {
+        "uae_code": "GOS", "uae_name": "Government Goods and Services",
+        "iso_code": "GOVT", "iso_confidence": "exact",
+        "bop_code": "291", "bop_confidence": "exact",
+        "taxonomy_code": "GOODS_EXP", "taxonomy_l0": "TRADE",
+        "notes": "Government procurement - BOP 291",
+    },
+    {
+        "uae_code": "TCP", "uae_name": "Trade Credits Payable",
+        "iso_code": "TRAD", "iso_confidence": "close",
+        "bop_code": "602", "bop_confidence": "exact",
+        "taxonomy_code": "GOODS_IMP", "taxonomy_l0": "TRADE",
+        "notes": "Trade credit - financial account item",
+    },
+    {
+        "uae_code": "TCR", "uae_name": "Trade Credits Receivable",
+        "iso_code": "TRAD", "iso_confidence": "close",
+        "bop_code": "602", "bop_confidence": "exact",
+        "taxonomy_code": "GOODS_EXP", "taxonomy_l0": "TRADE",
+        "notes": "Trade credit receivable - financial account",
+    },
+    {
+        "uae_code": "AE001", "uae_name": "Consulting Services",
+        "iso_code": "SCVE", "iso_confidence": "exact",
+        "bop_code": "268", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Professional consulting - BOP 268",
+    },
+    {
+        "uae_code": "AE002", "uae_name": "Legal Services",
+        "iso_code": "SCVE", "iso_confidence": "exact",
+        "bop_code": "268", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Legal services - BOP 268",
+    },
+    {
+        "uae_code": "IFS", "uae_name": "Information Services",
+        "iso_code": "SCVE", "iso_confidence": "close",
+        "bop_code": "262", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Information services - BOP 262",
+    },
+    {
+        "uae_code": "ITS", "uae_name": "Computer Services",
+        "iso_code": "SCVE", "iso_confidence": "close",
+        "bop_code": "262", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "IT/Computer services - BOP 262",
+    },
+    {
+        "uae_code": "PMS", "uae_name": "Professional and Management Consulting",
+        "iso_code": "SCVE", "iso_confidence": "exact",
+        "bop_code": "268", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Management consulting - BOP 268",
+    },
+    {
+        "uae_code": "RDS", "uae_name": "Research and Development Services",
+        "iso_code": "SCVE", "iso_confidence": "close",
+        "bop_code": "268", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "R&D services - BOP 268",
+    },
+    {
+        "uae_code": "TCS", "uae_name": "Telecommunication Services",
+        "iso_code": "PHON", "iso_confidence": "close",
+        "bop_code": "245", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Telecom services - BOP 245",
+    },
+    {
+        "uae_code": "TTS", "uae_name": "Technical Trade-Related Services",
+        "iso_code": "SCVE", "iso_confidence": "close",
+        "bop_code": "268", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Trade-related technical services - BOP 268",
+    },
+    {
+        "uae_code": "FIS", "uae_name": "Financial Services",
+        "iso_code": "FEES", "iso_confidence": "close",
+        "bop_code": "260", "bop_confidence": "exact",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Financial services - BOP 260",
+    },
+    {
+        "uae_code": "SCO", "uae_name": "Construction",
+        "iso_code": "SCVE", "iso_confidence": "close",
+        "bop_code": "249", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Construction services - BOP 249",
+    },
+    {
+        "uae_code": "ATS", "uae_name": "Air Transport",
+        "iso_code": "AIRB", "iso_confidence": "exact",
+        "bop_code": "210", "bop_confidence": "exact",
+        "taxonomy_code": "TRANSPORT", "taxonomy_l0": "SERVICES",
+        "notes": "Air transport - BOP 210",
+    },
+    {
+        "uae_code": "STS", "uae_name": "Sea Transport",
+        "iso_code": "SEAB", "iso_confidence": "exact",
+        "bop_code": "206", "bop_confidence": "exact",
+        "taxonomy_code": "TRANSPORT", "taxonomy_l0": "SERVICES",
+        "notes": "Sea transport - BOP 206",
+    },
+    {
+        "uae_code": "OTS", "uae_name": "Other Modes of Transport",
+        "iso_code": "TRPT", "iso_confidence": "exact",
+        "bop_code": "205", "bop_confidence": "exact",
+        "taxonomy_code": "TRANSPORT", "taxonomy_l0": "SERVICES",
+        "notes": "Other transport - BOP 205",
+    },
+    {
+        "uae_code": "STR", "uae_name": "Travel",
+        "iso_code": "TRVL", "iso_confidence": "exact",
+        "bop_code": "236", "bop_confidence": "exact",
+        "taxonomy_code": "TRAVEL", "taxonomy_l0": "SERVICES",
+        "notes": "Travel expenses - BOP 236",
+    },
+    {
+        "uae_code": "EDU", "uae_name": "Educational Support",
+        "iso_code": "EDUC", "iso_confidence": "exact",
+        "bop_code": "287", "bop_confidence": "exact",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Education expenses - BOP 287",
+    },
+    {
+        "uae_code": "TKT", "uae_name": "Tickets",
+        "iso_code": "TRVL", "iso_confidence": "close",
+        "bop_code": "236", "bop_confidence": "close",
+        "taxonomy_code": "TRAVEL", "taxonomy_l0": "SERVICES",
+        "notes": "Ticket purchases - travel related",
+    },
+    {
+        "uae_code": "CHC", "uae_name": "Charitable Contributions",
+        "iso_code": "CHAR", "iso_confidence": "exact",
+        "bop_code": "392", "bop_confidence": "exact",
+        "taxonomy_code": "CHARITY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Charitable donations - BOP 392",
+    },
+    {
+        "uae_code": "DIV", "uae_name": "Dividend Payouts",
+        "iso_code": "DIVI", "iso_confidence": "exact",
+        "bop_code": "331", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Dividend payments - BOP 331",
+    },
+    {
+        "uae_code": "DOE", "uae_name": "Dividends on Equity",
+        "iso_code": "DIVI", "iso_confidence": "exact",
+        "bop_code": "331", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Equity dividends - BOP 331",
+    },
+    {
+        "uae_code": "IGD", "uae_name": "Dividends Intragroup",
+        "iso_code": "DIVI", "iso_confidence": "exact",
+        "bop_code": "321", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Intragroup dividends - BOP 321 (direct investment)",
+    },
+    {
+        "uae_code": "IOL", "uae_name": "Income on Loans",
+        "iso_code": "INTE", "iso_confidence": "exact",
+        "bop_code": "339", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Loan interest income - BOP 339",
+    },
+    {
+        "uae_code": "IOD", "uae_name": "Income on Deposits",
+        "iso_code": "INTE", "iso_confidence": "exact",
+        "bop_code": "339", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Deposit interest - BOP 339",
+    },
+    {
+        "uae_code": "LIP", "uae_name": "Loan Interest Payments",
+        "iso_code": "INTE", "iso_confidence": "exact",
+        "bop_code": "339", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Loan interest payments - BOP 339",
+    },
+    {
+        "uae_code": "IPC", "uae_name": "Charges for Intellectual Property",
+        "iso_code": "LICF", "iso_confidence": "exact",
+        "bop_code": "266", "bop_confidence": "exact",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "IP royalties - BOP 266",
+    },
+    {
+        "uae_code": "LLA", "uae_name": "Long-term Loans to Non-Residents",
+        "iso_code": "LOAN", "iso_confidence": "exact",
+        "bop_code": "602", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Long-term cross-border lending - BOP 602",
+    },
+    {
+        "uae_code": "LLL", "uae_name": "Long-term Foreign Loans to Residents",
+        "iso_code": "LOAN", "iso_confidence": "exact",
+        "bop_code": "602", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Long-term borrowing - BOP 602",
+    },
+    {
+        "uae_code": "SLA", "uae_name": "Short-term Loans to Non-Residents",
+        "iso_code": "LOAN", "iso_confidence": "exact",
+        "bop_code": "602", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Short-term cross-border lending - BOP 602",
+    },
+    {
+        "uae_code": "SLL", "uae_name": "Short-term Foreign Loans to Residents",
+        "iso_code": "LOAN", "iso_confidence": "exact",
+        "bop_code": "602", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Short-term borrowing - BOP 602",
+    },
+    {
+        "uae_code": "LND", "uae_name": "Loan Disbursements",
+        "iso_code": "LOAN", "iso_confidence": "exact",
+        "bop_code": "602", "bop_confidence": "exact",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Loan disbursement - BOP 602",
+    },
+    {
+        "uae_code": "LNC", "uae_name": "Loan Charges",
+        "iso_code": "BKFE", "iso_confidence": "exact",
+        "bop_code": "260", "bop_confidence": "exact",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Loan fees - financial services BOP 260",
+    },
+    {
+        "uae_code": "CEA", "uae_name": "Equity in Company Abroad",
+        "iso_code": "INVS", "iso_confidence": "exact",
+        "bop_code": "505", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "FDI outward - BOP 505",
+    },
+    {
+        "uae_code": "CEL", "uae_name": "Equity in Company Abroad - Non-Residents",
+        "iso_code": "INVS", "iso_confidence": "exact",
+        "bop_code": "505", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "FDI - BOP 505",
+    },
+    {
+        "uae_code": "FSA", "uae_name": "Equity Shares in Foreign Companies",
+        "iso_code": "SECU", "iso_confidence": "exact",
+        "bop_code": "555", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Portfolio equity - BOP 555",
+    },
+    {
+        "uae_code": "FSL", "uae_name": "Equity Shares in UAE Companies",
+        "iso_code": "SECU", "iso_confidence": "exact",
+        "bop_code": "555", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Local portfolio equity - BOP 555",
+    },
+    {
+        "uae_code": "FIA", "uae_name": "Investment Fund Shares - Foreign",
+        "iso_code": "INVS", "iso_confidence": "exact",
+        "bop_code": "555", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Fund investment - BOP 555",
+    },
+    {
+        "uae_code": "FIL", "uae_name": "Investment Fund Shares - UAE",
+        "iso_code": "INVS", "iso_confidence": "exact",
+        "bop_code": "555", "bop_confidence": "close",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Local fund investment - BOP 555",
+    },
+    {
+        "uae_code": "ISH", "uae_name": "Income on Investment Fund Shares",
+        "iso_code": "DIVI", "iso_confidence": "exact",
+        "bop_code": "331", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Fund income distribution - BOP 331",
+    },
+    {
+        "uae_code": "IPO", "uae_name": "IPO Subscriptions",
+        "iso_code": "SECU", "iso_confidence": "exact",
+        "bop_code": "555", "bop_confidence": "exact",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "IPO subscription - BOP 555",
+    },
+    {
+        "uae_code": "INS", "uae_name": "Insurance Services",
+        "iso_code": "INSU", "iso_confidence": "exact",
+        "bop_code": "253", "bop_confidence": "exact",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Insurance services - BOP 253",
+    },
+    {
+        "uae_code": "RNT", "uae_name": "Rent Payments",
+        "iso_code": "RENT", "iso_confidence": "exact",
+        "bop_code": "268", "bop_confidence": "close",
+        "taxonomy_code": "PROPERTY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Rent payments - ISO RENT",
+    },
+    {
+        "uae_code": "LEA", "uae_name": "Leasing Abroad",
+        "iso_code": "LEAS", "iso_confidence": "exact",
+        "bop_code": "268", "bop_confidence": "exact",
+        "taxonomy_code": "PROPERTY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Cross-border leasing - BOP 268",
+    },
+    {
+        "uae_code": "LEL", "uae_name": "Leasing in UAE",
+        "iso_code": "LEAS", "iso_confidence": "exact",
+        "bop_code": None, "bop_confidence": "none",
+        "taxonomy_code": "PROPERTY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Domestic leasing - not BOP relevant",
+    },
+    {
+        "uae_code": "PRR", "uae_name": "Profits/Rents on Real Estate",
+        "iso_code": "RENT", "iso_confidence": "exact",
+        "bop_code": "320", "bop_confidence": "close",
+        "taxonomy_code": "PROPERTY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Property rental income",
+    },
+    {
+        "uae_code": "PPA", "uae_name": "Purchase Real Estate Abroad",
+        "iso_code": "RLWY", "iso_confidence": "exact",
+        "bop_code": "505", "bop_confidence": "close",
+        "taxonomy_code": "PROPERTY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Foreign property purchase",
+    },
+    {
+        "uae_code": "PPL", "uae_name": "Purchase Real Estate in UAE",
+        "iso_code": "RLWY", "iso_confidence": "exact",
+        "bop_code": "505", "bop_confidence": "close",
+        "taxonomy_code": "PROPERTY", "taxonomy_l0": "INVESTMENT",
+        "notes": "UAE property purchase from non-resident",
+    },
+    {
+        "uae_code": "TAX", "uae_name": "Tax Payment",
+        "iso_code": "TAXS", "iso_confidence": "exact",
+        "bop_code": "380", "bop_confidence": "exact",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Tax payments - BOP 380",
+    },
+    {
+        "uae_code": "XAT", "uae_name": "Tax Refund",
+        "iso_code": "TAXR", "iso_confidence": "exact",
+        "bop_code": "380", "bop_confidence": "exact",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Tax refund - BOP 380",
+    },
+    {
+        "uae_code": "GRI", "uae_name": "Government Related",
+        "iso_code": "GOVT", "iso_confidence": "exact",
+        "bop_code": "380", "bop_confidence": "exact",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Government transfers - BOP 380",
+    },
+    {
+        "uae_code": "UTL", "uae_name": "Utility Bill Payments",
+        "iso_code": "UBIL", "iso_confidence": "exact",
+        "bop_code": None, "bop_confidence": "none",
+        "taxonomy_code": "PROF_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Utility payments - typically domestic",
+    },
+    {
+        "uae_code": "CCP", "uae_name": "Corporate Card Payments",
+        "iso_code": "CCRD", "iso_confidence": "exact",
+        "bop_code": None, "bop_confidence": "none",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Corporate card - settlement mechanism",
+    },
+    {
+        "uae_code": "CRP", "uae_name": "Credit Card Payment",
+        "iso_code": "CCRD", "iso_confidence": "exact",
+        "bop_code": None, "bop_confidence": "none",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Credit card settlement",
+    },
+    {
+        "uae_code": "DCP", "uae_name": "Debit Card Payments",
+        "iso_code": "DCRD", "iso_confidence": "exact",
+        "bop_code": None, "bop_confidence": "none",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Debit card settlement",
+    },
+    {
+        "uae_code": "MWP", "uae_name": "Mobile Wallet Payments",
+        "iso_code": None, "iso_confidence": "none",
+        "bop_code": None, "bop_confidence": "none",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Mobile wallet - UAE specific digital payment",
+    },
+    {
+        "uae_code": "COM", "uae_name": "Commission",
+        "iso_code": "COMM", "iso_confidence": "exact",
+        "bop_code": "260", "bop_confidence": "close",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Commission payments",
+    },
+    {
+        "uae_code": "ACM", "uae_name": "Agency Commissions",
+        "iso_code": "COMM", "iso_confidence": "exact",
+        "bop_code": "268", "bop_confidence": "exact",
+        "taxonomy_code": "FIN_SVC", "taxonomy_l0": "SERVICES",
+        "notes": "Agency commission - BOP 268",
+    },
+    {
+        "uae_code": "OTH", "uae_name": "Other Payments",
+        "iso_code": "OTHR", "iso_confidence": "exact",
+        "bop_code": "392", "bop_confidence": "close",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Catch-all code",
+    },
+    {
+        "uae_code": "EMI", "uae_name": "Equated Monthly Installments",
+        "iso_code": "LOAR", "iso_confidence": "exact",
+        "bop_code": "602", "bop_confidence": "close",
+        "taxonomy_code": "DEBT", "taxonomy_l0": "INVESTMENT",
+        "notes": "Loan EMI payments",
+    },
+    {
+        "uae_code": "MCR", "uae_name": "Monetary Claim Reimbursements",
+        "iso_code": "REFU", "iso_confidence": "exact",
+        "bop_code": "392", "bop_confidence": "close",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Reimbursements",
+    },
+    {
+        "uae_code": "POR", "uae_name": "Refunds on IPO",
+        "iso_code": "REFU", "iso_confidence": "exact",
+        "bop_code": "555", "bop_confidence": "close",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "IPO refund",
+    },
+    {
+        "uae_code": "CBP", "uae_name": "Cross Border Payments",
+        "iso_code": "OTHR", "iso_confidence": "partial",
+        "bop_code": "392", "bop_confidence": "partial",
+        "taxonomy_code": "FAMILY", "taxonomy_l0": "TRANSFERS",
+        "notes": "Generic cross-border - needs specific classification",
+    },
+    {
+        "uae_code": "PIN", "uae_name": "Personal Investments",
+        "iso_code": "INVS", "iso_confidence": "close",
+        "bop_code": "555", "bop_confidence": "close",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Personal investment",
+    },
+    {
+        "uae_code": "CIN", "uae_name": "Commercial Investments",
+        "iso_code": "INVS", "iso_confidence": "close",
+        "bop_code": "505", "bop_confidence": "close",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Commercial investment",
+    },
+    {
+        "uae_code": "IGT", "uae_name": "Inter Group Transfer",
+        "iso_code": "INTC", "iso_confidence": "exact",
+        "bop_code": "321", "bop_confidence": "close",
+        "taxonomy_code": "EQUITY", "taxonomy_l0": "INVESTMENT",
+        "notes": "Intercompany transfer - ISO INTC",
+    },
+]
@@ -0,0 +1,257 @@
+"""
+UAE Tenant Profiles
+Per-business-line thresholds, penalty and enabled rules.
+
+Set UAE_TENANT_PROFILES_PATH to a JSON file of named profiles:
+
+    {
+        "retail": {
+            "version": "2026-10-01",
+            "thresholds": {"high_value_threshold_aed": 250000},
+            "disabled_rules": ["UAE_CORRIDOR_PPC"]
+        },
+        "treasury": {
+            "thresholds": {"lei_threshold_aed": 500000, "penalty_per_violation_aed": 5000.0},
+            "enabled_rules": ["UAE_PPC_MANDATORY", "UAE_PPC_VALID", "UAE_IBAN_DEBTOR", ...]
+        }
+    }
+
+Thresholds a profile leaves out come from the current reference data. The
+rules that count are enabled_rules (default: all of UAE_RULE_CODES) minus
+disabled_rules; results of the others are dropped before scoring. A
+profile's version defaults to a hash of its content.
+
+A request selects a profile with its tenant_profile field or, failing
+that, the X-Tenant-Profile header; with neither, the reference data
+applies unchanged. Each profile is compiled once into an immutable
+TenantPlan: a ReferenceData carrying the profile's thresholds and penalty
+(so FX limits, messages and penalties follow it with no per-rule changes)
+and the frozenset of disabled rules. Plans are cached per profile and tied
+to the profile version and reference data version they were compiled
+from, so resolving a tenant is one dict lookup and a version comparison.
+Replacing a profile (reload or PUT) drops its plan; a reference data
+reload recompiles plans lazily on first use.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, NamedTuple, Optional
+
+from app.constants import UAE_RULE_CODES
+from app.reference import ReferenceData
+
+TENANT_PROFILES_PATH_ENV = "UAE_TENANT_PROFILES_PATH"
+
+THRESHOLD_KEYS = frozenset({"lei_threshold_aed", "high_value_threshold_aed", "penalty_per_violation_aed"})
+RULE_CODES = frozenset(UAE_RULE_CODES)
+
+
+class UnknownTenantProfile(LookupError):
+    """A request named a tenant profile that is not configured."""
+
+
+# =============================================================================
+# PROFILES AND PLANS
+# =============================================================================
+
+@dataclass(frozen=True)
+class TenantProfile:
+    """One named profile as configured."""
+
+    name: str
+    version: str
+    label: Optional[str]
+    thresholds: Mapping[str, float]
+    enabled_rules: Optional[FrozenSet[str]]
+    disabled_rules: FrozenSet[str]
+
+    @classmethod
+    def from_dict(cls, name: str, raw: Mapping[str, Any]) -> "TenantProfile":
+        """Validate one profile's JSON; raises ValueError."""
+        if not name or "+" in name:
+            raise ValueError(f"Tenant name '{name}' must be non-empty and must not contain '+'")
+        thresholds = dict(raw.get("thresholds") or {})
+        unknown = set(thresholds) - THRESHOLD_KEYS
+        if unknown:
+            raise ValueError(f"Tenant '{name}': unknown thresholds {', '.join(sorted(unknown))}")
+        for key, value in thresholds.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                raise ValueError(f"Tenant '{name}': {key} must be a positive number")
+
+        enabled = raw.get("enabled_rules")
+        disabled = raw.get("disabled_rules") or []
+        for rules in (enabled or [], disabled):
+            unknown = set(rules) - RULE_CODES
+            if unknown:
+                raise ValueError(f"Tenant '{name}': unknown rules {', '.join(sorted(unknown))}")
+
+        # Plans and version-keyed caches (FX limits) follow the content, so the
+        # version must change whenever it does, whatever the label says
+        content = json.dumps(
+            [thresholds, sorted(enabled) if enabled is not None else None, sorted(disabled)],
+            sort_keys=True,
+        )
+        label = raw.get("version")
+
+        return cls(
+            name=name,
+            version="sha256:" + hashlib.sha256(content.encode("utf-8")).hexdigest()[:12],
+            label=str(label) if label else None,
+            thresholds=MappingProxyType(thresholds),
+            enabled_rules=frozenset(enabled) if enabled is not None else None,
+            disabled_rules=frozenset(disabled),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to the JSON file format."""
+        raw: Dict[str, Any] = {"thresholds": dict(self.thresholds)}
+        if self.label:
+            raw["version"] = self.label
+        if self.enabled_rules is not None:
+            raw["enabled_rules"] = sorted(self.enabled_rules)
+        raw["disabled_rules"] = sorted(self.disabled_rules)
+        return raw
+
+
+class TenantPlan(NamedTuple):
+    """A profile compiled against one reference data version."""
+
+    tenant: str
+    profile_version: str
+    base_version: str
+    ref: ReferenceData
+    disabled: FrozenSet[str]
+
+
+def compile_plan(profile: TenantProfile, base: ReferenceData) -> TenantPlan:
+    """Apply a profile to a reference data snapshot."""
+    thresholds = profile.thresholds
+    ref = dataclasses.replace(
+        base,
+        version=f"{base.version}+{profile.name}@{profile.version}",
+        lei_threshold_aed=thresholds.get("lei_threshold_aed", base.lei_threshold_aed),
+        high_value_threshold_aed=thresholds.get("high_value_threshold_aed", base.high_value_threshold_aed),
+        penalty_per_violation_aed=thresholds.get("penalty_per_violation_aed", base.penalty_per_violation_aed),
+    )
+    disabled = profile.disabled_rules
+    if profile.enabled_rules is not None:
+        disabled = disabled | (RULE_CODES - profile.enabled_rules)
+    return TenantPlan(profile.name, profile.version, base.version, ref, disabled)
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+class TenantRegistry:
+    """
+    Configured profiles and their compiled plans.
+
+    Readers never lock: profiles and plans are swapped in with single
+    assignments, and a plan is only published while its profile is still
+    the configured one.
+    """
+
+    def __init__(self, profiles: Mapping[str, TenantProfile] = MappingProxyType({}), source: str = "none"):
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, TenantProfile] = dict(profiles)
+        self._plans: Dict[str, TenantPlan] = {}
+        self.source = source
+
+    @classmethod
+    def from_file(cls, path: str) -> "TenantRegistry":
+        with open(path, encoding="utf-8") as f:
+            raw = json.load(f)
+        return cls(_parse_profiles(raw), source=path)
+
+    # -------------------------------------------------------------------------
+    # Request side
+    # -------------------------------------------------------------------------
+
+    def plan(self, tenant: str, ref: ReferenceData) -> TenantPlan:
+        """The tenant's plan for this reference data; raises UnknownTenantProfile."""
+        plan = self._plans.get(tenant)
+        if plan is not None and plan.base_version == ref.version:
+            return plan
+        profile = self._profiles.get(tenant)
+        if profile is None:
+            raise UnknownTenantProfile(f"Unknown tenant profile '{tenant}'")
+        plan = compile_plan(profile, ref)
+        with self._lock:
+            if self._profiles.get(tenant) is profile:
+                self._plans[tenant] = plan
+        return plan
+
+    def __contains__(self, tenant: str) -> bool:
+        return tenant in self._profiles
+
+    # -------------------------------------------------------------------------
+    # Configuration
+    # -------------------------------------------------------------------------
+
+    def profiles(self) -> Dict[str, TenantProfile]:
+        return dict(self._profiles)
+
+    def set_profile(self, profile: TenantProfile) -> None:
+        """Add or replace one profile, dropping its compiled plan."""
+        with self._lock:
+            profiles = dict(self._profiles)
+            profiles[profile.name] = profile
+            self._replace(profiles)
+
+    def replace_all(self, profiles: Mapping[str, TenantProfile], source: str) -> None:
+        """Swap in a new set of profiles, keeping the plans of unchanged ones."""
+        with self._lock:
+            self._replace(dict(profiles))
+            self.source = source
+
+    def _replace(self, profiles: Dict[str, TenantProfile]) -> None:
+        # Under the lock. Plans are dropped before the profiles change, so no
+        # reader can pair a stale plan with a new profile
+        self._plans = {
+            name: plan for name, plan in self._plans.items()
+            if profiles.get(name) == self._profiles.get(name)
+        }
+        self._profiles = profiles
+
+    def snapshot(self) -> Dict[str, TenantPlan]:
+        """Plans currently compiled (for status endpoints)."""
+        return dict(self._plans)
+
+
+def _parse_profiles(raw: Any) -> Dict[str, TenantProfile]:
+    if not isinstance(raw, dict):
+        raise ValueError("Tenant profile file must be a JSON object of named profiles")
+    return {name: TenantProfile.from_dict(name, profile) for name, profile in raw.items()}
+
+
+# =============================================================================
+# CURRENT PROFILES
+# =============================================================================
+
+tenant_profiles = (
+    TenantRegistry.from_file(os.environ[TENANT_PROFILES_PATH_ENV])
+    if os.environ.get(TENANT_PROFILES_PATH_ENV)
+    else TenantRegistry()
+)
+
+
+def reload_tenant_profiles(path: Optional[str] = None) -> TenantRegistry:
+    """
+    Reload profiles from a file (default: UAE_TENANT_PROFILES_PATH, else none).
+
+    A bad file leaves the current profiles in place.
+    """
+    path = path or os.environ.get(TENANT_PROFILES_PATH_ENV)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            profiles = _parse_profiles(json.load(f))
+    else:
+        profiles = {}
+    tenant_profiles.replace_all(profiles, path or "none")
+    return tenant_profiles
@@ -0,0 +1,141 @@
+"""
+UAE Purpose Code Translation
+Re-code purpose codes between UAE and corridor markets via ISO 20022.
+
+Same results as translateUAEToMarket / translateToUAE in the frontend
+(src/data/isoMiddleLayer.ts), but instead of scanning the mapping lists per
+call, every (source market, code, target market) translation is compiled
+once into a dict entry:
+
+    source code -> ISO code (market table) -> codes the target market uses
+    for that ISO code (MULTI_MARKET_MAPPINGS), best confidence first
+
+Entries also carry their batch item pre-encoded as JSON, so a batch
+response is assembled by joining bytes.
+"""
+
+import json
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from app.market_codes import (
+    BANGLADESH_TO_ISO,
+    CONFIDENCE_LEVELS,
+    EGYPT_TO_ISO,
+    INDIA_INWARD_TO_ISO,
+    INDIA_OUTWARD_TO_ISO,
+    ISO_PURPOSE_CODES,
+    MARKETS,
+    MULTI_MARKET_MAPPINGS,
+    PAKISTAN_TO_ISO,
+    PHILIPPINES_TO_ISO,
+    UAE_TO_ISO,
+)
+from app.schemas import UAEMarketCode, UAETranslationBatchItem, UAETranslationResponse
+
+# Code -> (iso, confidence[, direction]) per market; India checks inward codes first
+MARKET_TO_ISO: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "AE": UAE_TO_ISO,
+    "IN": {**INDIA_OUTWARD_TO_ISO, **INDIA_INWARD_TO_ISO},
+    "PK": PAKISTAN_TO_ISO,
+    "PH": PHILIPPINES_TO_ISO,
+    "BD": BANGLADESH_TO_ISO,
+    "EG": EGYPT_TO_ISO,
+}
+
+# UAETranslationBatchItem(code=..., found=False).model_dump_json()
+_MISS = b'{"code":%s,"found":false,"iso_code":null,"confidence":null,"target_codes":[]}'
+
+_RANK = {level: rank for rank, level in enumerate(CONFIDENCE_LEVELS)}
+
+
+class Translation(NamedTuple):
+    """One precomputed translation."""
+
+    response: UAETranslationResponse
+    batch_item: bytes  # UAETranslationBatchItem JSON
+
+
+class TranslationIndex:
+    """Every translation between two markets, compiled into one dict."""
+
+    def __init__(self):
+        self._index: Dict[Tuple[str, str, str], Translation] = {}
+        cross = {mapping["iso"]: mapping for mapping in MULTI_MARKET_MAPPINGS}
+        for source_market in MARKETS:
+            for code, entry in MARKET_TO_ISO[source_market].items():
+                mapping = cross.get(entry[0])
+                if mapping is None:
+                    continue
+                source = self._source_code(source_market, code, mapping)
+                if source is None:
+                    continue
+                for target_market in MARKETS:
+                    if target_market != source_market:
+                        self._add(source_market, target_market, source, entry, mapping)
+
+    @staticmethod
+    def _market_code(market: str, details: Dict) -> UAEMarketCode:
+        entry = MARKET_TO_ISO[market].get(details["code"])
+        return UAEMarketCode(**details, confidence=entry[1] if entry else None)
+
+    def _source_code(self, market: str, code: str, mapping: Dict) -> Optional[UAEMarketCode]:
+        for details in mapping["codes"][market]:
+            if details["code"] == code:
+                return self._market_code(market, details)
+        # UAE codes must be listed under their ISO code; other markets fall back
+        if market == "AE":
+            return None
+        return UAEMarketCode(code=code, purpose="Unknown", confidence=MARKET_TO_ISO[market][code][1])
+
+    def _add(self, source_market: str, target_market: str, source: UAEMarketCode, entry: Tuple, mapping: Dict) -> None:
+        targets = sorted(
+            (self._market_code(target_market, details) for details in mapping["codes"][target_market]),
+            key=lambda c: _RANK.get(c.confidence, len(_RANK)),
+        )
+        iso_code, confidence = entry[0], entry[1]
+        response = UAETranslationResponse(
+            source_market=source_market,
+            target_market=target_market,
+            source_code=source,
+            iso_code=iso_code,
+            iso_name=ISO_PURPOSE_CODES[iso_code]["name"],
+            confidence=confidence,
+            target_codes=targets,
+        )
+        batch_item = UAETranslationBatchItem(
+            code=source.code,
+            found=True,
+            iso_code=iso_code,
+            confidence=confidence,
+            target_codes=[c.code for c in targets],
+        ).model_dump_json().encode()
+        self._index[(source_market, source.code, target_market)] = Translation(response, batch_item)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def translate(self, code: str, source_market: str, target_market: str) -> Optional[UAETranslationResponse]:
+        """Translate one code, or None if it has no mapping into target_market."""
+        translation = self._index.get((source_market, code.strip().upper(), target_market))
+        return translation.response if translation else None
+
+    def translate_batch_json(self, codes: List[str], source_market: str, target_market: str) -> List[bytes]:
+        """UAETranslationBatchItem JSON per code, in order."""
+        index = self._index
+        misses: Dict[str, bytes] = {}
+        items = []
+        for code in codes:
+            translation = index.get((source_market, code, target_market))
+            if translation is None:
+                translation = index.get((source_market, code.strip().upper(), target_market))
+            if translation is not None:
+                items.append(translation.batch_item)
+                continue
+            item = misses.get(code)
+            if item is None:
+                item = misses[code] = _MISS % json.dumps(code).encode()
+            items.append(item)
+        return items
+
+
+translation_index = TranslationIndex()
@@ -6,24 +6,31 @@ IBAN validation and transaction validation engine.
 import re
 import time
 import uuid
+from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, FrozenSet, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence, Union
 from dataclasses import dataclass
 
+from app.audit import AuditSink
 from app.constants import (
-    UAE_BANK_CODES,
+    UAE_BIC_PATTERN,
+    UAE_IBAN_PATTERN,
     UAE_IBAN_LENGTH,
     UAE_IBAN_COUNTRY_CODE,
-    UAE_PURPOSE_CODES,
-    UAE_PPC_CATEGORIES,
-    PURPOSE_CODE_LOOKUP,
-    UAE_LEI_THRESHOLD_AED,
-    UAE_HIGH_VALUE_THRESHOLD_AED,
-    UAE_PENALTY_PER_VIOLATION_AED,
+    LEI_ACTIVE_REGISTRATION_STATUSES,
 )
+from app.corridors import CORRIDOR_PROFILES
+from app.fx import CurrencyLimits, FXSnapshot, get_fx_rates
+from app.lei import lei_checksum_valid, lei_registry
+from app.reference import ReferenceData, get_reference_data
+from app.tenants import tenant_profiles
 from app.schemas import (
+    DetailLevel,
+    ValidationMode,
     UAEValidationRequest,
     UAEValidationResponse,
+    UAEValidationMinimalResponse,
+    UAEPrescreenResponse,
     UAEValidationResultDetail,
     UAEValidationSummary,
     UAERecommendation,
@@ -31,6 +38,9 @@ from app.schemas import (
 )
 
 
+_LEI_FORMAT = re.compile(r"^[A-Z0-9]{20}$")
+
+
 # =============================================================================
 # IBAN VALIDATOR
 # =============================================================================
@@ -38,12 +48,15 @@ from app.schemas import (
 class UAEIBANValidator:
     """UAE IBAN validation with MOD 97-10 checksum."""
 
-    def validate(self, iban: Optional[str]) -> Dict:
+    _iban_re = re.compile(UAE_IBAN_PATTERN)
+
+    def validate(self, iban: Optional[str], ref: Optional[ReferenceData] = None) -> Dict:
         """
         Validate a UAE IBAN.
 
         Args:
             iban: The IBAN to validate
+            ref: Reference data snapshot for the bank lookup (default: current)
 
         Returns:
             Dict with validation results
@@ -55,7 +68,7 @@ class UAEIBANValidator:
             }
 
         # Normalize
-        iban = iban.upper().replace(" ", "").replace("-", "")
+        iban = self.normalize(iban)
 
         # Check length
         if len(iban) != UAE_IBAN_LENGTH:
@@ -72,7 +85,7 @@ class UAEIBANValidator:
             }
 
         # Check format (AE + 21 digits)
-        if not re.match(r"^AE\d{21}$", iban):
+        if not self._iban_re.match(iban):
             return {
                 "is_valid": False,
                 "error_message": "UAE IBAN must be AE followed by 21 digits",
@@ -93,8 +106,8 @@ class UAEIBANValidator:
                 "error_message": "Invalid IBAN checksum",
             }
 
-        # Lookup bank name
-        bank_info = UAE_BANK_CODES.get(bank_code, {})
+        # Lookup bank name (direct-address table, digits already checked)
+        bank_info = (ref or get_reference_data()).bank_code_table[int(bank_code)] or {}
         bank_name = bank_info.get("name", "Unknown Bank")
 
         return {
@@ -107,6 +120,14 @@ class UAEIBANValidator:
             "error_message": None,
         }
 
+    def normalize(self, iban: str) -> str:
+        """Upper-case an IBAN and strip spaces and dashes."""
+        return iban.upper().replace(" ", "").replace("-", "")
+
+    def format_valid(self, iban: str) -> bool:
+        """Length, country code and digits of a normalized IBAN (no checksum)."""
+        return len(iban) == UAE_IBAN_LENGTH and self._iban_re.match(iban) is not None
+
     def _validate_checksum(self, iban: str) -> bool:
         """Validate IBAN checksum using MOD 97-10 algorithm."""
         # Move first 4 chars to end
@@ -129,6 +150,50 @@ class UAEIBANValidator:
         return " ".join([iban[i:i + 4] for i in range(0, len(iban), 4)])
 
 
+# =============================================================================
+# BANK DIRECTORY
+# =============================================================================
+
+class UAEBankDirectory:
+    """UAE bank lookup by numeric bank code, IBAN or SWIFT/BIC."""
+
+    _iban_re = re.compile(UAE_IBAN_PATTERN)
+    _bic_re = re.compile(UAE_BIC_PATTERN)
+
+    def by_code(
+        self, bank_code: Optional[str], ref: Optional[ReferenceData] = None
+    ) -> Optional[Mapping[str, str]]:
+        """Look up a bank by its 3-digit CBUAE bank code."""
+        if not bank_code or len(bank_code) != 3 or not bank_code.isdigit():
+            return None
+        return (ref or get_reference_data()).bank_code_table[int(bank_code)]
+
+    def bank_code_from_iban(self, iban: Optional[str]) -> Optional[str]:
+        """Extract the bank code from a well-formed UAE IBAN (no checksum test)."""
+        if not iban:
+            return None
+        iban = iban.upper().replace(" ", "").replace("-", "")
+        if not self._iban_re.match(iban):
+            return None
+        return iban[4:7]
+
+    def normalize_bic(self, bic: Optional[str]) -> Optional[str]:
+        """Normalize a BIC, returning None if it is not 8 or 11 valid chars."""
+        if not bic:
+            return None
+        bic = bic.upper().replace(" ", "")
+        return bic if self._bic_re.match(bic) else None
+
+    def by_bic(
+        self, bic: Optional[str], ref: Optional[ReferenceData] = None
+    ) -> Optional[Mapping[str, str]]:
+        """Look up a bank by 8- or 11-character BIC."""
+        bic = self.normalize_bic(bic)
+        if not bic:
+            return None
+        return (ref or get_reference_data()).bic_lookup.get(bic[:8])
+
+
 # =============================================================================
 # VALIDATION RESULT (in-memory, no database)
 # =============================================================================
@@ -153,65 +218,414 @@ class ValidationResult:
     penalty_amount_aed: float = 0
 
 
+class RuleEvaluation(NamedTuple):
+    """Rule results and score for one transaction, before a response is built."""
+
+    session_uuid: str
+    start_time: float
+    ref: ReferenceData
+    limits: CurrencyLimits
+    amount_aed: float
+    results: List[ValidationResult]
+    stp_score: float
+    stp_rating: str
+    violation_count: int
+    penalty_risk: float
+
+    @property
+    def is_high_value(self) -> bool:
+        # Without an AED rate the amount cannot be placed, so assume the worst
+        return self.limits.aed_rate is None or self.amount_aed >= self.ref.high_value_threshold_aed
+
+    @property
+    def lei_required(self) -> bool:
+        return self.limits.aed_rate is None or self.amount_aed >= self.ref.lei_threshold_aed
+
+
+# =============================================================================
+# STATEFUL STAGES
+# =============================================================================
+
+class StageContext(NamedTuple):
+    """Per-request values computed by the engine and shared with stages."""
+
+    session_uuid: str
+    ref: ReferenceData
+    limits: CurrencyLimits
+    amount_aed: float
+    timestamp: float
+
+
+class ValidationStage(ABC):
+    """
+    Base class for stateful checks that look across requests
+    (duplicates, velocity). The engine calls check() once per request
+    after the stateless rules.
+    """
+
+    @abstractmethod
+    def check(self, request: UAEValidationRequest, context: StageContext) -> List[ValidationResult]:
+        """Results of this stage for one request (may update its state)."""
+
+
 # =============================================================================
 # STATELESS VALIDATION ENGINE
 # =============================================================================
 
+def _first_error(results: List[ValidationResult], disabled: FrozenSet[str]) -> Optional[ValidationResult]:
+    """First failing error-severity result of an enabled rule, if any."""
+    for result in results:
+        if not result.is_valid and result.severity == "error" and result.rule_code not in disabled:
+            return result
+    return None
+
+
+def _currency_equivalent(limits: CurrencyLimits, threshold: float, template: str) -> str:
+    """Format a threshold in the transaction currency, or '' for AED."""
+    if limits.currency == "AED":
+        return ""
+    if limits.aed_rate is None:
+        return template.format(f"any amount: no AED rate for {limits.currency}")
+    return template.format(f"{limits.currency} {threshold:,.2f}")
+
+
 class UAEValidationEngine:
     """
     Stateless UAE Payment Validation Engine.
-    Uses in-memory constants - no database required.
+    Uses in-memory reference data - no database required.
+
+    Each validation takes one reference data snapshot up front, so a
+    concurrent reload never mixes two data versions within a request.
+
+    Optional stateful stages (e.g. duplicate detection) run after the
+    stateless rules; each engine instance owns its stages' state. With an
+    audit sink every decision is queued to the audit log (see app.audit).
     """
 
-    def __init__(self):
+    def __init__(self, stages: Sequence[ValidationStage] = (), audit: Optional[AuditSink] = None):
         self.iban_validator = UAEIBANValidator()
+        self.bank_directory = UAEBankDirectory()
+        self.stages = list(stages)
+        self.audit = audit
 
-    def validate(self, request: UAEValidationRequest) -> UAEValidationResponse:
-        """Validate a UAE payment transaction."""
+    def evaluate(
+        self,
+        request: UAEValidationRequest,
+        ref: Optional[ReferenceData] = None,
+        fx: Optional[FXSnapshot] = None,
+        amount_aed: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        tenant: Optional[str] = None,
+        failures_only: bool = False,
+    ) -> "RuleEvaluation":
+        """
+        Run every rule and score the transaction, without building a response.
+
+        Args:
+            request: Transaction to validate
+            ref: Reference data snapshot (default: current)
+            fx: FX rate snapshot (default: latest)
+            amount_aed: Precomputed AED amount (batch callers convert per column)
+            timestamp: Payment time seen by the stateful stages (default: now;
+                replays pass the recorded time)
+            tenant: Tenant profile when the request names none (e.g. from a
+                header); its plan supplies the thresholds and disabled rules
+            failures_only: Skip building pass results (the score, violation
+                count and audit record only use failures)
+
+        Raises:
+            UnknownTenantProfile: if the tenant profile is not configured
+        """
         start_time = time.time()
         session_uuid = str(uuid.uuid4())
 
+        ref = ref or get_reference_data()
+        tenant = request.tenant_profile or tenant
+        plan = tenant_profiles.plan(tenant, ref) if tenant else None
+        if plan is not None:
+            ref = plan.ref
+        fx = fx or get_fx_rates().latest
+        # Thresholds in the transaction currency: one comparison per rule
+        limits = fx.limits_for(request.currency, ref)
+        if amount_aed is None:
+            amount_aed = limits.to_aed(request.amount)
         results: List[ValidationResult] = []
 
-        # 1. Validate Purpose Code
-        results.extend(self._validate_purpose_code(request))
+        # 1. Validate Purpose Code (and its corridor mapping)
+        results.extend(self._validate_purpose_code(request, ref, failures_only))
 
         # 2. Validate IBANs
-        results.extend(self._validate_ibans(request))
+        results.extend(self._validate_ibans(request, ref, failures_only))
 
-        # 3. Validate LEI requirements
-        results.extend(self._validate_lei(request))
+        # 3. Cross-check agent BICs against IBAN bank codes
+        results.extend(self._validate_bics(request, ref, failures_only))
 
-        # 4. Amount-based rules
-        results.extend(self._validate_amount_rules(request))
+        # 4. Validate LEI requirements
+        results.extend(self._validate_lei(request, ref, limits, failures_only))
 
-        # 5. Calculate STP score
+        # 5. Amount-based rules
+        results.extend(self._validate_amount_rules(request, ref, limits))
+
+        # 6. Stateful stages (cross-request checks)
+        if self.stages:
+            context = StageContext(session_uuid, ref, limits, amount_aed, start_time if timestamp is None else timestamp)
+            for stage in self.stages:
+                results.extend(stage.check(request, context))
+
+        # 7. Drop the results of rules the tenant disabled
+        if plan is not None and plan.disabled:
+            results = [r for r in results if r.rule_code not in plan.disabled]
+
+        # 8. Calculate STP score
         stp_score, stp_rating = self._calculate_stp_score(results)
         violation_count = sum(
             1 for r in results if not r.is_valid and r.severity == "error"
         )
-        penalty_risk = violation_count * UAE_PENALTY_PER_VIOLATION_AED
 
-        # 6. Generate recommendations
-        recommendations = self._generate_recommendations(results)
-
-        # 7. Build response
-        processing_time = int((time.time() - start_time) * 1000)
-
-        return self._build_response(
+        evaluation = RuleEvaluation(
             session_uuid=session_uuid,
+            start_time=start_time,
+            ref=ref,
+            limits=limits,
+            amount_aed=amount_aed,
             results=results,
-            recommendations=recommendations,
-            request=request,
             stp_score=stp_score,
             stp_rating=stp_rating,
             violation_count=violation_count,
-            penalty_risk=penalty_risk,
+            penalty_risk=violation_count * ref.penalty_per_violation_aed,
+        )
+
+        # 9. Queue the decision for the audit log
+        if self.audit is not None:
+            self.audit.record(evaluation, request)
+
+        return evaluation
+
+    def prescreen(
+        self,
+        request: UAEValidationRequest,
+        ref: Optional[ReferenceData] = None,
+        fx: Optional[FXSnapshot] = None,
+        tenant: Optional[str] = None,
+    ) -> UAEPrescreenResponse:
+        """
+        Fail-fast verdict: would the payment be rejected?
+
+        Error-severity rules run cheapest first and the first failure is the
+        verdict: purpose code presence, LEI presence, IBAN format, IBAN
+        checksums, then the remaining purpose code, LEI and BIC rules.
+        Amount rules, corridor checks and the stateful stages only ever
+        warn, so they are skipped, as are STP scoring, recommendations and
+        the audit log. uaefts_compliant is the same as a full validation's,
+        including under a tenant profile (rules it disabled never reject).
+        """
+        ref = ref or get_reference_data()
+        tenant = request.tenant_profile or tenant
+        disabled: FrozenSet[str] = frozenset()
+        if tenant:
+            plan = tenant_profiles.plan(tenant, ref)
+            ref, disabled = plan.ref, plan.disabled
+
+        # 1. Purpose code presence
+        if (
+            request.transaction_type == "offshore" and not request.purpose_code
+            and "UAE_PPC_MANDATORY" not in disabled
+        ):
+            return UAEPrescreenResponse(
+                uaefts_compliant=False,
+                failed_rule="UAE_PPC_MANDATORY",
+                error_code="PPC_REQUIRED",
+                field_code="purpose_code",
+                error_message="Purpose code is mandatory for offshore payments per UAEFTS AUX700",
+            )
+
+        # 2. LEI presence (threshold in the transaction currency)
+        limits = (fx or get_fx_rates().latest).limits_for(request.currency, ref)
+        if (
+            not request.debtor_lei and request.amount >= limits.lei_threshold
+            and "UAE_LEI_DEBTOR" not in disabled
+        ):
+            return UAEPrescreenResponse(
+                uaefts_compliant=False,
+                failed_rule="UAE_LEI_DEBTOR",
+                error_code="LEI_REQUIRED",
+                field_code="debtor_lei",
+                error_message=(
+                    f"Debtor LEI required for transactions >= AED {ref.lei_threshold_aed:,.0f}"
+                    + _currency_equivalent(limits, limits.lei_threshold, " ({})")
+                ),
+            )
+
+        # 3. IBAN format
+        ibans = []
+        for rule_code, field_code, iban in (
+            ("UAE_IBAN_DEBTOR", "debtor_iban", request.debtor_iban),
+            ("UAE_IBAN_CREDITOR", "creditor_iban", request.creditor_iban),
+        ):
+            if not iban or rule_code in disabled:
+                continue
+            iban = self.iban_validator.normalize(iban)
+            if not self.iban_validator.format_valid(iban):
+                return UAEPrescreenResponse(
+                    uaefts_compliant=False,
+                    failed_rule=rule_code,
+                    error_code="IBAN_INVALID",
+                    field_code=field_code,
+                    error_message="UAE IBAN must be AE followed by 21 digits",
+                )
+            ibans.append((rule_code, field_code, iban))
+
+        # 4. IBAN checksums
+        for rule_code, field_code, iban in ibans:
+            if not self.iban_validator._validate_checksum(iban):
+                return UAEPrescreenResponse(
+                    uaefts_compliant=False,
+                    failed_rule=rule_code,
+                    error_code="IBAN_INVALID",
+                    field_code=field_code,
+                    error_message="Invalid IBAN checksum",
+                )
+
+        # 5. Remaining error-severity rules, one group at a time
+        failure = (
+            _first_error(self._validate_purpose_code(request, ref), disabled)
+            or _first_error(self._validate_lei(request, ref, limits), disabled)
+            or _first_error(self._validate_bics(request, ref), disabled)
+        )
+        if failure is None:
+            return UAEPrescreenResponse(uaefts_compliant=True)
+        return UAEPrescreenResponse(
+            uaefts_compliant=False,
+            failed_rule=failure.rule_code,
+            error_code=failure.error_code,
+            field_code=failure.field_code,
+            error_message=failure.error_message,
+        )
+
+    def validate(
+        self,
+        request: UAEValidationRequest,
+        ref: Optional[ReferenceData] = None,
+        fx: Optional[FXSnapshot] = None,
+        amount_aed: Optional[float] = None,
+        detail: DetailLevel = "full",
+        mode: ValidationMode = "full",
+        tenant: Optional[str] = None,
+    ) -> Union[UAEValidationResponse, UAEValidationMinimalResponse, UAEPrescreenResponse]:
+        """
+        Validate a UAE payment transaction.
+
+        Args:
+            request: Transaction to validate
+            ref: Reference data snapshot (default: current)
+            fx: FX rate snapshot (default: latest)
+            amount_aed: Precomputed AED amount (batch callers convert per column)
+            detail: Response verbosity; lower levels skip building omitted parts
+            mode: "prescreen" returns the fail-fast verdict of prescreen()
+                instead (detail does not apply)
+            tenant: Tenant profile when the request names none
+        """
+        if mode == "prescreen":
+            return self.prescreen(request, ref, fx, tenant)
+        evaluation = self.evaluate(
+            request, ref, fx, amount_aed, tenant=tenant, failures_only=detail == "minimal"
+        )
+        return self._respond(request, evaluation, detail)
+
+    def _respond(
+        self,
+        request: UAEValidationRequest,
+        evaluation: "RuleEvaluation",
+        detail: DetailLevel = "full",
+    ) -> Union[UAEValidationResponse, UAEValidationMinimalResponse]:
+        if detail == "minimal":
+            return UAEValidationMinimalResponse(
+                session_uuid=evaluation.session_uuid,
+                stp_score=evaluation.stp_score,
+                stp_rating=evaluation.stp_rating,
+                uaefts_compliant=evaluation.violation_count == 0,
+                violation_count=evaluation.violation_count,
+                total_penalty_risk_aed=evaluation.penalty_risk,
+                failed_rules=[r.rule_code for r in evaluation.results if not r.is_valid],
+            )
+
+        # 10. Generate recommendations
+        recommendations = self._generate_recommendations(evaluation.results)
+
+        # 11. Build response
+        processing_time = int((time.time() - evaluation.start_time) * 1000)
+
+        return self._build_response(
+            session_uuid=evaluation.session_uuid,
+            ref=evaluation.ref,
+            limits=evaluation.limits,
+            amount_aed=evaluation.amount_aed,
+            results=evaluation.results,
+            recommendations=recommendations,
+            request=request,
+            stp_score=evaluation.stp_score,
+            stp_rating=evaluation.stp_rating,
+            violation_count=evaluation.violation_count,
+            penalty_risk=evaluation.penalty_risk,
             processing_time_ms=processing_time,
+            errors_only=detail == "errors_only",
+        )
+
+    def validate_many(
+        self, requests: Iterable[UAEValidationRequest]
+    ) -> Iterator[UAEValidationResponse]:
+        """
+        Validate a stream of transactions lazily.
+
+        The whole stream is validated against one reference data snapshot,
+        so a file never straddles two data versions.
+        """
+        ref = get_reference_data()
+        fx = get_fx_rates().latest
+        for request in requests:
+            yield self.validate(request, ref, fx)
+
+    def evaluate_batch(
+        self,
+        requests: List[UAEValidationRequest],
+        ref: Optional[ReferenceData] = None,
+        tenant: Optional[str] = None,
+        failures_only: bool = False,
+    ) -> Iterator["RuleEvaluation"]:
+        """
+        Evaluate a batch of transactions against one reference data snapshot.
+
+        Amounts are converted to AED once per batch, column-wise by currency.
+        tenant applies to transactions that name no tenant profile;
+        failures_only skips building pass results.
+        """
+        ref = ref or get_reference_data()
+        fx = get_fx_rates().latest
+        amounts_aed = fx.to_aed_column(
+            [request.amount for request in requests],
+            [request.currency for request in requests],
         )
+        for request, amount_aed in zip(requests, amounts_aed):
+            yield self.evaluate(request, ref, fx, amount_aed, tenant=tenant, failures_only=failures_only)
 
-    def _validate_purpose_code(self, request: UAEValidationRequest) -> List[ValidationResult]:
-        """Validate purpose code."""
+    def validate_batch(
+        self,
+        requests: List[UAEValidationRequest],
+        ref: Optional[ReferenceData] = None,
+        detail: DetailLevel = "full",
+        tenant: Optional[str] = None,
+    ) -> List[Union[UAEValidationResponse, UAEValidationMinimalResponse]]:
+        """Validate a batch of transactions against one reference data snapshot."""
+        evaluations = self.evaluate_batch(requests, ref, tenant, failures_only=detail == "minimal")
+        return [
+            self._respond(request, evaluation, detail)
+            for request, evaluation in zip(requests, evaluations)
+        ]
+
+    def _validate_purpose_code(
+        self, request: UAEValidationRequest, ref: ReferenceData, failures_only: bool = False
+    ) -> List[ValidationResult]:
+        """Validate purpose code (failures_only: skip pass results)."""
         results = []
 
         if request.transaction_type == "offshore":
@@ -230,20 +644,22 @@ class UAEValidationEngine:
                     remediation_suggestion="Select a valid purpose code (e.g., SAL, FAM, GDE)",
                     severity="error",
                     stp_impact=-20,
-                    penalty_amount_aed=UAE_PENALTY_PER_VIOLATION_AED,
+                    penalty_amount_aed=ref.penalty_per_violation_aed,
                 ))
             else:
-                results.extend(self._check_purpose_code_validity(request))
+                results.extend(self._check_purpose_code_validity(request, ref, failures_only))
         elif request.purpose_code:
-            results.extend(self._check_purpose_code_validity(request))
+            results.extend(self._check_purpose_code_validity(request, ref, failures_only))
 
         return results
 
-    def _check_purpose_code_validity(self, request: UAEValidationRequest) -> List[ValidationResult]:
+    def _check_purpose_code_validity(
+        self, request: UAEValidationRequest, ref: ReferenceData, failures_only: bool = False
+    ) -> List[ValidationResult]:
         """Check if purpose code exists and is applicable."""
         results = []
         code_upper = request.purpose_code.upper()
-        ppc = PURPOSE_CODE_LOOKUP.get(code_upper)
+        ppc = ref.purpose_code_lookup.get(code_upper)
 
         if not ppc:
             results.append(ValidationResult(
@@ -260,7 +676,7 @@ class UAEValidationEngine:
                 remediation_suggestion="Use one of the 117 valid UAE codes (SAL, FAM, GDE, etc.)",
                 severity="error",
                 stp_impact=-20,
-                penalty_amount_aed=UAE_PENALTY_PER_VIOLATION_AED,
+                penalty_amount_aed=ref.penalty_per_violation_aed,
             ))
         else:
             applies_offshore = ppc.get("offshore", True)
@@ -295,65 +711,206 @@ class UAEValidationEngine:
                     stp_impact=-5,
                 ))
             else:
-                results.append(ValidationResult(
-                    rule_code="UAE_PPC_VALID",
-                    rule_name="Purpose Code Validation",
-                    rule_category="enumeration",
-                    field_code="purpose_code",
-                    field_value=request.purpose_code,
-                    validation_status="pass",
-                    is_valid=True,
-                    severity="info",
-                ))
+                if not failures_only:
+                    results.append(ValidationResult(
+                        rule_code="UAE_PPC_VALID",
+                        rule_name="Purpose Code Validation",
+                        rule_category="enumeration",
+                        field_code="purpose_code",
+                        field_value=request.purpose_code,
+                        validation_status="pass",
+                        is_valid=True,
+                        severity="info",
+                    ))
+                if request.transaction_type == "offshore" and request.destination_market:
+                    results.extend(self._check_corridor(request, code_upper, failures_only))
 
         return results
 
-    def _validate_ibans(self, request: UAEValidationRequest) -> List[ValidationResult]:
-        """Validate IBANs."""
+    def _check_corridor(
+        self, request: UAEValidationRequest, code: str, failures_only: bool = False
+    ) -> List[ValidationResult]:
+        """Check how the purpose code maps into the destination market's code set."""
+        profile = CORRIDOR_PROFILES.get(request.destination_market)
+        if profile is None:
+            return []
+
+        mapped, confidence, targets = profile.lookup(code)
+        if not mapped:
+            return []  # no known mapping: the corridor tables are partial, so unknown
+        if confidence == "low":
+            return [ValidationResult(
+                rule_code="UAE_CORRIDOR_PPC",
+                rule_name=f"{profile.name} Corridor Purpose Code",
+                rule_category="corridor",
+                field_code="purpose_code",
+                field_value=request.purpose_code,
+                validation_status="warning",
+                is_valid=False,
+                error_code="CORRIDOR_PPC_LOW_CONFIDENCE",
+                error_message=(
+                    f"'{code}' maps to {profile.name} code(s) {', '.join(targets)} with low confidence"
+                ),
+                remediation_suggestion="Confirm the destination purpose code with the receiving bank",
+                severity="warning",
+                stp_impact=-2,
+            )]
+        if failures_only:
+            return []
+        return [ValidationResult(
+            rule_code="UAE_CORRIDOR_PPC",
+            rule_name=f"{profile.name} Corridor Purpose Code",
+            rule_category="corridor",
+            field_code="purpose_code",
+            field_value=request.purpose_code,
+            validation_status="pass",
+            is_valid=True,
+            severity="info",
+        )]
+
+    def _validate_ibans(
+        self, request: UAEValidationRequest, ref: ReferenceData, failures_only: bool = False
+    ) -> List[ValidationResult]:
+        """Validate IBANs (failures_only: skip pass results)."""
         results = []
 
         if request.debtor_iban:
-            validation = self.iban_validator.validate(request.debtor_iban)
-            results.append(ValidationResult(
-                rule_code="UAE_IBAN_DEBTOR",
-                rule_name="Debtor IBAN Validation",
-                rule_category="format",
-                field_code="debtor_iban",
-                field_value=request.debtor_iban,
-                validation_status="pass" if validation["is_valid"] else "fail",
-                is_valid=validation["is_valid"],
-                error_code="IBAN_INVALID" if not validation["is_valid"] else None,
-                error_message=validation.get("error_message"),
-                uaefts_reference="AUX700 Section 3.2",
-                remediation_suggestion="Provide valid UAE IBAN: AE + 21 digits" if not validation["is_valid"] else None,
-                severity="error" if not validation["is_valid"] else "info",
-                stp_impact=-15 if not validation["is_valid"] else 0,
-                penalty_amount_aed=UAE_PENALTY_PER_VIOLATION_AED if not validation["is_valid"] else 0,
-            ))
+            validation = self.iban_validator.validate(request.debtor_iban, ref)
+            if not (failures_only and validation["is_valid"]):
+                results.append(ValidationResult(
+                    rule_code="UAE_IBAN_DEBTOR",
+                    rule_name="Debtor IBAN Validation",
+                    rule_category="format",
+                    field_code="debtor_iban",
+                    field_value=request.debtor_iban,
+                    validation_status="pass" if validation["is_valid"] else "fail",
+                    is_valid=validation["is_valid"],
+                    error_code="IBAN_INVALID" if not validation["is_valid"] else None,
+                    error_message=validation.get("error_message"),
+                    uaefts_reference="AUX700 Section 3.2",
+                    remediation_suggestion="Provide valid UAE IBAN: AE + 21 digits" if not validation["is_valid"] else None,
+                    severity="error" if not validation["is_valid"] else "info",
+                    stp_impact=-15 if not validation["is_valid"] else 0,
+                    penalty_amount_aed=ref.penalty_per_violation_aed if not validation["is_valid"] else 0,
+                ))
 
         if request.creditor_iban:
-            validation = self.iban_validator.validate(request.creditor_iban)
-            results.append(ValidationResult(
-                rule_code="UAE_IBAN_CREDITOR",
-                rule_name="Creditor IBAN Validation",
-                rule_category="format",
-                field_code="creditor_iban",
-                field_value=request.creditor_iban,
-                validation_status="pass" if validation["is_valid"] else "fail",
-                is_valid=validation["is_valid"],
-                error_code="IBAN_INVALID" if not validation["is_valid"] else None,
-                error_message=validation.get("error_message"),
-                severity="error" if not validation["is_valid"] else "info",
-                stp_impact=-15 if not validation["is_valid"] else 0,
-                penalty_amount_aed=UAE_PENALTY_PER_VIOLATION_AED if not validation["is_valid"] else 0,
-            ))
+            validation = self.iban_validator.validate(request.creditor_iban, ref)
+            if not (failures_only and validation["is_valid"]):
+                results.append(ValidationResult(
+                    rule_code="UAE_IBAN_CREDITOR",
+                    rule_name="Creditor IBAN Validation",
+                    rule_category="format",
+                    field_code="creditor_iban",
+                    field_value=request.creditor_iban,
+                    validation_status="pass" if validation["is_valid"] else "fail",
+                    is_valid=validation["is_valid"],
+                    error_code="IBAN_INVALID" if not validation["is_valid"] else None,
+                    error_message=validation.get("error_message"),
+                    severity="error" if not validation["is_valid"] else "info",
+                    stp_impact=-15 if not validation["is_valid"] else 0,
+                    penalty_amount_aed=ref.penalty_per_violation_aed if not validation["is_valid"] else 0,
+                ))
+
+        return results
+
+    def _validate_bics(
+        self, request: UAEValidationRequest, ref: ReferenceData, failures_only: bool = False
+    ) -> List[ValidationResult]:
+        """Cross-check debtor/creditor BIC against the IBAN bank code (failures_only: skip passes)."""
+        results = []
+
+        for party, iban, bic in (
+            ("debtor", request.debtor_iban, request.debtor_bic),
+            ("creditor", request.creditor_iban, request.creditor_bic),
+        ):
+            if not bic:
+                continue
+            rule_code = f"UAE_BIC_{party.upper()}"
+            field_code = f"{party}_bic"
+
+            if not self.bank_directory.normalize_bic(bic):
+                results.append(ValidationResult(
+                    rule_code=rule_code,
+                    rule_name=f"{party.title()} BIC Format",
+                    rule_category="format",
+                    field_code=field_code,
+                    field_value=bic,
+                    validation_status="fail",
+                    is_valid=False,
+                    error_code="BIC_FORMAT_INVALID",
+                    error_message="BIC must be 8 or 11 characters (bank, country, location, optional branch)",
+                    remediation_suggestion="Provide a valid 8- or 11-character SWIFT/BIC",
+                    severity="error",
+                    stp_impact=-10,
+                    penalty_amount_aed=ref.penalty_per_violation_aed,
+                ))
+                continue
+
+            iban_bank_code = self.bank_directory.bank_code_from_iban(iban)
+            if not iban_bank_code:
+                # Nothing to cross-check against; IBAN rules report the IBAN itself
+                continue
+
+            bic_bank = self.bank_directory.by_bic(bic, ref)
+            if not bic_bank:
+                results.append(ValidationResult(
+                    rule_code=rule_code,
+                    rule_name=f"{party.title()} BIC / IBAN Bank Match",
+                    rule_category="consistency",
+                    field_code=field_code,
+                    field_value=bic,
+                    validation_status="warning",
+                    is_valid=False,
+                    error_code="BIC_UNKNOWN",
+                    error_message=f"BIC '{bic}' is not in the UAE bank directory",
+                    severity="warning",
+                    stp_impact=-5,
+                ))
+            elif bic_bank["code"] != iban_bank_code:
+                results.append(ValidationResult(
+                    rule_code=rule_code,
+                    rule_name=f"{party.title()} BIC / IBAN Bank Match",
+                    rule_category="consistency",
+                    field_code=field_code,
+                    field_value=bic,
+                    validation_status="fail",
+                    is_valid=False,
+                    error_code="BIC_IBAN_MISMATCH",
+                    error_message=(
+                        f"BIC belongs to {bic_bank['name']} ({bic_bank['code']}) "
+                        f"but IBAN bank code is {iban_bank_code}"
+                    ),
+                    uaefts_reference="AUX700 Section 3.2",
+                    remediation_suggestion="Use the BIC of the bank that holds the IBAN",
+                    severity="error",
+                    stp_impact=-15,
+                    penalty_amount_aed=ref.penalty_per_violation_aed,
+                ))
+            elif not failures_only:
+                results.append(ValidationResult(
+                    rule_code=rule_code,
+                    rule_name=f"{party.title()} BIC / IBAN Bank Match",
+                    rule_category="consistency",
+                    field_code=field_code,
+                    field_value=bic,
+                    validation_status="pass",
+                    is_valid=True,
+                    severity="info",
+                ))
 
         return results
 
-    def _validate_lei(self, request: UAEValidationRequest) -> List[ValidationResult]:
-        """Validate LEI requirements."""
+    def _validate_lei(
+        self,
+        request: UAEValidationRequest,
+        ref: ReferenceData,
+        limits: CurrencyLimits,
+        failures_only: bool = False,
+    ) -> List[ValidationResult]:
+        """Validate LEI requirements (failures_only: skip pass results)."""
         results = []
-        lei_required = request.amount >= UAE_LEI_THRESHOLD_AED
+        lei_required = request.amount >= limits.lei_threshold
 
         if lei_required:
             if not request.debtor_lei:
@@ -366,12 +923,15 @@ class UAEValidationEngine:
                     validation_status="fail",
                     is_valid=False,
                     error_code="LEI_REQUIRED",
-                    error_message=f"Debtor LEI required for transactions >= AED {UAE_LEI_THRESHOLD_AED:,}",
+                    error_message=(
+                        f"Debtor LEI required for transactions >= AED {ref.lei_threshold_aed:,.0f}"
+                        + _currency_equivalent(limits, limits.lei_threshold, " ({})")
+                    ),
                     uaefts_reference="AUX700 Section 5.1",
                     remediation_suggestion="Provide a valid 20-character LEI",
                     severity="error",
                     stp_impact=-25,
-                    penalty_amount_aed=UAE_PENALTY_PER_VIOLATION_AED,
+                    penalty_amount_aed=ref.penalty_per_violation_aed,
                 ))
             elif not self._validate_lei_format(request.debtor_lei):
                 results.append(ValidationResult(
@@ -386,31 +946,144 @@ class UAEValidationEngine:
                     error_message="LEI must be 20 alphanumeric characters",
                     severity="error",
                     stp_impact=-20,
-                    penalty_amount_aed=UAE_PENALTY_PER_VIOLATION_AED,
+                    penalty_amount_aed=ref.penalty_per_violation_aed,
                 ))
-            else:
+            elif not lei_checksum_valid(request.debtor_lei):
                 results.append(ValidationResult(
-                    rule_code="UAE_LEI_DEBTOR",
-                    rule_name="Debtor LEI Validation",
+                    rule_code="UAE_LEI_DEBTOR_FORMAT",
+                    rule_name="Debtor LEI Check Digits",
                     rule_category="format",
                     field_code="debtor_lei",
                     field_value=request.debtor_lei,
-                    validation_status="pass",
-                    is_valid=True,
-                    severity="info",
+                    validation_status="fail",
+                    is_valid=False,
+                    error_code="LEI_CHECKSUM_INVALID",
+                    error_message="LEI check digits are invalid (ISO 17442 MOD 97-10)",
+                    remediation_suggestion="Verify the LEI against the GLEIF register",
+                    severity="error",
+                    stp_impact=-20,
+                    penalty_amount_aed=ref.penalty_per_violation_aed,
                 ))
+            else:
+                results.extend(self._check_lei_status(request.debtor_lei, ref, failures_only))
+                if not failures_only:
+                    results.append(ValidationResult(
+                        rule_code="UAE_LEI_DEBTOR",
+                        rule_name="Debtor LEI Validation",
+                        rule_category="format",
+                        field_code="debtor_lei",
+                        field_value=request.debtor_lei,
+                        validation_status="pass",
+                        is_valid=True,
+                        severity="info",
+                    ))
 
         return results
 
+    def _check_lei_status(self, lei: str, ref: ReferenceData, failures_only: bool = False) -> List[ValidationResult]:
+        """Check LEI status against the local GLEIF index, if one is loaded."""
+        if not lei_registry.available:
+            return []
+
+        record = lei_registry.lookup(lei)
+        if not record:
+            return [ValidationResult(
+                rule_code="UAE_LEI_DEBTOR_STATUS",
+                rule_name="Debtor LEI Registration Status",
+                rule_category="reference",
+                field_code="debtor_lei",
+                field_value=lei,
+                validation_status="warning",
+                is_valid=False,
+                error_code="LEI_NOT_FOUND",
+                error_message="LEI not found in the GLEIF golden copy",
+                remediation_suggestion="Verify the LEI against the GLEIF register",
+                severity="warning",
+                stp_impact=-10,
+            )]
+
+        registration_status = record["registration_status"]
+        if registration_status in LEI_ACTIVE_REGISTRATION_STATUSES and record["entity_status"] != "INACTIVE":
+            if failures_only:
+                return []
+            return [ValidationResult(
+                rule_code="UAE_LEI_DEBTOR_STATUS",
+                rule_name="Debtor LEI Registration Status",
+                rule_category="reference",
+                field_code="debtor_lei",
+                field_value=lei,
+                validation_status="pass",
+                is_valid=True,
+                severity="info",
+            )]
+
+        if registration_status == "UNKNOWN":
+            # No status in the golden copy: neither confirmed nor ruled out
+            return [ValidationResult(
+                rule_code="UAE_LEI_DEBTOR_STATUS",
+                rule_name="Debtor LEI Registration Status",
+                rule_category="reference",
+                field_code="debtor_lei",
+                field_value=lei,
+                validation_status="warning",
+                is_valid=False,
+                error_code="LEI_STATUS_UNKNOWN",
+                error_message="LEI registration status is not recorded in the GLEIF golden copy",
+                remediation_suggestion="Verify the LEI registration status against the GLEIF register",
+                severity="warning",
+                stp_impact=-10,
+            )]
+
+        # A lapsed LEI still identifies the entity but its data is stale;
+        # retired, merged, annulled or duplicate LEIs must not be used.
+        lapsed = registration_status == "LAPSED"
+        return [ValidationResult(
+            rule_code="UAE_LEI_DEBTOR_STATUS",
+            rule_name="Debtor LEI Registration Status",
+            rule_category="reference",
+            field_code="debtor_lei",
+            field_value=lei,
+            validation_status="warning" if lapsed else "fail",
+            is_valid=False,
+            error_code="LEI_LAPSED" if lapsed else "LEI_NOT_ACTIVE",
+            error_message=f"LEI registration status is {registration_status} (entity {record['entity_status']})",
+            uaefts_reference="AUX700 Section 5.1",
+            remediation_suggestion="Ask the debtor to renew the LEI or provide its successor LEI",
+            severity="warning" if lapsed else "error",
+            stp_impact=-10 if lapsed else -20,
+            penalty_amount_aed=0 if lapsed else ref.penalty_per_violation_aed,
+        )]
+
     def _validate_lei_format(self, lei: str) -> bool:
         """Validate LEI format."""
-        return bool(lei and re.match(r"^[A-Z0-9]{20}$", lei.upper()))
+        return bool(lei and _LEI_FORMAT.match(lei.upper()))
 
-    def _validate_amount_rules(self, request: UAEValidationRequest) -> List[ValidationResult]:
+    def _validate_amount_rules(
+        self, request: UAEValidationRequest, ref: ReferenceData, limits: CurrencyLimits
+    ) -> List[ValidationResult]:
         """Amount-based rules."""
         results = []
 
-        if request.amount >= UAE_HIGH_VALUE_THRESHOLD_AED:
+        if limits.aed_rate is None:
+            results.append(ValidationResult(
+                rule_code="UAE_FX_RATE",
+                rule_name="AED Conversion Rate Available",
+                rule_category="threshold",
+                field_code="currency",
+                field_value=request.currency,
+                validation_status="warning",
+                is_valid=False,
+                error_code="FX_RATE_UNAVAILABLE",
+                error_message=(
+                    f"No AED rate for '{request.currency}'; the amount cannot be compared with the AED "
+                    f"thresholds, so an LEI is required and the payment is treated as high-value"
+                ),
+                remediation_suggestion="Add the currency to the FX rate table",
+                severity="warning",
+                stp_impact=-5,
+            ))
+
+        if request.amount >= limits.high_value_threshold:
             results.append(ValidationResult(
                 rule_code="UAE_HIGH_VALUE",
                 rule_name="High Value Transaction Flag",
@@ -419,7 +1092,10 @@ class UAEValidationEngine:
                 field_value=str(request.amount),
                 validation_status="warning",
                 is_valid=True,
-                error_message=f"High-value transaction (>= AED {UAE_HIGH_VALUE_THRESHOLD_AED:,})",
+                error_message=(
+                    f"High-value transaction (>= AED {ref.high_value_threshold_aed:,.0f}"
+                    + _currency_equivalent(limits, limits.high_value_threshold, " / {}") + ")"
+                ),
                 severity="warning",
                 stp_impact=-5,
             ))
@@ -467,6 +1143,9 @@ class UAEValidationEngine:
     def _build_response(
         self,
         session_uuid: str,
+        ref: ReferenceData,
+        limits: CurrencyLimits,
+        amount_aed: float,
         results: List[ValidationResult],
         recommendations: List[UAERecommendation],
         request: UAEValidationRequest,
@@ -475,23 +1154,30 @@ class UAEValidationEngine:
         violation_count: int,
         penalty_risk: float,
         processing_time_ms: int,
+        errors_only: bool = False,
     ) -> UAEValidationResponse:
-        """Build response."""
+        """Build response (errors_only: failing results, no IBAN details)."""
         # Purpose code details
         ppc_description = None
         ppc_valid = True
         if request.purpose_code:
-            ppc = PURPOSE_CODE_LOOKUP.get(request.purpose_code.upper())
+            ppc = ref.purpose_code_lookup.get(request.purpose_code.upper())
             if ppc:
                 ppc_description = ppc["name"]
             else:
                 ppc_valid = False
 
         # IBAN details
-        debtor_iban_result = self.iban_validator.validate(request.debtor_iban) if request.debtor_iban else {"is_valid": True}
-        creditor_iban_result = self.iban_validator.validate(request.creditor_iban) if request.creditor_iban else {"is_valid": True}
+        if errors_only:
+            # Validity is already known from the IBAN rule results
+            failed_codes = {r.rule_code for r in results if not r.is_valid}
+            debtor_iban_result = {"is_valid": "UAE_IBAN_DEBTOR" not in failed_codes}
+            creditor_iban_result = {"is_valid": "UAE_IBAN_CREDITOR" not in failed_codes}
+        else:
+            debtor_iban_result = self.iban_validator.validate(request.debtor_iban, ref) if request.debtor_iban else {"is_valid": True}
+            creditor_iban_result = self.iban_validator.validate(request.creditor_iban, ref) if request.creditor_iban else {"is_valid": True}
 
-        lei_required = request.amount >= UAE_LEI_THRESHOLD_AED
+        lei_required = request.amount >= limits.lei_threshold
         lei_provided = bool(request.debtor_lei or request.creditor_lei)
 
         # Summary
@@ -508,8 +1194,8 @@ class UAEValidationEngine:
             warnings=warnings,
             errors=errors,
             uaefts_compliant=errors == 0,
-            amount_aed=request.amount,
-            is_high_value=request.amount >= UAE_HIGH_VALUE_THRESHOLD_AED,
+            amount_aed=round(amount_aed, 2),
+            is_high_value=request.amount >= limits.high_value_threshold,
             lei_required=lei_required,
             lei_provided=lei_provided,
         )
@@ -523,7 +1209,7 @@ class UAEValidationEngine:
             purpose_code_description=ppc_description,
             debtor_iban_valid=debtor_iban_result["is_valid"],
             creditor_iban_valid=creditor_iban_result["is_valid"],
-            iban_details={
+            iban_details={} if errors_only else {
                 "debtor": UAEIBANDetails(**debtor_iban_result) if request.debtor_iban else None,
                 "creditor": UAEIBANDetails(**creditor_iban_result) if request.creditor_iban else None,
             },
@@ -552,6 +1238,7 @@ class UAEValidationEngine:
                     penalty_amount_aed=r.penalty_amount_aed,
                 )
                 for r in results
+                if not (errors_only and r.is_valid)
             ],
             recommendations=recommendations,
             summary=summary,
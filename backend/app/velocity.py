@@ -0,0 +1,178 @@
+"""
+UAE Velocity / Structuring Detection
+Per-debtor sliding-window totals that catch payments split to stay under
+the LEI and high-value thresholds.
+
+The window is divided into ring_size time buckets of window / ring_size
+seconds. Each tracked debtor IBAN owns a ring of (bucket epoch,
+amount_aed) entries in preallocated slab arrays, one per non-empty
+bucket, plus a running total. A payment adds to the newest entry when it
+falls in the same bucket, else appends one; whole buckets expire from the
+head of the ring once their epoch leaves the window. Only ring_size
+epochs fit in the window, so the ring never overflows and no amount
+outlives its bucket. The windowed total covers between window - bucket
+and window seconds. Every update is O(1) amortised.
+
+The number of tracked debtors is bounded; the least recently active
+debtor's slot is reused when the table is full.
+"""
+
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Optional
+
+from app.constants import (
+    UAE_VELOCITY_WINDOW_SECONDS,
+    UAE_VELOCITY_MAX_DEBTORS,
+    UAE_VELOCITY_RING_SIZE,
+)
+from app.schemas import UAEValidationRequest
+from app.validators import StageContext, ValidationResult, ValidationStage
+
+
+class VelocityTracker:
+    """Bounded per-key sliding-window sums over ring buffers. Thread-safe."""
+
+    def __init__(
+        self,
+        window_seconds: float = UAE_VELOCITY_WINDOW_SECONDS,
+        max_keys: int = UAE_VELOCITY_MAX_DEBTORS,
+        ring_size: int = UAE_VELOCITY_RING_SIZE,
+    ):
+        if ring_size < 2:
+            raise ValueError("ring_size must be at least 2")
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / ring_size
+        self.max_keys = max_keys
+        self.ring_size = ring_size
+        self.evictions = 0
+
+        # Slab storage: key slot i owns entries [i * ring_size, (i + 1) * ring_size)
+        self._epochs = array("q", bytes(8 * max_keys * ring_size))
+        self._amounts = array("d", bytes(8 * max_keys * ring_size))
+        self._start = array("i", bytes(4 * max_keys))
+        self._count = array("i", bytes(4 * max_keys))
+        self._totals = array("d", bytes(8 * max_keys))
+
+        self._slots: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tracked_keys(self) -> int:
+        return len(self._slots)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the preallocated slab arrays (excludes the key index)."""
+        arrays = (self._epochs, self._amounts, self._start, self._count, self._totals)
+        return sum(a.itemsize * len(a) for a in arrays)
+
+    def _slot_for(self, key: str) -> int:
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._slots.move_to_end(key)
+            return slot
+
+        if len(self._slots) >= self.max_keys:
+            _, slot = self._slots.popitem(last=False)
+            self.evictions += 1
+        else:
+            slot = len(self._slots)
+        self._slots[key] = slot
+        self._start[slot] = 0
+        self._count[slot] = 0
+        self._totals[slot] = 0.0
+        return slot
+
+    def record(self, key: str, amount: float, now: float) -> float:
+        """
+        Add a payment for key and return the windowed total before it.
+
+        Args:
+            key: Debtor identifier (normalised IBAN)
+            amount: Payment amount in AED
+            now: Payment timestamp (seconds)
+        """
+        ring = self.ring_size
+        epochs, amounts = self._epochs, self._amounts
+        epoch = int(now // self.bucket_seconds)
+        oldest = epoch - ring + 1
+
+        with self._lock:
+            slot = self._slot_for(key)
+            base = slot * ring
+            start = self._start[slot]
+            count = self._count[slot]
+            total = self._totals[slot]
+
+            # Expire buckets that left the window
+            while count and epochs[base + start] < oldest:
+                total -= amounts[base + start]
+                start = (start + 1) % ring
+                count -= 1
+            if not count:
+                total = 0.0  # drop accumulated float error
+            previous = total
+
+            # Same bucket as the newest entry (or slightly out of order): add to it
+            newest = base + (start + count - 1) % ring
+            if count and epochs[newest] >= epoch:
+                amounts[newest] += amount
+            else:
+                index = base + (start + count) % ring
+                epochs[index] = epoch
+                amounts[index] = amount
+                count += 1
+
+            self._start[slot] = start
+            self._count[slot] = count
+            self._totals[slot] = total + amount
+
+        return previous
+
+
+class VelocityStage(ValidationStage):
+    """
+    Engine stage that flags structuring: the debtor's windowed total
+    crosses the LEI or high-value threshold on a payment that is itself
+    below it. Fires once per crossing.
+    """
+
+    def __init__(self, tracker: Optional[VelocityTracker] = None):
+        self.tracker = tracker or VelocityTracker()
+
+    def check(self, request: UAEValidationRequest, context: StageContext) -> List[ValidationResult]:
+        if not request.debtor_iban:
+            return []
+
+        key = request.debtor_iban.upper().replace(" ", "")
+        amount = context.amount_aed
+        previous = self.tracker.record(key, amount, context.timestamp)
+        total = previous + amount
+        hours = self.tracker.window_seconds / 3600
+
+        results = []
+        for threshold, error_code, label in (
+            (context.ref.high_value_threshold_aed, "STRUCTURING_HIGH_VALUE", "high-value"),
+            (context.ref.lei_threshold_aed, "STRUCTURING_LEI_THRESHOLD", "LEI"),
+        ):
+            if amount >= threshold or not previous < threshold <= total:
+                continue
+            results.append(ValidationResult(
+                rule_code="UAE_VELOCITY_DEBTOR",
+                rule_name="Debtor Velocity / Structuring Check",
+                rule_category="velocity",
+                field_code="debtor_iban",
+                field_value=key,
+                validation_status="warning",
+                is_valid=False,
+                error_code=error_code,
+                error_message=(
+                    f"Debtor total AED {total:,.2f} over the last {hours:g}h crosses the "
+                    f"{label} threshold (AED {threshold:,.0f}) although no single payment did"
+                ),
+                severity="warning",
+                stp_impact=-20,
+            ))
+        return results
@@ -0,0 +1 @@
+# UAE Payment Validator Benchmarks
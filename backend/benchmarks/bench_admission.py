@@ -0,0 +1,162 @@
+"""
+Load test: interactive /validate latency while bulk work saturates the CPU.
+
+Bulk clients post --batch-size transaction lists to /validate-batch and
+--file-clients stream a pacs.008 file through /validate-pacs008, back to
+back, while an interactive client sends /validate at a fixed --rate (open
+loop: requests go out on schedule whether or not earlier ones returned).
+The scenario runs twice in-process (ASGI, no network): with admission
+control disabled, then enabled. Reports interactive latency percentiles,
+bulk throughput and shed requests, and exits non-zero if the scheduled
+interactive p99 exceeds --p99-ms.
+
+    python -m benchmarks.bench_admission --duration 10 --p99-ms 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+
+from app.main import app
+from app.scheduler import scheduler
+from benchmarks.bench_detail import make_payloads, percentile
+from benchmarks.bench_pacs008 import write_pacs008_file
+
+# Clients are told apart by X-Client-Id, as behind a trusted proxy
+os.environ.setdefault("UAE_TRUST_CLIENT_HEADER", "1")
+
+VALIDATE = "/api/v1/uae/validation/validate?detail=minimal"
+VALIDATE_BATCH = "/api/v1/uae/validation/validate-batch?detail=minimal"
+VALIDATE_PACS008 = "/api/v1/uae/validation/validate-pacs008?detail=minimal"
+HEADERS = {"content-type": "application/json"}
+
+
+async def bulk_client(client: httpx.AsyncClient, name: str, body: bytes, size: int, stop: float, totals: Dict) -> None:
+    headers = {**HEADERS, "X-Client-Id": name}
+    while time.perf_counter() < stop:
+        response = await client.post(VALIDATE_BATCH, content=body, headers=headers)
+        if response.status_code == 429:
+            totals["bulk_shed"] += 1
+            await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+            continue
+        response.raise_for_status()
+        totals["bulk_items"] += size
+
+
+async def file_client(client: httpx.AsyncClient, name: str, data: bytes, size: int, stop: float, totals: Dict) -> None:
+    while time.perf_counter() < stop:
+        response = await client.post(VALIDATE_PACS008, files={"file": ("batch.xml", data)}, headers={"X-Client-Id": name})
+        if response.status_code == 429:
+            totals["bulk_shed"] += 1
+            await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+            continue
+        response.raise_for_status()
+        totals["bulk_items"] += size
+
+
+async def interactive_request(client: httpx.AsyncClient, body: bytes, samples: List[float], totals: Dict) -> None:
+    start = time.perf_counter()
+    response = await client.post(VALIDATE, content=body, headers={**HEADERS, "X-Client-Id": "interactive"})
+    if response.status_code == 429:
+        totals["interactive_shed"] += 1
+        return
+    response.raise_for_status()
+    samples.append(time.perf_counter() - start)
+
+
+async def scenario(args: argparse.Namespace, bodies: List[bytes], batch_body: bytes, file_data: bytes) -> Dict:
+    transport = httpx.ASGITransport(app=app)
+    totals = {"bulk_items": 0, "bulk_shed": 0, "interactive_shed": 0}
+    samples: List[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        start = time.perf_counter()
+        stop = start + args.duration
+        bulk = [
+            asyncio.create_task(bulk_client(client, f"bulk-{i}", batch_body, args.batch_size, stop, totals))
+            for i in range(args.bulk_clients)
+        ] + [
+            asyncio.create_task(file_client(client, f"file-{i}", file_data, args.file_transactions, stop, totals))
+            for i in range(args.file_clients)
+        ]
+        # Let the bulk clients get going before measuring
+        await asyncio.sleep(args.warmup)
+        interactive = []
+        interval = 1 / args.rate
+        next_at = time.perf_counter()
+        i = 0
+        while next_at < stop:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            interactive.append(asyncio.create_task(interactive_request(client, bodies[i % len(bodies)], samples, totals)))
+            i += 1
+            next_at += interval
+        await asyncio.gather(*interactive)
+        await asyncio.gather(*bulk)
+        elapsed = time.perf_counter() - start
+    samples.sort()
+    return {**totals, "samples": samples, "elapsed": elapsed}
+
+
+def report(label: str, result: Dict) -> float:
+    samples = result["samples"]
+    p99 = percentile(samples, 0.99) * 1e3 if samples else float("inf")
+    print(
+        f"{label:<10} interactive n={len(samples):>5,} "
+        f"p50 {percentile(samples, 0.50) * 1e3:>7.2f} ms  "
+        f"p95 {percentile(samples, 0.95) * 1e3:>7.2f} ms  "
+        f"p99 {p99:>7.2f} ms  max {samples[-1] * 1e3:>7.2f} ms  "
+        f"shed {result['interactive_shed']:,} | "
+        f"bulk {result['bulk_items'] / result['elapsed']:>8,.0f} tx/s  shed {result['bulk_shed']:,}"
+    )
+    return p99
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of bulk load")
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--rate", type=float, default=50.0, help="interactive requests/second")
+    parser.add_argument("--bulk-clients", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=2_000)
+    parser.add_argument("--file-clients", type=int, default=2)
+    parser.add_argument("--file-transactions", type=int, default=5_000)
+    parser.add_argument("--p99-ms", type=float, default=50.0, help="bound on scheduled interactive p99")
+    args = parser.parse_args()
+
+    payloads = make_payloads(max(args.batch_size, 1_000), seed=45)
+    bodies = [json.dumps(p).encode() for p in payloads[:1_000]]
+    batch_body = json.dumps(payloads[:args.batch_size]).encode()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "batch.xml")
+        write_pacs008_file(path, args.file_transactions)
+        with open(path, "rb") as f:
+            file_data = f.read()
+
+    results = {}
+    for label, enabled in (("no admission control", False), ("scheduled", True)):
+        scheduler.configure(enabled=enabled)
+        results[label] = asyncio.run(scenario(args, bodies, batch_body, file_data))
+    print(
+        f"{args.bulk_clients} batch clients x {args.batch_size:,} tx, {args.file_clients} file clients x "
+        f"{args.file_transactions:,} tx, interactive {args.rate:g} req/s, {args.duration:g}s"
+    )
+    for label, result in results.items():
+        p99 = report(label.split()[0], result)
+    print(scheduler.snapshot())
+
+    if p99 > args.p99_ms:
+        print(f"FAIL: scheduled interactive p99 {p99:.2f} ms > {args.p99_ms:g} ms")
+        sys.exit(1)
+    print(f"OK: scheduled interactive p99 {p99:.2f} ms <= {args.p99_ms:g} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Aggregate-only batch validation versus full responses.
+
+Generates an MT103 file and compares:
+  - full: a UAEValidationResponse per row, serialised to NDJSON
+  - aggregate: rule evaluation folded into BatchAggregate
+
+Reports throughput, then allocation peaks (tracemalloc) on a smaller run.
+
+    python -m benchmarks.bench_aggregate --messages 100000
+"""
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+
+from app.ingest.base import aggregate_transactions, to_ndjson_line, validate_transactions
+from app.ingest.mt103 import iter_mt103
+from app.validators import UAEValidationEngine
+from benchmarks.bench_mt103 import write_mt103_file
+from benchmarks.common import timed
+
+
+def run_full(path: str) -> None:
+    engine = UAEValidationEngine()
+    for tx, response in validate_transactions(engine, iter_mt103(path)):
+        to_ndjson_line(tx, response)
+
+
+def run_aggregate(path: str) -> None:
+    aggregate_transactions(UAEValidationEngine(), iter_mt103(path)).to_response()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--traced-messages", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mt103.fin")
+        write_mt103_file(path, args.messages)
+
+        with timed("full responses + NDJSON", args.messages):
+            run_full(path)
+        with timed("aggregate only", args.messages):
+            run_aggregate(path)
+
+        traced = os.path.join(tmp, "traced.fin")
+        write_mt103_file(traced, args.traced_messages)
+        for label, run in (("full responses + NDJSON", run_full), ("aggregate only", run_aggregate)):
+            tracemalloc.start()
+            run(traced)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{label:<32} peak traced allocations {peak / 1e6:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Audit log: latency added to validation and sustained records/sec.
+
+1. Added latency: per-call UAEValidationEngine.evaluate percentiles without
+   an audit sink and with one per durability level (commit, interval, none).
+2. Sustained throughput: --records decisions submitted back to back, then
+   flush(); records/sec, group commits, fsyncs and bytes per record.
+
+    python -m benchmarks.bench_audit --requests 20000 --records 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+from app.audit import DURABILITY_LEVELS, AuditSink, segment_paths
+from app.reference import get_reference_data
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.bench_detail import make_payloads, percentile
+from benchmarks.common import peak_rss_mb
+
+
+def evaluate_latencies(requests: List[UAEValidationRequest], sink: Optional[AuditSink]) -> List[float]:
+    engine = UAEValidationEngine(audit=sink)
+    ref = get_reference_data()
+    samples = []
+    for request in requests:
+        start = time.perf_counter()
+        engine.evaluate(request, ref)
+        samples.append(time.perf_counter() - start)
+    if sink is not None:
+        sink.flush()
+    return sorted(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    requests = [UAEValidationRequest(**p) for p in make_payloads(args.requests, seed=46)]
+    # Warm caches before measuring
+    evaluate_latencies(requests[:1_000], None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline = evaluate_latencies(requests, None)
+        mean = sum(baseline) / len(baseline)
+        print(
+            f"{'no audit':<16} mean {mean * 1e6:>6.1f} us  p50 {percentile(baseline, 0.5) * 1e6:>6.1f} us  "
+            f"p99 {percentile(baseline, 0.99) * 1e6:>6.1f} us"
+        )
+        for durability in DURABILITY_LEVELS:
+            sink = AuditSink(os.path.join(tmp, f"latency-{durability}"), durability=durability)
+            samples = evaluate_latencies(requests, sink)
+            sink.close()
+            added = sum(samples) / len(samples) - mean
+            print(
+                f"audit {durability:<10} mean {sum(samples) / len(samples) * 1e6:>6.1f} us  "
+                f"p50 {percentile(samples, 0.5) * 1e6:>6.1f} us  p99 {percentile(samples, 0.99) * 1e6:>6.1f} us  "
+                f"(+{added * 1e6:.1f} us mean)"
+            )
+
+        rules = [(), ("UAE_PPC_MANDATORY",), ("UAE_IBAN_DEBTOR", "UAE_LEI_DEBTOR"), ("UAE_DUPLICATE_PAYMENT",)]
+        items = [
+            (time.time(), f"00000000-0000-4000-8000-{i:012d}", "sha256:bench", 85.0, "high", len(rules[i % 4]),
+             1000.0 * len(rules[i % 4]), rules[i % 4])
+            for i in range(args.records)
+        ]
+        for durability in DURABILITY_LEVELS:
+            directory = os.path.join(tmp, f"throughput-{durability}")
+            sink = AuditSink(directory, durability=durability)
+            start = time.perf_counter()
+            for item in items:
+                sink.submit(item)
+            sink.flush()
+            elapsed = time.perf_counter() - start
+            stats = sink.stats()
+            sink.close()
+            size = sum(os.path.getsize(path) for path in segment_paths(directory))
+            print(
+                f"sustained {durability:<8} {len(items) / elapsed:>10,.0f} records/s  "
+                f"{stats['commits']:>6,} commits (avg {stats['written'] / max(stats['commits'], 1):,.0f} records)  "
+                f"{stats['fsyncs']:>6,} fsyncs  {size / len(items):.0f} B/record"
+            )
+    print(f"peak RSS {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Corridor checks: per-payment mapping scans versus compiled corridor profiles.
+
+1. Single checks: does a UAE purpose code map into the destination
+   market, by scanning the corridor and cross-market mappings per payment versus
+   CorridorProfile.lookup (dict lookup and bit test).
+2. Engine throughput: UAEValidationEngine.evaluate_batch on offshore
+   payments without and with destination_market set.
+
+    python -m benchmarks.bench_corridors --payments 20000
+"""
+
+import argparse
+import random
+from typing import List, Optional, Tuple
+
+from app.constants import UAE_PURPOSE_CODES
+from app.corridors import CORRIDOR_MAPPINGS, CORRIDOR_PROFILES
+from app.market_codes import MULTI_MARKET_MAPPINGS, UAE_TO_ISO
+from app.reference import get_reference_data
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.common import peak_rss_mb, random_amount, random_iban, timed
+
+MARKETS = tuple(CORRIDOR_PROFILES)
+
+
+def scan_corridor(code: str, market: str) -> Tuple[bool, Optional[str]]:
+    """Corridor check without a compiled profile."""
+    if code in CORRIDOR_MAPPINGS.get(market, {}):
+        return True, "high"
+    entry = UAE_TO_ISO.get(code)
+    if entry is None:
+        return False, None
+    for mapping in MULTI_MARKET_MAPPINGS:
+        if mapping["iso"] == entry[0]:
+            if any(c["code"] == code for c in mapping["codes"]["AE"]) and mapping["codes"][market]:
+                return True, entry[1]
+            return False, None
+    return False, None
+
+
+def make_checks(n: int, seed: int) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    codes = [c["code"] for c in UAE_PURPOSE_CODES]
+    return [(rng.choice(codes), rng.choice(MARKETS)) for _ in range(n)]
+
+
+def make_requests(n: int, seed: int, corridor: bool) -> List[UAEValidationRequest]:
+    rng = random.Random(seed)
+    codes = [c["code"] for c in UAE_PURPOSE_CODES if c.get("offshore", True)]
+    return [
+        UAEValidationRequest(
+            transaction_type="offshore",
+            transaction_direction="outbound",
+            amount=random_amount(rng),
+            debtor_iban=random_iban(rng, invalid_rate=0.02),
+            creditor_iban=random_iban(rng, invalid_rate=0.02),
+            purpose_code=rng.choice(codes),
+            destination_market=rng.choice(MARKETS) if corridor else None,
+        )
+        for _ in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--checks", type=int, default=500_000)
+    parser.add_argument("--payments", type=int, default=20_000)
+    args = parser.parse_args()
+
+    for market, profile in CORRIDOR_PROFILES.items():
+        print(f"{market}: {len(profile.allowed_codes)} mapped UAE codes")
+
+    checks = make_checks(args.checks, seed=44)
+    with timed("mapping scan", len(checks), unit="check"):
+        scanned = [scan_corridor(code, market) for code, market in checks]
+    with timed("corridor profile", len(checks), unit="check"):
+        compiled = [CORRIDOR_PROFILES[market].lookup(code)[:2] for code, market in checks]
+    assert scanned == compiled, "profile and scan disagree"
+
+    ref = get_reference_data()
+    for corridor in (False, True):
+        requests = make_requests(args.payments, seed=45, corridor=corridor)
+        engine = UAEValidationEngine()
+        label = "with destination_market" if corridor else "without destination_market"
+        with timed(f"evaluate_batch {label}", len(requests), unit="payment"):
+            list(engine.evaluate_batch(requests, ref))
+    print(f"peak RSS {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Response size and latency per detail level.
+
+For each level (minimal, errors_only, full) reports the mean serialised
+response size and per-request latency percentiles, first for engine +
+JSON serialisation and then end-to-end through the ASGI app.
+
+    python -m benchmarks.bench_detail --requests 20000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.common import PURPOSE_CODES, random_amount, random_iban
+
+LEVELS = ("minimal", "errors_only", "full")
+
+
+def make_payloads(n: int, seed: int = 35) -> List[Dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "transaction_type": rng.choice(["domestic", "offshore"]),
+            "transaction_direction": "outbound",
+            "amount": random_amount(rng),
+            "purpose_code": rng.choice(PURPOSE_CODES) if rng.random() < 0.9 else None,
+            "debtor_iban": random_iban(rng, invalid_rate=0.1),
+            "creditor_iban": random_iban(rng, invalid_rate=0.1),
+        }
+        for _ in range(n)
+    ]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * pct))]
+
+
+def report(label: str, latencies: List[float], sizes: List[int]) -> None:
+    latencies.sort()
+    print(
+        f"{label:<24} mean {statistics.mean(sizes):>7,.0f} B  "
+        f"p50 {percentile(latencies, 0.50) * 1e6:>7,.0f} us  "
+        f"p99 {percentile(latencies, 0.99) * 1e6:>7,.0f} us"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--http-requests", type=int, default=3_000)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.requests)
+    requests = [UAEValidationRequest(**p) for p in payloads]
+    engine = UAEValidationEngine()
+
+    print("engine + model_dump_json")
+    for level in LEVELS:
+        latencies, sizes = [], []
+        for request in requests:
+            start = time.perf_counter()
+            body = engine.validate(request, detail=level).model_dump_json()
+            latencies.append(time.perf_counter() - start)
+            sizes.append(len(body))
+        report(level, latencies, sizes)
+
+    print("HTTP /validate (in-process ASGI)")
+    client = TestClient(app)
+    for level in LEVELS:
+        latencies, sizes = [], []
+        for payload in payloads[:args.http_requests]:
+            start = time.perf_counter()
+            response = client.post(f"/api/v1/uae/validation/validate?detail={level}", json=payload)
+            latencies.append(time.perf_counter() - start)
+            sizes.append(len(response.content))
+        report(level, latencies, sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Duplicate detection false-positive rate and throughput.
+
+Inserts --payments distinct fingerprints, then probes the same number of
+fresh fingerprints and reports the Bloom false-positive rate, the rate of
+reported duplicates (after LRU confirmation) and check() throughput.
+
+    python -m benchmarks.bench_duplicates --payments 1000000
+"""
+
+import argparse
+import os
+import random
+import time
+
+from app.constants import UAE_DUPLICATE_BUCKET_CAPACITY, UAE_DUPLICATE_FALSE_POSITIVE_RATE
+from app.duplicates import DuplicateDetectionStage, DuplicateDetector, payment_fingerprint
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.common import PURPOSE_CODES, random_amount, random_iban, timed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payments", type=int, default=500_000)
+    parser.add_argument("--engine-payments", type=int, default=20_000)
+    args = parser.parse_args()
+
+    detector = DuplicateDetector()
+    print(f"Bloom filter: {detector.bloom.memory_bytes / 1e6:.1f} MB, "
+          f"{detector.bloom.hashes} hashes, LRU {detector.lru_size:,} entries")
+
+    inserted = [os.urandom(16) for _ in range(args.payments)]
+    probes = [os.urandom(16) for _ in range(args.payments)]
+
+    # Spread submissions so each time bucket fills to its configured capacity
+    step = detector.bloom.bucket_seconds / UAE_DUPLICATE_BUCKET_CAPACITY
+    now = time.time()
+
+    with timed("check() distinct inserts", args.payments, unit="ops"):
+        for i, fingerprint in enumerate(inserted):
+            detector.check(fingerprint, "s", now + i * step)
+
+    probe_time = now + args.payments * step
+    bloom_hits = sum(detector.bloom.might_contain(fp, probe_time) for fp in probes)
+
+    reported = 0
+    with timed("check() fresh probes", args.payments, unit="ops"):
+        for i, fingerprint in enumerate(probes):
+            if detector.check(fingerprint, "p", probe_time + i * step):
+                reported += 1
+
+    print(f"Bloom false-positive rate: {bloom_hits / args.payments:.5f} "
+          f"(target {UAE_DUPLICATE_FALSE_POSITIVE_RATE} per bucket)")
+    print(f"Reported duplicates among fresh payments: {reported / args.payments:.5f}")
+
+    rng = random.Random(32)
+    requests = [
+        UAEValidationRequest(
+            transaction_type="domestic",
+            transaction_direction="outbound",
+            amount=random_amount(rng),
+            purpose_code=rng.choice(PURPOSE_CODES),
+            debtor_iban=random_iban(rng),
+            creditor_iban=random_iban(rng),
+        )
+        for _ in range(args.engine_payments)
+    ]
+    with timed("payment_fingerprint()", len(requests), unit="ops"):
+        for request in requests:
+            payment_fingerprint(request)
+
+    plain = UAEValidationEngine()
+    staged = UAEValidationEngine(stages=[DuplicateDetectionStage()])
+    with timed("engine without stage", len(requests)):
+        plain.validate_batch(requests)
+    with timed("engine with duplicate stage", len(requests)):
+        staged.validate_batch(requests)
+
+
+if __name__ == "__main__":
+    main()
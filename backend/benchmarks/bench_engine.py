@@ -0,0 +1,55 @@
+"""
+In-process library API versus validate() and HTTP.
+
+Compares, per payment:
+  - validate_fields(): plain arguments -> FieldsResult
+  - validate_tuples(): batches of tuples
+  - UAEValidationEngine.validate(): UAEValidationRequest parsing + full response
+  - POST /validate through the ASGI app (in-process, no network)
+
+    python -m benchmarks.bench_engine --payments 20000
+"""
+
+import argparse
+
+from fastapi.testclient import TestClient
+
+from app.engine import PaymentFields, validate_fields, validate_tuples
+from app.main import app
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.bench_detail import make_payloads
+from benchmarks.common import timed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payments", type=int, default=20_000)
+    parser.add_argument("--http-payments", type=int, default=2_000)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.payments, seed=36)
+    rows = [tuple(p.get(name, PaymentFields._field_defaults.get(name)) for name in PaymentFields._fields) for p in payloads]
+
+    with timed("validate_fields()", len(payloads)):
+        for payload in payloads:
+            validate_fields(**payload)
+
+    with timed("validate_tuples() batches of 500", len(rows)):
+        for i in range(0, len(rows), 500):
+            validate_tuples(rows[i:i + 500])
+
+    engine = UAEValidationEngine()
+    with timed("validate() + request parsing", len(payloads)):
+        for payload in payloads:
+            engine.validate(UAEValidationRequest(**payload))
+
+    client = TestClient(app)
+    http_payloads = payloads[:args.http_payments]
+    with timed("HTTP POST /validate", len(http_payloads)):
+        for payload in http_payloads:
+            client.post("/api/v1/uae/validation/validate", json=payload)
+
+
+if __name__ == "__main__":
+    main()
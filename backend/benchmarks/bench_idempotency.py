@@ -0,0 +1,67 @@
+"""
+Idempotency-Key overhead and replay latency.
+
+Through the ASGI app (httpx ASGITransport, no network) reports /validate
+requests/sec without a key, with a fresh key per request (validate + store)
+and replaying stored keys, for the in-memory and SQLite stores.
+
+    python -m benchmarks.bench_idempotency --requests 3000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from typing import List, Optional
+
+import httpx
+
+from app.api import validation
+from app.idempotency import IdempotencyCache, MemoryIdempotencyStore, SQLiteIdempotencyStore
+from app.main import app
+from benchmarks.bench_detail import make_payloads
+
+PATH = "/api/v1/uae/validation/validate"
+
+
+async def requests_per_second(bodies: List[bytes], keys: Optional[List[str]]) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for i, body in enumerate(bodies):
+            headers = {"content-type": "application/json"}
+            if keys is not None:
+                headers["Idempotency-Key"] = keys[i]
+            response = await client.post(PATH, content=body, headers=headers)
+            response.raise_for_status()
+        return len(bodies) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=3_000)
+    args = parser.parse_args()
+
+    bodies = [json.dumps(p).encode() for p in make_payloads(args.requests, seed=38)]
+    keys = [f"bench-{i}" for i in range(len(bodies))]
+
+    rps = asyncio.run(requests_per_second(bodies, None))
+    print(f"{'no key':<24} {rps:>10,.0f} req/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = (
+            ("memory", MemoryIdempotencyStore()),
+            ("sqlite", SQLiteIdempotencyStore(os.path.join(tmp, "idempotency.db"))),
+        )
+        for label, store in stores:
+            validation.idempotency = IdempotencyCache(store)
+            rps = asyncio.run(requests_per_second(bodies, keys))
+            print(f"{label + ' first use':<24} {rps:>10,.0f} req/s")
+            rps = asyncio.run(requests_per_second(bodies, keys))
+            print(f"{label + ' replay':<24} {rps:>10,.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
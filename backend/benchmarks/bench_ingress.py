@@ -0,0 +1,113 @@
+"""
+Request decoding: FastAPI default body handling versus fast ingress.
+
+1. Decode only: json.loads + Python-mode validation (what FastAPI does)
+   versus a single TypeAdapter.validate_json pass, for single payloads and
+   500-item batches.
+2. Requests/sec on one core through the ASGI stack (httpx ASGITransport,
+   no network) for two otherwise identical apps: FastAPI body parameter and
+   response_model serialisation, versus compiled decode + direct JSON
+   response.
+
+    python -m benchmarks.bench_ingress --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import List
+
+import httpx
+from fastapi import FastAPI, Request
+
+from app.api.ingress import (
+    VALIDATION_REQUEST,
+    VALIDATION_REQUEST_LIST,
+    VALIDATION_RESPONSE_LIST,
+    decode,
+    encode,
+    json_response,
+)
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.bench_detail import make_payloads
+from benchmarks.common import timed
+
+
+def build_apps():
+    engine = UAEValidationEngine()
+
+    before = FastAPI()
+
+    @before.post("/validate")
+    async def validate_before(request: UAEValidationRequest):
+        return engine.validate(request, detail="minimal")
+
+    @before.post("/validate-batch")
+    async def batch_before(requests: List[UAEValidationRequest]):
+        return engine.validate_batch(requests, detail="minimal")
+
+    after = FastAPI()
+
+    @after.post("/validate")
+    async def validate_after(request: Request):
+        response = engine.validate(decode(VALIDATION_REQUEST, await request.body()), detail="minimal")
+        return json_response(encode(response))
+
+    @after.post("/validate-batch")
+    async def batch_after(request: Request):
+        responses = engine.validate_batch(decode(VALIDATION_REQUEST_LIST, await request.body()), detail="minimal")
+        return json_response(encode(responses, VALIDATION_RESPONSE_LIST))
+
+    return before, after
+
+
+async def requests_per_second(app: FastAPI, path: str, bodies: List[bytes]) -> float:
+    transport = httpx.ASGITransport(app=app)
+    headers = {"content-type": "application/json"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for body in bodies:
+            response = await client.post(path, content=body, headers=headers)
+            response.raise_for_status()
+        return len(bodies) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.requests, seed=37)
+    bodies = [json.dumps(p).encode() for p in payloads]
+    batches = [
+        json.dumps(payloads[i:i + args.batch_size]).encode()
+        for i in range(0, len(payloads), args.batch_size)
+    ]
+
+    with timed("decode: json.loads + python", len(bodies), unit="req"):
+        for body in bodies:
+            VALIDATION_REQUEST.validate_python(json.loads(body))
+    with timed("decode: validate_json", len(bodies), unit="req"):
+        for body in bodies:
+            VALIDATION_REQUEST.validate_json(body)
+    with timed("decode batches: json.loads + python", len(payloads), unit="item"):
+        for body in batches:
+            VALIDATION_REQUEST_LIST.validate_python(json.loads(body))
+    with timed("decode batches: validate_json", len(payloads), unit="item"):
+        for body in batches:
+            VALIDATION_REQUEST_LIST.validate_json(body)
+
+    before, after = build_apps()
+    for label, app in (("before", before), ("after", after)):
+        rps = asyncio.run(requests_per_second(app, "/validate", bodies))
+        print(f"/validate {label:<7} {rps:>10,.0f} req/s (1 core)")
+    for label, app in (("before", before), ("after", after)):
+        rps = asyncio.run(requests_per_second(app, "/validate-batch", batches))
+        print(f"/validate-batch {label:<7} {rps * args.batch_size:>10,.0f} items/s (1 core)")
+
+
+if __name__ == "__main__":
+    main()
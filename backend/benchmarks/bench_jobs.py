@@ -0,0 +1,72 @@
+"""
+Interactive latency while a background batch job runs.
+
+Measures /validate latency percentiles with no job running, then again
+while a --messages MT103 job is validated by the worker pool, and reports
+the job's throughput.
+
+    python -m benchmarks.bench_jobs --messages 200000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from benchmarks.bench_detail import make_payloads, percentile
+from benchmarks.bench_mt103 import write_mt103_file
+
+JOBS = "/api/v1/uae/jobs/"
+VALIDATE = "/api/v1/uae/validation/validate"
+
+
+def latencies(client: TestClient, payloads: List[Dict]) -> List[float]:
+    samples = []
+    for payload in payloads:
+        start = time.perf_counter()
+        client.post(VALIDATE, json=payload).raise_for_status()
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)
+
+
+def report(label: str, samples: List[float]) -> None:
+    print(
+        f"{label:<20} p50 {percentile(samples, 0.50) * 1e3:>6.2f} ms  "
+        f"p99 {percentile(samples, 0.99) * 1e3:>6.2f} ms  "
+        f"max {samples[-1] * 1e3:>6.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.requests, seed=39)
+    with tempfile.TemporaryDirectory() as tmp, TestClient(app) as client:
+        path = os.path.join(tmp, "batch.fin")
+        write_mt103_file(path, args.messages)
+
+        report("idle", latencies(client, payloads))
+
+        with open(path, "rb") as f:
+            job_id = client.post(JOBS, params={"format": "mt103", "detail": "minimal"}, files={"file": f}).json()["job_id"]
+        while client.get(JOBS + job_id).json()["status"] == "queued":
+            time.sleep(0.05)
+
+        during: List[float] = []
+        while client.get(JOBS + job_id).json()["status"] == "running":
+            during.extend(latencies(client, payloads[:200]))
+        status = client.get(JOBS + job_id).json()
+
+        report("during job", sorted(during))
+        print(f"job {status['status']}: {status['rows_done']:,} rows, {status['rows_per_second']:,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""
+Load generator: requests/second and latency percentiles per endpoint.
+
+Closed loop: --concurrency virtual users, spread over --processes load
+generator processes, each send their next request as soon as the previous
+one returns. Only requests sent after --warmup and answered within
+--duration are measured. Every user has its own X-Client-Id, like distinct
+API clients, so per-client rate limits do not cap the run (a --url server
+needs UAE_TRUST_CLIENT_HEADER=1 for that). The target is:
+
+    in-process   (default) app.main:app over ASGI inside each load
+                 generator process: no network, one app per process
+    --url        a server that is already running
+    --serve N    uvicorn app.main:app started here with N workers on a free
+                 local port, and stopped afterwards
+
+Each request goes to an endpoint picked by the --mix weights. Payloads are
+drawn from purpose codes in UAE_PURPOSE_CODES (--missing-purpose share
+without one), IBANs with an --invalid-iban share failing MOD 97-10, amounts
+log-normal around a few thousand AED with a --threshold share within 10% of
+the AED 500,000 high-value and AED 1,000,000 LEI thresholds, and a debtor
+LEI on an --lei share of payments at or above the LEI threshold.
+
+Reports requests/s, 429s, errors and p50/p95/p99/p999 latency per endpoint
+and in total. Comparing --serve 1, 2, 4 ... (with enough --processes to
+keep the server busy) shows how throughput scales per worker and per core.
+
+    python -m benchmarks.bench_load --concurrency 32 --duration 10
+    python -m benchmarks.bench_load --serve 4 --processes 2 --concurrency 256
+    python -m benchmarks.bench_load --url http://127.0.0.1:8000 --mix validate=1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from app.constants import UAE_HIGH_VALUE_THRESHOLD_AED, UAE_LEI_THRESHOLD_AED
+from benchmarks.common import PURPOSE_CODES, make_lei, random_iban
+
+# Clients are told apart by X-Client-Id, as behind a trusted proxy
+os.environ.setdefault("UAE_TRUST_CLIENT_HEADER", "1")
+
+# name -> (method, path); {code} is filled in per request
+ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "validate": ("POST", "/api/v1/uae/validation/validate?detail={detail}"),
+    "validate-iban": ("POST", "/api/v1/uae/validation/validate-iban"),
+    "validate-batch": ("POST", "/api/v1/uae/validation/validate-batch?detail={detail}"),
+    "code": ("GET", "/api/v1/uae/codes/{code}"),
+}
+DEFAULT_MIX = "validate=80,validate-iban=10,validate-batch=5,code=5"
+HEALTH = "/api/v1/uae/health/"
+HEADERS = {"content-type": "application/json"}
+
+# (path, body) pool per endpoint
+Pools = Dict[str, List[Tuple[str, Optional[bytes]]]]
+# endpoint -> [latencies in ms, measured, shed (429), errors]
+Stats = Dict[str, list]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint {name!r} (one of {', '.join(ENDPOINTS)})")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("mix needs a positive weight")
+    return mix
+
+
+# =============================================================================
+# PAYLOADS
+# =============================================================================
+
+def load_amount(rng: random.Random, threshold_rate: float) -> float:
+    """Log-normal retail amounts, with a share within 10% of a threshold."""
+    if rng.random() < threshold_rate:
+        threshold = rng.choice((UAE_HIGH_VALUE_THRESHOLD_AED, UAE_LEI_THRESHOLD_AED))
+        return round(threshold * rng.uniform(0.9, 1.1), 2)
+    return round(min(rng.lognormvariate(8.0, 1.5), UAE_HIGH_VALUE_THRESHOLD_AED * 0.9), 2)
+
+
+def load_payment(rng: random.Random, args: argparse.Namespace) -> Dict:
+    payment = {
+        "transaction_type": "offshore" if rng.random() < args.offshore else "domestic",
+        "transaction_direction": "outbound",
+        "amount": load_amount(rng, args.threshold),
+        "currency": "AED",
+        "debtor_iban": random_iban(rng, invalid_rate=args.invalid_iban),
+        "creditor_iban": random_iban(rng, invalid_rate=args.invalid_iban),
+    }
+    if rng.random() >= args.missing_purpose:
+        payment["purpose_code"] = rng.choice(PURPOSE_CODES)
+    if payment["amount"] >= UAE_LEI_THRESHOLD_AED and rng.random() < args.lei:
+        payment["debtor_lei"] = make_lei(rng)
+    return payment
+
+
+def build_pools(rng: random.Random, args: argparse.Namespace) -> Pools:
+    """Pre-encoded requests per endpoint, so the generator spends no time on JSON."""
+    pools: Pools = {}
+    for name in args.mix:
+        method, template = ENDPOINTS[name]
+        pool = []
+        for _ in range(args.pool):
+            path = template.format(detail=args.detail, code=rng.choice(PURPOSE_CODES))
+            if name == "validate":
+                body = json.dumps(load_payment(rng, args)).encode()
+            elif name == "validate-iban":
+                body = json.dumps({"iban": random_iban(rng, invalid_rate=args.invalid_iban)}).encode()
+            elif name == "validate-batch":
+                body = json.dumps([load_payment(rng, args) for _ in range(args.batch_size)]).encode()
+            else:
+                body = None
+            pool.append((path, body))
+        pools[name] = pool
+    return pools
+
+
+# =============================================================================
+# LOAD GENERATOR PROCESS
+# =============================================================================
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    user: str,
+    rng: random.Random,
+    pools: Pools,
+    mix: Dict[str, float],
+    measure_from: float,
+    stop: float,
+    stats: Stats,
+) -> None:
+    names, weights = list(mix), list(mix.values())
+    headers = {**HEADERS, "X-Client-Id": user}
+    perf_counter = time.perf_counter
+    while True:
+        start = perf_counter()
+        if start >= stop:
+            return
+        name = rng.choices(names, weights)[0]
+        path, body = rng.choice(pools[name])
+        try:
+            response = await client.request(ENDPOINTS[name][0], path, content=body, headers=headers)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        end = perf_counter()
+        if start < measure_from or end > stop:
+            continue
+        entry = stats[name]
+        if status == 429:
+            entry[2] += 1
+        elif not 200 <= status < 300:
+            entry[3] += 1
+        else:
+            entry[0].append((end - start) * 1e3)
+            entry[1] += 1
+
+
+async def generate(index: int, args: argparse.Namespace, url: Optional[str]) -> Stats:
+    rng = random.Random(args.seed + index)
+    pools = build_pools(rng, args)
+    stats: Stats = {name: [array("f"), 0, 0, 0] for name in args.mix}
+    users = args.concurrency // args.processes + (index < args.concurrency % args.processes)
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+
+    if url is None:
+        from app.main import app
+
+        lifespan = app.router.lifespan_context(app)
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://load"
+    else:
+        lifespan = None
+        transport = None
+        base_url = url
+
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        if lifespan is not None:
+            await lifespan.__aenter__()
+        try:
+            start = time.perf_counter()
+            measure_from = start + args.warmup
+            stop = measure_from + args.duration
+            await asyncio.gather(*(
+                virtual_user(client, f"load-{index}-{user}", random.Random(rng.random()), pools, args.mix,
+                             measure_from, stop, stats)
+                for user in range(users)
+            ))
+        finally:
+            if lifespan is not None:
+                await lifespan.__aexit__(None, None, None)
+    return stats
+
+
+def run_process(index: int, args: argparse.Namespace, url: Optional[str]) -> Stats:
+    return asyncio.run(generate(index, args, url))
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int) -> Tuple[subprocess.Popen, str]:
+    """Start uvicorn with `workers` workers and wait until it answers."""
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {server.returncode}")
+        try:
+            if httpx.get(url + HEALTH, timeout=1).status_code == 200:
+                # Give the other workers time to finish importing
+                time.sleep(1 + 0.2 * workers)
+                return server, url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start within 60s")
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def percentile(samples: List[float], pct: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * pct))] if samples else 0.0
+
+
+def summarize(latencies: List[float], measured: int, shed: int, errors: int, duration: float) -> Dict:
+    latencies.sort()
+    return {
+        "requests": measured,
+        "rps": round(measured / duration, 1),
+        "shed": shed,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "p999_ms": round(percentile(latencies, 0.999), 3),
+        "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+    }
+
+
+def merge(results: List[Stats], duration: float) -> Dict[str, Dict]:
+    endpoints: Dict[str, Dict] = {}
+    everything: List[float] = []
+    totals = [0, 0, 0]
+    for name in results[0]:
+        latencies = [value for stats in results for value in stats[name][0]]
+        counts = [sum(stats[name][i] for stats in results) for i in (1, 2, 3)]
+        everything.extend(latencies)
+        totals = [a + b for a, b in zip(totals, counts)]
+        endpoints[name] = summarize(latencies, *counts, duration)
+    endpoints["total"] = summarize(everything, *totals, duration)
+    return endpoints
+
+
+def print_report(target: str, args: argparse.Namespace, endpoints: Dict[str, Dict]) -> None:
+    print(
+        f"{target}: {args.processes} load process(es), {args.concurrency} concurrent users, "
+        f"{args.duration:g}s measured after {args.warmup:g}s warmup, {os.cpu_count()} CPU(s)"
+    )
+    print(
+        f"{'endpoint':<16} {'requests':>9} {'req/s':>9} {'429':>6} {'errors':>6} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'p999 ms':>8}"
+    )
+    for name, row in endpoints.items():
+        print(
+            f"{name:<16} {row['requests']:>9,} {row['rps']:>9,.0f} {row['shed']:>6,} {row['errors']:>6,} "
+            f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['p999_ms']:>8.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="running server, e.g. http://127.0.0.1:8000 (default: in-process ASGI)")
+    target.add_argument("--serve", type=int, metavar="WORKERS", help="start uvicorn with this many workers")
+    parser.add_argument("--processes", type=int, default=1, help="load generator processes")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent users across all processes")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--timeout", type=float, default=30.0, help="per-request timeout in seconds")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"endpoint weights ({DEFAULT_MIX})")
+    parser.add_argument("--detail", choices=["minimal", "errors_only", "full"], default="full")
+    parser.add_argument("--batch-size", type=int, default=100, help="transactions per /validate-batch request")
+    parser.add_argument("--invalid-iban", type=float, default=0.1, help="share of IBANs failing MOD 97-10")
+    parser.add_argument("--missing-purpose", type=float, default=0.1, help="share of payments without a purpose code")
+    parser.add_argument("--threshold", type=float, default=0.2, help="share of amounts near AED 500k / 1M")
+    parser.add_argument("--lei", type=float, default=0.5, help="share of payments >= AED 1M with a debtor LEI")
+    parser.add_argument("--offshore", type=float, default=0.5, help="share of offshore payments")
+    parser.add_argument("--pool", type=int, default=1_000, help="distinct requests per endpoint and process")
+    parser.add_argument("--seed", type=int, default=48)
+    parser.add_argument("--json", help="also write the report (JSON) to this file")
+    args = parser.parse_args()
+    args.mix = {name: weight for name, weight in args.mix.items() if weight > 0}
+    if args.processes < 1 or args.concurrency < args.processes:
+        parser.error("need at least one process and one user per process")
+
+    server = None
+    url = args.url
+    if args.serve:
+        server, url = start_server(args.serve)
+    try:
+        if args.processes == 1:
+            results = [run_process(0, args, url)]
+        else:
+            with ProcessPoolExecutor(max_workers=args.processes, mp_context=get_context("spawn")) as pool:
+                results = list(pool.map(run_process, range(args.processes), [args] * args.processes,
+                                        [url] * args.processes))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if url is None:
+        target = "in-process ASGI"
+    elif args.serve:
+        target = f"uvicorn, {args.serve} worker(s)"
+    else:
+        target = url
+    endpoints = merge(results, args.duration)
+    print_report(target, args, endpoints)
+    if args.serve:
+        print(f"per server worker: {endpoints['total']['rps'] / args.serve:,.0f} req/s")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "target": target,
+                "server_workers": args.serve,
+                "processes": args.processes,
+                "concurrency": args.concurrency,
+                "duration_seconds": args.duration,
+                "cpus": os.cpu_count(),
+                "mix": args.mix,
+                "endpoints": endpoints,
+            }, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+MT103 bulk parser throughput.
+
+Generates a file of concatenated MT103 messages, then measures parse-only
+throughput (messages per second) and parse + batched validation.
+
+    python -m benchmarks.bench_mt103 --messages 200000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+
+from app.constants import UAE_BANK_CODES
+from app.ingest.base import validate_transactions
+from app.ingest.mt103 import iter_mt103
+from app.validators import UAEValidationEngine
+from benchmarks.common import BANK_CODES, PURPOSE_CODES, make_iban, random_amount, random_iban, timed
+
+
+def write_mt103_file(path: str, messages: int, seed: int = 103) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="ascii", newline="") as f:
+        for i in range(messages):
+            creditor_bank = rng.choice(BANK_CODES)
+            amount = f"{random_amount(rng):.2f}".replace(".", ",")
+            purpose = rng.choice(PURPOSE_CODES)
+            f.write(
+                "{1:F01EBILAEADAXXX0000000000}"
+                f"{{2:I103{UAE_BANK_CODES[creditor_bank]['swift']}XXXXN}}"
+                "{4:\r\n"
+                f":20:REF{i:012d}\r\n"
+                ":23B:CRED\r\n"
+                f":32A:261019AED{amount}\r\n"
+                f":50K:/{random_iban(rng, 0.02)}\r\nORDERING CUSTOMER {i}\r\nDUBAI AE\r\n"
+                f":59:/{make_iban(creditor_bank, rng.randrange(10 ** 16))}\r\nBENEFICIARY {i}\r\nABU DHABI AE\r\n"
+                f":70:/INV/{i:08d}\r\nPAYMENT FOR SERVICES\r\n"
+                + (f":77B:/ORDERRES/AE//{purpose}\r\n" if rng.random() > 0.05 else "")
+                + ":71A:SHA\r\n"
+                "-}{5:{CHK:0123456789AB}}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mt103.fin")
+        write_mt103_file(path, args.messages)
+        print(f"Generated {os.path.getsize(path) / 1e6:,.1f} MB MT103 file")
+
+        with timed("parse only", args.messages, unit="msg"):
+            for _ in iter_mt103(path):
+                pass
+
+        engine = UAEValidationEngine()
+        with timed("parse + validate (batched)", args.messages, unit="msg"):
+            for _ in validate_transactions(engine, iter_mt103(path)):
+                pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+pacs.008 streaming ingestion throughput.
+
+Generates a pacs.008 file, then measures parse-only and parse + validate
+throughput. Peak RSS should stay flat as --transactions grows.
+
+    python -m benchmarks.bench_pacs008 --transactions 200000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+from xml.sax.saxutils import escape
+
+from app.ingest.base import validate_transactions
+from app.ingest.pacs008 import iter_pacs008
+from app.validators import UAEValidationEngine
+from app.constants import UAE_BANK_CODES
+from benchmarks.common import BANK_CODES, PURPOSE_CODES, make_iban, random_amount, random_iban, timed
+
+NAMESPACE = "urn:iso:std:iso:20022:tech:xsd:pacs.008.001.08"
+
+
+def write_pacs008_file(path: str, transactions: int, seed: int = 8) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<Document xmlns="{NAMESPACE}"><FIToFICstmrCdtTrf>')
+        f.write(f"<GrpHdr><MsgId>BENCH</MsgId><NbOfTxs>{transactions}</NbOfTxs></GrpHdr>")
+        for i in range(transactions):
+            purpose = rng.choice(PURPOSE_CODES) if rng.random() > 0.05 else ""
+            creditor_bank = rng.choice(BANK_CODES)
+            f.write(
+                f"<CdtTrfTxInf><PmtId><EndToEndId>E2E{i:010d}</EndToEndId></PmtId>"
+                f'<IntrBkSttlmAmt Ccy="AED">{random_amount(rng):.2f}</IntrBkSttlmAmt>'
+                f"<Dbtr><Nm>Debtor {i}</Nm></Dbtr>"
+                f"<DbtrAcct><Id><IBAN>{random_iban(rng, 0.02)}</IBAN></Id></DbtrAcct>"
+                f"<CdtrAgt><FinInstnId><BICFI>{UAE_BANK_CODES[creditor_bank]['swift']}</BICFI></FinInstnId></CdtrAgt>"
+                f"<Cdtr><Nm>Creditor {i}</Nm></Cdtr>"
+                f"<CdtrAcct><Id><IBAN>{make_iban(creditor_bank, rng.randrange(10 ** 16))}</IBAN></Id></CdtrAcct>"
+                + (f"<Purp><Cd>{purpose}</Cd></Purp>" if purpose else "")
+                + f"<RmtInf><Ustrd>{escape('Invoice & payment ' + str(i))}</Ustrd></RmtInf>"
+                "</CdtTrfTxInf>"
+            )
+        f.write("</FIToFICstmrCdtTrf></Document>\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transactions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pacs008.xml")
+        write_pacs008_file(path, args.transactions)
+        print(f"Generated {os.path.getsize(path) / 1e6:,.1f} MB pacs.008 file")
+
+        with timed("parse only", args.transactions):
+            for _ in iter_pacs008(path):
+                pass
+
+        engine = UAEValidationEngine()
+        with timed("parse + validate", args.transactions):
+            for _ in validate_transactions(engine, iter_pacs008(path)):
+                pass
+
+
+if __name__ == "__main__":
+    main()
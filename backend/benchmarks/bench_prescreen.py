@@ -0,0 +1,106 @@
+"""
+Prescreen (mode=prescreen) vs full validation on failing traffic.
+
+Every payment fails at least one error-severity rule, spread over the
+failures a gateway sees: offshore without a purpose code, missing LEI
+above the threshold, malformed IBAN, bad IBAN checksum, unknown purpose
+code. Reports per-request latency percentiles and throughput for the full
+engine (detail=full and detail=minimal) and for prescreen, in-process and
+then end-to-end through the ASGI app, and checks that prescreen rejects
+every payment the full engine rejects.
+
+    python -m benchmarks.bench_prescreen --requests 20000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.bench_detail import percentile
+from benchmarks.common import PURPOSE_CODES, random_amount, random_iban
+
+VALIDATE = "/api/v1/uae/validation/validate"
+FAILURES = ("purpose_missing", "lei_missing", "iban_format", "iban_checksum", "purpose_unknown")
+
+
+def make_failing_payloads(n: int, seed: int = 49) -> List[Dict]:
+    rng = random.Random(seed)
+    payloads = []
+    for i in range(n):
+        payload = {
+            "transaction_type": "offshore",
+            "transaction_direction": "outbound",
+            "amount": min(random_amount(rng), 900_000),
+            "purpose_code": rng.choice(PURPOSE_CODES),
+            "debtor_iban": random_iban(rng),
+            "creditor_iban": random_iban(rng),
+        }
+        failure = FAILURES[i % len(FAILURES)]
+        if failure == "purpose_missing":
+            del payload["purpose_code"]
+        elif failure == "lei_missing":
+            payload["amount"] = round(rng.uniform(1_000_000, 1_500_000), 2)
+        elif failure == "iban_format":
+            payload["creditor_iban"] = payload["creditor_iban"][:-2]
+        elif failure == "iban_checksum":
+            payload["creditor_iban"] = random_iban(rng, invalid_rate=1.0)
+        else:
+            payload["purpose_code"] = "ZZZ"
+        payloads.append(payload)
+    return payloads
+
+
+def measure(label: str, func: Callable, items: List) -> None:
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        began = time.perf_counter()
+        func(item)
+        latencies.append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(
+        f"{label:<28} p50 {percentile(latencies, 0.50) * 1e6:>7,.1f} us  "
+        f"p99 {percentile(latencies, 0.99) * 1e6:>7,.1f} us  "
+        f"{len(items) / elapsed:>10,.0f} req/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--http-requests", type=int, default=3_000)
+    args = parser.parse_args()
+
+    payloads = make_failing_payloads(args.requests)
+    requests = [UAEValidationRequest(**p) for p in payloads]
+    engine = UAEValidationEngine()
+
+    missed = sum(
+        1 for request in requests
+        if engine.evaluate(request).violation_count and engine.prescreen(request).uaefts_compliant
+    )
+    rejected = sum(1 for request in requests if not engine.prescreen(request).uaefts_compliant)
+    print(f"{len(requests):,} failing payments: prescreen rejects {rejected:,}, misses {missed:,}")
+
+    print("engine + model_dump_json")
+    measure("full (detail=full)", lambda r: engine.validate(r).model_dump_json(), requests)
+    measure("full (detail=minimal)", lambda r: engine.validate(r, detail="minimal").model_dump_json(), requests)
+    measure("prescreen", lambda r: engine.prescreen(r).model_dump_json(), requests)
+
+    print("HTTP /validate (in-process ASGI)")
+    client = TestClient(app)
+    sample = payloads[:args.http_requests]
+    measure("detail=full", lambda p: client.post(VALIDATE, json=p), sample)
+    measure("detail=minimal", lambda p: client.post(f"{VALIDATE}?detail=minimal", json=p), sample)
+    measure("mode=prescreen", lambda p: client.post(f"{VALIDATE}?mode=prescreen", json=p), sample)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Result store write/read throughput and memory at scale.
+
+Writes --rows results (cycled from a few thousand real minimal responses)
+through ResultWriter, then pages, filters and exports them through
+ResultReader. Memory is reported as peak RSS and as anonymous RSS
+(process heap, excluding page cache mapped from the store files, which
+the kernel can drop at will).
+
+    python -m benchmarks.bench_results --rows 10000000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from app.ingest.base import IngestedTransaction, to_ndjson_line
+from app.results import ResultReader, ResultWriter
+from app.schemas import UAEValidationRequest
+from app.validators import UAEValidationEngine
+from benchmarks.bench_detail import make_payloads
+from benchmarks.common import peak_rss_mb, timed
+
+
+def anon_rss_mb() -> float:
+    """Anonymous resident memory (Linux), or peak RSS elsewhere."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return peak_rss_mb()
+
+
+def directory_mb(path: str) -> float:
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)) / (1024 * 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--distinct", type=int, default=5_000, help="real responses cycled through")
+    parser.add_argument("--page-size", type=int, default=1_000)
+    args = parser.parse_args()
+
+    engine = UAEValidationEngine()
+    responses = [
+        engine.validate(UAEValidationRequest(**payload), detail="minimal")
+        for payload in make_payloads(args.distinct, seed=40)
+    ]
+    print(f"baseline anon RSS {anon_rss_mb():,.0f} MB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = os.path.join(tmp, "results")
+        with timed("write", args.rows, unit="row"):
+            with ResultWriter(store) as writer:
+                for row in range(args.rows):
+                    response = responses[row % len(responses)]
+                    reference = f"REF{row:012d}"
+                    tx = IngestedTransaction(row, reference, None)
+                    writer.add(to_ndjson_line(tx, response).encode("utf-8"), reference, response)
+                    if row % 500 == 499:
+                        writer.flush()
+        print(f"store {directory_mb(store):,.0f} MB on disk, anon RSS {anon_rss_mb():,.0f} MB")
+
+        with ResultReader(store) as reader:
+            cases = [
+                ("page: first", 0, {}),
+                ("page: last", max(0, args.rows - args.page_size), {}),
+                ("page: stp_rating=low", args.rows // 2, {"stp_rating": "low"}),
+                ("page: uaefts_compliant=false", args.rows // 2, {"uaefts_compliant": False}),
+                ("page: rule_code", args.rows // 2, {"rule_code": "UAE_IBAN_DEBTOR"}),
+            ]
+            for label, start, filters in cases:
+                began = time.perf_counter()
+                lines, _ = reader.page(start, args.page_size, **filters)
+                elapsed = (time.perf_counter() - began) * 1e3
+                assert all(json.loads(line) for line in lines[:1])
+                print(f"{label:<32} {len(lines):>6} rows {elapsed:>9.2f} ms")
+
+            for label, export in (
+                ("export ndjson", reader.export_ndjson()),
+                ("export ndjson: stp_rating=low", reader.export_ndjson(stp_rating="low")),
+                ("export csv", reader.export_csv()),
+            ):
+                with timed(label, args.rows, unit="row"):
+                    size = sum(len(chunk) for chunk in export)
+                print(f"{'':<32} {size / (1024 * 1024):,.0f} MB, anon RSS {anon_rss_mb():,.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Returned-payment diagnosis throughput.
+
+Generates an NDJSON file of returned payments (a mix of return codes, with
+the matching defects planted in roughly half of them) and diagnoses it on
+one core through ReturnDiagnosisEngine.diagnose_ndjson, the path used by
+the CLI and /returns/diagnose-file. Target: 100k returns/min.
+
+Also compares the return code index with a per-payment scan of the return
+reason list, as the exception investigation screen does it.
+
+    python -m benchmarks.bench_returns --returns 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from app.constants import UAE_RETURN_REASONS
+from app.returns import RETURN_REASONS, ReturnDiagnosisEngine
+from benchmarks.common import PURPOSE_CODES, peak_rss_mb, random_amount, random_iban, timed
+
+REMITTANCE = ["monthly salary", "family support", "university education", "rent for apartment", "invoice goods import", ""]
+
+
+def make_return(rng: random.Random, index: int) -> dict:
+    reason = rng.choice(UAE_RETURN_REASONS)["code"]
+    defect = rng.random() < 0.5
+    tx = {
+        "transaction_type": "offshore",
+        "transaction_direction": "outbound",
+        "amount": random_amount(rng),
+        "currency": "AED",
+        "purpose_code": rng.choice(PURPOSE_CODES),
+        "debtor_iban": random_iban(rng),
+        "creditor_iban": random_iban(rng),
+        "remittance_info": rng.choice(REMITTANCE) or None,
+    }
+    if defect:
+        if reason in ("AC01", "IBAV"):
+            tx["creditor_iban"] = random_iban(rng, invalid_rate=1.0)
+        elif reason in ("NARR", "PURC"):
+            tx["purpose_code"] = None
+        elif reason == "LEIR":
+            tx["amount"] = 1_000_000 + rng.random() * 500_000
+        elif reason == "RC01":
+            tx["creditor_bic"] = "ZZZZAEAA"
+    return {"reference": f"RET{index:09d}", "return_code": reason, "transaction": tx}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--returns", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(43)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "returns.ndjson")
+        with open(path, "w", encoding="utf-8") as f:
+            for i in range(args.returns):
+                f.write(json.dumps(make_return(rng, i)) + "\n")
+
+        codes = [rng.choice(UAE_RETURN_REASONS)["code"] for _ in range(args.returns)]
+        with timed("return reason: list scan", len(codes), unit="lookup"):
+            for code in codes:
+                next((r for r in UAE_RETURN_REASONS if r["code"] == code), None)
+        with timed("return reason: index", len(codes), unit="lookup"):
+            for code in codes:
+                RETURN_REASONS.get(code)
+
+        engine = ReturnDiagnosisEngine()
+        statuses = {}
+        start = time.perf_counter()
+        with open(path, "rb") as f, open(os.devnull, "w") as out:
+            for line in engine.diagnose_ndjson(f):
+                out.write(line)
+                status = line[line.find('"status":') + 10:].split('"', 1)[0]
+                statuses[status] = statuses.get(status, 0) + 1
+        elapsed = time.perf_counter() - start
+
+    rate = args.returns / elapsed
+    print(f"diagnosed {args.returns:,} returns in {elapsed:.2f}s: {rate:,.0f}/s, {rate * 60:,.0f}/min (1 core)")
+    print(f"statuses: {dict(sorted(statuses.items()))}")
+    print(f"100k/min target {'met' if rate * 60 >= 100_000 else 'MISSED'}; peak RSS {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
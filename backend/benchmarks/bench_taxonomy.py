@@ -0,0 +1,91 @@
+"""
+BOP / ISO taxonomy reporting in the validation pass.
+
+Generates an MT103 file and compares:
+  - results only: validate and serialise to NDJSON
+  - results + taxonomy: the same pass also folding a TaxonomyReport
+  - two passes: results, then a separate reporting pass that looks each
+    code up the way the frontend does (getUAEMapping: a list scan)
+  - aggregate, with and without the taxonomy report
+
+Then checks the report's allocation peak is flat in the number of payments.
+
+    python -m benchmarks.bench_taxonomy --messages 100000
+"""
+
+import argparse
+import os
+import tempfile
+import tracemalloc
+from typing import Dict
+
+from app.fx import get_fx_rates
+from app.ingest.base import aggregate_transactions, iter_batches, to_ndjson_line, validate_transactions
+from app.ingest.mt103 import iter_mt103
+from app.taxonomy import TaxonomyReport
+from app.taxonomy_codes import UAE_TAXONOMY_MAPPINGS
+from app.validators import UAEValidationEngine
+from benchmarks.bench_mt103 import write_mt103_file
+from benchmarks.common import timed
+
+
+def run_results(path: str, taxonomy=None) -> None:
+    for tx, response in validate_transactions(UAEValidationEngine(), iter_mt103(path), taxonomy=taxonomy):
+        to_ndjson_line(tx, response)
+
+
+def scan_report(path: str) -> Dict:
+    """Second pass, one list scan per payment."""
+    totals: Dict = {}
+    fx = get_fx_rates().latest
+    for tx in iter_mt103(path):
+        if tx.request is None:
+            continue
+        code = (tx.request.purpose_code or "").upper()
+        mapping = next((m for m in UAE_TAXONOMY_MAPPINGS if m["uae_code"] == code), None)
+        bucket = totals.setdefault(mapping["bop_code"] if mapping else None, [0, 0.0])
+        bucket[0] += 1
+        bucket[1] += fx.to_aed_column([tx.request.amount], [tx.request.currency])[0]
+    return totals
+
+
+def report_only(path: str) -> None:
+    report = TaxonomyReport()
+    for batch in iter_batches(iter_mt103(path), 500):
+        report.add_batch([tx.request for tx in batch if tx.request])
+    report.to_response()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mt103.fin")
+        write_mt103_file(path, args.messages)
+
+        with timed("results only", args.messages):
+            run_results(path)
+        with timed("results + taxonomy (one pass)", args.messages):
+            run_results(path, TaxonomyReport())
+        with timed("results, then list-scan report", args.messages):
+            run_results(path)
+            scan_report(path)
+        with timed("aggregate", args.messages):
+            aggregate_transactions(UAEValidationEngine(), iter_mt103(path)).to_response()
+        with timed("aggregate + taxonomy", args.messages):
+            aggregate_transactions(UAEValidationEngine(), iter_mt103(path), taxonomy=TaxonomyReport()).to_response()
+
+        for messages in (args.messages // 10, args.messages):
+            sized = os.path.join(tmp, f"{messages}.fin")
+            write_mt103_file(sized, messages)
+            tracemalloc.start()
+            report_only(sized)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"taxonomy report over {messages:>9,} payments: peak traced allocations {peak / 1e6:,.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
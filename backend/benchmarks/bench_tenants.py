@@ -0,0 +1,79 @@
+"""
+Tenant profile dispatch overhead.
+
+Evaluates the same payments with no tenant, then round-robin across
+--tenants profiles (thresholds overridden, one rule disabled each), and
+reports the per-request difference. Also times the plan lookup on its own
+and a plan compilation (paid once per profile and reference data version).
+
+    python -m benchmarks.bench_tenants --payments 20000 --tenants 8
+"""
+
+import argparse
+import time
+
+from app.reference import get_reference_data
+from app.schemas import UAEValidationRequest
+from app.tenants import TenantProfile, compile_plan, tenant_profiles
+from app.validators import UAEValidationEngine
+from benchmarks.bench_detail import make_payloads
+
+
+def best_of(runs: int, func) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payments", type=int, default=20_000)
+    parser.add_argument("--tenants", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    names = [f"tenant-{i}" for i in range(args.tenants)]
+    for i, name in enumerate(names):
+        tenant_profiles.set_profile(TenantProfile.from_dict(name, {
+            "thresholds": {"lei_threshold_aed": 500_000 + 100_000 * i, "penalty_per_violation_aed": 1_000 + i},
+            "disabled_rules": ["UAE_CORRIDOR_PPC"],
+        }))
+
+    requests = [UAEValidationRequest(**p) for p in make_payloads(args.payments, seed=50)]
+    tenants = [names[i % len(names)] for i in range(len(requests))]
+    ref = get_reference_data()
+    engine = UAEValidationEngine()
+
+    def untenanted() -> None:
+        for request in requests:
+            engine.evaluate(request, ref)
+
+    def tenanted() -> None:
+        for request, tenant in zip(requests, tenants):
+            engine.evaluate(request, ref, tenant=tenant)
+
+    def lookups() -> None:
+        plan = tenant_profiles.plan
+        for tenant in tenants:
+            plan(tenant, ref)
+
+    tenanted()  # compile every plan once
+    base = best_of(args.runs, untenanted) / len(requests) * 1e6
+    with_tenant = best_of(args.runs, tenanted) / len(requests) * 1e6
+    lookup = best_of(args.runs, lookups) / len(requests) * 1e9
+
+    profile = tenant_profiles.profiles()[names[0]]
+    compile_us = best_of(args.runs, lambda: [compile_plan(profile, ref) for _ in range(1_000)]) / 1_000 * 1e6
+
+    print(f"{len(requests):,} payments, {len(names)} tenant profiles, best of {args.runs}")
+    print(f"{'no tenant':<24} {base:>8.2f} us/payment")
+    print(f"{'tenant (round-robin)':<24} {with_tenant:>8.2f} us/payment  ({with_tenant - base:+.2f} us)")
+    print(f"{'plan lookup':<24} {lookup:>8.0f} ns")
+    print(f"{'plan compilation':<24} {compile_us:>8.2f} us (once per profile version)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Purpose code translation: per-call list scans versus the precomputed index.
+
+1. Single translations: a direct port of translateUAEToMarket /
+   translateToUAE (dict lookup, then a linear scan of the cross-market
+   mappings and their code lists) versus TranslationIndex.translate.
+2. Bulk re-coding: items/sec for TranslationIndex.translate_batch_json and
+   through POST /translate-batch (ASGI, no network).
+
+    python -m benchmarks.bench_translation --codes 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.main import app
+from app.market_codes import MULTI_MARKET_MAPPINGS
+from app.translation import MARKET_TO_ISO, translation_index
+from benchmarks.common import peak_rss_mb, timed
+
+
+def scan_translate(code: str, source_market: str, target_market: str) -> Optional[Dict]:
+    """What the frontend does on every call."""
+    entry = MARKET_TO_ISO[source_market].get(code)
+    if entry is None:
+        return None
+    mapping = next((m for m in MULTI_MARKET_MAPPINGS if m["iso"] == entry[0]), None)
+    if mapping is None:
+        return None
+    source = next((c for c in mapping["codes"][source_market] if c["code"] == code), None)
+    if source is None and source_market == "AE":
+        return None
+    return {"source": source, "iso": entry[0], "targets": mapping["codes"][target_market]}
+
+
+def make_codes(n: int, source_market: str, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    known = sorted(MARKET_TO_ISO[source_market])
+    # ~5% codes that do not translate
+    return [rng.choice(known) if rng.random() < 0.95 else f"X{rng.randrange(1000):03d}" for _ in range(n)]
+
+
+async def batch_items_per_second(codes: List[str], target_market: str, batch_size: int) -> float:
+    bodies = [
+        json.dumps({"source_market": "AE", "target_market": target_market, "codes": codes[i:i + batch_size]}).encode()
+        for i in range(0, len(codes), batch_size)
+    ]
+    transport = httpx.ASGITransport(app=app)
+    headers = {"content-type": "application/json"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for body in bodies:
+            response = await client.post("/api/v1/uae/translation/translate-batch", content=body, headers=headers)
+            response.raise_for_status()
+        return len(codes) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--codes", type=int, default=1_000_000)
+    parser.add_argument("--single", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"index entries: {len(translation_index):,}")
+    for source_market, target_market in (("AE", "IN"), ("PK", "AE")):
+        codes = make_codes(args.single, source_market, seed=41)
+        with timed(f"{source_market}->{target_market} list scan", len(codes), unit="code"):
+            for code in codes:
+                scan_translate(code, source_market, target_market)
+        with timed(f"{source_market}->{target_market} index", len(codes), unit="code"):
+            for code in codes:
+                translation_index.translate(code, source_market, target_market)
+
+    codes = make_codes(args.codes, "AE", seed=42)
+    with timed("translate_batch_json AE->PK", len(codes), unit="code"):
+        translation_index.translate_batch_json(codes, "AE", "PK")
+
+    rate = asyncio.run(batch_items_per_second(codes, "PK", args.batch_size))
+    print(f"/translate-batch AE->PK {rate:>12,.0f} codes/s (1 core, batches of {args.batch_size:,})")
+    print(f"peak RSS {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
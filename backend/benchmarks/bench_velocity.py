@@ -0,0 +1,113 @@
+"""
+Velocity tracker throughput and structuring recall.
+
+Replays --payments payments at --rate payments/s (simulated clock) spread
+uniformly over --debtors distinct debtor IBANs, with --structurers debtors
+splitting 3 x AED 400,000 payments --gap seconds apart. Reports record()
+throughput (must stay above --rate), memory, evictions and how many
+structurers were flagged. First checks that a steady stream whose true
+windowed total stays below the LEI threshold (hourly payments for ten
+days) is never flagged, and exits non-zero if it is.
+
+    python -m benchmarks.bench_velocity --payments 2000000 --debtors 1000000
+"""
+
+import argparse
+import random
+import time
+
+from app.fx import get_fx_rates
+from app.reference import get_reference_data
+from app.schemas import UAEValidationRequest
+from app.validators import StageContext
+from app.velocity import VelocityStage, VelocityTracker
+from benchmarks.common import timed
+
+
+def debtor_key(i: int) -> str:
+    return f"AE00033{i:016d}"
+
+
+def check_steady_stream(ref) -> None:
+    """Hourly payments of threshold / 25 for ten days: the true 24h total never reaches it."""
+    tracker = VelocityTracker(max_keys=16)
+    threshold = ref.lei_threshold_aed
+    amount = threshold / 25
+    per_window = int(tracker.window_seconds // 3600)
+    highest = 0.0
+    for hour in range(240):
+        highest = max(highest, tracker.record("AE070331234567890123456", amount, hour * 3600.0) + amount)
+    print(f"Steady stream: AED {amount:,.0f}/h for 10 days, highest windowed total "
+          f"AED {highest:,.0f} (true AED {amount * per_window:,.0f}, threshold AED {threshold:,})")
+    if highest >= threshold:
+        raise SystemExit("FAIL: a steady sub-threshold stream crossed the threshold")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payments", type=int, default=2_000_000)
+    parser.add_argument("--debtors", type=int, default=1_000_000)
+    parser.add_argument("--rate", type=int, default=10_000, help="simulated payments per second")
+    parser.add_argument("--structurers", type=int, default=1_000)
+    parser.add_argument("--gap", type=float, default=5.0, help="seconds between split payments")
+    parser.add_argument("--max-keys", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(33)
+    tracker = VelocityTracker() if args.max_keys is None else VelocityTracker(max_keys=args.max_keys)
+    ref = get_reference_data()
+    check_steady_stream(ref)
+    print(f"Tracking up to {tracker.max_keys:,} debtors, ring {tracker.ring_size}, "
+          f"slab {tracker.memory_bytes / 1e6:.1f} MB")
+
+    # Background traffic: (timestamp, key, amount), retail amounts
+    step = 1.0 / args.rate
+    t0 = time.time()
+    keys = [debtor_key(rng.randrange(args.debtors)) for _ in range(args.payments)]
+    amounts = [rng.uniform(100, 50_000) for _ in range(args.payments)]
+
+    # Structurers start at random points and send 3 x 400k, gap seconds apart
+    duration = args.payments * step
+    split_payments = []
+    for s in range(args.structurers):
+        start = rng.uniform(0, max(0.0, duration - 3 * args.gap))
+        for n in range(3):
+            split_payments.append((start + n * args.gap, f"AE99033{s:016d}"))
+    split_payments.sort()
+
+    flagged = set()
+    threshold = ref.lei_threshold_aed
+    split_index = 0
+    total = args.payments + len(split_payments)
+    with timed("record() at simulated rate", total, unit="ops"):
+        for i in range(args.payments):
+            offset = i * step
+            while split_index < len(split_payments) and split_payments[split_index][0] <= offset:
+                at, key = split_payments[split_index]
+                previous = tracker.record(key, 400_000.0, t0 + at)
+                if previous < threshold <= previous + 400_000.0:
+                    flagged.add(key)
+                split_index += 1
+            tracker.record(keys[i], amounts[i], t0 + offset)
+
+    print(f"Tracked debtors: {tracker.tracked_keys:,}  evictions: {tracker.evictions:,}")
+    print(f"Structurers flagged at LEI threshold: {len(flagged):,} / {args.structurers:,}")
+
+    # Stage overhead on full requests
+    stage = VelocityStage(VelocityTracker(max_keys=50_000))
+    request = UAEValidationRequest(
+        transaction_type="domestic",
+        transaction_direction="outbound",
+        amount=1_000,
+        purpose_code="SAL",
+        debtor_iban=debtor_key(1),
+    )
+    limits = get_fx_rates().latest.limits_for("AED", ref)
+    n = 200_000
+    with timed("VelocityStage.check()", n, unit="ops"):
+        for i in range(n):
+            stage.check(request, StageContext("s", ref, limits, 1_000.0, t0 + i * step))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import random
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from app.constants import UAE_BANK_CODES, UAE_PURPOSE_CODES
+
+BANK_CODES: List[str] = sorted(UAE_BANK_CODES)
+PURPOSE_CODES: List[str] = [c["code"] for c in UAE_PURPOSE_CODES]
+
+
+def make_iban(bank_code: str, account: int) -> str:
+    """Build a UAE IBAN with valid MOD 97-10 check digits."""
+    bban = f"{bank_code}{account:016d}"
+    check = 98 - int(bban + "101400") % 97  # "AE00" -> A=10, E=14, 00
+    return f"AE{check:02d}{bban}"
+
+
+def make_lei(rng: random.Random) -> str:
+    """Build an LEI with valid ISO 17442 MOD 97-10 check digits."""
+    base = "".join(rng.choice("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(18))
+    check = 98 - int("".join(str(int(c, 36)) for c in base + "00")) % 97
+    return f"{base}{check:02d}"
+
+
+def random_iban(rng: random.Random, invalid_rate: float = 0.0) -> str:
+    iban = make_iban(rng.choice(BANK_CODES), rng.randrange(10 ** 16))
+    if invalid_rate and rng.random() < invalid_rate:
+        # Corrupt the check digits
+        iban = iban[:2] + f"{(int(iban[2:4]) + 1) % 100:02d}" + iban[4:]
+    return iban
+
+
+def random_amount(rng: random.Random) -> float:
+    """Mostly retail amounts, with a tail around the 500k and 1M thresholds."""
+    roll = rng.random()
+    if roll < 0.8:
+        return round(rng.uniform(100, 50_000), 2)
+    if roll < 0.9:
+        return round(rng.uniform(450_000, 550_000), 2)
+    return round(rng.uniform(900_000, 1_500_000), 2)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@contextmanager
+def timed(label: str, count: int, unit: str = "tx") -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0.0
+    print(f"{label:<32} {count:>10,} {unit} {elapsed:>8.2f}s {rate:>12,.0f} {unit}/s  peak RSS {peak_rss_mb():,.0f} MB")